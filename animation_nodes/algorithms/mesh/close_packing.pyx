@@ -1,11 +1,11 @@
 import cython
 from libc.math cimport sqrt
 from mathutils import Vector
-from mathutils.kdtree import KDTree
 from mathutils.bvhtree import BVHTree
 from ... algorithms.rotations.rotation_and_direction cimport directionToMatrix_LowLevel
 from ... data_structures cimport (
     Mesh,
+    KDTree,
     LongList,
     FloatList,
     DoubleList,
@@ -23,29 +23,38 @@ from ... math cimport (
     setMatrixTranslation,
     )
 
+# points are queried in blocks, so that only the neighbours
+# of the points in one block are in memory at the same time
+DEF QUERY_BLOCK_SIZE = 1024
+
 @cython.cdivision(True)
 def dynamicRadiusSpherePacking(Vector3DList points, float margin, float radiusMax, float radiusStep,
                                  FloatList influences, bint mask, DoubleList objectRadii):
     cdef Py_ssize_t numberOfPoints = points.length
-    kdTree = buildKDTree(numberOfPoints, points)
 
     cdef DoubleList radii = DoubleList(length = numberOfPoints)
     radii.fill(0)
 
     cdef float searchRadius = max(2 * (margin + radiusMax), 0)
     cdef DoubleList distances
-    cdef LongList indices
+    cdef LongList indices, starts, lengths
     cdef float radius
-    cdef Py_ssize_t i, iterations, numberOfNonZeroRadius
+    cdef Py_ssize_t i, start, iterations, numberOfNonZeroRadius
+    cdef Py_ssize_t blockStart, blockEnd
 
+    kdTree = KDTree(points)
     numberOfNonZeroRadius = 0
-    for i in range(numberOfPoints):
-        indices, distances = calculateDistancesByRange(kdTree, points.data[i], searchRadius)
-        iterations = int(radiusMax * influences.data[i] / radiusStep)
-        radius = calulateMaxRadius(iterations, margin, radiusStep, radii, indices, distances)
-        radii.data[i] = radius
-        if radius > 0:
-            numberOfNonZeroRadius += 1
+    for blockStart in range(0, numberOfPoints, QUERY_BLOCK_SIZE):
+        blockEnd = min(blockStart + QUERY_BLOCK_SIZE, numberOfPoints)
+        indices, distances, starts, lengths = kdTree.findInRadius(points[blockStart:blockEnd], searchRadius)
+        for i in range(blockStart, blockEnd):
+            iterations = int(radiusMax * influences.data[i] / radiusStep)
+            start = starts.data[i - blockStart]
+            radius = calulateMaxRadius(iterations, margin, radiusStep, radii, indices, distances,
+                                       start, start + lengths.data[i - blockStart])
+            radii.data[i] = radius
+            if radius > 0:
+                numberOfNonZeroRadius += 1
 
     return calculateMatricesRadii(numberOfPoints, numberOfNonZeroRadius, points, radii, objectRadii, mask)
 
@@ -54,27 +63,40 @@ def dynamicRadiusSpherePacking(Vector3DList points, float margin, float radiusMa
 def neighbourRadiusSpherePacking(Vector3DList points, float margin, float radiusMax, float radiusStep,
                                  FloatList influences, bint mask, DoubleList objectRadii):
     cdef Py_ssize_t numberOfPoints = points.length
-    kdTree = buildKDTree(numberOfPoints, points)
 
     cdef DoubleList radii = DoubleList(length = numberOfPoints)
     radii.fill(0)
 
-    cdef LongList indices
+    cdef LongList indices, starts, lengths
     cdef DoubleList distances
     cdef float nextRadius, influence, radius
     cdef Py_ssize_t iterations = int(radiusMax / radiusStep)
-    cdef Py_ssize_t i, numberOfNonZeroRadius
+    cdef Py_ssize_t i, start, end, numberOfNonZeroRadius
+
+    kdTree = KDTree(points)
+    cdef float maxRadius
+    cdef Py_ssize_t blockStart, blockEnd
 
     numberOfNonZeroRadius = 0
     for j in range(iterations):
         numberOfNonZeroRadius = 0
-        for i in range(numberOfPoints):
-            nextRadius = radii.data[i] + radiusStep
-            indices, distances = calculateDistancesByRange(kdTree, points.data[i], 2 * (margin + nextRadius))
-            influence = influences.data[i]
-            if comapareRadiusDistanceOfKDTree(margin + nextRadius * influence, radii, indices, distances):
-                radii.data[i] = nextRadius * influence
-            if radii.data[i] > 0: numberOfNonZeroRadius += 1
+        for blockStart in range(0, numberOfPoints, QUERY_BLOCK_SIZE):
+            blockEnd = min(blockStart + QUERY_BLOCK_SIZE, numberOfPoints)
+            # a radius only changes when its own point is processed
+            maxRadius = 0
+            for i in range(blockStart, blockEnd):
+                maxRadius = max(maxRadius, radii.data[i])
+            indices, distances, starts, lengths = kdTree.findInRadius(points[blockStart:blockEnd],
+                max(2 * (margin + maxRadius + radiusStep), 0))
+
+            for i in range(blockStart, blockEnd):
+                nextRadius = radii.data[i] + radiusStep
+                start = starts.data[i - blockStart]
+                end = getRangeEnd(distances, start, start + lengths.data[i - blockStart], 2 * (margin + nextRadius))
+                influence = influences.data[i]
+                if comapareRadiusDistanceOfKDTree(margin + nextRadius * influence, radii, indices, distances, start, end):
+                    radii.data[i] = nextRadius * influence
+                if radii.data[i] > 0: numberOfNonZeroRadius += 1
 
     return calculateMatricesRadii(numberOfPoints, numberOfNonZeroRadius, points, radii, objectRadii, mask)
 
@@ -122,7 +144,7 @@ def relaxSpherePacking(Vector3DList points, float margin, DoubleList radii, floa
     cdef Vector3DList prePoints = points
     cdef Vector3 point, force
     cdef DoubleList distances
-    cdef LongList indices
+    cdef LongList indices, starts, lengths
     cdef float radius, totalRadius, distance, forceScale, error
     cdef Py_ssize_t i, j, k, count, index, numberOfNonZeroRadius
 
@@ -134,14 +156,13 @@ def relaxSpherePacking(Vector3DList points, float margin, DoubleList radii, floa
 
     for k in range(iterations):
         count = 0
-        kdTree = buildKDTree(numberOfPoints, relaxPoints)
+        indices, distances, starts, lengths = KDTree(relaxPoints).findNNearest(relaxPoints, 1 + neighbourAmount)
         for j in range(numberOfPoints):
             radius = radii.data[j]
             point = relaxPoints.data[j]
-            indices, distances = calculateDistancesByAmount(kdTree, point, 1 + neighbourAmount)
 
             if radius == 0: continue
-            for i in range(1, indices.length):
+            for i in range(starts.data[j] + 1, starts.data[j] + lengths.data[j]):
                 index = indices.data[i]
                 distance = distances.data[i]
 
@@ -177,7 +198,7 @@ def relaxSpherePackingOnMesh(Vector3DList points, float margin, DoubleList radii
     cdef Vector3DList prePoints = points
     cdef Vector3 point, force
     cdef DoubleList distances
-    cdef LongList indices
+    cdef LongList indices, starts, lengths
     cdef float radius, totalRadius, distance, forceScale, error, x, y, z
     cdef Py_ssize_t i, j, k, count, index, numberOfNonZeroRadius
 
@@ -189,14 +210,13 @@ def relaxSpherePackingOnMesh(Vector3DList points, float margin, DoubleList radii
 
     for k in range(iterations):
         count = 0
-        kdTree = buildKDTree(numberOfPoints, relaxPoints)
+        indices, distances, starts, lengths = KDTree(relaxPoints).findNNearest(relaxPoints, 1 + neighbourAmount)
         for j in range(numberOfPoints):
             radius = radii.data[j]
             point = relaxPoints.data[j]
-            indices, distances = calculateDistancesByAmount(kdTree, point, 1 + neighbourAmount)
 
             if radius == 0: continue
-            for i in range(1, indices.length):
+            for i in range(starts.data[j] + 1, starts.data[j] + lengths.data[j]):
                 index = indices.data[i]
                 distance = distances.data[i]
 
@@ -316,18 +336,21 @@ cdef float mapping(float x, float xMin, float xMax, float yMin, float yMax):
     if mapValue < yMin: return yMin
     return mapValue
 
-cdef float calulateMaxRadius(Py_ssize_t iterations, float margin, float radiusStep, DoubleList radii, LongList indices, DoubleList distances):
+cdef float calulateMaxRadius(Py_ssize_t iterations, float margin, float radiusStep, DoubleList radii, LongList indices, DoubleList distances,
+                             Py_ssize_t start, Py_ssize_t end):
     cdef float newRadius = 0
     cdef Py_ssize_t i
     for i in range(iterations):
-        if not comapareRadiusDistanceOfKDTree(newRadius + margin, radii, indices, distances): break
+        if not comapareRadiusDistanceOfKDTree(newRadius + margin, radii, indices, distances, start, end): break
         newRadius += radiusStep
     return newRadius
 
-cdef bint comapareRadiusDistanceOfKDTree(float newRadius, DoubleList radii, LongList indices, DoubleList distances):
+cdef bint comapareRadiusDistanceOfKDTree(float newRadius, DoubleList radii, LongList indices, DoubleList distances,
+                                         Py_ssize_t start, Py_ssize_t end):
+    # the first neighbour is the point itself
     cdef bint newRadiusCheck = True
     cdef Py_ssize_t i
-    for i in range(1, distances.length):
+    for i in range(start + 1, end):
         if newRadius + radii.data[indices.data[i]] > distances.data[i]:
             newRadiusCheck = False
             break
@@ -352,39 +375,11 @@ cdef bint comapareRadiusDistanceIndexOfPoints(Py_ssize_t index, float newRadius,
         if newRadius + radii.data[i] > distanceVec3(&point, &points.data[i]): return False
     return True
 
-cdef calculateDistancesByRange(kdTree, Vector3 searchVector, float searchRadius):
-    cdef list results = kdTree.find_range(Vector((searchVector.x, searchVector.y, searchVector.z)), searchRadius)
-    cdef Py_ssize_t lenResult = len(results)
-    cdef DoubleList distances = DoubleList(length = lenResult)
-    cdef LongList indices = LongList(length = lenResult)
-    cdef Py_ssize_t i
-    for i in range(lenResult):
-        result = results[i]
-        indices.data[i] = result[1]
-        distances.data[i] = result[2]
-    return indices, distances
-
-cdef calculateDistancesByAmount(kdTree, Vector3 searchVector, long amount):
-    cdef list results = kdTree.find_n(Vector((searchVector.x, searchVector.y, searchVector.z)), amount)
-    cdef Py_ssize_t lenResult = len(results)
-    cdef DoubleList distances = DoubleList(length = lenResult)
-    cdef LongList indices = LongList(length = lenResult)
-    cdef Py_ssize_t i
-    for i in range(lenResult):
-        result = results[i]
-        indices.data[i] = result[1]
-        distances.data[i] = result[2]
-    return indices, distances
-
-cdef buildKDTree(Py_ssize_t numberOfPoints, Vector3DList points):
-    kdTree = KDTree(numberOfPoints)
-    cdef Vector3 vector
-    cdef Py_ssize_t i
-    for i in range(numberOfPoints):
-        vector = points.data[i]
-        kdTree.insert(Vector((vector.x, vector.y, vector.z)), i)
-    kdTree.balance()
-    return kdTree
+cdef Py_ssize_t getRangeEnd(DoubleList distances, Py_ssize_t start, Py_ssize_t end, float radius):
+    # the neighbours of a point are sorted by distance
+    while start < end and distances.data[start] <= radius:
+        start += 1
+    return start
 
 cdef buildBVHTree(Vector3DList vertices, PolygonIndicesList polygons, epsilon):
     return BVHTree.FromPolygons(vertices, polygons, epsilon = max(epsilon, 0))
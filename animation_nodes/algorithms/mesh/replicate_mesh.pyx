@@ -0,0 +1,273 @@
+# cython: profile=True
+import numpy as np
+from libc.string cimport memcpy
+from ... utils.parallel import getThreadAmount, splitRange, runParts
+from ... math cimport Vector3, Matrix4, transformVec3AsPoint, transformVec3AsDirection
+from ... data_structures cimport (
+    Mesh,
+    LongList,
+    UIntegerList,
+    Vector3DList,
+    Matrix4x4List,
+    EdgeIndicesList,
+    PolygonIndicesList
+)
+
+# Instances are replicated in chunks on a thread pool when the new mesh is large enough.
+# Every chunk writes into its own range of the preallocated lists without the GIL.
+DEF MIN_PARALLEL_ELEMENTS = 65536
+
+def replicateMesh(Mesh source, transformations):
+    '''
+    Normals are only replicated when they are cached on the source,
+    otherwise they are calculated on demand by the new mesh.
+    '''
+    cdef Py_ssize_t amount = len(transformations)
+    cdef Mesh target = Mesh(
+        Vector3DList(length = source.vertices.length * amount),
+        EdgeIndicesList(length = source.edges.length * amount),
+        PolygonIndicesList(indicesAmount = source.polygons.indices.length * amount,
+                           polygonAmount = source.polygons.polyStarts.length * amount),
+        LongList(length = source.materialIndices.length * amount),
+        skipValidation = True)
+
+    vertexNormals = polygonNormals = None
+    if source.getCachedDerivedData("Vertex Normals") is not None:
+        vertexNormals = Vector3DList(length = target.vertices.length)
+    if source.getCachedDerivedData("Polygon Normals") is not None:
+        polygonNormals = Vector3DList(length = target.polygons.polyStarts.length)
+    loopEdges = UIntegerList(length = target.polygons.indices.length)
+
+    MeshReplicator(source, transformations, target, 0,
+                   vertexNormals, polygonNormals, loopEdges).execute()
+
+    if vertexNormals is not None: target.setVertexNormals(vertexNormals)
+    if polygonNormals is not None: target.setPolygonNormals(polygonNormals)
+    target.setLoopEdges(loopEdges)
+    target.replicateMeshProperties(source, amount)
+    return target
+
+def replicateMeshInto(Mesh target, Mesh source, transformations, Py_ssize_t startInstance = 0):
+    '''
+    Writes the instances into an existing mesh instead of allocating a new one,
+    e.g. into the mesh that was replicated from the same source in the last frame.
+    The target has to contain only replicas of the source and needs space for
+    startInstance + len(transformations) instances.
+    Attributes, normals and loop edges are only written when the target has them already.
+    '''
+    cdef Py_ssize_t endInstance = startInstance + len(transformations)
+    if (startInstance < 0
+            or target.vertices.length < endInstance * source.vertices.length
+            or target.edges.length < endInstance * source.edges.length
+            or target.polygons.indices.length < endInstance * source.polygons.indices.length
+            or target.polygons.polyStarts.length < endInstance * source.polygons.polyStarts.length
+            or target.materialIndices.length < endInstance * source.materialIndices.length):
+        raise IndexError("the target mesh is too small")
+
+    vertexNormals = polygonNormals = None
+    if source.getCachedDerivedData("Vertex Normals") is not None:
+        vertexNormals = target.getCachedDerivedData("Vertex Normals")
+    if source.getCachedDerivedData("Polygon Normals") is not None:
+        polygonNormals = target.getCachedDerivedData("Polygon Normals")
+    loopEdges = target.getCachedDerivedData("Loop Edges")
+
+    MeshReplicator(source, transformations, target, startInstance,
+                   vertexNormals, polygonNormals, loopEdges).execute()
+
+    target.topologyChanged()
+    target.verticesTransformed()
+    if vertexNormals is not None: target.setVertexNormals(vertexNormals)
+    if polygonNormals is not None: target.setPolygonNormals(polygonNormals)
+    if loopEdges is not None: target.setLoopEdges(loopEdges)
+
+    for domain, name, data in source.attributes.iterAttributes():
+        targetData = target.getAttribute(domain, type(data), name)
+        if targetData is not None:
+            sourceArray = data.asNumpyArray().reshape(len(data), -1)
+            targetArray = targetData.asNumpyArray().reshape(len(targetData), -1)
+            targetArray[startInstance * len(data):endInstance * len(data)] = np.tile(
+                sourceArray, (endInstance - startInstance, 1))
+
+def getReplicatedVertices(Vector3DList oldVertices, transformations):
+    cdef Vector3DList newVertices = Vector3DList(length = oldVertices.length * len(transformations))
+    MeshReplicator(Mesh(oldVertices, skipValidation = True), transformations,
+                   Mesh(newVertices, skipValidation = True), 0).execute()
+    return newVertices
+
+def getReplicatedNormals(Vector3DList normals, Matrix4x4List matrices):
+    cdef Vector3DList newNormals = Vector3DList(length = normals.length * matrices.length)
+    cdef Vector3 *_normals = normals.data
+    cdef Vector3 *_newNormals = newNormals.data
+    cdef Matrix4 *_matrices = matrices.data
+    cdef Py_ssize_t normalAmount = normals.length
+
+    def replicateChunk(Py_ssize_t start, Py_ssize_t end):
+        with nogil:
+            replicateNormals(_normals, normalAmount, _matrices, _newNormals, start, end)
+
+    runParts(replicateChunk, getInstanceChunks(matrices.length, normalAmount))
+    return newNormals
+
+cdef class MeshReplicator:
+    cdef:
+        Mesh source, target
+        Vector3DList vectors
+        Matrix4x4List matrices
+        Py_ssize_t amount, startInstance
+        UIntegerList loopEdges
+        Vector3DList vertexNormals, polygonNormals
+        UIntegerList sourceLoopEdges
+        Vector3DList sourceVertexNormals, sourcePolygonNormals
+
+    def __cinit__(self, Mesh source, transformations, Mesh target, Py_ssize_t startInstance,
+                  Vector3DList vertexNormals = None, Vector3DList polygonNormals = None,
+                  UIntegerList loopEdges = None):
+        if isinstance(transformations, Vector3DList):
+            self.vectors = transformations
+        elif isinstance(transformations, Matrix4x4List):
+            self.matrices = transformations
+        else:
+            raise TypeError("expected a Vector3DList or Matrix4x4List")
+
+        self.source = source
+        self.target = target
+        self.amount = len(transformations)
+        self.startInstance = startInstance
+        self.vertexNormals = vertexNormals
+        self.polygonNormals = polygonNormals
+        self.loopEdges = loopEdges
+
+    def execute(self):
+        cdef Mesh source = self.source
+
+        # derived data is computed lazily and cached on the source,
+        # so it is resolved here before the chunks run on other threads
+        if self.vertexNormals is not None:
+            self.sourceVertexNormals = source.getVertexNormals()
+        if self.polygonNormals is not None:
+            self.sourcePolygonNormals = source.getPolygonNormals()
+        if self.loopEdges is not None:
+            self.sourceLoopEdges = source.getLoopEdges()
+
+        cdef Py_ssize_t instanceSize = (source.vertices.length + source.edges.length +
+                                        source.polygons.indices.length)
+        runParts(self.replicateChunk, getInstanceChunks(self.amount, instanceSize))
+
+    def replicateChunk(self, Py_ssize_t start, Py_ssize_t end):
+        cdef Mesh source = self.source
+        cdef Mesh target = self.target
+        cdef Py_ssize_t first = self.startInstance
+        cdef bint useMatrices = self.matrices is not None
+        cdef Vector3 *vectors = NULL
+        cdef Matrix4 *matrices = NULL
+        if useMatrices: matrices = self.matrices.data
+        else: vectors = self.vectors.data
+
+        cdef Py_ssize_t vertexAmount = source.vertices.length
+        cdef Py_ssize_t edgeAmount = source.edges.length
+        cdef Py_ssize_t indexAmount = source.polygons.indices.length
+        cdef Py_ssize_t polygonAmount = source.polygons.polyStarts.length
+        cdef Py_ssize_t materialAmount = source.materialIndices.length
+
+        cdef Vector3 *vertices = source.vertices.data
+        cdef Vector3 *newVertices = target.vertices.data + first * vertexAmount
+
+        cdef Vector3 *vertexNormals = NULL
+        cdef Vector3 *newVertexNormals = NULL
+        if self.vertexNormals is not None:
+            vertexNormals = self.sourceVertexNormals.data
+            newVertexNormals = self.vertexNormals.data + first * vertexAmount
+
+        cdef Vector3 *polygonNormals = NULL
+        cdef Vector3 *newPolygonNormals = NULL
+        if self.polygonNormals is not None:
+            polygonNormals = self.sourcePolygonNormals.data
+            newPolygonNormals = self.polygonNormals.data + first * polygonAmount
+
+        cdef unsigned int *loopEdges = NULL
+        cdef unsigned int *newLoopEdges = NULL
+        if self.loopEdges is not None:
+            loopEdges = self.sourceLoopEdges.data
+            newLoopEdges = self.loopEdges.data + first * indexAmount
+
+        with nogil:
+            if useMatrices:
+                replicatePoints_Matrices(vertices, vertexAmount, matrices, newVertices, start, end)
+            else:
+                replicatePoints_Vectors(vertices, vertexAmount, vectors, newVertices, start, end)
+
+            if vertexNormals != NULL:
+                replicateNormals(vertexNormals, vertexAmount, matrices, newVertexNormals, start, end)
+            if polygonNormals != NULL:
+                replicateNormals(polygonNormals, polygonAmount, matrices, newPolygonNormals, start, end)
+            if loopEdges != NULL:
+                replicateIndices(loopEdges, indexAmount, edgeAmount, first,
+                                 newLoopEdges, start, end)
+
+            replicateIndices(<unsigned int*>source.edges.data, edgeAmount * 2, vertexAmount, first,
+                             <unsigned int*>(target.edges.data + first * edgeAmount), start, end)
+            replicateIndices(source.polygons.indices.data, indexAmount, vertexAmount, first,
+                             target.polygons.indices.data + first * indexAmount, start, end)
+            replicateIndices(source.polygons.polyStarts.data, polygonAmount, indexAmount, first,
+                             target.polygons.polyStarts.data + first * polygonAmount, start, end)
+            replicateMemory(source.polygons.polyLengths.data, polygonAmount * sizeof(unsigned int),
+                            target.polygons.polyLengths.data + first * polygonAmount, start, end)
+            replicateMemory(source.materialIndices.data, materialAmount * sizeof(long),
+                            target.materialIndices.data + first * materialAmount, start, end)
+
+cdef void replicatePoints_Vectors(Vector3 *points, Py_ssize_t pointAmount, Vector3 *vectors,
+                                  Vector3 *target, Py_ssize_t start, Py_ssize_t end) nogil:
+    cdef Py_ssize_t i, j
+    cdef Vector3 *_target
+    for i in range(start, end):
+        _target = target + i * pointAmount
+        for j in range(pointAmount):
+            _target[j].x = points[j].x + vectors[i].x
+            _target[j].y = points[j].y + vectors[i].y
+            _target[j].z = points[j].z + vectors[i].z
+
+cdef void replicatePoints_Matrices(Vector3 *points, Py_ssize_t pointAmount, Matrix4 *matrices,
+                                   Vector3 *target, Py_ssize_t start, Py_ssize_t end) nogil:
+    cdef Py_ssize_t i, j
+    cdef Vector3 *_target
+    for i in range(start, end):
+        _target = target + i * pointAmount
+        for j in range(pointAmount):
+            transformVec3AsPoint(_target + j, points + j, matrices + i)
+
+cdef void replicateNormals(Vector3 *normals, Py_ssize_t normalAmount, Matrix4 *matrices,
+                           Vector3 *target, Py_ssize_t start, Py_ssize_t end) nogil:
+    '''Translations don't change normals, so matrices can be NULL.'''
+    cdef Py_ssize_t i, j
+    cdef Vector3 *_target
+    if matrices == NULL:
+        replicateMemory(normals, normalAmount * sizeof(Vector3), target, start, end)
+        return
+    for i in range(start, end):
+        _target = target + i * normalAmount
+        for j in range(normalAmount):
+            transformVec3AsDirection(_target + j, normals + j, matrices + i)
+
+cdef void replicateIndices(unsigned int *indices, Py_ssize_t indexAmount,
+                           Py_ssize_t offsetPerInstance, Py_ssize_t firstInstance,
+                           unsigned int *target, Py_ssize_t start, Py_ssize_t end) nogil:
+    cdef Py_ssize_t i, j
+    cdef unsigned int offset
+    cdef unsigned int *_target
+    for i in range(start, end):
+        offset = <unsigned int>(offsetPerInstance * (firstInstance + i))
+        _target = target + i * indexAmount
+        for j in range(indexAmount):
+            _target[j] = indices[j] + offset
+
+cdef void replicateMemory(void *source, Py_ssize_t size, void *target,
+                          Py_ssize_t start, Py_ssize_t end) nogil:
+    cdef Py_ssize_t i
+    for i in range(start, end):
+        memcpy(<char*>target + i * size, source, size)
+
+def getInstanceChunks(Py_ssize_t amount, Py_ssize_t instanceSize):
+    cdef Py_ssize_t threadAmount = getThreadAmount()
+    if threadAmount == 1 or amount < 2 or amount * instanceSize < MIN_PARALLEL_ELEMENTS:
+        return [(0, amount)]
+    return splitRange(amount, threadAmount)
@@ -0,0 +1,77 @@
+import os
+import threading
+import numpy as np
+from unittest import TestCase, mock
+from . replicate_mesh import replicateMesh, replicateMeshInto
+from ... data_structures.meshes.mesh_data import Mesh
+from ... data_structures.lists.polygon_indices_list import PolygonIndicesList
+from ... data_structures.lists.base_lists import (
+    Vector3DList, Vector2DList, EdgeIndicesList, LongList, Matrix4x4List
+)
+
+def createTriangle():
+    vertices = Vector3DList.fromValues([(0, 0, 0), (1, 0, 0), (0, 1, 0)])
+    edges = EdgeIndicesList.fromValues([(0, 1), (1, 2), (2, 0)])
+    polygons = PolygonIndicesList.fromValues([(0, 1, 2)])
+    return Mesh(vertices, edges, polygons, LongList.fromValues([3]))
+
+def createTranslations(amount):
+    matrices = Matrix4x4List(length = amount)
+    array = matrices.asNumpyArray().reshape(amount, 4, 4)
+    array[:] = np.eye(4)
+    array[:, 0, 3] = np.arange(amount)
+    return matrices
+
+class ThreadRecordingMesh(Mesh):
+    def __init__(self, *args, **kwargs):
+        self.threads = []
+
+    def getLoopEdges(self):
+        self.threads.append(threading.current_thread())
+        return super().getLoopEdges()
+
+class TestReplicateMesh(TestCase):
+    def testCompareWithJoin(self):
+        source = createTriangle()
+        source.insertUVMap("UV", Vector2DList.fromValues([(0, 0), (1, 0), (0, 1)]))
+        mesh = replicateMesh(source, createTranslations(4))
+        joined = Mesh.join(*[source.copy() for _ in range(4)])
+        self.assertEqual(list(mesh.edges), list(joined.edges))
+        self.assertEqual(list(mesh.polygons), list(joined.polygons))
+        self.assertEqual(list(mesh.materialIndices), [3] * 4)
+        self.assertEqual(list(mesh.getLoopEdges()), list(joined.getLoopEdges()))
+        self.assertEqual(len(mesh.getUVMapPositions("UV")), 12)
+        self.assertEqual(tuple(mesh.vertices[11]), (3, 1, 0))
+
+    def testDerivedDataIsResolvedOnCallingThread(self):
+        triangle = createTriangle()
+        source = ThreadRecordingMesh(triangle.vertices, triangle.edges,
+                                     triangle.polygons, triangle.materialIndices)
+        with mock.patch.object(os, "cpu_count", lambda: 4):
+            mesh = replicateMesh(source, createTranslations(20000))
+        self.assertEqual(source.threads, [threading.current_thread()])
+        self.assertEqual(list(mesh.getLoopEdges()[-3:]), [59997, 59998, 59999])
+
+    def testVectors(self):
+        mesh = replicateMesh(createTriangle(), Vector3DList.fromValues([(0, 0, 0), (0, 0, 2)]))
+        self.assertEqual(tuple(mesh.vertices[4]), (1, 0, 2))
+
+    def testOnlyCachedNormalsAreReplicated(self):
+        source = createTriangle()
+        self.assertIsNone(replicateMesh(source, createTranslations(2)).getCachedDerivedData("Vertex Normals"))
+        source.getVertexNormals()
+        mesh = replicateMesh(source, createTranslations(2))
+        self.assertEqual(tuple(mesh.getCachedDerivedData("Vertex Normals")[5]), (0, 0, 1))
+
+    def testReplicateInto(self):
+        source = createTriangle()
+        mesh = replicateMesh(source, createTranslations(3))
+        replicateMeshInto(mesh, source, Vector3DList.fromValues([(0, 0, 5)]), 2)
+        self.assertEqual(tuple(mesh.vertices[6]), (0, 0, 5))
+        self.assertEqual(tuple(mesh.vertices[3]), (1, 0, 0))
+
+    def testReplicateIntoTooSmallMesh(self):
+        source = createTriangle()
+        mesh = replicateMesh(source, createTranslations(2))
+        with self.assertRaises(IndexError):
+            replicateMeshInto(mesh, source, createTranslations(2), 1)
@@ -1,12 +1,12 @@
 import cython
 from libc.math cimport sqrt
 from mathutils import Vector
-from mathutils.kdtree import KDTree
 from mathutils.bvhtree import BVHTree
 from ... math cimport Vector3, distanceVec3
 from ... algorithms.rotations.rotation_and_direction cimport directionToMatrix_LowLevel
 from ... data_structures cimport (
     Mesh,
+    KDTree,
     LongList,
     FloatList,
     DoubleList,
@@ -22,27 +22,36 @@ from ... math cimport (
     setMatrixTranslation,
     )
 
+# points are queried in blocks, so that only the neighbours
+# of the points in one block are in memory at the same time
+DEF QUERY_BLOCK_SIZE = 1024
+
 @cython.cdivision(True)
 def dynamicRadiusSpherePacking(Vector3DList points, float margin, float radiusMax, float radiusStep,
                                  FloatList influences, bint mask):
     cdef Py_ssize_t totalPoints = points.length
-    kdTree = buildKDTree(totalPoints, points)
     cdef DoubleList radii = DoubleList(length = totalPoints)
     radii.fill(0)
     cdef float searchRadius = max(2 * (margin + radiusMax), 0)
     cdef DoubleList distances
-    cdef LongList indices
+    cdef LongList indices, starts, lengths
     cdef float radius
-    cdef Py_ssize_t i, iterations, totalNonZeros
+    cdef Py_ssize_t i, start, iterations, totalNonZeros
+    cdef Py_ssize_t blockStart, blockEnd
 
+    kdTree = KDTree(points)
     totalNonZeros = 0
-    for i in range(totalPoints):
-        indices, distances = calculateDistancesByRange(kdTree, points.data[i], searchRadius)
-        iterations = int(radiusMax * influences.data[i] / radiusStep)
-        radius = calulateMaxRadius(iterations, margin, radiusStep, radii, indices, distances)
-        radii.data[i] = radius
-        if radius > 0:
-            totalNonZeros += 1
+    for blockStart in range(0, totalPoints, QUERY_BLOCK_SIZE):
+        blockEnd = min(blockStart + QUERY_BLOCK_SIZE, totalPoints)
+        indices, distances, starts, lengths = kdTree.findInRadius(points[blockStart:blockEnd], searchRadius)
+        for i in range(blockStart, blockEnd):
+            iterations = int(radiusMax * influences.data[i] / radiusStep)
+            start = starts.data[i - blockStart]
+            radius = calulateMaxRadius(iterations, margin, radiusStep, radii, indices, distances,
+                                       start, start + lengths.data[i - blockStart])
+            radii.data[i] = radius
+            if radius > 0:
+                totalNonZeros += 1
 
     cdef Py_ssize_t totalMatrices = totalPoints
     if mask: totalMatrices = totalNonZeros
@@ -71,25 +80,38 @@ def dynamicRadiusSpherePacking(Vector3DList points, float margin, float radiusMa
 def neighbourRadiusSpherePacking(Vector3DList points, float margin, float radiusMax, float radiusStep,
                                  FloatList influences, bint mask):
     cdef Py_ssize_t totalPoints = points.length
-    kdTree = buildKDTree(totalPoints, points)
     cdef DoubleList radii = DoubleList(length = totalPoints)
     radii.fill(0)
     cdef DoubleList distances
-    cdef LongList indices
+    cdef LongList indices, starts, lengths
     cdef float nextRadius, influence, radius
     cdef Py_ssize_t iterations = int(radiusMax / radiusStep)
-    cdef Py_ssize_t i, totalNonZeros
+    cdef Py_ssize_t i, start, end, totalNonZeros
+
+    kdTree = KDTree(points)
+    cdef float maxRadius
+    cdef Py_ssize_t blockStart, blockEnd
 
     totalNonZeros = 0
     for j in range(iterations):
         totalNonZeros = 0
-        for i in range(totalPoints):
-            nextRadius = radii.data[i] + radiusStep
-            indices, distances = calculateDistancesByRange(kdTree, points.data[i], 2 * (margin + nextRadius))
-            influence = influences.data[i]
-            if comapareRadiusDistance(margin + nextRadius * influence, radii, indices, distances):
-                radii.data[i] = nextRadius * influence
-            if radii.data[i] > 0: totalNonZeros += 1
+        for blockStart in range(0, totalPoints, QUERY_BLOCK_SIZE):
+            blockEnd = min(blockStart + QUERY_BLOCK_SIZE, totalPoints)
+            # a radius only changes when its own point is processed
+            maxRadius = 0
+            for i in range(blockStart, blockEnd):
+                maxRadius = max(maxRadius, radii.data[i])
+            indices, distances, starts, lengths = kdTree.findInRadius(points[blockStart:blockEnd],
+                max(2 * (margin + maxRadius + radiusStep), 0))
+
+            for i in range(blockStart, blockEnd):
+                nextRadius = radii.data[i] + radiusStep
+                start = starts.data[i - blockStart]
+                end = getRangeEnd(distances, start, start + lengths.data[i - blockStart], 2 * (margin + nextRadius))
+                influence = influences.data[i]
+                if comapareRadiusDistance(margin + nextRadius * influence, radii, indices, distances, start, end):
+                    radii.data[i] = nextRadius * influence
+                if radii.data[i] > 0: totalNonZeros += 1
 
     cdef Py_ssize_t totalMatrices = totalPoints
     if mask: totalMatrices = totalNonZeros
@@ -115,23 +137,33 @@ def neighbourRadiusSpherePacking(Vector3DList points, float margin, float radius
 @cython.cdivision(True)
 def fixedRadiusSpherePacking(Vector3DList points, float margin, DoubleList radii, FloatList influences, bint mask):
     cdef Py_ssize_t totalPoints = points.length
-    kdTree = buildKDTree(totalPoints, points)
-    cdef float radius, searchRadius
+    cdef float radius, searchRadius, maxSearchRadius = 0
     cdef DoubleList distances
-    cdef LongList indices
-    cdef Py_ssize_t i, totalNonZeros
+    cdef LongList indices, starts, lengths
+    cdef Py_ssize_t i, start, end, totalNonZeros
+    cdef Py_ssize_t blockStart, blockEnd
 
+    # the neighbours within the largest search radius of a block are found at once and filtered per point
+    kdTree = KDTree(points)
     totalNonZeros = 0
-    for i in range(totalPoints):
-        radius = radii.data[i] * influences.data[i]
-        searchRadius = max(2 * (radius + margin), 0)
-        indices, distances = calculateDistancesByRange(kdTree, points.data[i], searchRadius)
-        influence = influences.data[i]
-        if comapareRadiusDistance(margin + radius, radii, indices, distances):
-            radii.data[i] = radius
-            totalNonZeros += 1
-        else:
-            radii.data[i] = 0
+    for blockStart in range(0, totalPoints, QUERY_BLOCK_SIZE):
+        blockEnd = min(blockStart + QUERY_BLOCK_SIZE, totalPoints)
+        maxSearchRadius = 0
+        for i in range(blockStart, blockEnd):
+            searchRadius = 2 * (radii.data[i] * influences.data[i] + margin)
+            maxSearchRadius = max(maxSearchRadius, searchRadius)
+        indices, distances, starts, lengths = kdTree.findInRadius(points[blockStart:blockEnd], maxSearchRadius)
+
+        for i in range(blockStart, blockEnd):
+            radius = radii.data[i] * influences.data[i]
+            searchRadius = max(2 * (radius + margin), 0)
+            start = starts.data[i - blockStart]
+            end = getRangeEnd(distances, start, start + lengths.data[i - blockStart], searchRadius)
+            if comapareRadiusDistance(margin + radius, radii, indices, distances, start, end):
+                radii.data[i] = radius
+                totalNonZeros += 1
+            else:
+                radii.data[i] = 0
 
     cdef Py_ssize_t totalMatrices = totalPoints
     if mask: totalMatrices = totalNonZeros
@@ -166,7 +198,7 @@ def relaxSpherePacking(Vector3DList points, float margin, DoubleList radii, floa
     cdef float radius, totalRadius, distance, forceScale, error
     cdef Vector3 point, force
     cdef DoubleList distances
-    cdef LongList indices
+    cdef LongList indices, starts, lengths
     cdef Py_ssize_t i, j, k, count, index, totalNonZeros
 
     totalNonZeros = 0
@@ -177,14 +209,13 @@ def relaxSpherePacking(Vector3DList points, float margin, DoubleList radii, floa
 
     for k in range(iterations):
         count = 0
-        kdTree = buildKDTree(totalPoints, relaxPoints)
+        indices, distances, starts, lengths = KDTree(relaxPoints).findNNearest(relaxPoints, 1 + neighbourAmount)
         for j in range(totalPoints):
             radius = radii.data[j]
             point = relaxPoints.data[j]
-            indices, distances = calculateDistancesByAmount(kdTree, point, 1 + neighbourAmount)
 
             if radius > 0:
-                for i in range(1, indices.length):
+                for i in range(starts.data[j] + 1, starts.data[j] + lengths.data[j]):
                     index = indices.data[i]
                     distance = distances.data[i]
 
@@ -240,7 +271,7 @@ def relaxSpherePackingOnMesh(Vector3DList points, float margin, DoubleList radii
     cdef float radius, totalRadius, distance, forceScale, error, x, y, z
     cdef Vector3 point, force
     cdef DoubleList distances
-    cdef LongList indices
+    cdef LongList indices, starts, lengths
     cdef Py_ssize_t i, j, k, count, index, totalNonZeros
 
     totalNonZeros = 0
@@ -251,14 +282,13 @@ def relaxSpherePackingOnMesh(Vector3DList points, float margin, DoubleList radii
 
     for k in range(iterations):
         count = 0
-        kdTree = buildKDTree(totalPoints, relaxPoints)
+        indices, distances, starts, lengths = KDTree(relaxPoints).findNNearest(relaxPoints, 1 + neighbourAmount)
         for j in range(totalPoints):
             radius = radii.data[j]
             point = relaxPoints.data[j]
-            indices, distances = calculateDistancesByAmount(kdTree, point, 1 + neighbourAmount)
 
             if radius > 0:
-                for i in range(1, indices.length):
+                for i in range(starts.data[j] + 1, starts.data[j] + lengths.data[j]):
                     index = indices.data[i]
                     distance = distances.data[i]
 
@@ -341,58 +371,33 @@ def relaxSpherePackingOnMesh(Vector3DList points, float margin, DoubleList radii
         return matrices, newRadii, normals
 
 
-cdef float calulateMaxRadius(Py_ssize_t iterations, float margin, float radiusStep, DoubleList radii, LongList indices, DoubleList distances):
+cdef float calulateMaxRadius(Py_ssize_t iterations, float margin, float radiusStep, DoubleList radii, LongList indices, DoubleList distances,
+                             Py_ssize_t start, Py_ssize_t end):
     cdef float newRadius = 0
     cdef Py_ssize_t i
     for i in range(iterations):
-        if comapareRadiusDistance(newRadius + margin, radii, indices, distances):
+        if comapareRadiusDistance(newRadius + margin, radii, indices, distances, start, end):
             newRadius += radiusStep
         else:
             break
     return newRadius
 
-cdef bint comapareRadiusDistance(float newRadius, DoubleList radii, LongList indices, DoubleList distances):
+cdef bint comapareRadiusDistance(float newRadius, DoubleList radii, LongList indices, DoubleList distances,
+                                 Py_ssize_t start, Py_ssize_t end):
+    # the first neighbour is the point itself
     cdef bint newRadiusCheck = True
     cdef Py_ssize_t i
-    for i in range(1, distances.length):
+    for i in range(start + 1, end):
         if newRadius + radii.data[indices.data[i]] > distances.data[i]:
             newRadiusCheck = False
             break
     return newRadiusCheck
 
-cdef calculateDistancesByRange(kdTree, Vector3 searchVector, float searchRadius):
-    cdef list results = kdTree.find_range(Vector((searchVector.x, searchVector.y, searchVector.z)), searchRadius)
-    cdef Py_ssize_t lenResult = len(results)
-    cdef DoubleList distances = DoubleList(length = lenResult)
-    cdef LongList indices = LongList(length = lenResult)
-    cdef Py_ssize_t i
-    for i in range(lenResult):
-        result = results[i]
-        indices.data[i] = result[1]
-        distances.data[i] = result[2]
-    return indices, distances
-
-cdef calculateDistancesByAmount(kdTree, Vector3 searchVector, long amount):
-    cdef list results = kdTree.find_n(Vector((searchVector.x, searchVector.y, searchVector.z)), amount)
-    cdef Py_ssize_t lenResult = len(results)
-    cdef DoubleList distances = DoubleList(length = lenResult)
-    cdef LongList indices = LongList(length = lenResult)
-    cdef Py_ssize_t i
-    for i in range(lenResult):
-        result = results[i]
-        indices.data[i] = result[1]
-        distances.data[i] = result[2]
-    return indices, distances
-
-cdef buildKDTree(Py_ssize_t totalPoints, Vector3DList points):
-    kdTree = KDTree(totalPoints)
-    cdef Vector3 vector
-    cdef Py_ssize_t i
-    for i in range(totalPoints):
-        vector = points.data[i]
-        kdTree.insert(Vector((vector.x, vector.y, vector.z)), i)
-    kdTree.balance()
-    return kdTree
+cdef Py_ssize_t getRangeEnd(DoubleList distances, Py_ssize_t start, Py_ssize_t end, float radius):
+    # the neighbours of a point are sorted by distance
+    while start < end and distances.data[start] <= radius:
+        start += 1
+    return start
 
 cdef buildBVHTree(Vector3DList vertices, PolygonIndicesList polygons, epsilon):
     return BVHTree.FromPolygons(vertices, polygons, epsilon = max(epsilon, 0))
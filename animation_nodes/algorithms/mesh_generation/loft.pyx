@@ -1,5 +1,7 @@
+from libc.string cimport memcpy
 from ... math cimport Vector3, mixVec3Arrays
 from ... data_structures cimport Vector3DList, Spline, BezierSpline
+from ... data_structures.splines.sampling import sampleSplinesDistributed
 from ... utils.lists cimport findListSegment_LowLevel, findListSegment
 
 from . import grid
@@ -12,6 +14,8 @@ cdef class LinearLoft:
         public bint cyclic
         public str distributionType
         public int uniformResolution
+        Vector3DList splineLines
+        dict splineLineIndices
 
     def validate(self):
         if self.start > self.end:
@@ -51,12 +55,13 @@ cdef class LinearLoft:
         totalLineAmount = controlLines + subdivisionLines
 
         vertices = Vector3DList(length = totalLineAmount * samples)
+        self.sampleSplineLines(startIndices, endIndices)
 
         if startIndices[0] == endIndices[0]: # <- only one segment in the result
             tmp1 = Vector3DList(length = samples);
             tmp2 = Vector3DList(length = samples);
-            self.writeSplineLine(self.splines[startIndices[0]], tmp1.data)
-            self.writeSplineLine(self.splines[startIndices[1]], tmp2.data)
+            self.writeSplineLine(startIndices[0], tmp1.data)
+            self.writeSplineLine(startIndices[1], tmp2.data)
 
             self.writeMixedLine(target = vertices.data,
                     sourceA = tmp1.data,
@@ -73,23 +78,22 @@ cdef class LinearLoft:
             # TODO: speedup when startT or endT is 0 or 1
             tmp1 = Vector3DList(length = samples)
             tmp2 = Vector3DList(length = samples)
-            self.writeSplineLine(self.splines[startIndices[0]], tmp1.data)
-            self.writeSplineLine(self.splines[startIndices[1]], tmp2.data)
+            self.writeSplineLine(startIndices[0], tmp1.data)
+            self.writeSplineLine(startIndices[1], tmp2.data)
             self.writeMixedLine(target = vertices.data,
                     sourceA = tmp1.data,
                     sourceB = tmp2.data,
                     factor = startT)
-            self.writeSplineLine(self.splines[endIndices[0]], tmp1.data)
-            self.writeSplineLine(self.splines[endIndices[1]], tmp2.data)
+            self.writeSplineLine(endIndices[0], tmp1.data)
+            self.writeSplineLine(endIndices[1], tmp2.data)
             self.writeMixedLine(target = vertices.data + (totalLineAmount - 1) * samples,
                     sourceA = tmp1.data,
                     sourceB = tmp2.data,
                     factor = endT)
 
             for i in range(endIndices[0] - startIndices[0]):
-                spline = self.splines[i + startIndices[1]]
                 lineIndex = (i + 1) * (subdivisions + 1)
-                self.writeSplineLine(spline, vertices.data + lineIndex * samples)
+                self.writeSplineLine(i + startIndices[1], vertices.data + lineIndex * samples)
                 self.writeSubdivisionLines(
                         target = vertices.data + (lineIndex - subdivisions) * samples,
                         sourceA = vertices.data + (lineIndex - subdivisions - 1) * samples,
@@ -106,12 +110,24 @@ cdef class LinearLoft:
 
         return vertices
 
-    cdef writeSplineLine(self, Spline spline, Vector3* target):
+    cdef sampleSplineLines(self, long *startIndices, long *endIndices):
+        # all splines that are used are sampled in one call
+        cdef list indices = sorted({startIndices[0], endIndices[1]} |
+                                   set(range(startIndices[1], endIndices[0] + 1)))
+        cdef list splines = [self.splines[index] for index in indices]
+        cdef Spline spline
         if self.distributionType == "UNIFORM":
-            self.ensureUniformConverter(self.uniformResolution)
+            for spline in splines:
+                spline.ensureUniformConverter(self.uniformResolution)
+
+        self.splineLines = sampleSplinesDistributed(splines, self.splineSamples,
+            0, 1, self.distributionType)[0]
+        self.splineLineIndices = {index : i for i, index in enumerate(indices)}
 
-        spline.calcDistributedPoints_LowLevel(self.splineSamples, target,
-            0, 1, self.distributionType)
+    cdef writeSplineLine(self, long splineIndex, Vector3* target):
+        cdef Py_ssize_t lineIndex = self.splineLineIndices[splineIndex]
+        memcpy(target, self.splineLines.data + lineIndex * self.splineSamples,
+               self.splineSamples * sizeof(Vector3))
 
     cdef writeMixedLine(self, Vector3* target, Vector3* sourceA, Vector3* sourceB, float factor):
         mixVec3Arrays(target, sourceA, sourceB, self.splineSamples, factor)
@@ -192,28 +208,21 @@ cdef class SmoothLoft:
             for spline in self.splines:
                 spline.ensureUniformConverter(self.uniformResolution)
 
+        cdef Vector3DList splinePoints = sampleSplinesDistributed(self.splines,
+            self.splineSamples, 0, 1, self.splineDistributionType)[0]
+
         for i in range(self.splineSamples):
-            self.createSurfaceSpline(i, surfaceSplinePoints.data)
+            self.createSurfaceSpline(i, splinePoints, surfaceSplinePoints.data)
             surfaceSpline.smoothAllHandles(self.smoothness)
             self.sampleSurfaceSpline(surfaceSpline, vertices.data + i * self.surfaceSamples)
 
         return vertices
 
-    cdef createSurfaceSpline(self, float index, Vector3* _surfaceSplinePoints):
-        cdef:
-            int k
-            Spline spline
-            float t
-            float tCyclic = index / <float>self.splineSamples
-            float tNormal = index / <float>(self.splineSamples - 1)
-            bint useUniform = self.splineDistributionType == "UNIFORM"
-
+    cdef createSurfaceSpline(self, int index, Vector3DList splinePoints, Vector3* _surfaceSplinePoints):
+        # the samples of every spline are stored after each other
+        cdef int k
         for k in range(len(self.splines)):
-            spline = self.splines[k]
-            t = tCyclic if spline.cyclic else tNormal
-            if useUniform:
-                t = spline.toUniformParameter_LowLevel(t)
-            spline.evaluatePoint_LowLevel(t, _surfaceSplinePoints + k)
+            _surfaceSplinePoints[k] = splinePoints.data[k * self.splineSamples + index]
 
     cdef sampleSurfaceSpline(self, BezierSpline spline, Vector3* output):
         if self.surfaceDistributionType == "UNIFORM":
@@ -16,7 +16,8 @@ from . sockets import (AnimationNodeSocket,
 from . effects import (
     VectorizeCodeEffect,
     PrependCodeEffect,
-    ReturnDefaultsOnExceptionCodeEffect
+    ReturnDefaultsOnExceptionCodeEffect,
+    OutputCacheCodeEffect
 )
 
 from . socket_templates import (
@@ -1 +1,2 @@
-from . code_effects import VectorizeCodeEffect, PrependCodeEffect, ReturnDefaultsOnExceptionCodeEffect
+from . code_effects import (VectorizeCodeEffect, PrependCodeEffect,
+                           ReturnDefaultsOnExceptionCodeEffect, OutputCacheCodeEffect)
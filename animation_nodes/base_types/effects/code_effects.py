@@ -154,3 +154,39 @@ class ReturnDefaultsOnExceptionCodeEffect(CodeEffect):
                 else:
                     yield f"    {outputVariables[s.identifier]} = self.outputs[{i}].getDefaultValue()"
         yield "    pass"
+
+
+class OutputCacheCodeEffect(CodeEffect):
+    def apply(self, node, code, required):
+        inputVariables = node.getInputSocketVariables()
+        outputVariables = node.getOutputSocketVariables()
+        inputNames = [inputVariables[socket.identifier] for socket in node.inputs]
+        outputs = [socket for socket in node.outputs if socket.identifier in required]
+        outputNames = [outputVariables[socket.identifier] for socket in outputs]
+
+        yield "_cacheKey = self.getOutputCacheKey({}, {})".format(
+            repr(tuple(sorted(required))), self.toTupleString(inputNames))
+        yield "_cacheFound, _cachedOutputs = self.getCachedOutputs(_cacheKey)"
+        yield "if _cacheFound:"
+        yield "    {} = _cachedOutputs".format(self.toTupleString(outputNames))
+        yield from self.iterCopyLines(outputs, outputNames)
+        yield "else:"
+        yield from self.iterIndented(code)
+        storeExpressions = [self.getCopyExpression(socket, name) for socket, name in zip(outputs, outputNames)]
+        yield "    self.setCachedOutputs(_cacheKey, {})".format(self.toTupleString(storeExpressions))
+
+    def iterCopyLines(self, outputs, outputNames):
+        for socket, name in zip(outputs, outputNames):
+            expression = self.getCopyExpression(socket, name)
+            if expression != name:
+                yield "    {} = {}".format(name, expression)
+
+    def getCopyExpression(self, socket, name):
+        # the cached data must not be changed by nodes that modify their input
+        if socket.isCopyable() and any(target.dataIsModified for target in socket.dataTargets):
+            return socket.getCopyExpression().replace("value", name)
+        return name
+
+    def toTupleString(self, names):
+        if len(names) == 0: return "()"
+        return "({},)".format(", ".join(names))
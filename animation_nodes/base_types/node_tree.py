@@ -10,6 +10,7 @@ from .. events import treeChanged, isRendering, propertyChanged
 from .. preferences import getBlenderVersion, getAnimationNodesVersion
 from .. utils.blender_ui import isViewportRendering, isInterfaceLocked
 from .. tree_info import getNetworksByNodeTree, getSubprogramNetworksByNodeTree
+from .. execution.measurements import registerTreeExecution
 from .. execution.units import getMainUnitsByNodeTree, setupExecutionUnits, finishExecutionUnits
 
 
@@ -101,6 +102,7 @@ class AnimationNodeTree(bpy.types.NodeTree):
             if not success:
                 allExecutionsSuccessfull = False
         end = time.perf_counter()
+        registerTreeExecution(self.name, self.scene.frame_current, start, end - start)
 
         if allExecutionsSuccessfull:
             self.lastExecutionInfo.executionTime = end - start
@@ -6,6 +6,7 @@ import functools
 from bpy.props import *
 from collections import defaultdict
 from ... import tree_info
+from ... events import executionCodeChanged
 from ... utils.handlers import eventHandler
 from ... ui.node_colors import colorAllNodes
 from .. socket_templates import SocketTemplate
@@ -16,13 +17,21 @@ from ... sockets.info import toIdName as toSocketIdName
 from ... utils.attributes import setattrRecursive, getattrRecursive
 from ... operators.dynamic_operators import getInvokeFunctionOperator
 from ... utils.nodes import getAnimationNodeTrees, iterAnimationNodes, idToSocket
-from .. effects import PrependCodeEffect, ReturnDefaultsOnExceptionCodeEffect
+from ... utils.pretty_strings import formatBytes
+from .. effects import PrependCodeEffect, ReturnDefaultsOnExceptionCodeEffect, OutputCacheCodeEffect
 
 from ... utils.blender_ui import (
     getNodeCornerLocation_BottomLeft,
     getNodeCornerLocation_BottomRight
 )
 
+from ... execution.cache import (
+    getNodeOutputCache,
+    getNodeOutputCacheMemory,
+    clearNodeOutputCache
+)
+from ... execution.incremental import getNodePropertiesKey
+from ... utils.lru_cache import toHashableKey
 from ... execution.measurements import (
     getMinExecutionTimeString,
     getMeasurementResultString
@@ -42,6 +51,10 @@ class AnimationNode:
     def useNetworkColorChanged(self, context):
         colorAllNodes()
 
+    def useOutputCacheChanged(self, context):
+        clearNodeOutputCache(self.identifier)
+        executionCodeChanged()
+
     # unique string for each node; don't change it at all
     identifier: StringProperty(name = "Identifier", default = "")
     inInvalidNetwork: BoolProperty(name = "In Invalid Network", default = False)
@@ -51,13 +64,29 @@ class AnimationNode:
     activeInputIndex: IntProperty()
     activeOutputIndex: IntProperty()
 
+    # outputs are reused when the node is executed with the same inputs again
+    useOutputCache: BoolProperty(name = "Cache Outputs", default = False,
+        description = "Reuse the outputs of previous executions with the same inputs",
+        update = useOutputCacheChanged)
+    outputCacheMaxEntries: IntProperty(name = "Max Entries", default = 25, min = 0,
+        description = "Maximum amount of cached results (0 = unlimited)")
+    outputCacheMaxMemory: FloatProperty(name = "Max Memory (MB)", default = 256, min = 0,
+        description = "Maximum estimated memory used by the cached results (0 = unlimited)")
+
     searchTags = []
     onlySearchTags = False
 
     # can contain: 'NO_EXECUTION', 'NOT_IN_SUBPROGRAM',
-    #              'NO_AUTO_EXECUTION'
+    #              'NO_AUTO_EXECUTION', 'NO_INCREMENTAL_EXECUTION',
+    #              'THREAD_SAFE'
+    # only nodes whose work releases the GIL should be 'THREAD_SAFE',
+    # their execution functions must not read node properties
     options = set()
 
+    # True when the node does not use its inputs in the current state,
+    # nodes that are only linked to these inputs are not executed
+    ignoresInputs = False
+
     # can be "NONE", "ALWAYS" or "HIDDEN_ONLY"
     dynamicLabelType = "NONE"
 
@@ -172,6 +201,7 @@ class AnimationNode:
     def free(self):
         self.delete()
         self._clear()
+        clearNodeOutputCache(self.identifier)
 
     def draw_buttons(self, context, layout):
         if self.inInvalidNetwork: layout.label(text = "Invalid Network", icon = "ERROR")
@@ -593,6 +623,50 @@ class AnimationNode:
         if errorType == "EXCEPTION":
             yield ReturnDefaultsOnExceptionCodeEffect("self.ControlledExecutionException")
 
+        # has to be the outermost effect so that a cache hit skips everything else
+        if self.useOutputCache and self.canCacheOutputs:
+            yield OutputCacheCodeEffect()
+
+
+    # Output Cache
+    ####################################################
+
+    @property
+    def canCacheOutputs(self):
+        if "NO_INCREMENTAL_EXECUTION" in self.options: return False
+        if len(self.outputs) == 0: return False
+        return all(socket.storable for socket in self.sockets)
+
+    def getOutputCacheKey(self, required, inputs):
+        try: return (required, getNodePropertiesKey(self), toHashableKey(inputs))
+        except TypeError: return None
+
+    def getCachedOutputs(self, key):
+        if key is None: return False, None
+        return getNodeOutputCache(self).lookup(key)
+
+    def setCachedOutputs(self, key, outputs):
+        if key is None: return
+        getNodeOutputCache(self).set(key, outputs)
+
+    def drawOutputCacheSettings(self, layout):
+        if not self.canCacheOutputs: return
+
+        box = layout.box()
+        box.prop(self, "useOutputCache")
+        if not self.useOutputCache: return
+
+        col = box.column(align = True)
+        col.prop(self, "outputCacheMaxEntries")
+        col.prop(self, "outputCacheMaxMemory")
+
+        row = box.row(align = True)
+        row.label(text = "Used: " + formatBytes(getNodeOutputCacheMemory(self.identifier)))
+        self.invokeFunction(row, "clearOutputCache", text = "", icon = "TRASH")
+
+    def clearOutputCache(self):
+        clearNodeOutputCache(self.identifier)
+
 
 
 # Non-Persistent data (will be removed when Blender is closed)
@@ -7,10 +7,14 @@ from . data_structures.virtual_list.virtual_clists cimport *
 
 from . data_structures.default_lists.c_default_list cimport CDefaultList
 from . data_structures.meshes.mesh_data cimport Mesh
+from . data_structures.meshes.mesh_attributes cimport MeshAttributes
+from . data_structures.meshes.instanced_mesh cimport InstancedMesh
+from . data_structures.kd_tree.kd_tree cimport KDTree
 
 from . data_structures.splines.base_spline cimport Spline
 from . data_structures.splines.poly_spline cimport PolySpline
 from . data_structures.splines.bezier_spline cimport BezierSpline
+from . data_structures.splines.spline_list cimport SplineList
 
 from . data_structures.falloffs.evaluation cimport FalloffEvaluator
 from . data_structures.falloffs.falloff_base cimport Falloff, BaseFalloff, CompoundFalloff
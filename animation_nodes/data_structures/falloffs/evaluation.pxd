@@ -1,5 +1,6 @@
 cdef class FalloffEvaluator:
     cdef str sourceType
+    cdef bint threadSafe
 
     cdef float evaluate(self, void *value, Py_ssize_t index)
     cdef pyEvaluate(self, object value, Py_ssize_t index)
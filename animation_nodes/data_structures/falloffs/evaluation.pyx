@@ -1,5 +1,7 @@
 from cpython.mem cimport PyMem_Malloc, PyMem_Free
 from cpython.ref cimport PyObject, Py_INCREF, Py_DECREF
+from libc.math cimport INFINITY
+from ... utils.parallel import getThreadAmount, splitRange, runParts
 
 from . falloff_base cimport Falloff
 from . falloff_base cimport BaseFalloff, CompoundFalloff
@@ -12,16 +14,21 @@ from . types cimport (
     getPyConversionFunction,
     getSizeOfFalloffDataType,
     PyConversionFunction,
-    getConvertListFunction
+    getConvertListFunction,
+    ConvertList
 )
 
-from ... utils.pointers cimport pointerToInt, intToPointer
 from ... math cimport Matrix4, Vector3, toVector3, toMatrix4
 
 ctypedef float (*EvaluatorFunction)(void *settings, void *value, Py_ssize_t index)
 ctypedef void (*ListEvaluatorFunction)(void *settings, void *values, Py_ssize_t startIndex,
                                        Py_ssize_t amount, float *target)
 
+# Lists are evaluated in chunks of this many elements. Compound falloffs only
+# need a buffer of this size per dependency instead of a full length list,
+# so the intermediate results stay in the cache, even for deep falloff trees.
+DEF CHUNK_SIZE = 4096
+
 
 # Interface for other files
 #########################################################
@@ -54,7 +61,14 @@ cdef class FalloffEvaluator:
     def evaluateList(self, CList values, Py_ssize_t startIndex = 0):
         cdef Py_ssize_t amount = values.getLength()
         cdef FloatList result = FloatList(length = amount)
-        self.evaluateList_LowLevel(values.getPointer(), startIndex, amount, result.data)
+        cdef Py_ssize_t elementSize = getSizeOfFalloffDataType(self.sourceType)
+        cdef list parts = getParallelParts(amount) if self.threadSafe else [(0, amount)]
+
+        def evaluatePart(Py_ssize_t start, Py_ssize_t end):
+            self.evaluateList_LowLevel(<char*>values.getPointer() + start * elementSize,
+                                       startIndex + start, end - start, result.data + start)
+
+        runParts(evaluatePart, parts)
         return result
 
     def __call__(self, object value, Py_ssize_t index):
@@ -102,6 +116,7 @@ cdef createFalloffEvaluator(Falloff falloff, str sourceType, bint clamped = Fals
         ListEvaluatorFunction listFunction
         void *listSettings
 
+    falloff = optimizeFalloff(falloff)
     createEvaluatorFunction(falloff, sourceType, clamped, &function, &settings)
     createListEvaluatorFunction(falloff, sourceType, clamped, &listFunction, &listSettings)
 
@@ -113,11 +128,237 @@ cdef createFalloffEvaluator(Falloff falloff, str sourceType, bint clamped = Fals
     evaluator.listSettings = listSettings
 
     evaluator.sourceType = sourceType
+    evaluator.threadSafe = isThreadSafeFalloff(falloff)
     evaluator.preparePyConversion()
 
     return evaluator
 
 
+# Parallel List Evaluation
+#########################################################
+
+# Lists of thread safe falloffs are split into one part per thread when they
+# have at least this many elements. Every part uses its own chunk buffers.
+DEF MIN_PARALLEL_ELEMENTS = 65536
+
+def getParallelParts(Py_ssize_t amount):
+    cdef Py_ssize_t threadAmount = getThreadAmount()
+    if threadAmount == 1 or amount < MIN_PARALLEL_ELEMENTS:
+        return [(0, amount)]
+    return splitRange(amount, min(threadAmount, amount // CHUNK_SIZE))
+
+cdef bint isThreadSafeFalloff(Falloff falloff):
+    if not falloff.isThreadSafe():
+        return False
+    if isinstance(falloff, CompoundFalloff):
+        for dependency in (<CompoundFalloff>falloff).getDependencies():
+            if not isThreadSafeFalloff(dependency):
+                return False
+    return True
+
+
+#########################################################
+# Optimization
+#########################################################
+
+cpdef Falloff optimizeFalloff(Falloff falloff):
+    '''
+    Returns a falloff that evaluates to the same values with fewer steps.
+    Compound falloffs that only depend on constant falloffs are folded into a
+    constant and chains of affine falloffs and clamps are collapsed into one.
+    A falloff that is used multiple times in the tree is optimized only once.
+    '''
+    return optimizeFalloff_Memoized(falloff, {})
+
+cdef Falloff optimizeFalloff_Memoized(Falloff falloff, dict optimizedFalloffs):
+    cdef Falloff result
+    key = id(falloff)
+    if key not in optimizedFalloffs:
+        if isinstance(falloff, CompoundFalloff):
+            result = optimizeCompoundFalloff(falloff, optimizedFalloffs)
+        else:
+            result = falloff
+        optimizedFalloffs[key] = result
+    return optimizedFalloffs[key]
+
+cdef Falloff optimizeCompoundFalloff(CompoundFalloff falloff, dict optimizedFalloffs):
+    cdef list originalDependencies = falloff.getDependencies()
+    cdef list clampingRequirements = falloff.getClampingRequirements()
+    cdef list dependencies = []
+    cdef Falloff dependency
+    cdef float factor, offset
+    cdef AffineFalloff affine
+
+    for dependency, clampRequired in zip(originalDependencies, clampingRequirements):
+        dependency = optimizeFalloff_Memoized(dependency, optimizedFalloffs)
+        if isConstantFalloff(dependency) and clampRequired and not dependency.clamped:
+            dependency = FoldedConstantFalloff(clampValue(getConstantValue(dependency)))
+        dependencies.append(dependency)
+
+    if len(dependencies) > 0 and all(isConstantFalloff(d) for d in dependencies):
+        return FoldedConstantFalloff(evaluateWithConstants(falloff, dependencies))
+
+    if len(dependencies) == 1 and falloff.getAffineMapping(&factor, &offset):
+        dependency = dependencies[0]
+        if isinstance(dependency, AffineFalloff):
+            affine = (<AffineFalloff>dependency).copy()
+        else:
+            affine = AffineFalloff(dependency)
+        if clampingRequirements[0] and not dependency.clamped:
+            affine.clampResult(0, 1)
+        affine.transformResult(factor, offset)
+        return affine
+
+    if any(a is not b for a, b in zip(dependencies, originalDependencies)):
+        return ReplacedDependenciesFalloff(falloff, dependencies, clampingRequirements)
+    return falloff
+
+cdef bint isConstantFalloff(Falloff falloff):
+    return isinstance(falloff, BaseFalloff) and (<BaseFalloff>falloff).isConstant()
+
+cdef float getConstantValue(Falloff falloff):
+    return (<BaseFalloff>falloff).evaluate(NULL, 0)
+
+cdef float evaluateWithConstants(CompoundFalloff falloff, list dependencies):
+    cdef Py_ssize_t i
+    cdef float result
+    cdef float *dependencyResults = <float*>PyMem_Malloc(sizeof(float) * len(dependencies))
+    for i in range(len(dependencies)):
+        dependencyResults[i] = getConstantValue(dependencies[i])
+    result = falloff.evaluate(dependencyResults)
+    PyMem_Free(dependencyResults)
+    return result
+
+cdef inline float clampValue(float value):
+    if value > 1: return 1
+    if value < 0: return 0
+    return value
+
+
+cdef class FoldedConstantFalloff(BaseFalloff):
+    cdef float value
+
+    def __cinit__(self, float value):
+        self.value = value
+        self.clamped = 0 <= value <= 1
+        self.dataType = "NONE"
+
+    cdef float evaluate(self, void *object, Py_ssize_t index):
+        return self.value
+
+    cdef void evaluateList(self, void *values, Py_ssize_t startIndex,
+                           Py_ssize_t amount, float *target):
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(amount):
+                target[i] = self.value
+
+    cdef bint isConstant(self):
+        return True
+
+    cdef bint isThreadSafe(self):
+        return True
+
+cdef class AffineFalloff(CompoundFalloff):
+    '''
+    Calculates min(max(x * factor + offset, low), high).
+    Without clamping, low and high are infinite.
+    '''
+    cdef Falloff falloff
+    cdef float factor, offset
+    cdef float low, high
+
+    def __cinit__(self, Falloff falloff):
+        self.falloff = falloff
+        self.factor = 1
+        self.offset = 0
+        self.low = -INFINITY
+        self.high = INFINITY
+        self.updateClamped()
+
+    cdef AffineFalloff copy(self):
+        cdef AffineFalloff affine = AffineFalloff(self.falloff)
+        affine.factor = self.factor
+        affine.offset = self.offset
+        affine.low = self.low
+        affine.high = self.high
+        affine.clamped = self.clamped
+        return affine
+
+    cdef transformResult(self, float factor, float offset):
+        cdef float a, b
+        self.factor *= factor
+        self.offset = self.offset * factor + offset
+        if factor == 0:
+            self.low = self.high = offset
+        else:
+            a = self.low * factor + offset
+            b = self.high * factor + offset
+            self.low, self.high = min(a, b), max(a, b)
+        self.updateClamped()
+
+    cdef clampResult(self, float low, float high):
+        self.low = min(max(self.low, low), high)
+        self.high = min(max(self.high, low), high)
+        self.updateClamped()
+
+    cdef updateClamped(self):
+        if self.falloff.clamped:
+            self.clamped = (0 <= evaluateAffine(self, 0) <= 1 and
+                            0 <= evaluateAffine(self, 1) <= 1)
+        else:
+            self.clamped = 0 <= self.low and self.high <= 1
+
+    cdef list getDependencies(self):
+        return [self.falloff]
+
+    cdef float evaluate(self, float *dependencyResults):
+        return evaluateAffine(self, dependencyResults[0])
+
+    cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target):
+        cdef float *data = dependencyResults[0]
+        cdef Py_ssize_t i
+        with nogil:
+            for i in range(amount):
+                target[i] = evaluateAffine(self, data[i])
+
+    cdef bint isThreadSafe(self):
+        return True
+
+cdef inline float evaluateAffine(AffineFalloff self, float x) nogil:
+    cdef float value = x * self.factor + self.offset
+    if value < self.low: return self.low
+    if value > self.high: return self.high
+    return value
+
+cdef class ReplacedDependenciesFalloff(CompoundFalloff):
+    '''Evaluates a compound falloff with optimized dependencies.'''
+    cdef CompoundFalloff falloff
+    cdef list dependencies
+    cdef list clampingRequirements
+
+    def __cinit__(self, CompoundFalloff falloff, list dependencies, list clampingRequirements):
+        self.falloff = falloff
+        self.dependencies = dependencies
+        self.clampingRequirements = clampingRequirements
+        self.clamped = falloff.clamped
+
+    cdef list getDependencies(self):
+        return self.dependencies
+
+    cdef list getClampingRequirements(self):
+        return self.clampingRequirements
+
+    cdef float evaluate(self, float *dependencyResults):
+        return self.falloff.evaluate(dependencyResults)
+
+    cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target):
+        self.falloff.evaluateList(dependencyResults, amount, target)
+
+    cdef bint isThreadSafe(self):
+        return self.falloff.isThreadSafe()
+
+
 #########################################################
 # Single Evaluation
 #########################################################
@@ -306,83 +547,194 @@ cdef float evaluateClamping(void *settings, void *value, Py_ssize_t index):
 cdef createListEvaluatorFunction(Falloff falloff, str sourceType, bint clamped,
                                  ListEvaluatorFunction *outFunction, void **outSettings):
 
+    cdef ListEvaluationPlan plan = ListEvaluationPlan(falloff, sourceType, clamped)
     cdef ListEvaluatorSettings *settings
     settings = <ListEvaluatorSettings*>PyMem_Malloc(sizeof(ListEvaluatorSettings))
-    settings.falloff = <PyObject*>falloff
-    settings.sourceType = <PyObject*>sourceType
-    Py_INCREF(sourceType)
+    settings.plan = <PyObject*>plan
+    Py_INCREF(plan)
 
     outFunction[0] = evaluateList
     outSettings[0] = settings
 
 cdef freeListEvaluatorFunction(ListEvaluatorFunction function, void *_settings):
     cdef ListEvaluatorSettings *settings = <ListEvaluatorSettings*>_settings
-    Py_DECREF(<object>settings.sourceType)
+    Py_DECREF(<object>settings.plan)
     PyMem_Free(settings)
 
 cdef struct ListEvaluatorSettings:
-    PyObject *falloff
-    PyObject *sourceType
+    PyObject *plan
 
 
 cdef void evaluateList(void *_settings, void *values, Py_ssize_t startIndex,
                        Py_ssize_t amount, float *target):
     cdef ListEvaluatorSettings *settings = <ListEvaluatorSettings*>_settings
-    cdef Falloff falloff = <Falloff>settings.falloff
-    cdef str sourceType = <str>settings.sourceType
+    (<ListEvaluationPlan>settings.plan).evaluate(values, startIndex, amount, target)
 
-    cdef set dataTypes = getBaseFalloffTypes(falloff)
 
-    cdef dict preparedLists
-    cdef set listsToFree
-    preparedLists, listsToFree = getListsForDataTypes(sourceType, dataTypes, values, amount)
+cdef class ListEvaluationStep:
+    cdef Falloff falloff
+    cdef bint isBaseFalloff
+    cdef bint isConstant
+    cdef bint clampResult
+    cdef Py_ssize_t dataTypeIndex
+    cdef Py_ssize_t *dependencies
+    cdef Py_ssize_t dependencyAmount
 
-    evaluateList_UnknownType(falloff, preparedLists, startIndex, amount, target)
-
-    freeListsForDataTypes(preparedLists, listsToFree)
-
-cdef evaluateList_UnknownType(Falloff falloff, dict preparedLists, Py_ssize_t startIndex,
-                              Py_ssize_t amount, float *target):
-    if isinstance(falloff, BaseFalloff):
-        evaluateList_BaseFalloff(falloff, preparedLists, startIndex, amount, target)
-    elif isinstance(falloff, CompoundFalloff):
-        evaluateList_CompoundFalloff(falloff, preparedLists, startIndex, amount, target)
-
-cdef evaluateList_BaseFalloff(BaseFalloff falloff, dict preparedLists, Py_ssize_t startIndex,
-                              Py_ssize_t amount, float *target):
-    cdef void *data = intToPointer(preparedLists[falloff.dataType])
-    falloff.evaluateList(data, startIndex, amount, target)
-
-cdef evaluateList_CompoundFalloff(CompoundFalloff falloff, dict preparedLists,
-                                  Py_ssize_t startIndex, Py_ssize_t amount, float *target):
-    cdef list dependencies = falloff.getDependencies()
-    cdef list clampingRequirements = falloff.getClampingRequirements()
-    cdef list subResults = evaluateList_UnkownType_Multiple(dependencies, preparedLists,
-                                                            startIndex, amount)
-
-    cdef Falloff subFalloff
-    for subFalloff, subResult, clampRequired in zip(dependencies, subResults, clampingRequirements):
-        if clampRequired and not subFalloff.clamped:
-            subResult.clamp(0, 1)
-
-    cdef float **depsResults = <float**>PyMem_Malloc(sizeof(float*) * len(dependencies))
+    def __dealloc__(self):
+        PyMem_Free(self.dependencies)
+
+cdef class ListEvaluationPlan:
+    '''
+    The falloff tree flattened into a list of steps. The dependencies of a
+    compound falloff always come before it, the last step is the falloff itself.
+    Every step writes into its own chunk buffer. Falloffs that are used multiple
+    times are evaluated once per chunk and constant falloffs only once per call.
+    '''
+    cdef str sourceType
+    cdef list dataTypes
+    cdef list steps
+    cdef Py_ssize_t maxDependencyAmount
+    cdef ConvertList *convertFunctions
+    cdef Py_ssize_t *dataTypeSizes
+
+    def __cinit__(self, Falloff falloff, str sourceType, bint clamped):
+        cdef Py_ssize_t i
+        self.sourceType = sourceType
+        self.dataTypes = list(getBaseFalloffTypes(falloff))
+        self.steps = []
+        self.maxDependencyAmount = 0
+        self.insertSteps(falloff, clamped and not falloff.clamped, {})
+
+        self.convertFunctions = <ConvertList*>PyMem_Malloc(sizeof(ConvertList) * len(self.dataTypes))
+        self.dataTypeSizes = <Py_ssize_t*>PyMem_Malloc(sizeof(Py_ssize_t) * len(self.dataTypes))
+        for i, dataType in enumerate(self.dataTypes):
+            self.dataTypeSizes[i] = getSizeOfFalloffDataType(dataType)
+            if typeConversionRequired(sourceType, dataType):
+                self.convertFunctions[i] = getConvertListFunction(sourceType, dataType)
+            else:
+                self.convertFunctions[i] = NULL
 
+    def __dealloc__(self):
+        PyMem_Free(self.convertFunctions)
+        PyMem_Free(self.dataTypeSizes)
+
+    cdef Py_ssize_t insertSteps(self, Falloff falloff, bint clampResult, dict stepIndices) except -1:
+        cdef ListEvaluationStep step = ListEvaluationStep()
+        cdef list dependencies, clampingRequirements
+        cdef Falloff dependency
+        cdef Py_ssize_t i
+
+        key = (id(falloff), clampResult)
+        if key in stepIndices:
+            return stepIndices[key]
+
+        step.falloff = falloff
+        step.clampResult = clampResult
+        if isinstance(falloff, BaseFalloff):
+            step.isBaseFalloff = True
+            step.isConstant = (<BaseFalloff>falloff).isConstant()
+            step.dataTypeIndex = self.dataTypes.index((<BaseFalloff>falloff).dataType)
+        elif isinstance(falloff, CompoundFalloff):
+            dependencies = (<CompoundFalloff>falloff).getDependencies()
+            clampingRequirements = (<CompoundFalloff>falloff).getClampingRequirements()
+            step.dependencyAmount = len(dependencies)
+            step.dependencies = <Py_ssize_t*>PyMem_Malloc(sizeof(Py_ssize_t) * step.dependencyAmount)
+            for i in range(step.dependencyAmount):
+                dependency = dependencies[i]
+                step.dependencies[i] = self.insertSteps(dependency,
+                    clampingRequirements[i] and not dependency.clamped, stepIndices)
+            self.maxDependencyAmount = max(self.maxDependencyAmount, step.dependencyAmount)
+
+        self.steps.append(step)
+        stepIndices[key] = len(self.steps) - 1
+        return len(self.steps) - 1
+
+    cdef evaluate(self, void *values, Py_ssize_t startIndex, Py_ssize_t amount, float *target):
+        cdef:
+            Py_ssize_t i
+            Py_ssize_t typeAmount = len(self.dataTypes)
+            Py_ssize_t sourceSize = getSizeOfFalloffDataType(self.sourceType)
+            Py_ssize_t chunkStart, chunkAmount
+            float *results = <float*>PyMem_Malloc(sizeof(float) * CHUNK_SIZE * len(self.steps))
+            float **dependencyResults = <float**>PyMem_Malloc(sizeof(float*) * self.maxDependencyAmount)
+            void **chunkData = <void**>PyMem_Malloc(sizeof(void*) * typeAmount)
+            void **convertedData = <void**>PyMem_Malloc(sizeof(void*) * typeAmount)
+
+        for i in range(typeAmount):
+            if self.convertFunctions[i] == NULL:
+                convertedData[i] = NULL
+            else:
+                convertedData[i] = PyMem_Malloc(CHUNK_SIZE * self.dataTypeSizes[i])
+
+        try:
+            self.evaluateConstants(results)
+            for chunkStart in range(0, amount, CHUNK_SIZE):
+                chunkAmount = min(CHUNK_SIZE, amount - chunkStart)
+                prepareChunkData(self, <char*>values + chunkStart * sourceSize,
+                                 chunkAmount, chunkData, convertedData)
+                self.evaluateChunk(chunkData, startIndex + chunkStart, chunkAmount,
+                                   results, dependencyResults, target + chunkStart)
+        finally:
+            for i in range(typeAmount):
+                PyMem_Free(convertedData[i])
+            PyMem_Free(convertedData)
+            PyMem_Free(chunkData)
+            PyMem_Free(dependencyResults)
+            PyMem_Free(results)
+
+    cdef evaluateConstants(self, float *results):
+        cdef ListEvaluationStep step
+        cdef Py_ssize_t i
+        cdef float *stepTarget
+
+        for i in range(len(self.steps) - 1):
+            step = self.steps[i]
+            if step.isConstant:
+                stepTarget = results + i * CHUNK_SIZE
+                (<BaseFalloff>step.falloff).evaluateList(NULL, 0, CHUNK_SIZE, stepTarget)
+                if step.clampResult:
+                    clampValues(stepTarget, CHUNK_SIZE)
+
+    cdef evaluateChunk(self, void **chunkData, Py_ssize_t startIndex, Py_ssize_t amount,
+                       float *results, float **dependencyResults, float *target):
+        cdef ListEvaluationStep step
+        cdef Py_ssize_t i, j
+        cdef Py_ssize_t stepAmount = len(self.steps)
+        cdef float *stepTarget
+
+        for i in range(stepAmount):
+            step = self.steps[i]
+            if step.isConstant and i < stepAmount - 1:
+                continue
+            stepTarget = target if i == stepAmount - 1 else results + i * CHUNK_SIZE
+
+            if step.isBaseFalloff:
+                (<BaseFalloff>step.falloff).evaluateList(chunkData[step.dataTypeIndex],
+                                                         startIndex, amount, stepTarget)
+            else:
+                for j in range(step.dependencyAmount):
+                    dependencyResults[j] = results + step.dependencies[j] * CHUNK_SIZE
+                (<CompoundFalloff>step.falloff).evaluateList(dependencyResults, amount, stepTarget)
+
+            if step.clampResult:
+                with nogil:
+                    clampValues(stepTarget, amount)
+
+cdef prepareChunkData(ListEvaluationPlan plan, void *values, Py_ssize_t amount,
+                      void **chunkData, void **convertedData):
     cdef Py_ssize_t i
-    for i in range(len(dependencies)):
-        depsResults[i] = (<FloatList>subResults[i]).data
-    falloff.evaluateList(depsResults, amount, target)
-
-    PyMem_Free(depsResults)
+    for i in range(len(plan.dataTypes)):
+        if plan.convertFunctions[i] == NULL:
+            chunkData[i] = values
+        else:
+            plan.convertFunctions[i](values, convertedData[i], amount)
+            chunkData[i] = convertedData[i]
 
-cdef evaluateList_UnkownType_Multiple(list falloffs, dict preparedLists,
-                                      Py_ssize_t startIndex, Py_ssize_t amount):
-    cdef list results = []
-    cdef FloatList result
-    for falloff in falloffs:
-        result = FloatList(length = amount)
-        evaluateList_UnknownType(falloff, preparedLists, startIndex, amount, result.data)
-        results.append(result)
-    return results
+cdef void clampValues(float *values, Py_ssize_t amount) nogil:
+    cdef Py_ssize_t i
+    for i in range(amount):
+        if values[i] > 1: values[i] = 1
+        elif values[i] < 0: values[i] = 0
 
 cdef set getBaseFalloffTypes(Falloff falloff):
     if isinstance(falloff, BaseFalloff):
@@ -392,22 +744,3 @@ cdef set getBaseFalloffTypes(Falloff falloff):
     if isinstance(falloff, CompoundFalloff):
         deps = (<CompoundFalloff>falloff).getDependencies()
         return {t for d in deps for t in getBaseFalloffTypes(d)}
-
-cdef getListsForDataTypes(str sourceType, set dataTypes, void *values, Py_ssize_t amount):
-    cdef dict lists = {}
-    cdef set listsToFree = set()
-    cdef void *ptr
-    for dataType in dataTypes:
-        if typeConversionRequired(sourceType, dataType):
-            elementSize = getSizeOfFalloffDataType(dataType)
-            ptr = PyMem_Malloc(amount * elementSize)
-            getConvertListFunction(sourceType, dataType)(values, ptr, amount)
-            lists[dataType] = pointerToInt(ptr)
-            listsToFree.add(dataType)
-        else:
-            lists[dataType] = pointerToInt(values)
-    return lists, listsToFree
-
-cdef freeListsForDataTypes(dict lists, set listsToFree):
-    for dataType in listsToFree:
-        PyMem_Free(intToPointer(lists[dataType]))
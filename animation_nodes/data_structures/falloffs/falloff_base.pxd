@@ -5,15 +5,18 @@ cdef class Falloff:
     cdef dict evaluators
 
     cpdef FalloffEvaluator getEvaluator(self, str sourceType, bint clamped = ?)
+    cdef bint isThreadSafe(self)
 
 cdef class BaseFalloff(Falloff):
     cdef str dataType
     cdef float evaluate(self, void *object, Py_ssize_t index)
     cdef void evaluateList(self, void *objects, Py_ssize_t startIndex,
                            Py_ssize_t amount, float *target)
+    cdef bint isConstant(self)
 
 cdef class CompoundFalloff(Falloff):
     cdef list getDependencies(self)
     cdef list getClampingRequirements(self)
     cdef float evaluate(self, float *dependencyResults)
     cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target)
+    cdef bint getAffineMapping(self, float *factor, float *offset)
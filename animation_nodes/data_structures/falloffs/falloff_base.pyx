@@ -12,6 +12,13 @@ cdef class Falloff:
             self.evaluators[settings] = FalloffEvaluator.create(self, sourceType, clamped)
         return self.evaluators[settings]
 
+    cdef bint isThreadSafe(self):
+        '''
+        Falloffs that can be evaluated on multiple threads at the same time return True.
+        They should release the GIL in evaluateList to actually run in parallel.
+        '''
+        return False
+
 
 cdef class BaseFalloff(Falloff):
     cdef float evaluate(self, void *object, Py_ssize_t index):
@@ -24,6 +31,10 @@ cdef class BaseFalloff(Falloff):
         for i in range(amount):
             target[i] = self.evaluate(<char*>objects + i * elementSize, i + startIndex)
 
+    cdef bint isConstant(self):
+        '''Constant falloffs are evaluated only once when the evaluator is created.'''
+        return False
+
     def __repr__(self):
         return "{}".format(type(self).__name__)
 
@@ -50,6 +61,13 @@ cdef class CompoundFalloff(Falloff):
 
         free(buffer)
 
+    cdef bint getAffineMapping(self, float *factor, float *offset):
+        '''
+        Falloffs that calculate dependencyResults[0] * factor + offset
+        can return True and set the factor and offset.
+        Chains of these falloffs are collapsed when the evaluator is created.
+        '''
+        return False
 
     def __repr__(self):
         return "\n".join(self._iterReprLines())
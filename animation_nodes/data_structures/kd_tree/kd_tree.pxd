@@ -0,0 +1,37 @@
+from ... math cimport Vector3
+from .. lists.base_lists cimport Vector3DList, LongList
+
+cdef struct KDTreeNode:
+    Py_ssize_t start, end
+    Py_ssize_t left, right
+    int axis
+    float split
+
+cdef struct Neighbour:
+    double distanceSquared
+    Py_ssize_t index
+
+cdef struct NeighbourBuffer:
+    Neighbour *data
+    Py_ssize_t length, capacity
+
+cdef class KDTree:
+    cdef:
+        readonly Vector3DList points
+        Vector3 *treePoints
+        Py_ssize_t *treeIndices
+        KDTreeNode *nodes
+        Py_ssize_t nodeAmount
+
+    cdef Py_ssize_t buildNode(self, Py_ssize_t start, Py_ssize_t end) nogil
+    cdef toResultTuple(self, Neighbour *neighbour)
+
+    cdef Py_ssize_t findNearest_LowLevel(self, Vector3 *point, double *distanceSquared) nogil
+    cdef Py_ssize_t findNNearest_LowLevel(self, Vector3 *point, Py_ssize_t amount, Neighbour *result) nogil
+    cdef bint findInRadius_LowLevel(self, Vector3 *point, double radius, NeighbourBuffer *result) nogil
+
+    cdef void searchNearest(self, Py_ssize_t nodeIndex, Vector3 *point, Neighbour *best) nogil
+    cdef void searchNNearest(self, Py_ssize_t nodeIndex, Vector3 *point, Neighbour *heap,
+                             Py_ssize_t *foundAmount, Py_ssize_t amount) nogil
+    cdef bint searchInRadius(self, Py_ssize_t nodeIndex, Vector3 *point,
+                             double radiusSquared, NeighbourBuffer *result) nogil
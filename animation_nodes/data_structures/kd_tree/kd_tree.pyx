@@ -0,0 +1,438 @@
+'''
+The tree is built once from all points. Every node splits its points at the
+median of the axis with the largest extent, leaves contain up to LEAF_SIZE
+points. The points are stored in tree order so that leaves are contiguous.
+
+All queries only read the tree, so they can run without the GIL and from
+multiple threads at the same time. Results of a query are sorted by distance,
+points with the same distance are sorted by their index.
+'''
+
+from libc.math cimport sqrt, INFINITY
+from libc.string cimport memcpy
+from libc.stdlib cimport malloc, realloc, free, qsort
+from .. lists.base_lists cimport DoubleList
+from ... math cimport toVector3, toPyVector3
+
+DEF LEAF_SIZE = 8
+
+cdef class KDTree:
+    def __cinit__(self, Vector3DList points = None):
+        if points is None:
+            points = Vector3DList()
+
+        self.points = points.copy()
+        cdef Py_ssize_t i, amount = self.points.length
+
+        # leaves contain at least half of LEAF_SIZE points
+        cdef Py_ssize_t maxNodeAmount = 2 * (amount // ((LEAF_SIZE + 1) // 2)) + 1
+
+        self.treePoints = <Vector3*>malloc(max(amount, 1) * sizeof(Vector3))
+        self.treeIndices = <Py_ssize_t*>malloc(max(amount, 1) * sizeof(Py_ssize_t))
+        self.nodes = <KDTreeNode*>malloc(maxNodeAmount * sizeof(KDTreeNode))
+        if self.treePoints == NULL or self.treeIndices == NULL or self.nodes == NULL:
+            raise MemoryError()
+
+        memcpy(self.treePoints, self.points.data, amount * sizeof(Vector3))
+        for i in range(amount):
+            self.treeIndices[i] = i
+
+        with nogil:
+            self.nodeAmount = 0
+            self.buildNode(0, amount)
+
+    def __dealloc__(self):
+        free(self.treePoints)
+        free(self.treeIndices)
+        free(self.nodes)
+
+    def __len__(self):
+        return self.points.length
+
+    def __repr__(self):
+        return "<KDTree with {} points>".format(self.points.length)
+
+    cdef Py_ssize_t buildNode(self, Py_ssize_t start, Py_ssize_t end) nogil:
+        cdef Py_ssize_t nodeIndex = self.nodeAmount
+        self.nodeAmount += 1
+
+        cdef KDTreeNode *node = self.nodes + nodeIndex
+        node.start = start
+        node.end = end
+        node.left = -1
+        node.right = -1
+        if end - start <= LEAF_SIZE:
+            return nodeIndex
+
+        cdef Py_ssize_t middle = (start + end) // 2
+        node.axis = getWidestAxis(self.treePoints, start, end)
+        selectNth(self.treePoints, self.treeIndices, start, end, middle, node.axis)
+        node.split = getCoordinate(self.treePoints + middle, node.axis)
+
+        # the node array is never reallocated, so the pointer stays valid
+        node.left = self.buildNode(start, middle)
+        node.right = self.buildNode(middle, end)
+        return nodeIndex
+
+
+    # Batched Queries
+    ###############################################
+
+    def findNearest(self, Vector3DList queries not None):
+        '''
+        Returns the index and distance of the closest point for every query.
+        Index and distance are -1 when the tree is empty.
+        '''
+        cdef Py_ssize_t i, amount = queries.length
+        cdef LongList indices = LongList(length = amount)
+        cdef DoubleList distances = DoubleList(length = amount)
+        cdef double distanceSquared
+
+        with nogil:
+            for i in range(amount):
+                indices.data[i] = self.findNearest_LowLevel(queries.data + i, &distanceSquared)
+                distances.data[i] = sqrt(distanceSquared) if indices.data[i] != -1 else -1
+        return indices, distances
+
+    def findNNearest(self, Vector3DList queries not None, Py_ssize_t amount):
+        '''
+        Returns (indices, distances, starts, lengths).
+        The neighbours of query i are in indices[starts[i]:starts[i] + lengths[i]].
+        '''
+        amount = max(min(amount, self.points.length), 0)
+        cdef Py_ssize_t i, j, start, queryAmount = queries.length
+        cdef LongList indices = LongList(length = queryAmount * amount)
+        cdef DoubleList distances = DoubleList(length = queryAmount * amount)
+        cdef LongList starts = LongList(length = queryAmount)
+        cdef LongList lengths = LongList(length = queryAmount)
+
+        cdef Neighbour *neighbours = <Neighbour*>malloc(max(amount, 1) * sizeof(Neighbour))
+        if neighbours == NULL:
+            raise MemoryError()
+
+        with nogil:
+            for i in range(queryAmount):
+                start = i * amount
+                self.findNNearest_LowLevel(queries.data + i, amount, neighbours)
+                for j in range(amount):
+                    indices.data[start + j] = neighbours[j].index
+                    distances.data[start + j] = sqrt(neighbours[j].distanceSquared)
+                starts.data[i] = start
+                lengths.data[i] = amount
+
+        free(neighbours)
+        return indices, distances, starts, lengths
+
+    def findInRadius(self, Vector3DList queries not None, double radius):
+        '''
+        Returns (indices, distances, starts, lengths).
+        The neighbours of query i are in indices[starts[i]:starts[i] + lengths[i]].
+        '''
+        cdef Py_ssize_t i, queryAmount = queries.length
+        cdef LongList starts = LongList(length = queryAmount)
+        cdef LongList lengths = LongList(length = queryAmount)
+        cdef NeighbourBuffer buffer
+        cdef bint success = True
+
+        initializeBuffer(&buffer)
+        with nogil:
+            for i in range(queryAmount):
+                starts.data[i] = buffer.length
+                if not self.findInRadius_LowLevel(queries.data + i, radius, &buffer):
+                    success = False
+                    break
+                lengths.data[i] = buffer.length - starts.data[i]
+
+        if not success:
+            free(buffer.data)
+            raise MemoryError()
+
+        cdef LongList indices = LongList(length = buffer.length)
+        cdef DoubleList distances = DoubleList(length = buffer.length)
+        for i in range(buffer.length):
+            indices.data[i] = buffer.data[i].index
+            distances.data[i] = sqrt(buffer.data[i].distanceSquared)
+
+        free(buffer.data)
+        return indices, distances, starts, lengths
+
+    def getPoints(self, LongList indices not None):
+        '''Index -1, the result of an empty tree, gives a zero vector.'''
+        cdef Py_ssize_t i, index
+        cdef Vector3DList points = Vector3DList(length = indices.length)
+        for i in range(indices.length):
+            index = indices.data[i]
+            if index == -1:
+                points.data[i] = Vector3(0, 0, 0)
+            elif 0 <= index < self.points.length:
+                points.data[i] = self.points.data[index]
+            else:
+                raise IndexError("point index out of range")
+        return points
+
+
+    # Single Queries
+    # Same interface as mathutils.kdtree.KDTree, so that existing scripts keep working.
+    ###############################################
+
+    def find(self, co):
+        cdef Vector3 point = toVector3(co)
+        cdef double distanceSquared
+        cdef Py_ssize_t index = self.findNearest_LowLevel(&point, &distanceSquared)
+        if index == -1:
+            return None, None, None
+        return toPyVector3(self.points.data + index), index, sqrt(distanceSquared)
+
+    def find_n(self, co, Py_ssize_t n):
+        cdef Vector3 point = toVector3(co)
+        n = max(min(n, self.points.length), 0)
+        cdef Neighbour *neighbours = <Neighbour*>malloc(max(n, 1) * sizeof(Neighbour))
+        if neighbours == NULL:
+            raise MemoryError()
+        self.findNNearest_LowLevel(&point, n, neighbours)
+        try: return [self.toResultTuple(neighbours + i) for i in range(n)]
+        finally: free(neighbours)
+
+    def find_range(self, co, double radius):
+        cdef Vector3 point = toVector3(co)
+        cdef NeighbourBuffer buffer
+        initializeBuffer(&buffer)
+        if not self.findInRadius_LowLevel(&point, radius, &buffer):
+            free(buffer.data)
+            raise MemoryError()
+        try: return [self.toResultTuple(buffer.data + i) for i in range(buffer.length)]
+        finally: free(buffer.data)
+
+    cdef toResultTuple(self, Neighbour *neighbour):
+        return (toPyVector3(self.points.data + neighbour.index),
+                neighbour.index, sqrt(neighbour.distanceSquared))
+
+
+    # Low Level Queries
+    ###############################################
+
+    cdef Py_ssize_t findNearest_LowLevel(self, Vector3 *point, double *distanceSquared) nogil:
+        '''Returns -1 when the tree is empty.'''
+        cdef Neighbour best
+        best.index = -1
+        best.distanceSquared = INFINITY
+        self.searchNearest(0, point, &best)
+        distanceSquared[0] = best.distanceSquared
+        return best.index
+
+    cdef Py_ssize_t findNNearest_LowLevel(self, Vector3 *point, Py_ssize_t amount, Neighbour *result) nogil:
+        '''The result has to have space for the given amount of neighbours.'''
+        amount = min(amount, self.points.length)
+        if amount <= 0:
+            return 0
+        cdef Py_ssize_t foundAmount = 0
+        self.searchNNearest(0, point, result, &foundAmount, amount)
+        qsort(result, foundAmount, sizeof(Neighbour), compareNeighbours)
+        return foundAmount
+
+    cdef bint findInRadius_LowLevel(self, Vector3 *point, double radius, NeighbourBuffer *result) nogil:
+        '''
+        Appends the neighbours to the buffer.
+        Returns False when the buffer could not be enlarged.
+        '''
+        if radius < 0:
+            return True
+        cdef Py_ssize_t start = result.length
+        if not self.searchInRadius(0, point, radius * radius, result):
+            return False
+        qsort(result.data + start, result.length - start, sizeof(Neighbour), compareNeighbours)
+        return True
+
+    cdef void searchNearest(self, Py_ssize_t nodeIndex, Vector3 *point, Neighbour *best) nogil:
+        cdef KDTreeNode *node = self.nodes + nodeIndex
+        cdef Neighbour candidate
+        cdef double difference
+        cdef Py_ssize_t i
+
+        if node.left == -1:
+            for i in range(node.start, node.end):
+                candidate.distanceSquared = getDistanceSquared(point, self.treePoints + i)
+                candidate.index = self.treeIndices[i]
+                if isFarther(best, &candidate):
+                    best[0] = candidate
+            return
+
+        difference = getCoordinate(point, node.axis) - node.split
+        if difference < 0:
+            self.searchNearest(node.left, point, best)
+            if difference * difference <= best.distanceSquared:
+                self.searchNearest(node.right, point, best)
+        else:
+            self.searchNearest(node.right, point, best)
+            if difference * difference <= best.distanceSquared:
+                self.searchNearest(node.left, point, best)
+
+    cdef void searchNNearest(self, Py_ssize_t nodeIndex, Vector3 *point, Neighbour *heap,
+                             Py_ssize_t *foundAmount, Py_ssize_t amount) nogil:
+        '''The heap contains the found neighbours, the farthest one is at the top.'''
+        cdef KDTreeNode *node = self.nodes + nodeIndex
+        cdef Neighbour candidate
+        cdef double difference
+        cdef Py_ssize_t i, near, far
+
+        if node.left == -1:
+            for i in range(node.start, node.end):
+                candidate.distanceSquared = getDistanceSquared(point, self.treePoints + i)
+                candidate.index = self.treeIndices[i]
+                if candidate.distanceSquared != candidate.distanceSquared:
+                    # keeps the order of the heap well defined
+                    candidate.distanceSquared = INFINITY
+                if foundAmount[0] < amount:
+                    pushHeap(heap, foundAmount[0], &candidate)
+                    foundAmount[0] += 1
+                elif isFarther(heap, &candidate):
+                    replaceHeapTop(heap, amount, &candidate)
+            return
+
+        difference = getCoordinate(point, node.axis) - node.split
+        if difference < 0:
+            near, far = node.left, node.right
+        else:
+            near, far = node.right, node.left
+
+        self.searchNNearest(near, point, heap, foundAmount, amount)
+        if foundAmount[0] < amount or difference * difference <= heap[0].distanceSquared:
+            self.searchNNearest(far, point, heap, foundAmount, amount)
+
+    cdef bint searchInRadius(self, Py_ssize_t nodeIndex, Vector3 *point,
+                             double radiusSquared, NeighbourBuffer *result) nogil:
+        cdef KDTreeNode *node = self.nodes + nodeIndex
+        cdef double difference, distanceSquared
+        cdef Py_ssize_t i
+
+        if node.left == -1:
+            for i in range(node.start, node.end):
+                distanceSquared = getDistanceSquared(point, self.treePoints + i)
+                if distanceSquared <= radiusSquared:
+                    if not appendNeighbour(result, distanceSquared, self.treeIndices[i]):
+                        return False
+            return True
+
+        difference = getCoordinate(point, node.axis) - node.split
+        if difference <= 0 or difference * difference <= radiusSquared:
+            if not self.searchInRadius(node.left, point, radiusSquared, result):
+                return False
+        if difference >= 0 or difference * difference <= radiusSquared:
+            if not self.searchInRadius(node.right, point, radiusSquared, result):
+                return False
+        return True
+
+
+# Utilities
+###############################################
+
+cdef inline float getCoordinate(Vector3 *point, int axis) nogil:
+    return (<float*>point)[axis]
+
+cdef inline double getDistanceSquared(Vector3 *a, Vector3 *b) nogil:
+    cdef double x = <double>a.x - <double>b.x
+    cdef double y = <double>a.y - <double>b.y
+    cdef double z = <double>a.z - <double>b.z
+    return x * x + y * y + z * z
+
+cdef int getWidestAxis(Vector3 *points, Py_ssize_t start, Py_ssize_t end) nogil:
+    cdef float minValues[3]
+    cdef float maxValues[3]
+    cdef Py_ssize_t i
+    cdef int axis, widestAxis = 0
+    cdef float value
+
+    for axis in range(3):
+        minValues[axis] = getCoordinate(points + start, axis)
+        maxValues[axis] = minValues[axis]
+
+    for i in range(start + 1, end):
+        for axis in range(3):
+            value = getCoordinate(points + i, axis)
+            if value < minValues[axis]: minValues[axis] = value
+            if value > maxValues[axis]: maxValues[axis] = value
+
+    for axis in range(1, 3):
+        if maxValues[axis] - minValues[axis] > maxValues[widestAxis] - minValues[widestAxis]:
+            widestAxis = axis
+    return widestAxis
+
+cdef void selectNth(Vector3 *points, Py_ssize_t *indices,
+                    Py_ssize_t start, Py_ssize_t end, Py_ssize_t n, int axis) nogil:
+    '''
+    Reorders the points so that the n-th point is at its sorted position,
+    smaller points are before and larger points after it.
+    '''
+    cdef Py_ssize_t left = start, right = end - 1
+    cdef Py_ssize_t i, j
+    cdef float pivot
+
+    while left < right:
+        pivot = getCoordinate(points + (left + right) // 2, axis)
+        i, j = left, right
+        while i <= j:
+            while getCoordinate(points + i, axis) < pivot: i += 1
+            while getCoordinate(points + j, axis) > pivot: j -= 1
+            if i <= j:
+                points[i], points[j] = points[j], points[i]
+                indices[i], indices[j] = indices[j], indices[i]
+                i += 1
+                j -= 1
+        if n <= j: right = j
+        elif n >= i: left = i
+        else: break
+
+cdef inline bint isFarther(Neighbour *a, Neighbour *b) nogil:
+    if a.distanceSquared != b.distanceSquared:
+        return a.distanceSquared > b.distanceSquared
+    return a.index > b.index
+
+cdef int compareNeighbours(const void *a, const void *b) nogil:
+    if isFarther(<Neighbour*>a, <Neighbour*>b): return 1
+    if isFarther(<Neighbour*>b, <Neighbour*>a): return -1
+    return 0
+
+cdef void pushHeap(Neighbour *heap, Py_ssize_t length, Neighbour *neighbour) nogil:
+    cdef Py_ssize_t parent, i = length
+    while i > 0:
+        parent = (i - 1) // 2
+        if not isFarther(neighbour, heap + parent):
+            break
+        heap[i] = heap[parent]
+        i = parent
+    heap[i] = neighbour[0]
+
+cdef void replaceHeapTop(Neighbour *heap, Py_ssize_t length, Neighbour *neighbour) nogil:
+    cdef Py_ssize_t child, i = 0
+    while True:
+        child = 2 * i + 1
+        if child >= length:
+            break
+        if child + 1 < length and isFarther(heap + child + 1, heap + child):
+            child += 1
+        if not isFarther(heap + child, neighbour):
+            break
+        heap[i] = heap[child]
+        i = child
+    heap[i] = neighbour[0]
+
+cdef void initializeBuffer(NeighbourBuffer *buffer):
+    buffer.data = NULL
+    buffer.length = 0
+    buffer.capacity = 0
+
+cdef bint appendNeighbour(NeighbourBuffer *buffer, double distanceSquared, Py_ssize_t index) nogil:
+    cdef Py_ssize_t newCapacity
+    cdef Neighbour *newData
+    if buffer.length == buffer.capacity:
+        newCapacity = max(16, buffer.capacity * 2)
+        newData = <Neighbour*>realloc(buffer.data, newCapacity * sizeof(Neighbour))
+        if newData == NULL:
+            return False
+        buffer.data = newData
+        buffer.capacity = newCapacity
+
+    buffer.data[buffer.length].distanceSquared = distanceSquared
+    buffer.data[buffer.length].index = index
+    buffer.length += 1
+    return True
@@ -0,0 +1,99 @@
+import random
+from unittest import TestCase
+from . kd_tree import KDTree
+from .. lists.base_lists import Vector3DList, LongList
+
+def randomVectors(amount, seed):
+    random.seed(seed)
+    return Vector3DList.fromValues([(random.uniform(-5, 5), random.uniform(-5, 5), random.uniform(-5, 5))
+                                    for _ in range(amount)])
+
+def sortedNeighbours(points, query):
+    distances = [sum((a - b) ** 2 for a, b in zip(point, query)) ** 0.5 for point in points]
+    return sorted((distance, index) for index, distance in enumerate(distances))
+
+class TestFindNearest(TestCase):
+    def testEmptyTree(self):
+        indices, distances = KDTree(Vector3DList()).findNearest(randomVectors(3, 0))
+        self.assertEqual(list(indices), [-1, -1, -1])
+        self.assertEqual(list(distances), [-1, -1, -1])
+
+    def testCompareWithBruteForce(self):
+        points = randomVectors(500, 1)
+        queries = randomVectors(50, 2)
+        indices, distances = KDTree(points).findNearest(queries)
+        for i, query in enumerate(queries):
+            distance, index = sortedNeighbours(points, query)[0]
+            self.assertEqual(indices[i], index)
+            self.assertAlmostEqual(distances[i], distance, places = 4)
+
+    def testDuplicatePoints(self):
+        points = Vector3DList.fromValues([(1, 1, 1)] * 20 + [(0, 0, 0)] * 20)
+        indices, distances = KDTree(points).findNearest(Vector3DList.fromValues([(0.1, 0, 0)]))
+        self.assertEqual(indices[0], 20)
+
+class TestFindNNearest(TestCase):
+    def testCompareWithBruteForce(self):
+        points = randomVectors(300, 3)
+        queries = randomVectors(20, 4)
+        indices, distances, starts, lengths = KDTree(points).findNNearest(queries, 7)
+        for i, query in enumerate(queries):
+            expected = sortedNeighbours(points, query)[:7]
+            self.assertEqual(lengths[i], 7)
+            self.assertEqual(list(indices[starts[i]:starts[i] + 7]), [index for _, index in expected])
+
+    def testAmountLargerThanTree(self):
+        indices, distances, starts, lengths = KDTree(randomVectors(5, 5)).findNNearest(randomVectors(2, 6), 10)
+        self.assertEqual(list(lengths), [5, 5])
+        self.assertEqual(list(starts), [0, 5])
+
+class TestFindInRadius(TestCase):
+    def testCompareWithBruteForce(self):
+        points = randomVectors(400, 7)
+        queries = randomVectors(30, 8)
+        indices, distances, starts, lengths = KDTree(points).findInRadius(queries, 2)
+        for i, query in enumerate(queries):
+            expected = [index for distance, index in sortedNeighbours(points, query) if distance <= 2]
+            start = starts[i]
+            self.assertEqual(list(indices[start:start + lengths[i]]), expected)
+        self.assertEqual(len(indices), sum(lengths))
+
+    def testNegativeRadius(self):
+        indices, distances, starts, lengths = KDTree(randomVectors(10, 9)).findInRadius(randomVectors(2, 10), -1)
+        self.assertEqual(len(indices), 0)
+        self.assertEqual(list(lengths), [0, 0])
+
+class TestSingleQueries(TestCase):
+    def setUp(self):
+        self.kdTree = KDTree(Vector3DList.fromValues([(0, 0, 0), (3, 0, 0), (1, 0, 0)]))
+
+    def testFind(self):
+        vector, index, distance = self.kdTree.find((2.9, 0, 0))
+        self.assertEqual(index, 1)
+        self.assertAlmostEqual(distance, 0.1, places = 5)
+
+    def testFindOnEmptyTree(self):
+        self.assertEqual(KDTree().find((0, 0, 0)), (None, None, None))
+
+    def testFindN(self):
+        self.assertEqual([index for _, index, _ in self.kdTree.find_n((0, 0, 0), 2)], [0, 2])
+
+    def testFindRange(self):
+        self.assertEqual([index for _, index, _ in self.kdTree.find_range((0, 0, 0), 1.5)], [0, 2])
+
+class TestGetPoints(TestCase):
+    def testNormal(self):
+        kdTree = KDTree(Vector3DList.fromValues([(0, 0, 0), (1, 2, 3)]))
+        points = kdTree.getPoints(LongList.fromValues([1, -1]))
+        self.assertEqual(tuple(points[0]), (1, 2, 3))
+        self.assertEqual(tuple(points[1]), (0, 0, 0))
+
+    def testOutOfRange(self):
+        with self.assertRaises(IndexError):
+            KDTree(Vector3DList.fromValues([(0, 0, 0)])).getPoints(LongList.fromValues([1]))
+
+    def testPointsAreCopied(self):
+        points = Vector3DList.fromValues([(0, 0, 0)])
+        kdTree = KDTree(points)
+        points[0] = (5, 5, 5)
+        self.assertEqual(kdTree.find((5, 5, 5))[2], 75 ** 0.5)
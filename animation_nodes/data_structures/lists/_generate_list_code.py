@@ -35,6 +35,17 @@ def getPyPreprocessTasks(PyPreprocessTask, utils):
     )
     return [pyxTask, pxdTask]
 
+# struct module format characters of the buffer types
+bufferFormats = {
+    "char" : "b", "unsigned char" : "B",
+    "short" : "h", "unsigned short" : "H",
+    "int" : "i", "unsigned int" : "I",
+    "long" : "l", "unsigned long" : "L",
+    "long long" : "q", "unsigned long long" : "Q",
+    "float" : "f", "double" : "d",
+    "NotExistentType" : ""
+}
+
 def generate_pyx(target, utils):
     implementation = utils.readTextFile(paths["implementation"])
 
@@ -48,6 +59,7 @@ def generate_pyx(target, utils):
             LISTNAME = info["LISTNAME"],
             TYPE = info["TYPE"],
             MEMVIEW = info["MEMVIEW"],
+            BUFFER_FORMAT = bufferFormats[info["MEMVIEW"]],
             TRY_CONVERSION_CODE = indent(info["TRY_CONVERSION_CODE"], " "*8),
             TO_PYOBJECT_CODE = indent(info["TO_PYOBJECT_CODE"], " "*8)
         )
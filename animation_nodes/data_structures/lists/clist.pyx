@@ -1,6 +1,8 @@
 cimport cython
 from libc.string cimport memcpy
+from libc.stdint cimport uint32_t
 from ... data_structures cimport LongList
+from ... algorithms.hashing.murmurhash3 cimport murmur3_32
 
 @cython.freelist(10)
 cdef class CList:
@@ -16,6 +18,27 @@ cdef class CList:
     cdef Py_ssize_t getCapacity(self):
         raise NotImplementedError()
 
+    def getMemoryUsage(self):
+        '''Amount of bytes allocated for the elements.'''
+        return self.getCapacity() * self.getElementSize()
+
+    def getContentHash(self, uint32_t seed = 0):
+        '''
+        Hash of the raw element data. Two lists of the same type
+        with equal elements always have the same hash.
+        '''
+        cdef:
+            char *data = <char*>self.getPointer()
+            Py_ssize_t remaining = self.getLength() * self.getElementSize()
+            Py_ssize_t chunkSize = 1 << 30
+            uint32_t hash = seed
+
+        while remaining > chunkSize:
+            hash = murmur3_32(data, chunkSize, hash)
+            data += chunkSize
+            remaining -= chunkSize
+        return murmur3_32(data, remaining, hash)
+
     def repeated(self, *, Py_ssize_t length = -1, Py_ssize_t amount = -1, default = None):
         if length < 0 and amount < 0:
             raise ValueError("'length' or 'amount' has to be non-negative")
@@ -101,6 +101,15 @@ cdef class PolygonIndicesList:
         newList.polyLengths.overwrite(self.polyLengths)
         return newList
 
+    def getMemoryUsage(self):
+        return (self.indices.getMemoryUsage() +
+                self.polyStarts.getMemoryUsage() +
+                self.polyLengths.getMemoryUsage())
+
+    def getContentHash(self, seed = 0):
+        # the poly starts are implied by the lengths
+        return self.polyLengths.getContentHash(self.indices.getContentHash(seed))
+
     cpdef index(self, value):
         cdef:
             UIntegerList _value = UIntegerList.fromValues(value)
@@ -310,6 +319,17 @@ cdef class PolygonIndicesList:
         newList.extend(values)
         return newList
 
+    @classmethod
+    def fromLists(cls, UIntegerList indices, UIntegerList polyStarts, UIntegerList polyLengths):
+        '''The lists are used without copying and without validation.'''
+        if polyStarts.length != polyLengths.length:
+            raise ValueError("polyStarts and polyLengths need the same length")
+        cdef PolygonIndicesList newList = PolygonIndicesList()
+        newList.indices = indices
+        newList.polyStarts = polyStarts
+        newList.polyLengths = polyLengths
+        return newList
+
     @classmethod
     def join(cls, *lists):
         cdef PolygonIndicesList newList = PolygonIndicesList()
@@ -591,3 +591,80 @@ class TestIAdd(TestCase):
     def testSimiliarType(self):
         self.list += FloatList.fromValues([4, 5, 6])
         self.assertEqual(self.list, [0, 1, 2, 3, 4, 5, 6])
+
+class TestContentHash(TestCase):
+    def testEqualContent(self):
+        a = IntegerList.fromValues([1, 2, 3])
+        b = IntegerList.fromValues([1, 2, 3])
+        self.assertEqual(a.getContentHash(), b.getContentHash())
+
+    def testDifferentContent(self):
+        a = IntegerList.fromValues([1, 2, 3])
+        b = IntegerList.fromValues([1, 2, 4])
+        self.assertNotEqual(a.getContentHash(), b.getContentHash())
+
+    def testDifferentSeed(self):
+        a = IntegerList.fromValues([1, 2, 3])
+        self.assertNotEqual(a.getContentHash(0), a.getContentHash(1))
+
+    def testCapacityIsIgnored(self):
+        a = IntegerList.fromValues([1, 2, 3])
+        b = IntegerList(capacity = 100)
+        b.extend([1, 2, 3])
+        self.assertEqual(a.getContentHash(), b.getContentHash())
+
+class TestMemoryUsage(TestCase):
+    def testUsesCapacity(self):
+        a = FloatList(capacity = 100)
+        self.assertGreaterEqual(a.getMemoryUsage(), 100 * 4)
+
+class TestFromBuffer(TestCase):
+    def testSharesMemory(self):
+        data = bytearray(12)
+        a = FloatList.fromBuffer(data)
+        self.assertEqual(len(a), 3)
+        self.assertTrue(a.isView())
+        a[1] = 2
+        self.assertEqual(FloatList.fromBuffer(data)[1], 2)
+
+    def testEmptyBuffer(self):
+        a = IntegerList.fromBuffer(bytearray())
+        self.assertEqual(len(a), 0)
+
+    def testReadOnlyBuffer(self):
+        with self.assertRaises(BufferError):
+            FloatList.fromBuffer(bytes(12))
+
+    def testInvalidSize(self):
+        with self.assertRaises(ValueError):
+            FloatList.fromBuffer(bytearray(6))
+
+    def testKeepsBaseAlive(self):
+        a = IntegerList.fromBuffer(memoryview(bytearray(8)))
+        a[0] = 5
+        self.assertEqual(a, [5, 0])
+
+    def testGrowCopiesData(self):
+        data = bytearray(8)
+        a = IntegerList.fromBuffer(data)
+        a.append(3)
+        self.assertFalse(a.isView())
+        a[0] = 4
+        self.assertEqual(a, [4, 0, 3])
+        self.assertEqual(IntegerList.fromBuffer(data), [0, 0])
+
+class TestExportedMemory(TestCase):
+    def testMemoryViewSharesMemory(self):
+        a = IntegerList.fromValues([1, 2, 3])
+        view = a.asMemoryView()
+        view[0] = 7
+        self.assertEqual(a[0], 7)
+
+    def testNoGrowWhileExported(self):
+        a = IntegerList.fromValues([1, 2, 3])
+        view = a.asMemoryView()
+        with self.assertRaises(BufferError):
+            a.extend(range(100))
+        view.release()
+        a.extend(range(100))
+        self.assertEqual(len(a), 103)
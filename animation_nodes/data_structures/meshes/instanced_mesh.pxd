@@ -0,0 +1,8 @@
+from . mesh_data cimport Mesh
+from .. lists.base_lists cimport Matrix4x4List
+
+cdef class InstancedMesh:
+    cdef:
+        readonly Mesh source
+        readonly Matrix4x4List matrices
+        dict cache
@@ -0,0 +1,109 @@
+'''
+An instanced mesh is a source mesh and one transformation matrix per instance.
+The replicated data is only created when it is requested and it is cached until
+the instances are transformed. Output nodes that only have to update vertex
+locations never need the replicated edges and polygons.
+'''
+
+from libc.stdint cimport uint32_t
+from . mesh_data cimport Mesh
+from ... math cimport Matrix4, setIdentityMatrix
+from ... algorithms.hashing.murmurhash3 cimport murmur3_32
+from .. lists.base_lists cimport Matrix4x4List, Vector3DList
+
+cdef class InstancedMesh:
+    def __cinit__(self, Mesh source = None, Matrix4x4List matrices = None):
+        if source is None: source = Mesh()
+        if matrices is None: matrices = Matrix4x4List()
+        self.source = source
+        self.matrices = matrices
+        self.cache = {}
+
+    @classmethod
+    def fromMesh(cls, Mesh mesh):
+        cdef Matrix4x4List matrices = Matrix4x4List(length = 1)
+        setIdentityMatrix(matrices.data)
+        return InstancedMesh(mesh, matrices)
+
+    def getInstanceAmount(self):
+        return self.matrices.length
+
+    def getDomainLength(self, str domain):
+        return self.source.getDomainLength(domain) * self.matrices.length
+
+    def copy(self):
+        return InstancedMesh(self.source.copy(), self.matrices.copy())
+
+    def transform(self, transformation):
+        self.matrices.transform(transformation)
+        self.cache.clear()
+
+    def move(self, translation):
+        cdef Py_ssize_t i
+        cdef Matrix4 *m
+        cdef float x, y, z
+        x, y, z = translation
+        for i in range(self.matrices.length):
+            m = self.matrices.data + i
+            m.a14 += x
+            m.a24 += y
+            m.a34 += z
+        self.cache.clear()
+
+    @property
+    def vertices(self):
+        return self.getVertices()
+
+    def getVertices(self):
+        from ... algorithms.mesh.replicate_mesh import getReplicatedVertices
+        if "Vertices" not in self.cache:
+            self.cache["Vertices"] = getReplicatedVertices(self.source.vertices, self.matrices)
+        return self.cache["Vertices"]
+
+    def getVertexNormals(self, normalized = False):
+        return self.getReplicatedNormals("Vertex Normals", self.source.getVertexNormals, normalized)
+
+    def getPolygonNormals(self, normalized = False):
+        return self.getReplicatedNormals("Polygon Normals", self.source.getPolygonNormals, normalized)
+
+    def getReplicatedNormals(self, str name, getSourceNormals, bint normalized):
+        from ... algorithms.mesh.replicate_mesh import getReplicatedNormals
+        cdef Vector3DList normals
+        if name not in self.cache:
+            self.cache[name] = (getReplicatedNormals(getSourceNormals(), self.matrices), False)
+        normals, isNormalized = self.cache[name]
+        if normalized and not isNormalized:
+            normals.normalize()
+            self.cache[name] = (normals, True)
+        return normals
+
+    def getTopologyHash(self):
+        cdef long amount = self.matrices.length
+        cdef uint32_t hash = self.source.getTopologyHash()
+        return murmur3_32(<char*>&amount, sizeof(long), hash)
+
+    def getUVMapNames(self):
+        return self.source.getUVMapNames()
+
+    def getVertexColorLayerNames(self):
+        return self.source.getVertexColorLayerNames()
+
+    def getUVMaps(self):
+        return [(name, data.repeated(amount = self.matrices.length))
+                for name, data in self.source.getUVMaps()]
+
+    def getVertexColorLayers(self):
+        return [(name, data.repeated(amount = self.matrices.length))
+                for name, data in self.source.getVertexColorLayers()]
+
+    def toMesh(self):
+        from ... algorithms.mesh.replicate_mesh import replicateMesh
+        # normals of the small source mesh are replicated instead of
+        # being calculated on the large mesh later
+        self.source.getVertexNormals()
+        self.source.getPolygonNormals()
+        return replicateMesh(self.source, self.matrices)
+
+    def __repr__(self):
+        return "<InstancedMesh {} instances of {} vertices>".format(
+            self.matrices.length, self.source.vertices.length)
@@ -0,0 +1,3 @@
+cdef class MeshAttributes:
+    cdef:
+        readonly dict layers
@@ -0,0 +1,88 @@
+'''
+Attributes of a mesh are stored per domain and list type.
+An attribute is identified by its domain, its list type and its name,
+so a UV map and a vertex color layer can have the same name.
+'''
+
+domains = ("POINT", "EDGE", "FACE", "CORNER")
+
+cdef class MeshAttributes:
+    def __cinit__(self):
+        # (domain, list type) -> {name : list}, dictionaries keep the insertion order
+        self.layers = {}
+
+    def insert(self, str domain, str name, data):
+        if domain not in domains:
+            raise Exception("invalid domain")
+        key = (domain, type(data))
+        if key not in self.layers:
+            self.layers[key] = {}
+        self.layers[key][name] = data
+
+    def get(self, str domain, dataType, str name):
+        return self.layers.get((domain, dataType), {}).get(name, None)
+
+    def remove(self, str domain, dataType, str name):
+        self.layers.get((domain, dataType), {}).pop(name, None)
+
+    def getNames(self, str domain, dataType):
+        return list(self.layers.get((domain, dataType), {}).keys())
+
+    def getItems(self, str domain, dataType):
+        return list(self.layers.get((domain, dataType), {}).items())
+
+    def iterAttributes(self):
+        '''Yields (domain, name, data) for all attributes.'''
+        for (domain, _), attributes in self.layers.items():
+            for name, data in attributes.items():
+                yield domain, name, data
+
+    def copy(self):
+        return self.mapData(lambda data: data.copy())
+
+    def replicated(self, long amount):
+        return self.mapData(lambda data: data.repeated(amount = amount))
+
+    def mapData(self, function):
+        cdef MeshAttributes newAttributes = MeshAttributes()
+        for key, attributes in self.layers.items():
+            newAttributes.layers[key] = {name : function(data) for name, data in attributes.items()}
+        return newAttributes
+
+    def getMemoryUsage(self):
+        cdef long size = 0
+        for _, _, data in self.iterAttributes():
+            size += data.getMemoryUsage()
+        return size
+
+    @staticmethod
+    def join(attributesList, domainLengthsList):
+        '''
+        Every attribute is joined with a single allocation.
+        Meshes that don't have an attribute contribute zeros.
+        The domain lengths are dictionaries with the amount of elements per domain.
+        '''
+        cdef MeshAttributes attributes
+        cdef MeshAttributes newAttributes = MeshAttributes()
+
+        names = {}
+        for attributes in attributesList:
+            for key, layer in attributes.layers.items():
+                names.setdefault(key, {}).update(dict.fromkeys(layer))
+
+        for (domain, dataType), layerNames in names.items():
+            newLayer = newAttributes.layers[(domain, dataType)] = {}
+            for name in layerNames:
+                parts = []
+                for attributes, domainLengths in zip(attributesList, domainLengthsList):
+                    data = attributes.get(domain, dataType, name)
+                    if data is None:
+                        data = dataType(length = domainLengths[domain])
+                        data.fill(0)
+                    parts.append(data)
+                newLayer[name] = dataType.join(*parts)
+        return newAttributes
+
+    def __repr__(self):
+        return "<MeshAttributes {}>".format(
+            [(domain, name) for domain, name, _ in self.iterAttributes()])
@@ -1,3 +1,4 @@
+from . mesh_attributes cimport MeshAttributes
 from .. lists.polygon_indices_list cimport PolygonIndicesList
 from .. lists.base_lists cimport Vector3DList, EdgeIndicesList, LongList
 
@@ -7,7 +8,10 @@ cdef class Mesh:
         readonly EdgeIndicesList edges
         readonly PolygonIndicesList polygons
         readonly LongList materialIndices
+        readonly MeshAttributes attributes
+        readonly Py_ssize_t topologyVersion
+        readonly Py_ssize_t verticesVersion
+        readonly Py_ssize_t shapeVersion
         dict derivedMeshDataCache
-        object uvMaps
-        object vertexColorLayers
 
+    cdef tuple getDerivedDataVersion(self, str name)
@@ -1,8 +1,9 @@
 # cython: profile=True
 import textwrap
 import functools
-from collections import OrderedDict
+from libc.stdint cimport uint32_t
 from . validate import createValidEdgesList
+from . mesh_attributes cimport MeshAttributes
 from . validate import checkMeshData, calculateLoopEdges
 from ... algorithms.mesh.triangulate_mesh import (
     triangulatePolygonsUsingFanSpanMethod, triangulatePolygonsUsingEarClipMethod
@@ -15,25 +16,47 @@ from ... math cimport (
     Matrix4, toMatrix4
 )
 
+# Every derived data depends on the topology.
+# "Vertices" changes whenever vertices move, "Shape" only when they are not just translated.
+derivedDataDependencies = {
+    "Loop Edges" : (),
+    "Linked Vertices" : (),
+    "Topology Hash" : (),
+    "Polygon Normals" : ("Shape",),
+    "Vertex Normals" : ("Shape",),
+    "Polygon Tangents" : ("Shape",),
+    "Polygon Bitangents" : ("Shape",),
+    "Polygon Centers" : ("Vertices",)
+}
+
 def derivedMeshDataCacheHelper(name, handleNormalization = False):
+    '''
+    Cached values store the versions they were calculated with
+    and are only recalculated when one of these versions changed.
+    '''
     def decorator(function):
         if handleNormalization:
             @functools.wraps(function)
             def wrapper(Mesh self, normalized = False, **kwargs):
-                if name not in self.derivedMeshDataCache:
-                    vectors = function(self, **kwargs)
-                    self.derivedMeshDataCache[name] = (vectors, False)
-                vectors, isNorm = self.derivedMeshDataCache[name]
+                version = self.getDerivedDataVersion(name)
+                entry = self.derivedMeshDataCache.get(name)
+                if entry is None or entry[0] != version:
+                    entry = (version, function(self, **kwargs), False)
+                    self.derivedMeshDataCache[name] = entry
+                _, vectors, isNorm = entry
                 if normalized and not isNorm:
                     vectors.normalize()
-                    self.derivedMeshDataCache[name] = (vectors, True)
+                    self.derivedMeshDataCache[name] = (version, vectors, True)
                 return vectors
         else:
             @functools.wraps(function)
             def wrapper(Mesh self, **kwargs):
-                if name not in self.derivedMeshDataCache:
-                    self.derivedMeshDataCache[name] = function(self, **kwargs)
-                return self.derivedMeshDataCache[name]
+                version = self.getDerivedDataVersion(name)
+                entry = self.derivedMeshDataCache.get(name)
+                if entry is None or entry[0] != version:
+                    entry = (version, function(self, **kwargs))
+                    self.derivedMeshDataCache[name] = entry
+                return entry[1]
         return wrapper
     return decorator
 
@@ -58,27 +81,30 @@ cdef class Mesh:
         self.materialIndices = materialIndices
 
         self.derivedMeshDataCache = {}
-        self.uvMaps = OrderedDict()
-        self.vertexColorLayers = OrderedDict()
-
-    def getMeshProperties(self):
-        return (
-            (self.uvMaps, Vector2DList),
-            (self.vertexColorLayers, ColorList),
-        )
+        self.attributes = MeshAttributes()
 
     def verticesTransformed(self):
-        self.derivedMeshDataCache.pop("Vertex Normals", None)
-        self.derivedMeshDataCache.pop("Polygon Centers", None)
-        self.derivedMeshDataCache.pop("Polygon Normals", None)
-        self.derivedMeshDataCache.pop("Polygon Tangents", None)
-        self.derivedMeshDataCache.pop("Polygon Bitangents", None)
+        self.verticesVersion += 1
+        self.shapeVersion += 1
 
     def verticesMoved(self):
-        self.derivedMeshDataCache.pop("Polygon Centers", None)
+        self.verticesVersion += 1
 
     def topologyChanged(self):
-        self.derivedMeshDataCache.pop("Linked Vertices", None)
+        self.topologyVersion += 1
+
+    cdef tuple getDerivedDataVersion(self, str name):
+        dependencies = derivedDataDependencies[name]
+        return (self.topologyVersion,
+                self.shapeVersion if "Shape" in dependencies else 0,
+                self.verticesVersion if "Vertices" in dependencies else 0)
+
+    def getCachedDerivedData(self, str name):
+        '''Returns the cached value if it is up to date, otherwise None.'''
+        entry = self.derivedMeshDataCache.get(name)
+        if entry is None or entry[0] != self.getDerivedDataVersion(name):
+            return None
+        return entry[1]
 
     def getPolygonOrientationMatrices(self, normalized = True):
         normals = self.getPolygonNormals(normalized)
@@ -114,53 +140,84 @@ cdef class Mesh:
     def getLinkedVertices(self):
         return calculateLinkedVertices(self.vertices.length, self.edges)
 
+    @derivedMeshDataCacheHelper("Topology Hash")
+    def getTopologyHash(self):
+        '''
+        Hash of the vertex amount, edges, polygons and material indices.
+        It is cached, so topologyChanged has to be called after they are changed in place.
+        '''
+        cdef uint32_t hash = <uint32_t>self.vertices.length
+        for data in (self.edges, self.polygons, self.materialIndices):
+            hash = data.getContentHash(hash)
+        return hash
+
     def setLoopEdges(self, UIntegerList loopEdges):
         if len(loopEdges) == len(self.polygons.indices):
-            self.derivedMeshDataCache["Loop Edges"] = loopEdges
+            self.derivedMeshDataCache["Loop Edges"] = (
+                self.getDerivedDataVersion("Loop Edges"), loopEdges)
         else:
             raise Exception("invalid length")
 
     def setPolygonNormals(self, Vector3DList normals):
         if len(normals) == len(self.polygons):
-            self.derivedMeshDataCache["Polygon Normals"] = (normals, False)
+            self.derivedMeshDataCache["Polygon Normals"] = (
+                self.getDerivedDataVersion("Polygon Normals"), normals, False)
         else:
             raise Exception("invalid length")
 
     def setVertexNormals(self, Vector3DList normals):
         if len(normals) == len(self.vertices):
-            self.derivedMeshDataCache["Vertex Normals"] = (normals, False)
+            self.derivedMeshDataCache["Vertex Normals"] = (
+                self.getDerivedDataVersion("Vertex Normals"), normals, False)
         else:
             raise Exception("invalid length")
 
-    def insertUVMap(self, str name, Vector2DList uvs):
-        if len(uvs) == len(self.polygons.indices):
-            self.uvMaps[name] = uvs
+    def getDomainLength(self, str domain):
+        if domain == "POINT": return self.vertices.length
+        if domain == "EDGE": return self.edges.length
+        if domain == "FACE": return self.polygons.polyStarts.length
+        if domain == "CORNER": return self.polygons.indices.length
+        raise Exception("invalid domain")
+
+    def getDomainLengths(self):
+        return {domain : self.getDomainLength(domain)
+                for domain in ("POINT", "EDGE", "FACE", "CORNER")}
+
+    def insertAttribute(self, str domain, str name, data):
+        if len(data) == self.getDomainLength(domain):
+            self.attributes.insert(domain, name, data)
         else:
             raise Exception("invalid length")
 
+    def getAttribute(self, str domain, dataType, str name):
+        return self.attributes.get(domain, dataType, name)
+
+    def getAttributeNames(self, str domain, dataType):
+        return self.attributes.getNames(domain, dataType)
+
+    def insertUVMap(self, str name, Vector2DList uvs):
+        self.insertAttribute("CORNER", name, uvs)
+
     def getUVMaps(self):
-        return list(self.uvMaps.items())
+        return self.attributes.getItems("CORNER", Vector2DList)
 
     def getUVMapNames(self):
-        return list(self.uvMaps.keys())
+        return self.attributes.getNames("CORNER", Vector2DList)
 
     def getUVMapPositions(self, str uvMapName):
-        return self.uvMaps.get(uvMapName, None)
+        return self.attributes.get("CORNER", Vector2DList, uvMapName)
 
     def insertVertexColorLayer(self, str name, ColorList colors):
-        if len(colors) == len(self.polygons.indices):
-            self.vertexColorLayers[name] = colors
-        else:
-            raise Exception("invalid length")
+        self.insertAttribute("CORNER", name, colors)
 
     def getVertexColorLayers(self):
-        return list(self.vertexColorLayers.items())
+        return self.attributes.getItems("CORNER", ColorList)
 
     def getVertexColorLayerNames(self):
-        return list(self.vertexColorLayers.keys())
+        return self.attributes.getNames("CORNER", ColorList)
 
     def getVertexColors(self, str colorLayerName):
-        return self.vertexColorLayers.get(colorLayerName, None)
+        return self.attributes.get("CORNER", ColorList, colorLayerName)
 
     def getVertexLinkedVertices(self, long vertexIndex):
         cdef LongList neighboursAmounts, neighboursStarts, neighbours, neighbourEdges
@@ -180,10 +237,14 @@ cdef class Mesh:
         return mesh
 
     def copyMeshProperties(self, Mesh source):
-        for ((meshProperty, _), (sourceMeshProperty, _)) in zip(
-                self.getMeshProperties(), source.getMeshProperties()):
-            for name, value in sourceMeshProperty.items():
-                meshProperty[name] = value.copy()
+        for domain, name, data in source.attributes.iterAttributes():
+            self.attributes.insert(domain, name, data.copy())
+
+    def getMemoryUsage(self):
+        '''Bytes allocated for the mesh data, without the derived data cache.'''
+        cdef long size = (self.vertices.getMemoryUsage() + self.edges.getMemoryUsage() +
+                          self.polygons.getMemoryUsage() + self.materialIndices.getMemoryUsage())
+        return size + self.attributes.getMemoryUsage()
 
     def transform(self, transformation):
         self.vertices.transform(transformation)
@@ -203,7 +264,7 @@ cdef class Mesh:
         self.edges = createValidEdgesList(polygons = newPolygons)
         self.polygons = newPolygons
         self.materialIndices =  LongList.fromValue(0, length = newPolygons.getLength())
-        self.derivedMeshDataCache.clear()
+        self.topologyChanged()
 
     def __repr__(self):
         return textwrap.dedent(
@@ -215,33 +276,73 @@ cdef class Mesh:
         Vertex Colors: {self.getVertexColorLayerNames()}""")
 
     def replicateMeshProperties(self, Mesh source, long amount):
-        for ((meshProperty, _), (sourceMeshProperty, _)) in zip(
-                self.getMeshProperties(), source.getMeshProperties()):
-            for name, value in sourceMeshProperty.items():
-                meshProperty[name] = value.repeated(amount = amount)
+        for domain, name, data in source.attributes.iterAttributes():
+            self.attributes.insert(domain, name, data.repeated(amount = amount))
 
     def appendMeshProperties(self, Mesh source):
-        for ((meshProperty, meshPropertyType), (sourceMeshProperty, _)) in zip(
-                self.getMeshProperties(), source.getMeshProperties()):
-            for name in meshProperty.keys():
-                if name in sourceMeshProperty:
-                    meshProperty[name].extend(sourceMeshProperty[name])
-                else:
-                    extension = meshPropertyType(length = source.polygons.indices.length)
-                    extension.fill(0)
-                    meshProperty[name].extend(extension)
-
-            for name in sourceMeshProperty.keys():
-                if name not in meshProperty:
-                    extension = meshPropertyType(length = self.polygons.indices.length)
-                    extension.fill(0)
-                    meshProperty[name] = extension + sourceMeshProperty[name]
+        self.attributes = MeshAttributes.join([self.attributes, source.attributes],
+                                              [self.getDomainLengths(), source.getDomainLengths()])
 
     @classmethod
     def join(cls, *meshes):
-        cdef Mesh newMesh = Mesh()
-        for meshData in meshes:
-            newMesh.append(meshData)
+        '''
+        All lists of the new mesh are allocated once.
+        Normals and loop edges are joined as well when they are
+        cached and up to date in all meshes.
+        '''
+        cdef Mesh mesh, newMesh
+        cdef EdgeIndicesList edges
+        cdef UIntegerList indices, polyStarts, loopEdges
+        cdef Py_ssize_t i, vertexOffset, edgeOffset, indexOffset, polygonOffset
+
+        vertices = Vector3DList.join(*[mesh.vertices for mesh in meshes])
+        edges = EdgeIndicesList.join(*[mesh.edges for mesh in meshes])
+        indices = UIntegerList.join(*[mesh.polygons.indices for mesh in meshes])
+        polyStarts = UIntegerList.join(*[mesh.polygons.polyStarts for mesh in meshes])
+        polyLengths = UIntegerList.join(*[mesh.polygons.polyLengths for mesh in meshes])
+        materialIndices = LongList.join(*[mesh.materialIndices for mesh in meshes])
+
+        vertexOffset = edgeOffset = indexOffset = polygonOffset = 0
+        for mesh in meshes:
+            for i in range(mesh.edges.length):
+                edges.data[edgeOffset + i].v1 += vertexOffset
+                edges.data[edgeOffset + i].v2 += vertexOffset
+            for i in range(mesh.polygons.indices.length):
+                indices.data[indexOffset + i] += vertexOffset
+            for i in range(mesh.polygons.polyStarts.length):
+                polyStarts.data[polygonOffset + i] += indexOffset
+            vertexOffset += mesh.vertices.length
+            edgeOffset += mesh.edges.length
+            indexOffset += mesh.polygons.indices.length
+            polygonOffset += mesh.polygons.polyStarts.length
+
+        newMesh = Mesh(vertices, edges, PolygonIndicesList.fromLists(indices, polyStarts, polyLengths),
+                       materialIndices, skipValidation = True)
+        newMesh.attributes = MeshAttributes.join([mesh.attributes for mesh in meshes],
+                                                 [mesh.getDomainLengths() for mesh in meshes])
+
+        if len(meshes) == 0:
+            return newMesh
+
+        polygonNormals = [mesh.getCachedDerivedData("Polygon Normals") for mesh in meshes]
+        if all(data is not None for data in polygonNormals):
+            newMesh.setPolygonNormals(Vector3DList.join(*polygonNormals))
+
+        vertexNormals = [mesh.getCachedDerivedData("Vertex Normals") for mesh in meshes]
+        if all(data is not None for data in vertexNormals):
+            newMesh.setVertexNormals(Vector3DList.join(*vertexNormals))
+
+        loopEdgesList = [mesh.getCachedDerivedData("Loop Edges") for mesh in meshes]
+        if all(data is not None for data in loopEdgesList):
+            loopEdges = UIntegerList.join(*loopEdgesList)
+            edgeOffset = indexOffset = 0
+            for mesh in meshes:
+                for i in range(mesh.polygons.indices.length):
+                    loopEdges.data[indexOffset + i] += edgeOffset
+                edgeOffset += mesh.edges.length
+                indexOffset += mesh.polygons.indices.length
+            newMesh.setLoopEdges(loopEdges)
+
         return newMesh
 
     def append(self, Mesh meshData):
@@ -264,6 +365,8 @@ cdef class Mesh:
             self.polygons.indices.data[polygonIndicesOffset + i] += vertexOffset
 
         self.materialIndices.extend(meshData.materialIndices)
+        self.topologyChanged()
+        self.verticesTransformed()
 
 
 def calculatePolygonNormals(Vector3DList vertices, PolygonIndicesList polygons):
@@ -0,0 +1,46 @@
+import numpy as np
+from unittest import TestCase
+from . instanced_mesh import InstancedMesh
+from . test_mesh_data import createQuad
+from .. lists.base_lists import Vector2DList, Matrix4x4List
+
+def createTranslations(amount):
+    matrices = Matrix4x4List(length = amount)
+    array = matrices.asNumpyArray().reshape(amount, 4, 4)
+    array[:] = np.eye(4)
+    array[:, 0, 3] = np.arange(amount)
+    return matrices
+
+class TestInstancedMesh(TestCase):
+    def testVertices(self):
+        mesh = InstancedMesh(createQuad(), createTranslations(3))
+        self.assertEqual(len(mesh.vertices), 12)
+        self.assertEqual(tuple(mesh.vertices[9]), (3, 0, 0))
+        self.assertEqual(mesh.getDomainLength("CORNER"), 12)
+
+    def testMoveClearsCache(self):
+        mesh = InstancedMesh(createQuad(), createTranslations(2))
+        mesh.getVertices()
+        mesh.move((0, 0, 1))
+        self.assertEqual(tuple(mesh.vertices[0]), (0, 0, 1))
+
+    def testToMesh(self):
+        source = createQuad()
+        source.insertUVMap("UV", Vector2DList(length = 4))
+        mesh = InstancedMesh(source, createTranslations(2)).toMesh()
+        self.assertEqual(len(mesh.polygons), 2)
+        self.assertEqual(len(mesh.getUVMapPositions("UV")), 8)
+        self.assertIsNotNone(mesh.getCachedDerivedData("Vertex Normals"))
+
+    def testTopologyHash(self):
+        mesh = InstancedMesh(createQuad(), createTranslations(2))
+        moved = InstancedMesh(createQuad(), createTranslations(2))
+        moved.move((1, 2, 3))
+        self.assertEqual(mesh.getTopologyHash(), moved.getTopologyHash())
+        self.assertNotEqual(mesh.getTopologyHash(),
+                            InstancedMesh(createQuad(), createTranslations(3)).getTopologyHash())
+
+    def testFromMesh(self):
+        mesh = InstancedMesh.fromMesh(createQuad())
+        self.assertEqual(mesh.getInstanceAmount(), 1)
+        self.assertEqual(tuple(mesh.vertices[2]), (1, 1, 0))
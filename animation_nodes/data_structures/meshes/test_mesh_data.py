@@ -0,0 +1,101 @@
+from unittest import TestCase
+from . mesh_data import Mesh
+from ... utils.lru_cache import getContentDigest
+from .. lists.polygon_indices_list import PolygonIndicesList
+from .. lists.base_lists import (
+    Vector3DList, Vector2DList, EdgeIndicesList, LongList, FloatList, ColorList
+)
+
+def createQuad():
+    vertices = Vector3DList.fromValues([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)])
+    edges = EdgeIndicesList.fromValues([(0, 1), (1, 2), (2, 3), (3, 0)])
+    polygons = PolygonIndicesList.fromValues([(0, 1, 2, 3)])
+    return Mesh(vertices, edges, polygons, LongList.fromValues([0]))
+
+class TestTopologyHash(TestCase):
+    def testIgnoresVertexPositions(self):
+        mesh = createQuad()
+        movedMesh = createQuad()
+        movedMesh.move((1, 2, 3))
+        self.assertEqual(mesh.getTopologyHash(), movedMesh.getTopologyHash())
+
+    def testDifferentPolygons(self):
+        mesh = createQuad()
+        otherMesh = createQuad()
+        otherMesh.polygons.indices[0] = 1
+        otherMesh.polygons.indices[1] = 0
+        self.assertNotEqual(mesh.getTopologyHash(), otherMesh.getTopologyHash())
+
+    def testDifferentMaterialIndices(self):
+        mesh = createQuad()
+        otherMesh = createQuad()
+        otherMesh.materialIndices[0] = 1
+        self.assertNotEqual(mesh.getTopologyHash(), otherMesh.getTopologyHash())
+
+    def testTopologyChanged(self):
+        mesh = createQuad()
+        oldHash = mesh.getTopologyHash()
+        mesh.materialIndices[0] = 2
+        self.assertEqual(mesh.getTopologyHash(), oldHash)
+        mesh.topologyChanged()
+        self.assertNotEqual(mesh.getTopologyHash(), oldHash)
+
+    def testAppend(self):
+        mesh = createQuad()
+        oldHash = mesh.getTopologyHash()
+        mesh.append(createQuad())
+        self.assertNotEqual(mesh.getTopologyHash(), oldHash)
+
+class TestDerivedData(TestCase):
+    def testMoveKeepsNormals(self):
+        mesh = createQuad()
+        normals = mesh.getPolygonNormals()
+        centers = mesh.getPolygonCenters()
+        mesh.move((1, 0, 0))
+        self.assertIs(mesh.getPolygonNormals(), normals)
+        self.assertIsNot(mesh.getPolygonCenters(), centers)
+        self.assertEqual(tuple(mesh.getPolygonCenters()[0]), (1.5, 0.5, 0))
+
+    def testVerticesTransformedInvalidatesNormals(self):
+        mesh = createQuad()
+        normals = mesh.getPolygonNormals()
+        loopEdges = mesh.getLoopEdges()
+        mesh.verticesTransformed()
+        self.assertIsNot(mesh.getPolygonNormals(), normals)
+        self.assertIs(mesh.getLoopEdges(), loopEdges)
+
+    def testTopologyChangedInvalidatesLoopEdges(self):
+        mesh = createQuad()
+        loopEdges = mesh.getLoopEdges()
+        mesh.topologyChanged()
+        self.assertIsNot(mesh.getLoopEdges(), loopEdges)
+
+class TestAttributes(TestCase):
+    def testSameNameInDifferentTypes(self):
+        mesh = createQuad()
+        mesh.insertUVMap("A", Vector2DList(length = 4))
+        mesh.insertVertexColorLayer("A", ColorList(length = 4))
+        self.assertEqual(mesh.getUVMapNames(), ["A"])
+        self.assertEqual(mesh.getVertexColorLayerNames(), ["A"])
+
+    def testInvalidLength(self):
+        mesh = createQuad()
+        with self.assertRaises(Exception):
+            mesh.insertAttribute("POINT", "Weight", FloatList(length = 3))
+        with self.assertRaises(Exception):
+            mesh.insertAttribute("VOLUME", "Weight", FloatList(length = 4))
+
+    def testJoin(self):
+        mesh = createQuad()
+        mesh.insertAttribute("POINT", "Weight", FloatList.fromValues([1, 2, 3, 4]))
+        mesh.getLoopEdges()
+        otherMesh = createQuad()
+        otherMesh.insertUVMap("UV", Vector2DList.fromValues([(1, 1)] * 4))
+        otherMesh.getLoopEdges()
+
+        joined = Mesh.join(mesh, otherMesh)
+        self.assertEqual(list(joined.getAttribute("POINT", FloatList, "Weight")), [1, 2, 3, 4, 0, 0, 0, 0])
+        self.assertEqual([tuple(uv) for uv in joined.getUVMapPositions("UV")], [(0, 0)] * 4 + [(1, 1)] * 4)
+        self.assertEqual(list(joined.polygons[1]), [4, 5, 6, 7])
+        self.assertEqual(list(joined.getLoopEdges()), [0, 1, 2, 3, 4, 5, 6, 7])
+        self.assertEqual(getContentDigest(joined), getContentDigest(Mesh.join(mesh.copy(), otherMesh.copy())))
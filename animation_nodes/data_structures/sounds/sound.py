@@ -1,24 +1,37 @@
 import numpy
 from math import ceil, log
-from functools import lru_cache
 from . sound_sequence import sampleRate
+from . spectrum_cache import getSpectrumFrames, getCachedKaiser
 
 class Sound:
     def __init__(self, soundSequences):
         self.soundSequences = soundSequences
 
+    def getCacheKey(self):
+        return tuple((sequence.data, sequence.start, sequence.startOffset, sequence.end, sequence.volume)
+                     for sequence in self.soundSequences)
+
+    def getPersistentKey(self):
+        return tuple((sequence.data.getHash(), sequence.start, sequence.startOffset, sequence.end, sequence.volume)
+                     for sequence in self.soundSequences)
+
     def getSamplesInRange(self, start, end):
         if end <= start: raise ValueError("Invaild range!")
         start, end = int(start * sampleRate), int(end * sampleRate)
         samples = numpy.zeros(end - start + 1)
+        samples[:-1] = self.getSamplesInIndexRange(start, end)
+        return samples
+
+    def getSamplesInIndexRange(self, start, end):
+        samples = numpy.zeros(end - start)
 
         for sequence in self.soundSequences:
             sequenceStart = int(sequence.start * sampleRate)
             sequenceEnd = int(sequence.end * sampleRate)
-            if start > sequenceEnd or end < sequenceStart: continue
-            
-            sequenceStartOffset = int(sequence.startOffset * sampleRate)
             i, j = max(start, sequenceStart), min(end, sequenceEnd)
+            if j <= i: continue
+
+            sequenceStartOffset = int(sequence.startOffset * sampleRate)
             chunk = sequence.data.samples[i - sequenceStart + sequenceStartOffset:
                                           j - sequenceStart + sequenceStartOffset] * sequence.volume
             samples[i - start:i - start + len(chunk)] += chunk
@@ -30,17 +43,17 @@ class Sound:
         chunk[:len(samples)] = samples * getCachedKaiser(len(samples), beta)
         return numpy.abs(numpy.fft.rfft(chunk)) / len(samples) * 2
 
-    def computeTimeSmoothedSpectrum(self, start, end, attack, release, smoothingSamples = 5, beta = 6):
-        FFT = None
-        duration = end - start
-        for i in range(smoothingSamples, -1, -1):
-            newFFT = self.computeSpectrum(start - i * duration, end - i * duration, beta = beta)
-            if FFT is None: FFT = newFFT
-            else:
-                factor = numpy.array((attack, release))[(newFFT < FFT).astype(int)]
-                FFT = FFT * factor + newFFT * (1 - factor)
-        return FFT
+    def computeTimeSmoothedSpectrum(self, start, end, attack, release, smoothingSamples = 5, beta = 6,
+                                    cacheDirectory = None):
+        '''
+        The spectra of the frames are taken from a cache that is shared by all sounds
+        with the same sequences, see spectrum_cache.py for more information.
+        '''
+        if end <= start: raise ValueError("Invaild range!")
+        frames = getSpectrumFrames(self, start, end - start, smoothingSamples + 1, beta, cacheDirectory)
 
-@lru_cache(maxsize = 16)
-def getCachedKaiser(length, beta):
-    return numpy.kaiser(length, beta)
+        FFT = frames[0].copy()
+        for newFFT in frames[1:]:
+            factor = numpy.where(newFFT < FFT, release, attack)
+            FFT = FFT * factor + newFFT * (1 - factor)
+        return FFT
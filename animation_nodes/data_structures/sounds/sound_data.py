@@ -1,4 +1,14 @@
+import numpy
+import hashlib
+
 class SoundData:
     def __init__(self, samples, sampleRate):
         self.samples = samples
         self.sampleRate = sampleRate
+        self.hash = None
+
+    def getHash(self):
+        # stays the same between sessions, unlike the default hash
+        if self.hash is None:
+            self.hash = hashlib.sha1(numpy.ascontiguousarray(self.samples).tobytes()).hexdigest()
+        return self.hash
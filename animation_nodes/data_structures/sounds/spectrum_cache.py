@@ -0,0 +1,139 @@
+'''
+Spectra of a sound are computed for frames that start every hop samples,
+beginning at the phase of the requested time. Neighbouring frames overlap
+by one sample, like consecutive calls of Sound.computeSpectrum. The frames
+are computed in blocks when they are first requested and are shared by all
+nodes that use the same sound with the same duration and window.
+
+Blocks are kept in memory until the cache is full. When a cache directory
+is given, they are also stored in and loaded from files in that directory.
+The least recently used files are removed when the files of the directory
+need more space than maxDirectorySize.
+'''
+
+import os
+import glob
+import numpy
+import hashlib
+import threading
+from math import ceil, floor, log
+from functools import lru_cache
+from . sound_sequence import sampleRate
+from ... utils.lru_cache import LRUCache
+
+framesPerBlock = 32
+maxDirectorySize = 1024 * 2**20
+
+cachedBlocks = LRUCache(maxBytes = 256 * 2**20)
+cacheLock = threading.Lock()
+
+def getSpectrumFrames(sound, start, duration, amount, beta, cacheDirectory = None):
+    '''
+    Spectra of the amount frames that end with the frame starting at the start time.
+    Frame i starts duration seconds before frame i + 1.
+    '''
+    hop = duration * sampleRate
+    position = start * sampleRate / hop
+    lastFrame = floor(position + 1e-6)
+    phase = max(round((position - lastFrame) * hop, 3), 0)
+    stft = ShortTimeSpectrum(sound, round(hop, 6), phase, beta, cacheDirectory)
+    return stft.getFrames(lastFrame - amount + 1, lastFrame + 1)
+
+def clearSpectrumCache():
+    with cacheLock:
+        cachedBlocks.clear()
+
+class ShortTimeSpectrum:
+    def __init__(self, sound, hop, phase, beta, cacheDirectory = None):
+        self.sound = sound
+        self.hop = hop
+        self.phase = phase
+        self.beta = beta
+        self.cacheDirectory = cacheDirectory
+        self.windowSize = ceil(hop) + 1
+        self.fftSize = 2**ceil(log(self.windowSize, 2))
+        self.key = (sound.getCacheKey(), hop, phase, beta)
+
+    def getFrames(self, start, end):
+        firstBlock = start // framesPerBlock
+        lastBlock = (end - 1) // framesPerBlock
+        blocks = [self.getBlock(i) for i in range(firstBlock, lastBlock + 1)]
+        frames = blocks[0] if len(blocks) == 1 else numpy.concatenate(blocks)
+        offset = firstBlock * framesPerBlock
+        return frames[start - offset:end - offset]
+
+    def getBlock(self, index):
+        key = (self.key, index)
+        with cacheLock:
+            found, block = cachedBlocks.lookup(key)
+            if found:
+                return block
+
+        block = self.loadOrComputeBlock(index)
+        block.setflags(write = False)
+
+        with cacheLock:
+            if key not in cachedBlocks:
+                cachedBlocks.set(key, block, block.nbytes)
+        return block
+
+    def loadOrComputeBlock(self, index):
+        if not self.cacheDirectory:
+            return self.computeBlock(index)
+
+        path = os.path.join(self.cacheDirectory, self.getBlockFileName(index))
+        if os.path.exists(path):
+            try:
+                block = numpy.load(path)
+                # the modification time is used to find the least recently used files
+                os.utime(path)
+                return block
+            except (OSError, ValueError): pass
+
+        block = self.computeBlock(index)
+        os.makedirs(self.cacheDirectory, exist_ok = True)
+        numpy.save(path, block)
+        pruneCacheDirectory(self.cacheDirectory, maxDirectorySize)
+        return block
+
+    def getBlockFileName(self, index):
+        identifier = repr((self.sound.getPersistentKey(), self.hop, self.phase, self.beta, sampleRate))
+        return "spectrum_{}_{}.npy".format(hashlib.sha1(identifier.encode()).hexdigest(), index)
+
+    def computeBlock(self, index):
+        frameIndices = numpy.arange(index * framesPerBlock, (index + 1) * framesPerBlock)
+        starts = numpy.floor(self.phase + frameIndices * self.hop).astype(numpy.int64)
+        ends = numpy.floor(self.phase + (frameIndices + 1) * self.hop).astype(numpy.int64)
+        lengths = ends - starts + 1
+        samples = self.sound.getSamplesInIndexRange(starts[0], ends[-1])
+
+        # The lengths of the frames differ by one sample when the hop is not an integer.
+        # The last sample of every frame is zero, like in Sound.computeSpectrum.
+        spectra = numpy.zeros((framesPerBlock, self.fftSize // 2 + 1))
+        for length in numpy.unique(lengths):
+            length = int(length)
+            rows = numpy.nonzero(lengths == length)[0]
+            indices = (starts[rows] - starts[0])[:, numpy.newaxis] + numpy.arange(length - 1)
+            chunk = numpy.zeros((len(rows), self.fftSize))
+            chunk[:, :length - 1] = samples[indices] * getCachedKaiser(length, self.beta)[:length - 1]
+            spectra[rows] = numpy.abs(numpy.fft.rfft(chunk, axis = 1)) / length * 2
+        return spectra
+
+def pruneCacheDirectory(directory, maxSize):
+    '''Removes the least recently used spectrum files until they need at most maxSize bytes.'''
+    files = []
+    for path in glob.glob(os.path.join(glob.escape(directory), "spectrum_*.npy")):
+        try: files.append((os.path.getmtime(path), os.path.getsize(path), path))
+        except OSError: pass
+
+    totalSize = sum(size for _, size, _ in files)
+    for _, size, path in sorted(files):
+        if totalSize <= maxSize:
+            break
+        try: os.remove(path)
+        except OSError: continue
+        totalSize -= size
+
+@lru_cache(maxsize = 16)
+def getCachedKaiser(length, beta):
+    return numpy.kaiser(length, beta)
@@ -0,0 +1,95 @@
+import os
+import numpy
+import tempfile
+from unittest import TestCase, mock
+from . sound import Sound
+from . sound_data import SoundData
+from . sound_sequence import SoundSequence, sampleRate
+from . import spectrum_cache
+from . spectrum_cache import ShortTimeSpectrum, clearSpectrumCache, pruneCacheDirectory
+
+def createSound(seed = 0):
+    random = numpy.random.RandomState(seed)
+    data = SoundData(random.uniform(-1, 1, sampleRate * 3).astype(numpy.float32), sampleRate)
+    return Sound([SoundSequence(data, 0.5, 0.2, 3, 0.8, 25)])
+
+def computeSmoothedSpectrumDirectly(sound, start, end, attack, release, smoothingSamples, beta):
+    FFT = None
+    duration = end - start
+    for i in range(smoothingSamples, -1, -1):
+        newFFT = sound.computeSpectrum(start - i * duration, end - i * duration, beta = beta)
+        if FFT is None: FFT = newFFT
+        else:
+            factor = numpy.array((attack, release))[(newFFT < FFT).astype(int)]
+            FFT = FFT * factor + newFFT * (1 - factor)
+    return FFT
+
+class TestSpectrumCache(TestCase):
+    def setUp(self):
+        clearSpectrumCache()
+
+    def testSameAsDirectComputation(self):
+        sound = createSound()
+        for frame in (0, 3, 30, 61):
+            result = sound.computeTimeSmoothedSpectrum(frame / 25, (frame + 1) / 25, 0.1, 0.6, 10, 6)
+            expected = computeSmoothedSpectrumDirectly(sound, frame / 25, (frame + 1) / 25, 0.1, 0.6, 10, 6)
+            self.assertSpectraAlmostEqual(result, expected)
+
+    def testFractionalHop(self):
+        sound = createSound()
+        result = sound.computeTimeSmoothedSpectrum(40 / 24, 41 / 24, 0.1, 0.6, 5, 6)
+        expected = computeSmoothedSpectrumDirectly(sound, 40 / 24, 41 / 24, 0.1, 0.6, 5, 6)
+        self.assertSpectraAlmostEqual(result, expected)
+
+    def testBlocksAreReused(self):
+        sequences = createSound().soundSequences
+        with mock.patch.object(ShortTimeSpectrum, "computeBlock",
+                               autospec = True, side_effect = ShortTimeSpectrum.computeBlock) as computeBlock:
+            for frame in range(40, 50):
+                Sound(sequences).computeTimeSmoothedSpectrum(frame / 25, (frame + 1) / 25, 0.1, 0.6, 10, 6)
+            self.assertEqual(computeBlock.call_count, 2)
+
+    def testCacheDirectory(self):
+        sound = createSound()
+        with tempfile.TemporaryDirectory() as directory:
+            expected = sound.computeTimeSmoothedSpectrum(1, 1.04, 0.1, 0.6, 3, 6, cacheDirectory = directory)
+            self.assertTrue(len(os.listdir(directory)) > 0)
+            clearSpectrumCache()
+            # the files are found by the hash of the data, not by the sound object
+            with mock.patch.object(ShortTimeSpectrum, "computeBlock") as computeBlock:
+                result = createSound().computeTimeSmoothedSpectrum(1, 1.04, 0.1, 0.6, 3, 6, cacheDirectory = directory)
+                self.assertEqual(computeBlock.call_count, 0)
+            self.assertTrue(numpy.array_equal(result, expected))
+
+    def testMemoryLimit(self):
+        sound = createSound()
+        with mock.patch.object(spectrum_cache.cachedBlocks, "maxBytes", 1):
+            result = sound.computeTimeSmoothedSpectrum(1, 1.04, 0.1, 0.6, 3, 6)
+            self.assertEqual(len(spectrum_cache.cachedBlocks), 0)
+        self.assertSpectraAlmostEqual(result, sound.computeTimeSmoothedSpectrum(1, 1.04, 0.1, 0.6, 3, 6))
+
+    def testCacheDirectoryIsLimited(self):
+        sound = createSound()
+        with tempfile.TemporaryDirectory() as directory:
+            sound.computeTimeSmoothedSpectrum(0.2, 0.24, 0.1, 0.6, 3, 6, cacheDirectory = directory)
+            fileSize = os.path.getsize(os.path.join(directory, os.listdir(directory)[0]))
+            with mock.patch.object(spectrum_cache, "maxDirectorySize", fileSize * 2):
+                for frame in range(0, 75, 5):
+                    sound.computeTimeSmoothedSpectrum(frame / 25, (frame + 1) / 25, 0.1, 0.6, 0, 6,
+                                                      cacheDirectory = directory)
+            self.assertEqual(len(os.listdir(directory)), 2)
+
+    def testPruneRemovesLeastRecentlyUsedFiles(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for i, name in enumerate(("spectrum_a.npy", "spectrum_b.npy", "spectrum_c.npy", "other.npy")):
+                path = os.path.join(directory, name)
+                with open(path, "wb") as f:
+                    f.write(bytes(100))
+                os.utime(path, (1000 + i, 1000 + i))
+            pruneCacheDirectory(directory, 250)
+            self.assertEqual(sorted(os.listdir(directory)), ["other.npy", "spectrum_b.npy", "spectrum_c.npy"])
+
+    def assertSpectraAlmostEqual(self, result, expected):
+        # the direct computation rounds some frame starts to the previous sample
+        self.assertEqual(result.shape, expected.shape)
+        self.assertTrue(numpy.allclose(result, expected, atol = 1e-3 * expected.max()))
@@ -1,13 +1,32 @@
 from ... math.vector cimport Vector3
 from ... math.matrix cimport Matrix4
-from .. lists.base_lists cimport FloatList, Vector3DList, Matrix4x4List
+from .. lists.base_lists cimport FloatList, DoubleList, LongList, Vector3DList, Matrix4x4List
+
+cdef class ArcLengthTable:
+    cdef:
+        readonly float tolerance
+        readonly Py_ssize_t minResolution
+        readonly double totalLength
+        FloatList parameters
+        DoubleList lengths
+        LongList segmentStarts
+        DoubleList segmentOffsets
+        Vector3DList controlPoints
+
+    cdef double getLength_LowLevel(self, float parameter)
+    cdef float getParameter_LowLevel(self, double length)
+
+cdef float findArcLengthParameter(float *parameters, double *lengths,
+                                  long *segmentStarts, double *segmentOffsets,
+                                  Py_ssize_t segmentAmount, double length) nogil
 
 cdef class Spline:
     cdef:
         public bint cyclic
         public long materialIndex
         readonly str type
-        FloatList uniformParameters
+        readonly ArcLengthTable arcLengthTable
+        bint arcLengthTableOutdated
 
     # Generic
     #############################################
@@ -21,10 +40,12 @@ cdef class Spline:
     #############################################
 
     cdef checkUniformConverter(self)
-    cpdef ensureUniformConverter(self, Py_ssize_t minResolution)
-    cdef _updateUniformParameters(self, Py_ssize_t totalResolution)
+    cpdef ensureUniformConverter(self, Py_ssize_t minResolution, float tolerance = ?)
+    cdef bint hasUniformConverter(self)
 
     cdef float toUniformParameter_LowLevel(self, float parameter)
+    cdef Py_ssize_t getSegmentAmount_LowLevel(self) except -1
+    cdef Vector3DList getSegmentControlPoints(self)
 
 
     # Normals
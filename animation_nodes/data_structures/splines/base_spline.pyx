@@ -1,6 +1,9 @@
-from ... utils.lists cimport findListSegment_LowLevel
+cimport cython
+from libc.string cimport memcmp, memcpy
+from libc.math cimport cos, sqrt, M_PI
 from ... math cimport (
-    distanceSquaredVec3, crossVec3, projectOnCenterPlaneVec3,
+    distanceVec3, distanceSquaredVec3, crossVec3, projectOnCenterPlaneVec3,
+    subVec3, lengthVec3,
     almostZeroVec3, angleVec3, dotVec3, normalizeVec3_InPlace,
     toPyVector3, toVector3, toPyMatrix4,
     findNearestLineParameter,
@@ -17,7 +20,7 @@ ctypedef float (*EvaluateFloat)(Spline, float)
 cdef class Spline:
 
     cpdef void markChanged(self):
-        self.uniformParameters = None
+        self.arcLengthTableOutdated = True
 
 
     # Generic
@@ -45,23 +48,30 @@ cdef class Spline:
     #############################################
 
     cdef checkUniformConverter(self):
-        if self.uniformParameters is None:
+        if not self.hasUniformConverter():
             raise Exception("cannot evaluate uniform parameters, call spline.ensureUniformConverter(resolution) first")
 
-    cpdef ensureUniformConverter(self, Py_ssize_t minResolution):
-        cdef Py_ssize_t pointAmount = len(self.points)
-        cdef Py_ssize_t totalResolution = pointAmount + max((pointAmount - 1), 0) * max(0, minResolution)
-        if self.uniformParameters is None:
-            self._updateUniformParameters(totalResolution)
-        elif self.uniformParameters.length < totalResolution:
-            self._updateUniformParameters(totalResolution)
-
-    cdef _updateUniformParameters(self, Py_ssize_t totalResolution):
-        from . poly_spline import PolySpline
-        if isinstance(self, PolySpline): polySpline = self
-        else: polySpline = PolySpline(self.getDistributedPoints(totalResolution))
-        self.uniformParameters = polySpline.getUniformParameters(totalResolution)
-
+    cdef bint hasUniformConverter(self):
+        return self.arcLengthTable is not None and not self.arcLengthTableOutdated
+
+    cpdef ensureUniformConverter(self, Py_ssize_t minResolution, float tolerance = 0.01):
+        '''
+        Every segment is split into minResolution + 1 parts. Parts whose estimated
+        relative length error is above the tolerance are subdivided further. Segments
+        whose control points did not change since the last call are taken from the old table.
+        '''
+        minResolution = max(minResolution, 0)
+        cdef ArcLengthTable oldTable = self.arcLengthTable
+        if oldTable is not None:
+            if (not self.arcLengthTableOutdated and
+                    oldTable.minResolution >= minResolution and oldTable.tolerance <= tolerance):
+                return
+            # the table never becomes less accurate, so that its segments can be reused
+            minResolution = max(minResolution, oldTable.minResolution)
+            tolerance = min(tolerance, oldTable.tolerance)
+
+        self.arcLengthTable = buildArcLengthTable(self, minResolution, tolerance, oldTable)
+        self.arcLengthTableOutdated = False
 
     def toUniformParameter(self, float t):
         self.checkUniformConverter()
@@ -78,11 +88,16 @@ cdef class Spline:
         return result
 
     cdef float toUniformParameter_LowLevel(self, float t):
-        cdef float factor
-        cdef long indices[2]
-        findListSegment_LowLevel(self.uniformParameters.length, False, t, indices, &factor)
-        return self.uniformParameters.data[indices[0]] * (1 - factor) + \
-               self.uniformParameters.data[indices[1]] * factor
+        cdef ArcLengthTable table = self.arcLengthTable
+        if table.totalLength == 0:
+            return t
+        return table.getParameter_LowLevel(t * table.totalLength)
+
+    cdef Py_ssize_t getSegmentAmount_LowLevel(self) except -1:
+        raise NotImplementedError()
+
+    cdef Vector3DList getSegmentControlPoints(self):
+        raise NotImplementedError()
 
 
     # Normals
@@ -335,6 +350,23 @@ cdef class Spline:
         self.projectExtended_LowLevel(&_point, &nearestPoint, &nearestTangent)
         return toPyVector3(&nearestPoint), toPyVector3(&nearestTangent)
 
+    def projectPoints(self, Vector3DList points):
+        self.checkEvaluability()
+        cdef FloatList parameters = FloatList(length = points.length)
+        cdef Py_ssize_t i
+        for i in range(points.length):
+            parameters.data[i] = self.project_LowLevel(points.data + i)
+        return parameters
+
+    def projectPointsExtended(self, Vector3DList points):
+        self.checkEvaluability()
+        cdef Vector3DList projections = Vector3DList(length = points.length)
+        cdef Vector3DList tangents = Vector3DList(length = points.length)
+        cdef Py_ssize_t i
+        for i in range(points.length):
+            self.projectExtended_LowLevel(points.data + i, projections.data + i, tangents.data + i)
+        return projections, tangents
+
     cdef float project_LowLevel(self, Vector3 *point):
         raise NotImplementedError()
 
@@ -418,6 +450,9 @@ cdef class Spline:
         if not self.isEvaluable(): return 0.0
         start = min(max(start, 0), 1)
         end = min(max(end, 0), 1)
+        if self.hasUniformConverter():
+            return abs(self.arcLengthTable.getLength_LowLevel(end) -
+                       self.arcLengthTable.getLength_LowLevel(start))
         return distanceSumOfVector3DList(self.getDistributedPoints(resolution, start, end))
 
 
@@ -428,6 +463,241 @@ cdef class Spline:
         return "<{} object at {}>".format(type(self).__name__, hex(id(self)))
 
 
+# Arc Length Table
+######################################################
+
+# parts of a segment are not subdivided further than this, even when the tolerance is not reached
+cdef int maxSubdivisionDepth = 12
+
+cdef class ArcLengthTable:
+    '''
+    Arc length of a spline at increasing parameters. Every segment has its own samples
+    between segmentStarts[i] and segmentStarts[i + 1] whose lengths start at 0,
+    so that segments can be copied into a new table without changes.
+    The segment offsets contain the length of the spline before every segment.
+    '''
+
+    def __len__(self):
+        return self.parameters.length
+
+    def getLength(self, float parameter):
+        if parameter < 0 or parameter > 1:
+            raise ValueError("parameter has to be between 0 and 1")
+        return self.getLength_LowLevel(parameter)
+
+    def getParameter(self, double length):
+        return self.getParameter_LowLevel(min(max(length, 0), self.totalLength))
+
+    @cython.cdivision(True)
+    cdef double getLength_LowLevel(self, float parameter):
+        cdef Py_ssize_t segmentAmount = self.segmentStarts.length - 1
+        if segmentAmount == 0:
+            return 0
+
+        cdef Py_ssize_t segment = min(max(<Py_ssize_t>(parameter * segmentAmount), 0), segmentAmount - 1)
+        cdef Py_ssize_t start = self.segmentStarts.data[segment]
+        cdef float *parameters = self.parameters.data + start
+        cdef double *lengths = self.lengths.data + start
+        cdef Py_ssize_t i = findInterval(parameters, self.segmentStarts.data[segment + 1] - start, parameter)
+
+        cdef float factor = 0
+        if parameters[i + 1] > parameters[i]:
+            factor = min(max((parameter - parameters[i]) / (parameters[i + 1] - parameters[i]), 0), 1)
+        return self.segmentOffsets.data[segment] + lengths[i] + (lengths[i + 1] - lengths[i]) * factor
+
+    cdef float getParameter_LowLevel(self, double length):
+        return findArcLengthParameter(self.parameters.data, self.lengths.data,
+            self.segmentStarts.data, self.segmentOffsets.data,
+            self.segmentStarts.length - 1, length)
+
+cdef float findArcLengthParameter(float *parameters, double *lengths,
+                                  long *segmentStarts, double *segmentOffsets,
+                                  Py_ssize_t segmentAmount, double length) nogil:
+    # Takes the data of an ArcLengthTable, so that it can be used without the GIL
+    if segmentAmount == 0:
+        return 0
+
+    cdef Py_ssize_t segment = findInterval(segmentOffsets, segmentAmount + 1, length)
+    cdef Py_ssize_t start = segmentStarts[segment]
+    parameters += start
+    lengths += start
+    length -= segmentOffsets[segment]
+    cdef Py_ssize_t i = findInterval(lengths, segmentStarts[segment + 1] - start, length)
+    return interpolateParameter(parameters + i, lengths + i, length)
+
+@cython.cdivision(True)
+cdef inline float interpolateParameter(float *parameters, double *lengths, double length) nogil:
+    cdef double factor = 0
+    if lengths[1] > lengths[0]:
+        factor = min(max((length - lengths[0]) / (lengths[1] - lengths[0]), 0), 1)
+    return parameters[0] + (parameters[1] - parameters[0]) * factor
+
+cdef float findParameter_Walking(ArcLengthTable table, double length, Py_ssize_t *segment, Py_ssize_t *index):
+    # Same result as table.getParameter_LowLevel, but the search starts at the previous
+    # segment and sample. This is much faster when the lengths are sorted.
+    cdef Py_ssize_t segmentAmount = table.segmentStarts.length - 1
+    cdef double *offsets = table.segmentOffsets.data
+    cdef double *lengths = table.lengths.data
+    cdef Py_ssize_t s = segment[0]
+    while s < segmentAmount - 1 and offsets[s + 1] <= length: s += 1
+    while s > 0 and offsets[s] > length: s -= 1
+
+    cdef Py_ssize_t first = table.segmentStarts.data[s]
+    cdef Py_ssize_t last = table.segmentStarts.data[s + 1] - 2
+    cdef Py_ssize_t i = min(max(index[0], first), last)
+    length -= offsets[s]
+    while i < last and lengths[i + 1] <= length: i += 1
+    while i > first and lengths[i] > length: i -= 1
+
+    segment[0] = s
+    index[0] = i
+    return interpolateParameter(table.parameters.data + i, lengths + i, length)
+
+cdef inline Py_ssize_t findInterval(cython.floating *values, Py_ssize_t amount, cython.floating value) nogil:
+    # binary search for the last i with values[i] <= value, the result is between 0 and amount - 2
+    # the loop has no unpredictable branch, which makes it much faster for random values
+    cdef Py_ssize_t index = 0
+    cdef Py_ssize_t half
+    amount -= 1
+    while amount > 1:
+        half = amount // 2
+        index = index + half if values[index + half] <= value else index
+        amount -= half
+    return index
+
+cdef ArcLengthTable buildArcLengthTable(Spline spline, Py_ssize_t minResolution,
+                                        float tolerance, ArcLengthTable oldTable):
+    cdef ArcLengthTable table = ArcLengthTable.__new__(ArcLengthTable)
+    table.minResolution = minResolution
+    table.tolerance = tolerance
+    table.parameters = FloatList()
+    table.lengths = DoubleList()
+    table.segmentStarts = LongList()
+    table.segmentOffsets = DoubleList()
+    table.segmentOffsets.append_LowLevel(0)
+
+    if not spline.isEvaluable():
+        table.segmentStarts.append_LowLevel(0)
+        table.controlPoints = Vector3DList()
+        table.totalLength = 0
+        return table
+
+    cdef Py_ssize_t segmentAmount = spline.getSegmentAmount_LowLevel()
+    cdef Vector3DList controlPoints = spline.getSegmentControlPoints()
+    cdef Py_ssize_t pointsPerSegment = controlPoints.length // segmentAmount
+    # the segments of poly splines are straight
+    cdef bint subdivide = spline.type != "POLY"
+    cdef Vector3DList partPoints = Vector3DList(length = minResolution + 2 if subdivide else 2)
+    # the relative length difference between a circular arc and its chord is about angle² / 24
+    cdef float minChordCos = cos(min(sqrt(24 * tolerance), M_PI))
+
+    cdef Py_ssize_t oldSegmentAmount = 0
+    if oldTable is not None and oldTable.minResolution == minResolution and oldTable.tolerance == tolerance:
+        oldSegmentAmount = oldTable.segmentStarts.length - 1
+        if oldTable.controlPoints.length != oldSegmentAmount * pointsPerSegment:
+            oldSegmentAmount = 0
+
+    cdef Py_ssize_t i
+    cdef double totalLength = 0
+    for i in range(segmentAmount):
+        table.segmentStarts.append_LowLevel(table.parameters.length)
+        if i < oldSegmentAmount and memcmp(controlPoints.data + i * pointsPerSegment,
+                                           oldTable.controlPoints.data + i * pointsPerSegment,
+                                           pointsPerSegment * sizeof(Vector3)) == 0:
+            copySegmentSamples(oldTable, table, i, oldSegmentAmount, segmentAmount)
+        else:
+            sampleSegment(spline, table, i, segmentAmount, partPoints, subdivide, minChordCos)
+        totalLength += table.lengths.data[table.lengths.length - 1]
+        table.segmentOffsets.append_LowLevel(totalLength)
+    table.segmentStarts.append_LowLevel(table.parameters.length)
+
+    table.controlPoints = controlPoints
+    table.totalLength = totalLength
+    return table
+
+@cython.cdivision(True)
+cdef sampleSegment(Spline spline, ArcLengthTable table, Py_ssize_t segment, Py_ssize_t segmentAmount,
+                   Vector3DList partPoints, bint subdivide, float minChordCos):
+    cdef Py_ssize_t i
+    cdef Py_ssize_t parts = partPoints.length - 1
+    cdef Vector3 *points = partPoints.data
+    cdef float start = <float>segment / <float>segmentAmount
+    cdef float end
+
+    for i in range(parts + 1):
+        spline.evaluatePoint_LowLevel((segment + <float>i / <float>parts) / <float>segmentAmount, points + i)
+    table.parameters.append_LowLevel(start)
+    table.lengths.append_LowLevel(0)
+
+    # The angles to the neighbouring chords estimate the angle of the arc of a part.
+    # Only parts with a large angle are subdivided.
+    cdef Vector3 chord, nextChord
+    cdef float chordLength, nextChordLength
+    cdef bint bentBefore = False, bentAfter
+    subVec3(&chord, points + 1, points)
+    chordLength = lengthVec3(&chord)
+
+    for i in range(parts):
+        end = (segment + <float>(i + 1) / <float>parts) / <float>segmentAmount
+        bentAfter = False
+        if i < parts - 1:
+            subVec3(&nextChord, points + i + 2, points + i + 1)
+            nextChordLength = lengthVec3(&nextChord)
+            bentAfter = dotVec3(&chord, &nextChord) < minChordCos * chordLength * nextChordLength
+
+        if subdivide and (parts == 1 or bentBefore or bentAfter):
+            subdivideSegmentPart(spline, table, start, end, points + i, points + i + 1, 0)
+        else:
+            appendArcLengthSample(table, end, chordLength)
+
+        start = end
+        chord = nextChord
+        chordLength = nextChordLength
+        bentBefore = bentAfter
+
+cdef void subdivideSegmentPart(Spline spline, ArcLengthTable table, float start, float end,
+                               Vector3 *startPoint, Vector3 *endPoint, int depth):
+    cdef float middle = (start + end) / 2
+    cdef Vector3 middlePoint
+    spline.evaluatePoint_LowLevel(middle, &middlePoint)
+
+    cdef double firstDistance = distanceVec3(startPoint, &middlePoint)
+    cdef double secondDistance = distanceVec3(&middlePoint, endPoint)
+    cdef double arcLength = firstDistance + secondDistance
+    cdef double error = arcLength - distanceVec3(startPoint, endPoint)
+
+    if depth < maxSubdivisionDepth and error > table.tolerance * arcLength:
+        subdivideSegmentPart(spline, table, start, middle, startPoint, &middlePoint, depth + 1)
+        subdivideSegmentPart(spline, table, middle, end, &middlePoint, endPoint, depth + 1)
+    else:
+        # the part is almost straight, so the middle sample is not needed
+        appendArcLengthSample(table, end, arcLength)
+
+cdef inline void appendArcLengthSample(ArcLengthTable table, float parameter, double distance):
+    table.lengths.append_LowLevel(table.lengths.data[table.lengths.length - 1] + distance)
+    table.parameters.append_LowLevel(parameter)
+
+@cython.cdivision(True)
+cdef copySegmentSamples(ArcLengthTable oldTable, ArcLengthTable table, Py_ssize_t segment,
+                        Py_ssize_t oldSegmentAmount, Py_ssize_t segmentAmount):
+    cdef Py_ssize_t start = oldTable.segmentStarts.data[segment]
+    cdef Py_ssize_t amount = oldTable.segmentStarts.data[segment + 1] - start
+    cdef Py_ssize_t oldLength = table.parameters.length
+    cdef Py_ssize_t i
+
+    table.parameters.grow(oldLength + amount)
+    table.lengths.grow(oldLength + amount)
+    memcpy(table.lengths.data + oldLength, oldTable.lengths.data + start, amount * sizeof(double))
+    if oldSegmentAmount == segmentAmount:
+        memcpy(table.parameters.data + oldLength, oldTable.parameters.data + start, amount * sizeof(float))
+    else:
+        # keep the position within the segment when the segment amount changed
+        for i in range(amount):
+            table.parameters.data[oldLength + i] = oldTable.parameters.data[start + i] * oldSegmentAmount / <float>segmentAmount
+    table.parameters.length += amount
+    table.lengths.length += amount
+
+
 # Float Range
 ######################################################
 
@@ -467,12 +737,17 @@ cdef evaluateDistributed(Spline spline, Py_ssize_t amount, EvaluateFunction eval
     cdef Py_ssize_t i
     cdef float t
     cdef bint convertToUniform = distributionType == "UNIFORM"
+    cdef ArcLengthTable table = spline.arcLengthTable
+    cdef Py_ssize_t segment = 0, sample = 0
+    if convertToUniform and table.totalLength == 0:
+        convertToUniform = False
+
     for i in range(amount):
         t = start + i * step
         if t > 1: t = 1
         elif t < 0: t = 0
         if convertToUniform:
-            t = spline.toUniformParameter_LowLevel(t)
+            t = findParameter_Walking(table, t * table.totalLength, &segment, &sample)
         if EvaluateFunction is EvaluateVector:
             evaluate(spline, t, <Vector3*>target + i)
         elif EvaluateFunction is EvaluateFloat:
@@ -10,3 +10,31 @@ cdef class BezierSpline(Spline):
         public FloatList radii
         public FloatList tilts
         Vector3DList normalsCache
+        Vector3DList projectionBoxes
+        Vector3DList projectionSamples
+
+    cdef ensureProjectionTree(self)
+
+cdef inline void evaluateBezierSegment_Point(Vector3 *result, float t, Vector3 **w) nogil:
+    cdef:
+        float t2 = t * t
+        float t3 = t2 * t
+        float mt1 = 1 - t
+        float mt2 = mt1 * mt1
+        float mt3 = mt2 * mt1
+        float coeff1 = 3 * mt2 * t
+        float coeff2 = 3 * mt1 * t2
+    result.x = w[0].x*mt3 + w[1].x*coeff1 + w[2].x*coeff2 + w[3].x*t3
+    result.y = w[0].y*mt3 + w[1].y*coeff1 + w[2].y*coeff2 + w[3].y*t3
+    result.z = w[0].z*mt3 + w[1].z*coeff1 + w[2].z*coeff2 + w[3].z*t3
+
+cdef inline void evaluateBezierSegment_Tangent(Vector3 *result, float t, Vector3 **w) nogil:
+    cdef:
+        float t2 = t * t
+        float coeff0 = -3 +  6 * t - 3 * t2
+        float coeff1 =  3 - 12 * t + 9 * t2
+        float coeff2 =       6 * t - 9 * t2
+        float coeff3 =                3 * t2
+    result.x = w[0].x*coeff0 + w[1].x*coeff1 + w[2].x*coeff2 + w[3].x*coeff3
+    result.y = w[0].y*coeff0 + w[1].y*coeff1 + w[2].y*coeff2 + w[3].y*coeff3
+    result.z = w[0].z*coeff0 + w[1].z*coeff1 + w[2].z*coeff2 + w[3].z*coeff3
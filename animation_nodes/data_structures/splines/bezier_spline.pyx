@@ -1,18 +1,27 @@
 cimport cython
 import textwrap
+from libc.math cimport fabs, INFINITY
 from libc.string cimport memcpy
-from numpy.polynomial import Polynomial
 from ... utils.lists cimport findListSegment_LowLevel
 from ... math cimport (
     subVec3, normalizeVec3_InPlace, lengthVec3, crossVec3,
     toPyVector3, mixVec3, isCloseVec3, lengthSquaredVec3,
+    dotVec3, distanceSquaredVec3,
 )
 
-from mathutils import Vector
 from . base_spline import calculateNormalsForTangents
 
 cdef Py_ssize_t normalsResolution = 5
 
+# samples per segment used to find the start parameter of the newton iteration
+cdef Py_ssize_t projectionResolution = 8
+cdef int maxNewtonIterations = 8
+
+cdef struct NearestSegmentPoint:
+    float distanceSquared
+    Py_ssize_t segment
+    float t
+
 # Great free online book about bezier curves:
 # http://pomax.github.io/bezierinfo/
 
@@ -55,6 +64,8 @@ cdef class BezierSpline(Spline):
     cpdef void markChanged(self):
         Spline.markChanged(self)
         self.normalsCache = None
+        self.projectionBoxes = None
+        self.projectionSamples = None
 
     cpdef bint isEvaluable(self):
         return self.points.length >= 2
@@ -68,13 +79,17 @@ cdef class BezierSpline(Spline):
         self.markChanged()
 
     def copy(self):
-        return BezierSpline(self.points.copy(),
-                            self.leftHandles.copy(),
-                            self.rightHandles.copy(),
-                            self.radii.copy(),
-                            self.tilts.copy(),
-                            self.cyclic,
-                            self.materialIndex)
+        cdef BezierSpline spline = BezierSpline(self.points.copy(),
+                                                self.leftHandles.copy(),
+                                                self.rightHandles.copy(),
+                                                self.radii.copy(),
+                                                self.tilts.copy(),
+                                                self.cyclic,
+                                                self.materialIndex)
+        # arc length tables are replaced instead of modified, so they can be shared
+        spline.arcLengthTable = self.arcLengthTable
+        spline.arcLengthTableOutdated = self.arcLengthTableOutdated
+        return spline
 
     def transform(self, matrix):
         self.points.transform(matrix)
@@ -82,6 +97,24 @@ cdef class BezierSpline(Spline):
         self.rightHandles.transform(matrix)
         self.markChanged()
 
+    # Uniform Conversion
+    ############################################################
+
+    cdef Py_ssize_t getSegmentAmount_LowLevel(self) except -1:
+        return getSegmentAmount(self)
+
+    cdef Vector3DList getSegmentControlPoints(self):
+        cdef Py_ssize_t i, segmentAmount = getSegmentAmount(self)
+        cdef Vector3DList controlPoints = Vector3DList(length = segmentAmount * 4)
+        cdef Vector3 *w[4]
+        for i in range(segmentAmount):
+            getSegmentData_Index(self, i, w)
+            controlPoints.data[i * 4 + 0] = w[0][0]
+            controlPoints.data[i * 4 + 1] = w[1][0]
+            controlPoints.data[i * 4 + 2] = w[2][0]
+            controlPoints.data[i * 4 + 3] = w[3][0]
+        return controlPoints
+
     # Normals
     ############################################################
 
@@ -136,49 +169,43 @@ cdef class BezierSpline(Spline):
     # Projection
     ############################################################
 
-    cdef float project_LowLevel(self, Vector3* _point):
-        # TODO: Speedup using cython
-        # slowest part here is the root finding using numpy
-        # maybe implement another numerical method to find the best parameter
-        # http://jazzros.blogspot.be/2011/03/projecting-point-on-bezier-curve.html
-        cdef:
-            int segmentAmount = getSegmentAmount(self)
-            Py_ssize_t i
-            Vector3 *w[4]
-            set possibleParameters = set()
-            list coeffs = [0] * 6
-
-        point = toPyVector3(_point)
+    cdef ensureProjectionTree(self):
+        '''
+        The bounding boxes of the control points form a binary tree over the segments.
+        Segments whose box is further away than the nearest point found so far
+        cannot contain the projection because a segment is inside the convex
+        hull of its control points.
+        '''
+        if self.projectionBoxes is not None:
+            return
 
-        for i in range(segmentAmount):
-            getSegmentData_Index(self, i, w)
-            p0 = toPyVector3(w[0]) - point
-            p1 = toPyVector3(w[1]) - point
-            p2 = toPyVector3(w[2]) - point
-            p3 = toPyVector3(w[3]) - point
-
-            a = p3 - 3 * p2 + 3 * p1 - p0
-            b = 3 * p2 - 6 * p1 + 3 * p0
-            c = 3 * (p1 - p0)
-
-            coeffs[0] = c.dot(p0)
-            coeffs[1] = c.dot(c) + b.dot(p0) * 2.0
-            coeffs[2] = b.dot(c) * 3.0 + a.dot(p0) * 3.0
-            coeffs[3] = a.dot(c) * 4.0 + b.dot(b) * 2.0
-            coeffs[4] = a.dot(b) * 5.0
-            coeffs[5] = a.dot(a) * 3.0
-
-            poly = Polynomial(coeffs, [0.0, 1.0], [0.0, 1.0])
-            roots = poly.roots()
-            realRoots = [float(min(max(root.real, 0), 1)) for root in roots]
-            segmentParameters = [(i + t) / segmentAmount for t in realRoots]
-            possibleParameters.update(segmentParameters)
-
-        sampledData = [(p, (point - self.evaluatePoint(p)).length_squared) for p in possibleParameters]
-        if len(sampledData) > 0:
-            return min(sampledData, key = lambda item: item[1])[0]
-        return 0
+        cdef Py_ssize_t segmentAmount = getSegmentAmount(self)
+        cdef Py_ssize_t resolution = projectionResolution
+        self.projectionBoxes = Vector3DList(length = 8 * segmentAmount)
+        self.projectionSamples = Vector3DList(length = segmentAmount * (resolution + 1))
+        buildProjectionTree(self, self.projectionBoxes.data, 0, 0, segmentAmount)
 
+        cdef Py_ssize_t segment, i
+        cdef Vector3 *w[4]
+        cdef Vector3 *samples = self.projectionSamples.data
+        for segment in range(segmentAmount):
+            getSegmentData_Index(self, segment, w)
+            for i in range(resolution + 1):
+                evaluateBezierSegment_Point(samples + segment * (resolution + 1) + i,
+                                            i / <float>resolution, w)
+
+    cdef float project_LowLevel(self, Vector3* point):
+        cdef Py_ssize_t segmentAmount = getSegmentAmount(self)
+        if segmentAmount <= 0:
+            return 0
+        self.ensureProjectionTree()
+
+        cdef NearestSegmentPoint nearest
+        nearest.distanceSquared = INFINITY
+        nearest.segment = 0
+        nearest.t = 0
+        searchProjectionTree(self, point, 0, 0, segmentAmount, &nearest)
+        return (nearest.segment + nearest.t) / <float>segmentAmount
 
     cdef void evaluatePoint_LowLevel(self, float parameter, Vector3 *result):
         cdef float t
@@ -325,6 +352,125 @@ cdef class BezierSpline(Spline):
             if isCloseVec3(w[0], w[1]) and isCloseVec3(w[2], w[3]):
                 mixVec3(w[1], w[0], w[3], 1.0 / 3.0)
                 mixVec3(w[2], w[0], w[3], 2.0 / 3.0)
+        self.markChanged()
+
+
+# Projection
+############################################################
+
+cdef void buildProjectionTree(BezierSpline spline, Vector3 *boxes,
+                              Py_ssize_t node, Py_ssize_t start, Py_ssize_t end):
+    '''
+    Node i covers the segments [start, end) and its children are 2i+1 and 2i+2.
+    The minimum of the box is stored at 2i and the maximum at 2i+1.
+    '''
+    cdef Vector3 *boxMin = boxes + 2 * node
+    cdef Vector3 *boxMax = boxes + 2 * node + 1
+    cdef Vector3 *w[4]
+    cdef Py_ssize_t i, middle
+
+    if end - start == 1:
+        getSegmentData_Index(spline, start, w)
+        boxMin[0] = w[0][0]
+        boxMax[0] = w[0][0]
+        for i in range(1, 4):
+            extendBox(boxMin, boxMax, w[i], w[i])
+        return
+
+    middle = (start + end) // 2
+    buildProjectionTree(spline, boxes, 2 * node + 1, start, middle)
+    buildProjectionTree(spline, boxes, 2 * node + 2, middle, end)
+    boxMin[0] = boxes[2 * (2 * node + 1)]
+    boxMax[0] = boxes[2 * (2 * node + 1) + 1]
+    extendBox(boxMin, boxMax, boxes + 2 * (2 * node + 2), boxes + 2 * (2 * node + 2) + 1)
+
+cdef inline void extendBox(Vector3 *boxMin, Vector3 *boxMax, Vector3 *otherMin, Vector3 *otherMax):
+    boxMin.x = min(boxMin.x, otherMin.x)
+    boxMin.y = min(boxMin.y, otherMin.y)
+    boxMin.z = min(boxMin.z, otherMin.z)
+    boxMax.x = max(boxMax.x, otherMax.x)
+    boxMax.y = max(boxMax.y, otherMax.y)
+    boxMax.z = max(boxMax.z, otherMax.z)
+
+cdef inline float distanceSquaredToBox(Vector3 *point, Vector3 *box):
+    cdef float dx = max(box[0].x - point.x, 0, point.x - box[1].x)
+    cdef float dy = max(box[0].y - point.y, 0, point.y - box[1].y)
+    cdef float dz = max(box[0].z - point.z, 0, point.z - box[1].z)
+    return dx * dx + dy * dy + dz * dz
+
+cdef void searchProjectionTree(BezierSpline spline, Vector3 *point,
+                               Py_ssize_t node, Py_ssize_t start, Py_ssize_t end,
+                               NearestSegmentPoint *nearest):
+    if end - start == 1:
+        projectOnSegment(spline, point, start, nearest)
+        return
+
+    cdef Vector3 *boxes = spline.projectionBoxes.data
+    cdef Py_ssize_t middle = (start + end) // 2
+    cdef Py_ssize_t left = 2 * node + 1, right = 2 * node + 2
+    cdef float leftDistance = distanceSquaredToBox(point, boxes + 2 * left)
+    cdef float rightDistance = distanceSquaredToBox(point, boxes + 2 * right)
+
+    # the closer child is searched first so that more of the other one can be pruned
+    if leftDistance <= rightDistance:
+        if leftDistance < nearest.distanceSquared:
+            searchProjectionTree(spline, point, left, start, middle, nearest)
+        if rightDistance < nearest.distanceSquared:
+            searchProjectionTree(spline, point, right, middle, end, nearest)
+    else:
+        if rightDistance < nearest.distanceSquared:
+            searchProjectionTree(spline, point, right, middle, end, nearest)
+        if leftDistance < nearest.distanceSquared:
+            searchProjectionTree(spline, point, left, start, middle, nearest)
+
+@cython.cdivision(True)
+cdef void projectOnSegment(BezierSpline spline, Vector3 *point, Py_ssize_t segment,
+                           NearestSegmentPoint *nearest):
+    cdef Py_ssize_t resolution = projectionResolution
+    cdef Vector3 *samples = spline.projectionSamples.data + segment * (resolution + 1)
+    cdef Py_ssize_t i, closestIndex = 0
+    cdef float distance, closestDistance = INFINITY
+
+    for i in range(resolution + 1):
+        distance = distanceSquaredVec3(point, samples + i)
+        if distance < closestDistance:
+            closestDistance = distance
+            closestIndex = i
+
+    cdef Vector3 *w[4]
+    getSegmentData_Index(spline, segment, w)
+
+    # newton iteration to find the root of the derivative of the squared distance
+    cdef float t = closestIndex / <float>resolution
+    cdef float newT, f, df
+    cdef Vector3 position, difference, tangent, secondDerivative
+    for i in range(maxNewtonIterations):
+        evaluateBezierSegment_Point(&position, t, w)
+        evaluateBezierSegment_Tangent(&tangent, t, w)
+        evaluateBezierSegment_Normal(&secondDerivative, t, w)
+        subVec3(&difference, &position, point)
+        f = dotVec3(&difference, &tangent)
+        df = dotVec3(&tangent, &tangent) + dotVec3(&difference, &secondDerivative)
+        if df <= 0:
+            break
+        newT = min(max(t - f / df, 0), 1)
+        if fabs(newT - t) < 1e-6:
+            t = newT
+            break
+        t = newT
+
+    evaluateBezierSegment_Point(&position, t, w)
+    distance = distanceSquaredVec3(point, &position)
+
+    # the newton iteration can end in a worse local minimum
+    if distance > closestDistance:
+        distance = closestDistance
+        t = closestIndex / <float>resolution
+
+    if distance < nearest.distanceSquared:
+        nearest.distanceSquared = distance
+        nearest.segment = segment
+        nearest.t = t
 
 cdef smoothPoint(BezierSpline spline, Py_ssize_t index, float strength):
     if 0 < index < spline.points.length - 1:
@@ -469,30 +615,6 @@ cdef inline void getSegmentIndex(BezierSpline spline, float parameter, Py_ssize_
 cdef inline int getSegmentAmount(BezierSpline spline):
     return spline.points.length - 1 + spline.cyclic
 
-cdef inline void evaluateBezierSegment_Point(Vector3 *result, float t, Vector3 **w):
-    cdef:
-        float t2 = t * t
-        float t3 = t2 * t
-        float mt1 = 1 - t
-        float mt2 = mt1 * mt1
-        float mt3 = mt2 * mt1
-        float coeff1 = 3 * mt2 * t
-        float coeff2 = 3 * mt1 * t2
-    result.x = w[0].x*mt3 + w[1].x*coeff1 + w[2].x*coeff2 + w[3].x*t3
-    result.y = w[0].y*mt3 + w[1].y*coeff1 + w[2].y*coeff2 + w[3].y*t3
-    result.z = w[0].z*mt3 + w[1].z*coeff1 + w[2].z*coeff2 + w[3].z*t3
-
-cdef inline void evaluateBezierSegment_Tangent(Vector3 *result, float t, Vector3 **w):
-    cdef:
-        float t2 = t * t
-        float coeff0 = -3 +  6 * t - 3 * t2
-        float coeff1 =  3 - 12 * t + 9 * t2
-        float coeff2 =       6 * t - 9 * t2
-        float coeff3 =                3 * t2
-    result.x = w[0].x*coeff0 + w[1].x*coeff1 + w[2].x*coeff2 + w[3].x*coeff3
-    result.y = w[0].y*coeff0 + w[1].y*coeff1 + w[2].y*coeff2 + w[3].y*coeff3
-    result.z = w[0].z*coeff0 + w[1].z*coeff1 + w[2].z*coeff2 + w[3].z*coeff3
-
 cdef inline void evaluateBezierSegment_Normal(Vector3 *result, float t, Vector3 **w):
     result.x = 6 * (1 - t) * (w[2].x - 2 * w[1].x + w[0].x) + 6 * t * (w[3].x - 2 * w[2].x + w[1].x)
     result.y = 6 * (1 - t) * (w[2].y - 2 * w[1].y + w[0].y) + 6 * t * (w[3].y - 2 * w[2].y + w[1].y)
@@ -57,11 +57,15 @@ cdef class PolySpline(Spline):
         self.markChanged()
 
     def copy(self):
-        return PolySpline(self.points.copy(),
-                          self.radii.copy(),
-                          self.tilts.copy(),
-                          self.cyclic,
-                          self.materialIndex)
+        cdef PolySpline spline = PolySpline(self.points.copy(),
+                                            self.radii.copy(),
+                                            self.tilts.copy(),
+                                            self.cyclic,
+                                            self.materialIndex)
+        # arc length tables are replaced instead of modified, so they can be shared
+        spline.arcLengthTable = self.arcLengthTable
+        spline.arcLengthTableOutdated = self.arcLengthTableOutdated
+        return spline
 
     def transform(self, matrix):
         self.points.transform(matrix)
@@ -74,6 +78,20 @@ cdef class PolySpline(Spline):
                                    self.points.data + self.points.length - 1)
         return length
 
+    # Uniform Conversion
+    #################################################
+
+    cdef Py_ssize_t getSegmentAmount_LowLevel(self) except -1:
+        return getSegmentAmount(self)
+
+    cdef Vector3DList getSegmentControlPoints(self):
+        cdef Py_ssize_t i, segmentAmount = getSegmentAmount(self)
+        cdef Vector3DList controlPoints = Vector3DList(length = segmentAmount * 2)
+        for i in range(segmentAmount):
+            controlPoints.data[i * 2 + 0] = self.points.data[i]
+            controlPoints.data[i * 2 + 1] = self.points.data[(i + 1) % self.points.length]
+        return controlPoints
+
     # Normals
     #################################################
 
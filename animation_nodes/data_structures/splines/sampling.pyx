@@ -0,0 +1,295 @@
+from cpython.mem cimport PyMem_Malloc, PyMem_Free
+from ... utils.lists cimport findListSegment_LowLevel
+from ... utils.parallel import getThreadAmount, splitRange, runParts
+from ... math cimport (
+    Vector3, Matrix4,
+    mixVec3, subVec3, crossVec3, normalizeVec3_InPlace,
+    rotateAroundAxisVec3, projectOnCenterPlaneVec3,
+    matrixFromNormalizedAxisData, scaleMatrix3x3Part
+)
+from .. lists.base_lists cimport FloatList, Vector3DList, Matrix4x4List
+from . base_spline cimport Spline, ArcLengthTable, findArcLengthParameter
+from . poly_spline cimport PolySpline
+from . bezier_spline cimport (
+    BezierSpline,
+    evaluateBezierSegment_Point,
+    evaluateBezierSegment_Tangent
+)
+
+# Splines are sampled in chunks on a thread pool when there are enough samples.
+# Every chunk writes the samples of its own splines without the GIL.
+DEF MIN_PARALLEL_ELEMENTS = 65536
+
+cdef struct SplineData:
+    bint isBezier
+    bint cyclic
+    Py_ssize_t pointAmount
+    Py_ssize_t tiltAmount
+    Vector3 *points
+    Vector3 *leftHandles
+    Vector3 *rightHandles
+    float *radii
+    float *tilts
+    Vector3 *normals
+    Py_ssize_t normalsResolution
+    float *parameters
+
+    # the arc length table, the parameters are not converted when it is NULL
+    float *tableParameters
+    double *tableLengths
+    long *tableSegmentStarts
+    double *tableSegmentOffsets
+    Py_ssize_t tableSegmentAmount
+    double totalLength
+
+cdef struct SampleTargets:
+    Py_ssize_t amount
+    Vector3 *points
+    Vector3 *tangents
+    Vector3 *normals
+    Matrix4 *matrices
+
+def sampleSplines(splines, FloatList parameters not None,
+                  bint checkRange = True, str parameterType = "RESOLUTION",
+                  bint points = True, bint tangents = False,
+                  bint normals = False, bint matrices = False):
+    '''
+    Evaluate every spline at the same parameters in a single call.
+    The samples of spline i start at index i * len(parameters).
+    Returns the points, tangents, normals and matrices; the ones that
+    are not requested are None.
+    '''
+    if checkRange:
+        if not parameters.allValuesInRange(0, 1):
+            raise Exception("parameters have to be between 0 and 1")
+    if parameterType not in ("RESOLUTION", "UNIFORM"):
+        raise Exception("Unknown parameterType; expected 'RESOLUTION' or 'UNIFORM' but got {}".format(repr(parameterType)))
+
+    return sample(list(splines), parameters, parameters, parameterType == "UNIFORM",
+                  points, tangents, normals, matrices)
+
+def sampleSplinesDistributed(splines, Py_ssize_t amount,
+                             float start = 0, float end = 1,
+                             str distributionType = "RESOLUTION",
+                             bint points = True, bint tangents = False,
+                             bint normals = False, bint matrices = False):
+    '''
+    Same as sampleSplines, but every spline is evaluated at the
+    parameters used by Spline.getDistributedPoints.
+    '''
+    if amount < 0:
+        raise ValueError("amount has to be >= 0")
+    if not (0 <= start <= 1 and 0 <= end <= 1):
+        raise ValueError("start and end values have to be between 0 and 1")
+    if distributionType not in ("RESOLUTION", "UNIFORM"):
+        raise ValueError("expected 'RESOLUTION' or 'UNIFORM' as distribution type")
+
+    # cyclic splines don't evaluate the end of the range when it is the start
+    cdef FloatList parameters = getDistributedParameters(amount, start, end, False)
+    cdef FloatList cyclicParameters = getDistributedParameters(amount, start, end, start == 0 and end == 1)
+    return sample(list(splines), parameters, cyclicParameters, distributionType == "UNIFORM",
+                  points, tangents, normals, matrices)
+
+cdef FloatList getDistributedParameters(Py_ssize_t amount, float start, float end, bint cyclic):
+    cdef FloatList parameters = FloatList(length = amount)
+    if amount == 1:
+        parameters.data[0] = (start + end) / 2
+        return parameters
+
+    cdef float step
+    if cyclic:
+        step = (end - start) / amount
+    else:
+        step = (end - start) / (amount - 1)
+
+    cdef Py_ssize_t i
+    for i in range(amount):
+        parameters.data[i] = min(max(start + i * step, 0), 1)
+    return parameters
+
+cdef sample(list splines, FloatList parameters, FloatList cyclicParameters, bint uniform,
+            bint points, bint tangents, bint normals, bint matrices):
+    cdef Py_ssize_t splineAmount = len(splines)
+    cdef Py_ssize_t amount = parameters.length
+    cdef Py_ssize_t i
+
+    cdef Spline spline
+    for spline in splines:
+        spline.checkEvaluability()
+        if uniform:
+            spline.checkUniformConverter()
+        if normals or matrices:
+            spline.checkNormals()
+
+    cdef Vector3DList resultPoints = Vector3DList(length = splineAmount * amount) if points else None
+    cdef Vector3DList resultTangents = Vector3DList(length = splineAmount * amount) if tangents else None
+    cdef Vector3DList resultNormals = Vector3DList(length = splineAmount * amount) if normals else None
+    cdef Matrix4x4List resultMatrices = Matrix4x4List(length = splineAmount * amount) if matrices else None
+
+    cdef SampleTargets targets
+    targets.amount = amount
+    targets.points = resultPoints.data if points else NULL
+    targets.tangents = resultTangents.data if tangents else NULL
+    targets.normals = resultNormals.data if normals else NULL
+    targets.matrices = resultMatrices.data if matrices else NULL
+
+    cdef SplineData *data = <SplineData*>PyMem_Malloc(max(splineAmount, 1) * sizeof(SplineData))
+    if data == NULL:
+        raise MemoryError()
+
+    try:
+        for i in range(splineAmount):
+            spline = splines[i]
+            setSplineData(data + i, spline, parameters, cyclicParameters, uniform)
+
+        def sampleChunk(Py_ssize_t start, Py_ssize_t end):
+            with nogil:
+                sampleSplineRange(data, start, end, &targets)
+
+        runParts(sampleChunk, getSplineChunks(splineAmount, amount))
+    finally:
+        PyMem_Free(data)
+
+    return resultPoints, resultTangents, resultNormals, resultMatrices
+
+cdef setSplineData(SplineData *data, Spline spline,
+                   FloatList parameters, FloatList cyclicParameters, bint uniform):
+    cdef BezierSpline bezierSpline
+    cdef PolySpline polySpline
+
+    if isinstance(spline, BezierSpline):
+        bezierSpline = spline
+        data.isBezier = True
+        data.points = bezierSpline.points.data
+        data.leftHandles = bezierSpline.leftHandles.data
+        data.rightHandles = bezierSpline.rightHandles.data
+        data.pointAmount = bezierSpline.points.length
+        data.radii = bezierSpline.radii.data
+        data.tilts = bezierSpline.tilts.data
+        data.tiltAmount = bezierSpline.tilts.length
+        data.normals = NULL
+        data.normalsResolution = 0
+        if bezierSpline.normalsCache is not None:
+            data.normals = bezierSpline.normalsCache.data
+            data.normalsResolution = bezierSpline.normalsCache.length // bezierSpline.getSegmentAmount_LowLevel()
+    elif isinstance(spline, PolySpline):
+        polySpline = spline
+        data.isBezier = False
+        data.points = polySpline.points.data
+        data.leftHandles = NULL
+        data.rightHandles = NULL
+        data.pointAmount = polySpline.points.length
+        data.radii = polySpline.radii.data
+        data.tilts = polySpline.tilts.data
+        data.tiltAmount = polySpline.tilts.length
+        data.normals = polySpline.normalsCache.data if polySpline.normalsCache is not None else NULL
+        data.normalsResolution = 1
+    else:
+        raise TypeError("expected a BezierSpline or PolySpline")
+
+    data.cyclic = spline.cyclic
+    data.parameters = cyclicParameters.data if spline.cyclic else parameters.data
+
+    cdef ArcLengthTable table = spline.arcLengthTable
+    data.tableParameters = NULL
+    if uniform and table.totalLength > 0:
+        data.tableParameters = table.parameters.data
+        data.tableLengths = table.lengths.data
+        data.tableSegmentStarts = table.segmentStarts.data
+        data.tableSegmentOffsets = table.segmentOffsets.data
+        data.tableSegmentAmount = table.segmentStarts.length - 1
+        data.totalLength = table.totalLength
+
+
+# Sampling without the GIL
+#########################################################
+
+cdef void sampleSplineRange(SplineData *splines, Py_ssize_t start, Py_ssize_t end,
+                            SampleTargets *targets) nogil:
+    cdef Py_ssize_t i, j
+    cdef float t
+    cdef SplineData *spline
+    for i in range(start, end):
+        spline = splines + i
+        for j in range(targets.amount):
+            t = spline.parameters[j]
+            if spline.tableParameters != NULL:
+                t = findArcLengthParameter(spline.tableParameters, spline.tableLengths,
+                    spline.tableSegmentStarts, spline.tableSegmentOffsets,
+                    spline.tableSegmentAmount, t * spline.totalLength)
+            sampleSpline(spline, t, targets, i * targets.amount + j)
+
+cdef void sampleSpline(SplineData *spline, float parameter,
+                       SampleTargets *targets, Py_ssize_t index) nogil:
+    # Same results as the evaluate functions of the spline classes
+    cdef long indices[2]
+    cdef float t
+    cdef Vector3 *w[4]
+    cdef Vector3 point, tangent, normal, bitangent
+    findListSegment_LowLevel(spline.pointAmount, spline.cyclic, parameter, indices, &t)
+
+    cdef bint needsPoint = targets.points != NULL or targets.matrices != NULL
+    cdef bint needsTangent = targets.tangents != NULL or targets.normals != NULL or targets.matrices != NULL
+
+    if spline.isBezier:
+        w[0] = spline.points + indices[0]
+        w[1] = spline.rightHandles + indices[0]
+        w[2] = spline.leftHandles + indices[1]
+        w[3] = spline.points + indices[1]
+        if needsPoint:
+            evaluateBezierSegment_Point(&point, t, w)
+        if needsTangent:
+            evaluateBezierSegment_Tangent(&tangent, t, w)
+    else:
+        if needsPoint:
+            mixVec3(&point, spline.points + indices[0], spline.points + indices[1], t)
+        if needsTangent:
+            subVec3(&tangent, spline.points + indices[1], spline.points + indices[0])
+
+    if targets.points != NULL:
+        targets.points[index] = point
+    if targets.tangents != NULL:
+        targets.tangents[index] = tangent
+    if targets.normals == NULL and targets.matrices == NULL:
+        return
+
+    evaluateNormal(spline, parameter, indices[0], t, &tangent, &normal)
+    if targets.normals != NULL:
+        targets.normals[index] = normal
+    if targets.matrices == NULL:
+        return
+
+    normalizeVec3_InPlace(&tangent)
+    normalizeVec3_InPlace(&normal)
+    crossVec3(&bitangent, &tangent, &normal)
+    matrixFromNormalizedAxisData(targets.matrices + index, &point, &tangent, &normal, &bitangent)
+    scaleMatrix3x3Part(targets.matrices + index,
+        spline.radii[indices[0]] * (1 - t) + spline.radii[indices[1]] * t)
+
+cdef void evaluateNormal(SplineData *spline, float parameter, long segment, float t,
+                         Vector3 *tangent, Vector3 *result) nogil:
+    cdef long indices[2]
+    cdef float f
+    cdef Vector3 approximated, rotated
+    cdef Vector3 *normals = spline.normals + segment * spline.normalsResolution
+
+    if spline.isBezier:
+        findListSegment_LowLevel(spline.normalsResolution, False, t, indices, &f)
+        mixVec3(&approximated, normals + indices[0], normals + indices[1], f)
+    else:
+        approximated = normals[0]
+
+    findListSegment_LowLevel(spline.tiltAmount, spline.cyclic, parameter, indices, &f)
+    cdef float tilt = spline.tilts[indices[0]] * (1 - f) + spline.tilts[indices[1]] * f
+    rotateAroundAxisVec3(&rotated, &approximated, tangent, tilt)
+    projectOnCenterPlaneVec3(result, &rotated, tangent)
+
+
+# Parallel Sampling
+#########################################################
+
+def getSplineChunks(Py_ssize_t splineAmount, Py_ssize_t sampleAmount):
+    cdef Py_ssize_t threadAmount = getThreadAmount()
+    if threadAmount == 1 or splineAmount < 2 or splineAmount * sampleAmount < MIN_PARALLEL_ELEMENTS:
+        return [(0, splineAmount)]
+    return splitRange(splineAmount, threadAmount)
@@ -0,0 +1,29 @@
+from ... math cimport Vector3
+from . base_spline cimport Spline
+from .. lists.base_lists cimport Vector3DList, FloatList, LongList, CharList, BooleanList
+
+cdef enum SplineListType:
+    POLY_SPLINE = 0
+    BEZIER_SPLINE = 1
+
+cdef class SplineList:
+    cdef:
+        readonly Vector3DList points
+        readonly Vector3DList leftHandles
+        readonly Vector3DList rightHandles
+        readonly FloatList radii
+        readonly FloatList tilts
+        readonly LongList pointStarts
+        readonly LongList pointAmounts
+        readonly CharList types
+        readonly BooleanList cyclic
+        readonly LongList materialIndices
+
+    cdef Py_ssize_t getLength(self)
+    cdef appendSpline(self, Spline spline)
+    cdef extend_SameType(self, SplineList other)
+    cdef Spline getSpline(self, Py_ssize_t index)
+    cdef reservePoints(self, Py_ssize_t amount)
+
+    cdef void evaluatePoint_LowLevel(self, Py_ssize_t index, float parameter, Vector3 *result)
+    cdef void evaluateTangent_LowLevel(self, Py_ssize_t index, float parameter, Vector3 *result)
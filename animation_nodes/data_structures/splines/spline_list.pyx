@@ -0,0 +1,297 @@
+cimport cython
+from libc.string cimport memcpy
+from ... utils.lists cimport findListSegment_LowLevel
+from ... math cimport mixVec3, subVec3
+from . poly_spline cimport PolySpline
+from . bezier_spline cimport (
+    BezierSpline,
+    evaluateBezierSegment_Point,
+    evaluateBezierSegment_Tangent
+)
+
+cdef class SplineList:
+    '''
+    Many splines whose data is stored in shared lists.
+    The points of spline i are pointAmounts[i] elements starting at pointStarts[i].
+    The handles of poly splines are equal to their points, so that all point lists have the same length.
+    '''
+
+    def __cinit__(self):
+        self.points = Vector3DList()
+        self.leftHandles = Vector3DList()
+        self.rightHandles = Vector3DList()
+        self.radii = FloatList()
+        self.tilts = FloatList()
+        self.pointStarts = LongList()
+        self.pointAmounts = LongList()
+        self.types = CharList()
+        self.cyclic = BooleanList()
+        self.materialIndices = LongList()
+
+    @classmethod
+    def fromSplines(cls, splines):
+        cdef SplineList splineList = SplineList()
+        splineList.extend(splines)
+        return splineList
+
+    @classmethod
+    def fromPolySplinePoints(cls, Vector3DList points, FloatList radii, LongList pointAmounts):
+        '''
+        Creates poly splines that use consecutive parts of the points.
+        Tilts are zero, the splines are not cyclic and use the first material.
+        '''
+        if points.length != radii.length:
+            raise ValueError("list lengths of the splines have to be equal")
+        if pointAmounts.getSumOfElements() != points.length:
+            raise ValueError("the point amounts don't match the amount of points")
+
+        cdef SplineList splineList = SplineList()
+        cdef Py_ssize_t i, start = 0
+        splineList.points = points.copy()
+        splineList.leftHandles = points.copy()
+        splineList.rightHandles = points.copy()
+        splineList.radii = radii.copy()
+        splineList.tilts = FloatList.fromValue(0, length = points.length)
+        splineList.pointAmounts = pointAmounts.copy()
+        splineList.pointStarts = LongList(length = pointAmounts.length)
+        for i in range(pointAmounts.length):
+            splineList.pointStarts.data[i] = start
+            start += pointAmounts.data[i]
+        splineList.types = CharList.fromValue(POLY_SPLINE, length = pointAmounts.length)
+        splineList.cyclic = BooleanList.fromValue(False, length = pointAmounts.length)
+        splineList.materialIndices = LongList.fromValue(0, length = pointAmounts.length)
+        return splineList
+
+    def toSplines(self):
+        cdef Py_ssize_t i
+        return [self.getSpline(i) for i in range(self.getLength())]
+
+    def __len__(self):
+        return self.getLength()
+
+    cdef Py_ssize_t getLength(self):
+        return self.types.length
+
+    def __getitem__(self, Py_ssize_t index):
+        if index < 0:
+            index += self.getLength()
+        if index < 0 or index >= self.getLength():
+            raise IndexError("index out of range")
+        return self.getSpline(index)
+
+    def __iter__(self):
+        cdef Py_ssize_t i
+        for i in range(self.getLength()):
+            yield self.getSpline(i)
+
+    def __repr__(self):
+        return "<SplineList with {} splines and {} points>".format(self.getLength(), self.points.length)
+
+    def getMemoryUsage(self):
+        return sum(data.getMemoryUsage() for data in (
+            self.points, self.leftHandles, self.rightHandles, self.radii, self.tilts,
+            self.pointStarts, self.pointAmounts, self.types, self.cyclic, self.materialIndices))
+
+
+    # Modify
+    #############################################
+
+    def append(self, Spline spline):
+        self.appendSpline(spline)
+
+    def extend(self, splines):
+        cdef Spline spline
+        if isinstance(splines, SplineList):
+            self.extend_SameType(splines)
+        else:
+            for spline in splines:
+                self.appendSpline(spline)
+
+    cdef appendSpline(self, Spline spline):
+        cdef Py_ssize_t start = self.points.length
+        cdef BezierSpline bezierSpline
+        cdef PolySpline polySpline
+
+        if isinstance(spline, BezierSpline):
+            bezierSpline = spline
+            if not (bezierSpline.points.length == bezierSpline.leftHandles.length == bezierSpline.rightHandles.length
+                    == bezierSpline.radii.length == bezierSpline.tilts.length):
+                raise ValueError("list lengths of the spline have to be equal")
+            self.reservePoints(bezierSpline.points.length)
+            appendVectors(self.points, bezierSpline.points)
+            appendVectors(self.leftHandles, bezierSpline.leftHandles)
+            appendVectors(self.rightHandles, bezierSpline.rightHandles)
+            appendFloats(self.radii, bezierSpline.radii)
+            appendFloats(self.tilts, bezierSpline.tilts)
+            self.types.append_LowLevel(BEZIER_SPLINE)
+        elif isinstance(spline, PolySpline):
+            polySpline = spline
+            if not (polySpline.points.length == polySpline.radii.length == polySpline.tilts.length):
+                raise ValueError("list lengths of the spline have to be equal")
+            self.reservePoints(polySpline.points.length)
+            appendVectors(self.points, polySpline.points)
+            appendVectors(self.leftHandles, polySpline.points)
+            appendVectors(self.rightHandles, polySpline.points)
+            appendFloats(self.radii, polySpline.radii)
+            appendFloats(self.tilts, polySpline.tilts)
+            self.types.append_LowLevel(POLY_SPLINE)
+        else:
+            raise TypeError("expected a BezierSpline or PolySpline")
+
+        self.pointStarts.append_LowLevel(start)
+        self.pointAmounts.append_LowLevel(self.points.length - start)
+        self.cyclic.append_LowLevel(spline.cyclic)
+        self.materialIndices.append_LowLevel(spline.materialIndex)
+
+    cdef extend_SameType(self, SplineList other):
+        cdef Py_ssize_t offset = self.points.length
+        cdef Py_ssize_t oldLength = self.getLength()
+        cdef Py_ssize_t i
+
+        self.points.extend(other.points)
+        self.leftHandles.extend(other.leftHandles)
+        self.rightHandles.extend(other.rightHandles)
+        self.radii.extend(other.radii)
+        self.tilts.extend(other.tilts)
+        self.pointAmounts.extend(other.pointAmounts)
+        self.types.extend(other.types)
+        self.cyclic.extend(other.cyclic)
+        self.materialIndices.extend(other.materialIndices)
+        self.pointStarts.extend(other.pointStarts)
+        for i in range(oldLength, self.getLength()):
+            self.pointStarts.data[i] += offset
+
+    cdef reservePoints(self, Py_ssize_t amount):
+        cdef Py_ssize_t newLength = self.points.length + amount
+        self.points.grow(newLength)
+        self.leftHandles.grow(newLength)
+        self.rightHandles.grow(newLength)
+        self.radii.grow(newLength)
+        self.tilts.grow(newLength)
+
+    def copy(self):
+        cdef SplineList splineList = SplineList()
+        splineList.extend_SameType(self)
+        return splineList
+
+    def transform(self, matrix):
+        self.points.transform(matrix)
+        self.leftHandles.transform(matrix)
+        self.rightHandles.transform(matrix)
+
+
+    # Splines
+    #############################################
+
+    cdef Spline getSpline(self, Py_ssize_t index):
+        cdef Py_ssize_t start = self.pointStarts.data[index]
+        cdef Py_ssize_t amount = self.pointAmounts.data[index]
+        cdef Vector3DList points = sliceVectors(self.points, start, amount)
+        cdef FloatList radii = sliceFloats(self.radii, start, amount)
+        cdef FloatList tilts = sliceFloats(self.tilts, start, amount)
+        cdef bint cyclic = self.cyclic.data[index]
+        cdef long materialIndex = self.materialIndices.data[index]
+
+        if self.types.data[index] == BEZIER_SPLINE:
+            return BezierSpline(points,
+                                sliceVectors(self.leftHandles, start, amount),
+                                sliceVectors(self.rightHandles, start, amount),
+                                radii, tilts, cyclic, materialIndex)
+        else:
+            return PolySpline(points, radii, tilts, cyclic, materialIndex)
+
+
+    # Evaluation
+    #############################################
+
+    def getDistributedPoints(self, Py_ssize_t amount, float start = 0, float end = 1):
+        '''
+        Evaluate amount points on every spline, like Spline.getDistributedPoints.
+        The points of spline i start at index i * amount.
+        '''
+        cdef Vector3DList result = Vector3DList(length = amount * self.getLength())
+        evaluateDistributed(self, amount, start, end, False, result.data)
+        return result
+
+    def getDistributedTangents(self, Py_ssize_t amount, float start = 0, float end = 1):
+        cdef Vector3DList result = Vector3DList(length = amount * self.getLength())
+        evaluateDistributed(self, amount, start, end, True, result.data)
+        return result
+
+    cdef void evaluatePoint_LowLevel(self, Py_ssize_t index, float parameter, Vector3 *result):
+        cdef Py_ssize_t start = self.pointStarts.data[index]
+        cdef long indices[2]
+        cdef float t
+        cdef Vector3 *w[4]
+        findListSegment_LowLevel(self.pointAmounts.data[index], self.cyclic.data[index], parameter, indices, &t)
+        if self.types.data[index] == BEZIER_SPLINE:
+            getSegmentData(self, start, indices, w)
+            evaluateBezierSegment_Point(result, t, w)
+        else:
+            mixVec3(result, self.points.data + start + indices[0], self.points.data + start + indices[1], t)
+
+    cdef void evaluateTangent_LowLevel(self, Py_ssize_t index, float parameter, Vector3 *result):
+        cdef Py_ssize_t start = self.pointStarts.data[index]
+        cdef long indices[2]
+        cdef float t
+        cdef Vector3 *w[4]
+        findListSegment_LowLevel(self.pointAmounts.data[index], self.cyclic.data[index], parameter, indices, &t)
+        if self.types.data[index] == BEZIER_SPLINE:
+            getSegmentData(self, start, indices, w)
+            evaluateBezierSegment_Tangent(result, t, w)
+        else:
+            subVec3(result, self.points.data + start + indices[1], self.points.data + start + indices[0])
+
+cdef inline void getSegmentData(SplineList splines, Py_ssize_t start, long *indices, Vector3 **w):
+    w[0] = splines.points.data + start + indices[0]
+    w[1] = splines.rightHandles.data + start + indices[0]
+    w[2] = splines.leftHandles.data + start + indices[1]
+    w[3] = splines.points.data + start + indices[1]
+
+@cython.cdivision(True)
+cdef evaluateDistributed(SplineList splines, Py_ssize_t amount, float start, float end,
+                         bint tangents, Vector3 *result):
+    if amount < 0:
+        raise ValueError("amount has to be >= 0")
+    if not (0 <= start <= 1 and 0 <= end <= 1):
+        raise ValueError("start and end values have to be between 0 and 1")
+
+    cdef Py_ssize_t i, j
+    for i in range(splines.getLength()):
+        if splines.pointAmounts.data[i] < 2:
+            raise Exception("spline at index {} is not evaluable".format(i))
+
+    cdef float t, first, step
+    for i in range(splines.getLength()):
+        if amount == 1:
+            first, step = (start + end) / 2, 0
+        elif splines.cyclic.data[i] and start == 0 and end == 1:
+            first, step = start, (end - start) / amount
+        else:
+            first, step = start, (end - start) / (amount - 1)
+
+        for j in range(amount):
+            t = min(max(first + j * step, 0), 1)
+            if tangents:
+                splines.evaluateTangent_LowLevel(i, t, result + i * amount + j)
+            else:
+                splines.evaluatePoint_LowLevel(i, t, result + i * amount + j)
+
+cdef inline void appendVectors(Vector3DList target, Vector3DList source):
+    # the memory has been reserved before
+    memcpy(target.data + target.length, source.data, source.length * sizeof(Vector3))
+    target.length += source.length
+
+cdef inline void appendFloats(FloatList target, FloatList source):
+    memcpy(target.data + target.length, source.data, source.length * sizeof(float))
+    target.length += source.length
+
+cdef Vector3DList sliceVectors(Vector3DList source, Py_ssize_t start, Py_ssize_t amount):
+    cdef Vector3DList result = Vector3DList(length = amount)
+    memcpy(result.data, source.data + start, amount * sizeof(Vector3))
+    return result
+
+cdef FloatList sliceFloats(FloatList source, Py_ssize_t start, Py_ssize_t amount):
+    cdef FloatList result = FloatList(length = amount)
+    memcpy(result.data, source.data + start, amount * sizeof(float))
+    return result
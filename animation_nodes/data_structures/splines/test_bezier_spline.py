@@ -1,6 +1,8 @@
+from random import Random
 from mathutils import Vector
 from unittest import TestCase
 from . bezier_spline import BezierSpline
+from .. lists.base_lists import Vector3DList
 
 class TestInitialisation(TestCase):
     def testNormal(self):
@@ -163,6 +165,99 @@ class TestProjectOnSpline(TestCase):
         parameter = spline.project((0, 0, 1))
         self.assertAlmostEqual(parameter, 0.5)
 
+    def testSameDistanceAsDenseSampling(self):
+        spline = getRandomSpline(30, cyclic = False)
+        samples = spline.getDistributedPoints(30000)
+        for point in [(0, 0, 0), (3, -2, 1), (10, 10, 10), (-4, 1, -2), (1.5, 0.2, -0.7)]:
+            expected = min((Vector(sample) - Vector(point)).length for sample in samples)
+            projected = spline.evaluatePoint(spline.project(point))
+            self.assertAlmostEqual((Vector(projected) - Vector(point)).length, expected, places = 3)
+
+    def testCyclic(self):
+        spline = BezierSpline()
+        spline.appendPoint((0, 0, 0), (-1, 0, 0), (1, 0, 0))
+        spline.appendPoint((4, 0, 0), (3, 0, 0), (5, 0, 0))
+        spline.cyclic = True
+        spline.markChanged()
+        self.assertAlmostEqual(spline.project((2, -1, 0)), 0.25, places = 4)
+        self.assertAlmostEqual(spline.project((2, 1, 0)), 0.25, places = 4)
+
+    def testProjectPoints(self):
+        spline = getRandomSpline(50, cyclic = True)
+        points = Vector3DList.fromValues([(x, x % 3, -x) for x in range(-20, 20)])
+        parameters = spline.projectPoints(points)
+        for point, parameter in zip(points, parameters):
+            self.assertAlmostEqual(spline.project(point), parameter)
+
+    def testChangedSpline(self):
+        spline = BezierSpline()
+        spline.appendPoint((0, 0, 0), (0, 0, 0), (1, 0, 0))
+        spline.appendPoint((3, 0, 0), (2, 0, 0), (3, 0, 0))
+        self.assertAlmostEqual(spline.project((3, 0, 1)), 1)
+        spline.appendPoint((3, 0, 3), (3, 0, 2), (3, 0, 3))
+        self.assertAlmostEqual(spline.project((3, 0, 4)), 1)
+
+class TestArcLengthTable(TestCase):
+    def testSameLengthAsDenseSampling(self):
+        spline = getRandomSpline(20, cyclic = True)
+        spline.ensureUniformConverter(0, tolerance = 0.0001)
+        samples = spline.getDistributedPoints(200000)
+        expected = sum((Vector(a) - Vector(b)).length for a, b in zip(samples, samples[1:]))
+        self.assertAlmostEqual(spline.arcLengthTable.totalLength / expected, 1, places = 3)
+
+    def testUniformDistribution(self):
+        spline = getRandomSpline(10, cyclic = False)
+        spline.ensureUniformConverter(20)
+        parameters = [spline.toUniformParameter(i / 20) for i in range(21)]
+        # measured with dense sampling because there is no arc length table yet
+        reference = BezierSpline(spline.points, spline.leftHandles, spline.rightHandles)
+        lengths = [reference.getPartialLength(a, b, 5000) for a, b in zip(parameters, parameters[1:])]
+        self.assertGreater(min(lengths) / max(lengths), 0.98)
+
+    def testPartialLength(self):
+        spline = getRandomSpline(10, cyclic = False)
+        spline.ensureUniformConverter(5)
+        table = spline.arcLengthTable
+        self.assertAlmostEqual(spline.getPartialLength(0.2, 0.7), table.getLength(0.7) - table.getLength(0.2))
+        self.assertAlmostEqual(table.getParameter(table.getLength(0.3)), 0.3, places = 5)
+
+    def testChangedSpline(self):
+        spline = getRandomSpline(10, cyclic = False)
+        spline.ensureUniformConverter(5)
+        spline.points[4] = (10, 10, 10)
+        spline.appendPoint((12, 0, 0), (11, 0, 0), (13, 0, 0))
+        with self.assertRaises(Exception):
+            spline.toUniformParameter(0.5)
+
+        spline.ensureUniformConverter(5)
+        fresh = BezierSpline(spline.points.copy(), spline.leftHandles.copy(), spline.rightHandles.copy())
+        fresh.ensureUniformConverter(5)
+        for i in range(11):
+            self.assertAlmostEqual(spline.toUniformParameter(i / 10), fresh.toUniformParameter(i / 10), places = 5)
+
+    def testCopy(self):
+        spline = getRandomSpline(5, cyclic = False)
+        spline.ensureUniformConverter(5)
+        copy = spline.copy()
+        self.assertIs(copy.arcLengthTable, spline.arcLengthTable)
+        length = spline.arcLengthTable.totalLength
+        copy.points[0] = (20, 0, 0)
+        copy.markChanged()
+        copy.ensureUniformConverter(5)
+        self.assertNotAlmostEqual(copy.arcLengthTable.totalLength, length)
+        self.assertEqual(spline.arcLengthTable.totalLength, length)
+
+def getRandomSpline(amount, cyclic):
+    random = Random(amount)
+    spline = BezierSpline()
+    for i in range(amount):
+        point = Vector((random.uniform(-5, 5), random.uniform(-5, 5), random.uniform(-5, 5)))
+        offset = Vector((random.uniform(-1, 1), random.uniform(-1, 1), random.uniform(-1, 1)))
+        spline.appendPoint(point, point - offset, point + offset)
+    spline.cyclic = cyclic
+    spline.markChanged()
+    return spline
+
 def testEqual(testCase, vector1, vector2):
     testCase.assertAlmostEqual(vector1[0], vector2[0], places = 5)
     testCase.assertAlmostEqual(vector1[1], vector2[1], places = 5)
@@ -0,0 +1,95 @@
+import os
+import numpy as np
+from unittest import TestCase, mock
+from . poly_spline import PolySpline
+from . bezier_spline import BezierSpline
+from . sampling import sampleSplines, sampleSplinesDistributed, getSplineChunks
+from .. lists.base_lists import Vector3DList, FloatList
+
+def randomVectors(amount, seed):
+    random = np.random.RandomState(seed)
+    return Vector3DList.fromNumpyArray(random.uniform(-5, 5, amount * 3).astype(np.float32))
+
+def randomFloats(amount, seed):
+    random = np.random.RandomState(seed)
+    return FloatList.fromNumpyArray(random.uniform(0, 1, amount).astype(np.float32))
+
+def createSplines():
+    splines = []
+    for i in range(6):
+        points = randomVectors(4 + i, i)
+        if i % 2 == 0:
+            spline = BezierSpline(points, randomVectors(4 + i, i + 10), randomVectors(4 + i, i + 20),
+                                  randomFloats(4 + i, i), randomFloats(4 + i, i + 30))
+        else:
+            spline = PolySpline(points, randomFloats(4 + i, i), randomFloats(4 + i, i + 30))
+        spline.cyclic = i % 3 == 0
+        spline.ensureNormals()
+        spline.ensureUniformConverter(20)
+        splines.append(spline)
+    return splines
+
+class TestSampleSplines(TestCase):
+    def testSameAsSplines(self):
+        splines = createSplines()
+        parameters = randomFloats(25, 1)
+        for parameterType in ("RESOLUTION", "UNIFORM"):
+            points, tangents, normals, matrices = sampleSplines(splines, parameters,
+                parameterType = parameterType, tangents = True, normals = True, matrices = True)
+            for i, spline in enumerate(splines):
+                part = slice(i * 25, (i + 1) * 25)
+                self.assertVectorsAlmostEqual(points[part], spline.samplePoints(parameters, True, parameterType))
+                self.assertVectorsAlmostEqual(tangents[part], spline.sampleTangents(parameters, True, parameterType))
+                self.assertVectorsAlmostEqual(normals[part], spline.sampleNormals(parameters, True, parameterType))
+                self.assertMatricesAlmostEqual(matrices[part], spline.sampleMatrices(parameters, True, parameterType))
+
+    def testDistributed(self):
+        splines = createSplines()
+        for start, end in [(0, 1), (0.3, 0.8)]:
+            for distributionType in ("RESOLUTION", "UNIFORM"):
+                points, tangents, _, matrices = sampleSplinesDistributed(splines, 10, start, end,
+                    distributionType, tangents = True, matrices = True)
+                for i, spline in enumerate(splines):
+                    part = slice(i * 10, (i + 1) * 10)
+                    self.assertVectorsAlmostEqual(points[part], spline.getDistributedPoints(10, start, end, distributionType))
+                    self.assertVectorsAlmostEqual(tangents[part], spline.getDistributedTangents(10, start, end, distributionType))
+                    self.assertMatricesAlmostEqual(matrices[part], spline.getDistributedMatrices(10, start, end, distributionType))
+
+    def testOnlyRequestedOutputs(self):
+        points, tangents, normals, matrices = sampleSplines(createSplines(), randomFloats(5, 2))
+        self.assertEqual(len(points), 30)
+        self.assertIsNone(tangents)
+        self.assertIsNone(normals)
+        self.assertIsNone(matrices)
+
+    def testMissingPreparation(self):
+        spline = BezierSpline(randomVectors(5, 3))
+        with self.assertRaises(Exception):
+            sampleSplines([spline], randomFloats(5, 3), normals = True)
+        with self.assertRaises(Exception):
+            sampleSplines([spline], randomFloats(5, 3), parameterType = "UNIFORM")
+        with self.assertRaises(Exception):
+            sampleSplines([PolySpline()], randomFloats(5, 3))
+
+    def testParallelChunks(self):
+        splines = createSplines() * 5
+        parameters = randomFloats(3000, 4)
+        with mock.patch.object(os, "cpu_count", lambda: 4):
+            self.assertEqual(len(getSplineChunks(30, 3000)), 4)
+            self.assertEqual(getSplineChunks(30, 10), [(0, 30)])
+            parallel = sampleSplines(splines, parameters, normals = True)
+        with mock.patch.object(os, "cpu_count", lambda: 1):
+            serial = sampleSplines(splines, parameters, normals = True)
+        self.assertEqual(list(parallel[0]), list(serial[0]))
+        self.assertEqual(list(parallel[2]), list(serial[2]))
+
+    def assertVectorsAlmostEqual(self, vectors1, vectors2):
+        self.assertEqual(len(vectors1), len(vectors2))
+        for vector1, vector2 in zip(vectors1, vectors2):
+            for a, b in zip(vector1, vector2):
+                self.assertAlmostEqual(a, b, places = 4)
+
+    def assertMatricesAlmostEqual(self, matrices1, matrices2):
+        array1 = matrices1.asNumpyArray()
+        array2 = matrices2.asNumpyArray()
+        self.assertTrue(np.allclose(array1, array2, atol = 1e-4))
@@ -0,0 +1,90 @@
+from unittest import TestCase
+from . spline_list import SplineList
+from . poly_spline import PolySpline
+from . bezier_spline import BezierSpline
+from .. lists.base_lists import Vector3DList, FloatList, LongList
+
+def createSplines():
+    bezierSpline = BezierSpline()
+    bezierSpline.appendPoint((0, 0, 0), (-1, 0, 0), (1, 0, 0), 0.5, 0.1)
+    bezierSpline.appendPoint((3, 1, 0), (2, 2, 0), (4, 0, 0), 0.2, 0.3)
+    bezierSpline.appendPoint((5, 0, 2), (5, 1, 1), (5, -1, 3), 0.1, 0)
+    polySpline = PolySpline(Vector3DList.fromValues([(1, 1, 1), (2, 3, 4), (0, -1, 2)]),
+                            FloatList.fromValues([1, 2, 3]), cyclic = True, materialIndex = 2)
+    shortSpline = PolySpline(Vector3DList.fromValues([(0, 0, 0), (0, 0, 1)]))
+    return [bezierSpline, polySpline, shortSpline]
+
+def toTuples(vectors):
+    return [tuple(vector) for vector in vectors]
+
+class TestSplineConversion(TestCase):
+    def testRoundTrip(self):
+        splines = createSplines()
+        splineList = SplineList.fromSplines(splines)
+        self.assertEqual(len(splineList), 3)
+        self.assertEqual(len(splineList.points), 8)
+        for spline, result in zip(splines, splineList.toSplines()):
+            self.assertEqual(type(spline), type(result))
+            self.assertEqual(toTuples(spline.points), toTuples(result.points))
+            self.assertEqual(list(spline.radii), list(result.radii))
+            self.assertEqual(list(spline.tilts), list(result.tilts))
+            self.assertEqual(spline.cyclic, result.cyclic)
+            self.assertEqual(spline.materialIndex, result.materialIndex)
+        self.assertEqual(toTuples(splines[0].leftHandles), toTuples(splineList[0].leftHandles))
+        self.assertEqual(toTuples(splines[0].rightHandles), toTuples(splineList[0].rightHandles))
+
+    def testGetItem(self):
+        splineList = SplineList.fromSplines(createSplines())
+        self.assertEqual(toTuples(splineList[-1].points), [(0, 0, 0), (0, 0, 1)])
+        with self.assertRaises(IndexError):
+            splineList[3]
+
+    def testExtend(self):
+        splineList = SplineList.fromSplines(createSplines())
+        splineList.extend(splineList.copy())
+        splineList.append(createSplines()[1])
+        self.assertEqual(len(splineList), 7)
+        self.assertEqual(list(splineList.pointStarts), [0, 3, 6, 8, 11, 14, 16])
+        self.assertEqual(toTuples(splineList[4].points), toTuples(splineList[1].points))
+        self.assertEqual(toTuples(splineList[6].points), toTuples(splineList[1].points))
+
+    def testFromPolySplinePoints(self):
+        points = Vector3DList.fromValues([(0, 0, 0), (1, 0, 0), (2, 0, 0), (0, 1, 0), (0, 2, 0)])
+        radii = FloatList.fromValues([1, 2, 3, 4, 5])
+        splineList = SplineList.fromPolySplinePoints(points, radii, LongList.fromValues([3, 2]))
+        expected = [PolySpline(Vector3DList.fromValues([(0, 0, 0), (1, 0, 0), (2, 0, 0)]), FloatList.fromValues([1, 2, 3])),
+                    PolySpline(Vector3DList.fromValues([(0, 1, 0), (0, 2, 0)]), FloatList.fromValues([4, 5]))]
+        for spline, result in zip(expected, splineList):
+            self.assertIsInstance(result, PolySpline)
+            self.assertEqual(toTuples(spline.points), toTuples(result.points))
+            self.assertEqual(list(spline.radii), list(result.radii))
+            self.assertEqual(list(result.tilts), [0] * len(spline.points))
+            self.assertFalse(result.cyclic)
+        with self.assertRaises(ValueError):
+            SplineList.fromPolySplinePoints(points, radii, LongList.fromValues([3, 3]))
+
+    def testWrongType(self):
+        with self.assertRaises(TypeError):
+            SplineList.fromSplines([1, 2])
+
+class TestSplineListEvaluation(TestCase):
+    def testSameAsSplines(self):
+        splines = createSplines()
+        splineList = SplineList.fromSplines(splines)
+        for start, end in [(0, 1), (0.2, 0.7)]:
+            points = splineList.getDistributedPoints(7, start, end)
+            tangents = splineList.getDistributedTangents(7, start, end)
+            for i, spline in enumerate(splines):
+                self.assertVectorsAlmostEqual(points[i * 7:(i + 1) * 7], spline.getDistributedPoints(7, start, end))
+                self.assertVectorsAlmostEqual(tangents[i * 7:(i + 1) * 7], spline.getDistributedTangents(7, start, end))
+
+    def testNotEvaluable(self):
+        splineList = SplineList.fromSplines([PolySpline()])
+        with self.assertRaises(Exception):
+            splineList.getDistributedPoints(5)
+
+    def assertVectorsAlmostEqual(self, vectors1, vectors2):
+        self.assertEqual(len(vectors1), len(vectors2))
+        for vector1, vector2 in zip(vectors1, vectors2):
+            for a, b in zip(vector1, vector2):
+                self.assertAlmostEqual(a, b, places = 5)
@@ -0,0 +1,63 @@
+import numpy
+from unittest import TestCase
+from . spline_list import SplineList
+from . test_spline_list import createSplines
+from . to_blender import setSplinesOnBlenderObject
+
+class FakePoints:
+    def __init__(self):
+        self.amount = 1
+        self.data = {}
+
+    def add(self, amount):
+        self.amount += amount
+
+    def foreach_set(self, name, data):
+        self.data[name] = numpy.array(data, dtype = float).ravel().tolist()
+
+class FakeSpline:
+    def __init__(self, type):
+        self.type = type
+        self.use_cyclic_u = False
+        self.points = FakePoints()
+        self.bezier_points = FakePoints()
+
+class FakeSplines(list):
+    def __init__(self):
+        self.data = {}
+        self.foreachSetCalls = 0
+
+    def new(self, type):
+        self.append(FakeSpline(type))
+        return self[-1]
+
+    def foreach_set(self, name, data):
+        self.data[name] = list(data)
+        self.foreachSetCalls += 1
+
+class FakeCurveObject:
+    type = "CURVE"
+    def __init__(self):
+        self.data = type("FakeCurve", (), {"splines" : FakeSplines()})()
+
+def getWrittenData(splines):
+    object = FakeCurveObject()
+    setSplinesOnBlenderObject(object, splines)
+    bSplines = object.data.splines
+    return ([(bSpline.type, bSpline.use_cyclic_u, bSpline.points.amount, bSpline.points.data,
+              bSpline.bezier_points.amount, bSpline.bezier_points.data) for bSpline in bSplines],
+            bSplines.data, bSplines.foreachSetCalls)
+
+class TestSetSplinesOnBlenderObject(TestCase):
+    def testSplines(self):
+        bSplines, splineData, foreachSetCalls = getWrittenData(createSplines())
+        self.assertEqual([bSpline[0] for bSpline in bSplines], ["BEZIER", "POLY", "POLY"])
+        self.assertEqual([bSpline[1] for bSpline in bSplines], [False, True, False])
+        self.assertEqual(bSplines[0][4], 3)
+        self.assertEqual(bSplines[1][3]["co"], [1, 1, 1, 1, 2, 3, 4, 1, 0, -1, 2, 1])
+        self.assertEqual(splineData["material_index"], [0, 2, 0])
+        self.assertEqual(foreachSetCalls, 1)
+
+    def testSplineListWritesSameData(self):
+        splines = createSplines()
+        self.assertEqual(getWrittenData(SplineList.fromSplines(splines)), getWrittenData(splines))
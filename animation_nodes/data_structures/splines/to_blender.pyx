@@ -2,26 +2,41 @@ from libc.string cimport memcpy
 from . base_spline cimport Spline
 from . poly_spline cimport PolySpline
 from . bezier_spline cimport BezierSpline
-from .. lists.base_lists cimport FloatList, Vector3DList
+from . spline_list cimport SplineList, BEZIER_SPLINE
+from .. lists.base_lists cimport FloatList
+from ... math cimport Vector3
 
-def setSplinesOnBlenderObject(object, list splines):
+def setSplinesOnBlenderObject(object, splines):
+    '''
+    The splines can be a list of splines or a SplineList.
+    The material indices are set with one call for all splines.
+    '''
     if object is None: return
     if object.type != "CURVE": return
 
     bSplines = object.data.splines
     bSplines.clear()
+    if isinstance(splines, SplineList):
+        appendSplineList(bSplines, splines)
+    else:
+        appendSplines(bSplines, splines)
+
+cdef appendSplines(object bSplines, list splines):
     cdef Spline spline
+    materialIndices = []
     for spline in splines:
         if isinstance(spline, BezierSpline):
             appendBezierSpline(bSplines, spline)
         elif isinstance(spline, PolySpline):
             appendPolySpline(bSplines, spline)
+        else:
+            continue
+        materialIndices.append(spline.materialIndex)
 
+    bSplines.foreach_set("material_index", materialIndices)
 
 cdef appendBezierSpline(object bSplines, BezierSpline spline):
-    bSpline = bSplines.new("BEZIER")
-    bSpline.use_cyclic_u = spline.cyclic
-    bSpline.material_index = spline.materialIndex
+    bSpline = newSpline(bSplines, "BEZIER", spline.cyclic)
 
     # one point is already there
     bSpline.bezier_points.add(len(spline.points) - 1)
@@ -33,25 +48,59 @@ cdef appendBezierSpline(object bSplines, BezierSpline spline):
     bSpline.bezier_points.foreach_set("tilt", spline.tilts.asMemoryView())
 
 cdef appendPolySpline(object bSplines, PolySpline spline):
-    # Blender stores 4 values for each point of a poly spline
-    cdef FloatList bPoints = FloatList(length = spline.points.length * 4)
-
-    # Insert a one after every vector to match Blenders data format
-    # [1, 2, 3, 4, 5, 6] -> [1, 2, 3, (1), 4, 5, 6, (1)]
-    cdef long i
-    for i in range(spline.points.length):
-        memcpy(bPoints.data + i * 4,
-               spline.points.data + i,
-               sizeof(float) * 3)
-        bPoints.data[i * 4 + 3] = 1
-
-    bSpline = bSplines.new("POLY")
-    bSpline.use_cyclic_u = spline.cyclic
-    bSpline.material_index = spline.materialIndex
+    bSpline = newSpline(bSplines, "POLY", spline.cyclic)
 
     # one point is already there
     points = bSpline.points
     points.add(spline.points.length - 1)
-    points.foreach_set("co", bPoints.asMemoryView())
+    points.foreach_set("co", getPolyPoints(spline.points.data, spline.points.length).asMemoryView())
     points.foreach_set("radius", spline.radii.asMemoryView())
     points.foreach_set("tilt", spline.tilts.asMemoryView())
+
+cdef appendSplineList(object bSplines, SplineList splines):
+    cdef Py_ssize_t i, start, end
+    points = splines.points.asMemoryView()
+    leftHandles = splines.leftHandles.asMemoryView()
+    rightHandles = splines.rightHandles.asMemoryView()
+    radii = splines.radii.asMemoryView()
+    tilts = splines.tilts.asMemoryView()
+
+    for i in range(len(splines)):
+        start = splines.pointStarts.data[i]
+        end = start + splines.pointAmounts.data[i]
+
+        if splines.types.data[i] == BEZIER_SPLINE:
+            bPoints = newSpline(bSplines, "BEZIER", splines.cyclic.data[i]).bezier_points
+            # one point is already there
+            bPoints.add(end - start - 1)
+            bPoints.foreach_set("co", points[start * 3:end * 3])
+            bPoints.foreach_set("handle_left", leftHandles[start * 3:end * 3])
+            bPoints.foreach_set("handle_right", rightHandles[start * 3:end * 3])
+        else:
+            bPoints = newSpline(bSplines, "POLY", splines.cyclic.data[i]).points
+            bPoints.add(end - start - 1)
+            bPoints.foreach_set("co", getPolyPoints(splines.points.data + start, end - start).asMemoryView())
+
+        bPoints.foreach_set("radius", radii[start:end])
+        bPoints.foreach_set("tilt", tilts[start:end])
+
+    bSplines.foreach_set("material_index", list(splines.materialIndices))
+
+cdef newSpline(object bSplines, str type, bint cyclic):
+    bSpline = bSplines.new(type)
+    # foreach_set would skip the update that recalculates handles and knots
+    if cyclic:
+        bSpline.use_cyclic_u = True
+    return bSpline
+
+cdef FloatList getPolyPoints(Vector3 *points, Py_ssize_t amount):
+    # Blender stores 4 values for each point of a poly spline
+    cdef FloatList bPoints = FloatList(length = amount * 4)
+
+    # Insert a one after every vector to match Blenders data format
+    # [1, 2, 3, 4, 5, 6] -> [1, 2, 3, (1), 4, 5, 6, (1)]
+    cdef Py_ssize_t i
+    for i in range(amount):
+        memcpy(bPoints.data + i * 4, points + i, sizeof(float) * 3)
+        bPoints.data[i * 4 + 3] = 1
+    return bPoints
@@ -1,4 +1,27 @@
 from .. utils import fcurve
+from .. utils.lru_cache import getLimitedCache
+from .. utils.handlers import eventHandler
 
 def clearExecutionCache():
     fcurve.clearCache()
+
+
+# Node Output Caches
+##########################################
+
+outputCachesByNodeIdentifier = {}
+
+def getNodeOutputCache(node):
+    return getLimitedCache(outputCachesByNodeIdentifier, node.identifier,
+        node.outputCacheMaxEntries, int(node.outputCacheMaxMemory * 1024 ** 2))
+
+def getNodeOutputCacheMemory(identifier):
+    cache = outputCachesByNodeIdentifier.get(identifier)
+    return 0 if cache is None else cache.usedBytes
+
+def clearNodeOutputCache(identifier):
+    outputCachesByNodeIdentifier.pop(identifier, None)
+
+@eventHandler("FILE_LOAD_POST")
+def clearNodeOutputCaches():
+    outputCachesByNodeIdentifier.clear()
@@ -2,7 +2,7 @@ import re
 import traceback
 from itertools import chain
 from .. utils.names import replaceVariableName
-from .. sockets.info import getAllowedInputDataTypes
+from .. sockets.info import getAllowedInputDataTypes, isList
 from .. sockets.implicit_conversion import getConversionCode
 from .. problems import NodeFailesToCreateExecutionCode
 from .. preferences import addonName, getExecutionCodeType
@@ -31,7 +31,8 @@ def getInitialVariables(nodes):
 
 def iterSetupCodeLines(nodes, variables):
     yield from iter_Imports(nodes)
-    yield get_LoadMeasurementsDict()
+    yield get_LoadRegisterNodeExecution()
+    yield get_LoadIncrementalStatesDict()
     yield from iter_GetNodeReferences(nodes)
     yield from iter_GetSocketValues(nodes, variables)
 
@@ -56,8 +57,11 @@ def getModulesNeededByNodes(nodes):
         moduleNames.update(node.getUsedModules())
     return list(moduleNames)
 
-def get_LoadMeasurementsDict():
-    return "_node_execution_times = animation_nodes.execution.measurements.getMeasurementsDict()"
+def get_LoadRegisterNodeExecution():
+    return "_register_node_execution = animation_nodes.execution.measurements.registerNodeExecution"
+
+def get_LoadIncrementalStatesDict():
+    return "_incremental_states = animation_nodes.execution.incremental.getIncrementalStatesDict()"
 
 def iter_GetNodeReferences(nodes):
     yield "nodes = bpy.data.node_groups[{}].nodes".format(repr(nodes[0].nodeTree.name))
@@ -98,27 +102,27 @@ def iterUnlinkedSockets(nodes):
     for node in nodes:
         yield from node.unlinkedInputs
 
-def getFunction_IterNodeExecutionLines():
+def getFunction_IterNodeExecutionLines(allowIncremental = False):
     mode = getExecutionCodeType()
-    if mode == "DEFAULT":
+    if mode == "INCREMENTAL" and allowIncremental:
+        return iterNodeExecutionLines_Incremental
+    elif mode in ("DEFAULT", "INCREMENTAL", "PARALLEL", "MEASURE"):
         return iterNodeExecutionLines_Basic
     elif mode == "MONITOR":
         return iterNodeExecutionLines_Monitored
-    elif mode == "MEASURE":
-        return iterNodeExecutionLines_MeasureTimes
     elif mode == "BAKE":
         return iterNodeExecutionLines_Bake
 
 def iterNodeExecutionLines_Basic(node, variables):
     yield from iterNodeCommentLines(node)
-    yield from setupNodeForExecution(node, variables)
     try:
-        yield from iterRealNodeExecutionLines(node, variables)
+        yield from iterMeasuredNodeExecutionLines(node, variables)
     except:
         handleExecutionCodeCreationException(node)
 
 def iterNodeExecutionLines_Monitored(node, variables):
     yield from iterNodeCommentLines(node)
+    yield getExecutionStartLine()
     yield from setupNodeForExecution(node, variables)
     yield "try:"
     try:
@@ -133,23 +137,26 @@ def iterNodeExecutionLines_Monitored(node, variables):
     yield "except Exception as e:"
     yield "    animation_nodes.problems.NodeRaisesExceptionDuringExecution({}).report()".format(repr(node.identifier))
     yield "    raise"
+    yield getRegisterExecutionLine(node, variables)
 
-def iterNodeExecutionLines_MeasureTimes(node, variables):
+def iterNodeExecutionLines_Bake(node, variables):
     yield from iterNodeCommentLines(node)
+    yield getExecutionStartLine()
+    yield from setupNodeForExecution(node, variables)
     try:
-        yield "_execution_start_time = getCurrentTime()"
-        yield from setupNodeForExecution(node, variables)
-        yield from iterRealNodeExecutionLines(node, variables)
-        yield "_execution_end_time = getCurrentTime()"
-        yield "_node_execution_times[{}].registerTime(_execution_end_time - _execution_start_time)".format(repr(node.identifier))
+        yield from iterRealNodeExecutionLines(node, variables, bake = True)
+        yield getRegisterExecutionLine(node, variables)
     except:
         handleExecutionCodeCreationException(node)
 
-def iterNodeExecutionLines_Bake(node, variables):
+def iterNodeExecutionLines_Incremental(node, variables):
     yield from iterNodeCommentLines(node)
-    yield from setupNodeForExecution(node, variables)
     try:
-        yield from iterRealNodeExecutionLines(node, variables, bake = True)
+        if canExecuteIncrementally(node):
+            yield from iterSkippableNodeExecutionLines(node, variables)
+        else:
+            yield from iterMeasuredNodeExecutionLines(node, variables)
+            yield getOutputsChangedLine(node, variables)
     except:
         handleExecutionCodeCreationException(node)
 
@@ -157,11 +164,28 @@ def iterNodeCommentLines(node):
     yield ""
     yield "# Node: {} - {}".format(repr(node.nodeTree.name), repr(node.name))
 
+def iterMeasuredNodeExecutionLines(node, variables):
+    yield getExecutionStartLine()
+    yield from setupNodeForExecution(node, variables)
+    yield from iterRealNodeExecutionLines(node, variables)
+    yield getRegisterExecutionLine(node, variables)
+
+def getExecutionStartLine():
+    return "_execution_start_time = getCurrentTime()"
+
+def getRegisterExecutionLine(node, variables):
+    # only lists and meshes report their memory usage
+    outputNames = [variables[socket] for socket in node.linkedOutputs
+                   if socket.dataType == "Mesh" or isList(socket.bl_idname)]
+    return "_register_node_execution({}, _execution_start_time, {})".format(
+        repr(node.identifier), toTupleString(outputNames))
+
 def setupNodeForExecution(node, variables):
     yield from iterNodePreExecutionLines(node, variables)
     resolveInnerLinks(node, variables)
 
 def iterNodePreExecutionLines(node, variables):
+    if node.ignoresInputs: return
     yield from iterInputConversionLines(node, variables)
     yield from iterInputCopyLines(node, variables)
 
@@ -220,6 +244,90 @@ def handleExecutionCodeCreationException(node):
 
 
 
+# Incremental Execution
+##########################################
+
+def canExecuteIncrementally(node):
+    if "NO_INCREMENTAL_EXECUTION" in node.options or node.ignoresInputs: return False
+    if len(node.inputs) == 0 or len(node.linkedOutputs) == 0: return False
+    return all(socket.storable for socket in node.sockets)
+
+def iterSkippableNodeExecutionLines(node, variables):
+    state = getIncrementalStateExpression(node)
+    dirty = getDirtyVariableName(node)
+    inputNames = [variables[socket] for socket in node.unlinkedInputs if socket.comparable]
+    originDirtyNames = [getDirtyVariableName(origin) for origin in node.originNodes]
+    checkExpression = "{}.needsExecution({}, {})".format(state, node.identifier, toTupleString(inputNames))
+    yield "{} = {}".format(dirty, " or ".join([checkExpression] + originDirtyNames))
+
+    yield "if {}:".format(dirty)
+    for line in iterMeasuredNodeExecutionLines(node, variables):
+        yield "    " + line
+
+    outputs = node.linkedOutputs
+    storeExpressions = [getCopyExpression(socket, variables) if outputNeedsCachedCopy(socket)
+                        else variables[socket] for socket in outputs]
+    yield "    {}.outputs = {}".format(state, toTupleString(storeExpressions))
+    yield "else:"
+    yield "    {} = {}.outputs".format(toTupleString([variables[socket] for socket in outputs]), state)
+    for socket in outputs:
+        if outputNeedsCachedCopy(socket):
+            yield "    " + getCopyLine(socket, variables[socket], variables)
+
+def getOutputsChangedLine(node, variables):
+    outputs = node.linkedOutputs
+    if all(socket.comparable for socket in outputs):
+        outputNames = [variables[socket] for socket in outputs]
+        return "{} = {}.outputsChanged({})".format(getDirtyVariableName(node),
+            getIncrementalStateExpression(node), toTupleString(outputNames))
+    return "{} = True".format(getDirtyVariableName(node))
+
+def outputNeedsCachedCopy(socket):
+    # the cached value must not be changed by nodes that modify their input
+    return socket.isCopyable() and any(target.dataIsModified for target in socket.dataTargets)
+
+def getIncrementalStateExpression(node):
+    return "_incremental_states[{}]".format(repr(node.identifier))
+
+def getDirtyVariableName(node):
+    return "_dirty_" + node.identifier
+
+def toTupleString(names):
+    if len(names) == 0: return "()"
+    return "({},)".format(", ".join(names))
+
+
+
+# Unused Nodes
+##########################################
+
+def removeNodesLinkedToIgnoredInputs(nodes, nodeByID):
+    '''
+    Removes nodes whose results are only used by nodes that ignore their inputs.
+    The nodes have to be sorted topologically.
+    '''
+    if not any(node.ignoresInputs for node in nodes):
+        return nodes
+
+    neededIdentifiers = set()
+    for node in reversed(nodes):
+        if isNodeResultNeeded(node, neededIdentifiers, nodeByID):
+            neededIdentifiers.add(node.identifier)
+    return [node for node in nodes if node.identifier in neededIdentifiers]
+
+def isNodeResultNeeded(node, neededIdentifiers, nodeByID):
+    linkedOutputs = node.linkedOutputs
+    if len(linkedOutputs) == 0:
+        return True
+    for socket in linkedOutputs:
+        for target in iterLinkedSocketsWithInfo(socket, node, nodeByID):
+            targetNode = target.node
+            if targetNode.identifier in neededIdentifiers and not targetNode.ignoresInputs:
+                return True
+    return False
+
+
+
 # Modify Socket Variables
 ##########################################
 
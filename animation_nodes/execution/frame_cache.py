@@ -0,0 +1,296 @@
+'''
+Frame caches store the results of a socket for every frame of a frame range
+in a single binary file. The file is memory mapped during playback and
+the lists of a frame are views on the mapped memory. Every read of a frame
+maps the frame again with copy on write access. Nodes that modify their
+input therefore never change the data that later reads of the frame get.
+
+Arrays of LongLists are always stored as little endian 64 bit integers,
+so that files can be read on platforms where long has 32 bits.
+
+File Layout:
+    Header: magic, version, data type, table offset
+    Data:   raw list data of all frames, every array is 16 byte aligned
+    Table:  frame amount, then per frame:
+              frame, array amount, (offset, size, list type) per array,
+              description size, description (JSON, e.g. mesh attribute names)
+
+Every bake writes a new file "<path>.<version>", because the old file can not
+be replaced or removed on every platform while lists still map its memory.
+Readers always use the newest version. Older versions are removed as soon as
+this is possible.
+'''
+
+import os
+import re
+import sys
+import mmap
+import json
+import numpy
+import struct
+from .. utils.handlers import eventHandler
+from .. data_structures import (Mesh, Vector3DList, Vector2DList, Matrix4x4List, ColorList,
+                                QuaternionList, BooleanList, FloatList, DoubleList, IntegerList,
+                                UIntegerList, LongList, EdgeIndicesList, PolygonIndicesList)
+
+magic = b"ANFC"
+version = 2
+headerStruct = struct.Struct("<4sIIQ")
+amountStruct = struct.Struct("<I")
+frameStruct = struct.Struct("<i")
+arrayStruct = struct.Struct("<QQI")
+alignment = 16
+
+# the index of a type is stored in the file, so new types have to be appended
+listTypes = (Vector3DList, Vector2DList, Matrix4x4List, ColorList, QuaternionList, BooleanList,
+             FloatList, DoubleList, IntegerList, UIntegerList, LongList, EdgeIndicesList)
+
+longIsInt64 = struct.calcsize("l") == 8 and sys.byteorder == "little"
+
+def getListArrays(value):
+    return [value], None
+
+def createList(arrays, description):
+    return arrays[0]
+
+def getMeshArrays(mesh):
+    arrays = [mesh.vertices, mesh.edges, mesh.polygons.indices, mesh.polygons.polyStarts,
+              mesh.polygons.polyLengths, mesh.materialIndices]
+    attributes = []
+    for domain, name, data in mesh.attributes.iterAttributes():
+        arrays.append(data)
+        attributes.append((domain, name))
+    return arrays, attributes
+
+def createMesh(arrays, attributes):
+    vertices, edges, indices, polyStarts, polyLengths, materialIndices = arrays[:6]
+    polygons = PolygonIndicesList.fromLists(indices, polyStarts, polyLengths)
+    mesh = Mesh(vertices, edges, polygons, materialIndices, skipValidation = True)
+    for (domain, name), data in zip(attributes, arrays[6:]):
+        mesh.insertAttribute(domain, name, data)
+    return mesh
+
+# data type : (to arrays and description, from arrays and description)
+dataTypeInfo = {
+    "Vector List" : (getListArrays, createList),
+    "Matrix List" : (getListArrays, createList),
+    "Float List" : (getListArrays, createList),
+    "Mesh" : (getMeshArrays, createMesh)
+}
+dataTypes = tuple(dataTypeInfo.keys())
+
+def isSupportedDataType(dataType):
+    return dataType in dataTypeInfo
+
+
+# Writing
+##########################################
+
+class FrameCacheWriter:
+    def __init__(self, path, dataType):
+        self.path = path
+        self.dataType = dataType
+        self.toArrays, _ = dataTypeInfo[dataType]
+        self.framesData = {}
+
+        os.makedirs(os.path.dirname(path), exist_ok = True)
+        latestVersion = max(iterVersions(path), default = 0)
+        self.versionPath = getVersionPath(path, latestVersion + 1)
+        self.temporaryPath = self.versionPath + ".tmp"
+        self.file = open(self.temporaryPath, "wb")
+        self.file.write(bytes(headerStruct.size))
+
+    def writeFrame(self, frame, value):
+        arrays, description = self.toArrays(value)
+        arraysInfo = []
+        for array in arrays:
+            typeIndex = getListTypeIndex(array)
+            self.pad()
+            offset = self.file.tell()
+            if len(array) > 0:
+                self.file.write(toFileBuffer(array))
+            arraysInfo.append((offset, self.file.tell() - offset, typeIndex))
+        self.framesData[frame] = (arraysInfo, json.dumps(description).encode())
+
+    def pad(self):
+        remainder = self.file.tell() % alignment
+        if remainder != 0:
+            self.file.write(bytes(alignment - remainder))
+
+    def close(self):
+        tableOffset = self.file.tell()
+        self.file.write(amountStruct.pack(len(self.framesData)))
+        for frame, (arraysInfo, description) in sorted(self.framesData.items()):
+            self.file.write(frameStruct.pack(frame))
+            self.file.write(amountStruct.pack(len(arraysInfo)))
+            for arrayInfo in arraysInfo:
+                self.file.write(arrayStruct.pack(*arrayInfo))
+            self.file.write(amountStruct.pack(len(description)))
+            self.file.write(description)
+
+        self.file.seek(0)
+        self.file.write(headerStruct.pack(magic, version, dataTypes.index(self.dataType), tableOffset))
+        self.file.close()
+
+        # nothing maps the new file yet, so it can be renamed everywhere
+        os.replace(self.temporaryPath, self.versionPath)
+        closeReader(self.path)
+        removeOldVersions(self.path)
+
+def getListTypeIndex(array):
+    try: return listTypes.index(type(array))
+    except ValueError: raise Exception("cannot bake lists of type " + type(array).__name__)
+
+def toFileBuffer(array):
+    if isinstance(array, LongList) and not longIsInt64:
+        return numpy.asarray(array.asMemoryView()).astype("<i8")
+    return array.asMemoryView()
+
+
+# Reading
+##########################################
+
+class FrameCacheReader:
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "rb")
+        try:
+            self.data = mmap.mmap(self.file.fileno(), 0, access = mmap.ACCESS_READ)
+        except:
+            self.file.close()
+            raise
+
+        fileMagic, fileVersion, typeIndex, tableOffset = headerStruct.unpack_from(self.data, 0)
+        if fileMagic != magic or fileVersion != version:
+            self.close()
+            raise Exception("invalid frame cache file: " + path)
+
+        self.dataType = dataTypes[typeIndex]
+        _, self.fromArrays = dataTypeInfo[self.dataType]
+        self.framesData = {}
+
+        frameAmount, = amountStruct.unpack_from(self.data, tableOffset)
+        position = tableOffset + amountStruct.size
+        for _ in range(frameAmount):
+            frame, = frameStruct.unpack_from(self.data, position)
+            arrayAmount, = amountStruct.unpack_from(self.data, position + frameStruct.size)
+            position += frameStruct.size + amountStruct.size
+            arraysInfo = []
+            for _ in range(arrayAmount):
+                arraysInfo.append(arrayStruct.unpack_from(self.data, position))
+                position += arrayStruct.size
+            descriptionSize, = amountStruct.unpack_from(self.data, position)
+            position += amountStruct.size
+            description = json.loads(self.data[position:position + descriptionSize].decode())
+            position += descriptionSize
+            self.framesData[frame] = (arraysInfo, description)
+
+    @property
+    def frames(self):
+        return self.framesData.keys()
+
+    def readFrame(self, frame):
+        frameData = self.framesData.get(frame)
+        if frameData is None:
+            return None
+        arraysInfo, description = frameData
+        data, dataOffset = self.mapFrame(arraysInfo)
+        lists = [readList(listTypes[typeIndex], data[offset - dataOffset:offset - dataOffset + size])
+                 for offset, size, typeIndex in arraysInfo]
+        return self.fromArrays(lists, description)
+
+    def mapFrame(self, arraysInfo):
+        # copy on write mapping, because list views require writable buffers
+        start = min((offset for offset, _, _ in arraysInfo), default = 0)
+        end = max((offset + size for offset, size, _ in arraysInfo), default = 0)
+        start -= start % mmap.ALLOCATIONGRANULARITY
+        data = mmap.mmap(self.file.fileno(), max(end - start, 1),
+                         access = mmap.ACCESS_COPY, offset = start)
+        return memoryview(data), start
+
+    def close(self):
+        # the mappings of frames stay alive as long as list views use them
+        self.data.close()
+        self.file.close()
+
+def readList(listType, buffer):
+    if listType is LongList and not longIsInt64:
+        return LongList.fromNumpyArray(numpy.frombuffer(buffer, dtype = "<i8").astype("l"))
+    return listType.fromBuffer(buffer)
+
+readersByPath = {}
+
+def getReader(path):
+    '''Returns None when no version of the file exists.'''
+    reader = readersByPath.get(path)
+    if reader is None:
+        latestVersion = max(iterVersions(path), default = None)
+        if latestVersion is None:
+            return None
+        reader = FrameCacheReader(getVersionPath(path, latestVersion))
+        readersByPath[path] = reader
+    return reader
+
+def closeReader(path):
+    reader = readersByPath.pop(path, None)
+    if reader is not None:
+        reader.close()
+
+@eventHandler("FILE_LOAD_POST")
+def closeAllReaders():
+    for path in list(readersByPath.keys()):
+        closeReader(path)
+        removeOldVersions(path)
+
+
+# Versions
+##########################################
+
+def getVersionPath(path, version):
+    return "{}.{}".format(path, version)
+
+def iterVersions(path):
+    directory, name = os.path.split(path)
+    if not os.path.isdir(directory):
+        return
+    pattern = re.compile(re.escape(name) + r"\.(\d+)")
+    for fileName in os.listdir(directory):
+        match = pattern.fullmatch(fileName)
+        if match is not None:
+            yield int(match.group(1))
+
+def removeOldVersions(path):
+    versions = sorted(iterVersions(path))
+    for version in versions[:-1]:
+        # fails while lists still use the memory of the file on some platforms,
+        # the file is removed after a later bake or when a blend file is loaded
+        try: os.remove(getVersionPath(path, version))
+        except OSError: pass
+
+
+# Bake Sessions
+##########################################
+
+writersByPath = {}
+bakeSessionIsActive = False
+
+def startBakeSession():
+    global bakeSessionIsActive
+    bakeSessionIsActive = True
+
+def finishBakeSession():
+    global bakeSessionIsActive
+    bakeSessionIsActive = False
+    for writer in writersByPath.values():
+        writer.close()
+    writersByPath.clear()
+
+def isBaking():
+    return bakeSessionIsActive
+
+def writeFrame(path, dataType, frame, value):
+    writer = writersByPath.get(path)
+    if writer is None:
+        writer = FrameCacheWriter(path, dataType)
+        writersByPath[path] = writer
+    writer.writeFrame(frame, value)
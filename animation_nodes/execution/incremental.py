@@ -0,0 +1,79 @@
+import bpy
+from collections import defaultdict
+from .. utils.operators import makeOperator
+
+class IncrementalNodeState:
+    __slots__ = ("inputsKey", "outputs", "outputsKey")
+
+    def __init__(self):
+        self.inputsKey = None
+        self.outputs = None
+        self.outputsKey = None
+
+    def needsExecution(self, node, inputs):
+        '''
+        Returns False when the node properties and the unlinked
+        input values are the same as in the last successful execution.
+        The outputs are only set again after the node executed without error.
+        '''
+        key = (getNodePropertiesKey(node), toComparableKey(inputs))
+        if self.outputs is not None and key == self.inputsKey:
+            return False
+        self.inputsKey = key
+        self.outputs = None
+        return True
+
+    def outputsChanged(self, outputs):
+        key = toComparableKey(outputs)
+        if self.outputsKey is not None and key == self.outputsKey:
+            return False
+        self.outputsKey = key
+        return True
+
+statesByNodeIdentifier = defaultdict(IncrementalNodeState)
+
+@makeOperator("an.reset_incremental_execution", "Reset Incremental Execution", redraw = True)
+def resetIncrementalStates():
+    statesByNodeIdentifier.clear()
+
+def getIncrementalStatesDict():
+    return statesByNodeIdentifier
+
+
+# Fingerprints
+##########################################
+
+def toComparableKey(value):
+    if isinstance(value, (tuple, list)):
+        return tuple(toComparableKey(element) for element in value)
+    if hasattr(value, "freeze") and hasattr(value, "copy"):
+        return value.copy().freeze()
+    return value
+
+ignoredPropertyNames = {"identifier", "inInvalidNetwork", "useNetworkColor",
+                        "activeInputIndex", "activeOutputIndex", "useOutputCache",
+                        "outputCacheMaxEntries", "outputCacheMaxMemory"}
+propertyTypes = {"BOOLEAN", "INT", "FLOAT", "STRING", "ENUM", "POINTER"}
+propertyNamesByIdName = {}
+
+def getNodePropertiesKey(node):
+    names = propertyNamesByIdName.get(node.bl_idname)
+    if names is None:
+        names = tuple(iterNodePropertyNames(node))
+        propertyNamesByIdName[node.bl_idname] = names
+    return tuple(toPropertyKey(getattr(node, name)) for name in names)
+
+def iterNodePropertyNames(node):
+    baseNames = {prop.identifier for prop in bpy.types.Node.bl_rna.properties}
+    for prop in node.bl_rna.properties:
+        name = prop.identifier
+        if name in baseNames or name in ignoredPropertyNames: continue
+        if prop.type in propertyTypes:
+            yield name
+
+def toPropertyKey(value):
+    if isinstance(value, set):
+        return frozenset(value)
+    try: hash(value)
+    except TypeError: return tuple(value)
+    return value
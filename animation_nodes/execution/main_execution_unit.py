@@ -1,10 +1,13 @@
 import sys, traceback
 from .. import problems
 from . compile_scripts import compileScript
+from .. preferences import getExecutionCodeType
+from . parallel import iterParallelExecutionScriptLines
 from .. problems import ExecutionUnitNotSetup, ExceptionDuringExecution
 from . code_generator import (getInitialVariables,
                               iterSetupCodeLines,
                               linkOutputSocketsToTargets,
+                              removeNodesLinkedToIgnoredInputs,
                               getFunction_IterNodeExecutionLines)
 
 class MainExecutionUnit:
@@ -52,13 +55,22 @@ class MainExecutionUnit:
     def generateScripts(self, nodeByID):
         try: nodes = self.network.getSortedAnimationNodes(nodeByID)
         except: return
+        nodes = removeNodesLinkedToIgnoredInputs(nodes, nodeByID)
 
         variables = getInitialVariables(nodes)
         self.setupScript = "\n".join(iterSetupCodeLines(nodes, variables))
-        self.executeScript = "\n".join(self.iterExecutionScriptLines(nodes, variables, nodeByID))
+        if getExecutionCodeType() == "PARALLEL":
+            nodeIDs = {node.toID() for node in nodes}
+            dependencies = {nodeID : originIDs & nodeIDs for nodeID, originIDs
+                            in self.network.getAnimationNodeDependencies().items()
+                            if nodeID in nodeIDs}
+            lines = iterParallelExecutionScriptLines(nodes, dependencies, variables, nodeByID)
+        else:
+            lines = self.iterExecutionScriptLines(nodes, variables, nodeByID)
+        self.executeScript = "\n".join(lines)
 
     def iterExecutionScriptLines(self, nodes, variables, nodeByID):
-        iterNodeExecutionLines = getFunction_IterNodeExecutionLines()
+        iterNodeExecutionLines = getFunction_IterNodeExecutionLines(allowIncremental = True)
 
         for node in nodes:
             yield from iterNodeExecutionLines(node, variables)
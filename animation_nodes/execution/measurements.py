@@ -1,44 +1,109 @@
 import bpy
+import json
 import textwrap
-from collections import defaultdict
+from threading import get_ident
+from collections import defaultdict, deque
+from time import perf_counter as getCurrentTime
 from .. utils.timing import prettyTime
+from .. utils.path import toAbsolutePath
+from .. utils.nodes import iterAnimationNodes
 from .. draw_handler import drawHandler
 from .. graphics.text_box import TextBox
 from .. utils.operators import makeOperator
 from .. preferences import getExecutionCodeType
 
+# amount of samples used to calculate the percentiles of a node
+recentTimesAmount = 256
+
+# the ring buffers only keep the most recent events
+maxNodeEventAmount = 100000
+maxFrameEventAmount = 1000
+
 class NodeMeasurements:
-    __slots__ = ("minTime", "totalTime", "calls")
+    __slots__ = ("minTime", "maxTime", "totalTime", "calls", "recentTimes", "outputMemory")
 
     def __init__(self):
         self.totalTime = 0
         self.calls = 0
         self.minTime = 1e10
+        self.maxTime = 0
+        self.recentTimes = deque(maxlen = recentTimesAmount)
+        self.outputMemory = 0
 
     def registerTime(self, time):
         self.calls += 1
         self.totalTime += time
+        self.recentTimes.append(time)
         if time < self.minTime:
             self.minTime = time
+        if time > self.maxTime:
+            self.maxTime = time
+
+    def getPercentile(self, percentile):
+        '''Percentile of the recent execution times, between 0 and 100.'''
+        if len(self.recentTimes) == 0:
+            return 0
+        times = sorted(self.recentTimes)
+        index = round(percentile / 100 * (len(times) - 1))
+        return times[index]
 
     def __repr__(self):
         return textwrap.dedent("""\
             Min: {}
+            P50: {}
+            P95: {}
+            Max: {}
             Total: {}
-            Calls: {:,d}\
+            Calls: {:,d}
+            Output Memory: {:,d} bytes\
             """.format(prettyTime(self.minTime),
+                       prettyTime(self.getPercentile(50)),
+                       prettyTime(self.getPercentile(95)),
+                       prettyTime(self.maxTime),
                        prettyTime(self.totalTime),
-                       self.calls))
+                       self.calls,
+                       self.outputMemory))
 
 measurementsByNodeIdentifier = defaultdict(NodeMeasurements)
 
+# (node identifier, start time, duration, output memory, thread id)
+nodeEvents = deque(maxlen = maxNodeEventAmount)
+
+# (tree name, frame, start time, duration, thread id)
+frameEvents = deque(maxlen = maxFrameEventAmount)
+
 @makeOperator("an.reset_measurements", "Reset Measurements", redraw = True)
 def resetMeasurements():
     measurementsByNodeIdentifier.clear()
 
+@makeOperator("an.reset_execution_events", "Reset Execution Events", redraw = True)
+def resetExecutionEvents():
+    nodeEvents.clear()
+    frameEvents.clear()
+
 def getMeasurementsDict():
     return measurementsByNodeIdentifier
 
+def registerNodeExecution(identifier, startTime, outputs):
+    '''
+    Called by the execution code after every node.
+    The outputs are the values of the linked list and mesh sockets.
+    '''
+    duration = getCurrentTime() - startTime
+    memory = 0
+    for value in outputs:
+        getMemoryUsage = getattr(value, "getMemoryUsage", None)
+        if getMemoryUsage is not None:
+            memory += getMemoryUsage()
+
+    measurements = measurementsByNodeIdentifier[identifier]
+    measurements.registerTime(duration)
+    measurements.outputMemory = memory
+    nodeEvents.append((identifier, startTime, duration, memory, get_ident()))
+
+def registerTreeExecution(treeName, frame, startTime, duration):
+    frameEvents.append((treeName, frame, startTime, duration, get_ident()))
+
 def getMinExecutionTimeString(node):
     measure = measurementsByNodeIdentifier[node.identifier]
     if measure.calls > 0:
@@ -50,3 +115,38 @@ def getMeasurementResultString(node):
     result = measurementsByNodeIdentifier[node.identifier]
     if result.calls == 0: return "Not Measured"
     else: return str(result)
+
+
+# Chrome Trace
+##########################################
+
+def getChromeTrace(nodeNames = {}):
+    '''
+    Trace in the Chrome trace event format that can be opened in chrome://tracing
+    or https://ui.perfetto.dev. The node names are used instead of the identifiers.
+    '''
+    events = []
+    threadIndices = {}
+    def getThreadIndex(threadID):
+        return threadIndices.setdefault(threadID, len(threadIndices))
+
+    # frames are shown above the nodes that are executed in the same thread
+    for treeName, frame, startTime, duration, threadID in frameEvents:
+        events.append({"name" : "{} - Frame {}".format(treeName, frame), "cat" : "frame",
+                       "ph" : "X", "ts" : startTime * 1e6, "dur" : duration * 1e6,
+                       "pid" : 0, "tid" : getThreadIndex(threadID), "args" : {"frame" : frame}})
+
+    for identifier, startTime, duration, memory, threadID in nodeEvents:
+        events.append({"name" : nodeNames.get(identifier, identifier), "cat" : "node",
+                       "ph" : "X", "ts" : startTime * 1e6, "dur" : duration * 1e6,
+                       "pid" : 0, "tid" : getThreadIndex(threadID), "args" : {"output memory" : memory}})
+
+    return {"traceEvents" : events, "displayTimeUnit" : "ms"}
+
+@makeOperator("an.export_chrome_trace", "Export Chrome Trace", arguments = ["String"],
+              description = "Write the recent node and frame execution times into a json file")
+def exportChromeTrace(path = "//animation_nodes_trace.json"):
+    nodeNames = {node.identifier : "{} - {}".format(node.nodeTree.name, node.name)
+                 for node in iterAnimationNodes()}
+    with open(toAbsolutePath(path), "w") as f:
+        json.dump(getChromeTrace(nodeNames), f)
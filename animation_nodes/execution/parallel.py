@@ -0,0 +1,164 @@
+from collections import defaultdict
+from .. tree_info import isSocketLinked, iterLinkedSocketsWithInfo
+from concurrent.futures import wait, FIRST_COMPLETED
+from .. utils.parallel import getExecutor, isWorkerThread
+from . code_generator import (getGlobalizeStatement,
+                              linkOutputSocketsToTargets,
+                              getFunction_IterNodeExecutionLines)
+
+class ExecutionBranch:
+    def __init__(self, index, runInThread):
+        self.index = index
+        self.runInThread = runInThread
+        self.nodes = []
+        self.dependencies = set()
+        self.importedNames = set()
+        self.exportedNames = set()
+
+    @property
+    def functionName(self):
+        return "_branch_" + str(self.index)
+
+
+# Branch Detection
+##########################################
+
+def splitIntoBranches(nodes, dependencies):
+    '''
+    Groups topologically sorted nodes into chains.
+    A node is appended to the chain of its origin when it is the only
+    target of its only origin and both can run in the same thread.
+    '''
+    targetAmounts = defaultdict(int)
+    for originIDs in dependencies.values():
+        for originID in originIDs:
+            targetAmounts[originID] += 1
+
+    branches = []
+    branchByNodeID = {}
+    for node in nodes:
+        nodeID = node.toID()
+        originIDs = dependencies[nodeID]
+        runInThread = canRunInThread(node)
+
+        branch = None
+        if len(originIDs) == 1:
+            originID = next(iter(originIDs))
+            originBranch = branchByNodeID[originID]
+            if targetAmounts[originID] == 1 and originBranch.runInThread == runInThread:
+                branch = originBranch
+        if branch is None:
+            branch = ExecutionBranch(len(branches), runInThread)
+            branches.append(branch)
+
+        branch.nodes.append(node)
+        branchByNodeID[nodeID] = branch
+
+    return branches
+
+def canRunInThread(node):
+    return "THREAD_SAFE" in node.options
+
+
+# Code Generation
+##########################################
+
+def iterParallelExecutionScriptLines(nodes, dependencies, variables, nodeByID):
+    branches = splitIntoBranches(nodes, dependencies)
+    branchByIdentifier = {node.identifier : branch for branch in branches for node in branch.nodes}
+    iterNodeExecutionLines = getFunction_IterNodeExecutionLines()
+
+    # has to be done before the variables are changed during code generation
+    globalizeStatements = [getGlobalizeStatement(branch.nodes, variables) for branch in branches]
+
+    linesByBranch = [[] for branch in branches]
+    for node in nodes:
+        branch = branchByIdentifier[node.identifier]
+        lines = linesByBranch[branch.index]
+        lines.extend(iterNodeExecutionLines(node, variables))
+        lines.extend(linkOutputSocketsToTargets(node, variables, nodeByID))
+
+        for socket in node.linkedOutputs:
+            for target in iterLinkedSocketsWithInfo(socket, node, nodeByID):
+                targetBranch = branchByIdentifier.get(target.node.identifier)
+                if targetBranch is not None and targetBranch is not branch:
+                    branch.exportedNames.add(variables[target])
+                    targetBranch.importedNames.add(variables[target])
+                    targetBranch.dependencies.add(branch.index)
+
+    for branch, lines, globalizeStatement in zip(branches, linesByBranch, globalizeStatements):
+        importedNames = sorted(branch.importedNames)
+        yield ""
+        yield "def {}({}):".format(branch.functionName, ", ".join(importedNames))
+        yield "    " + globalizeStatement
+        for line in lines:
+            yield "    " + line
+        exports = ", ".join("{0!r} : {0}".format(name) for name in sorted(branch.exportedNames))
+        yield "    return {" + exports + "}"
+
+    yield ""
+    yield "animation_nodes.execution.parallel.executeBranches(globals(), ("
+    for branch in branches:
+        yield "    ({}, {}, {}, {}),".format(
+            branch.functionName,
+            tuple(sorted(branch.importedNames)),
+            tuple(sorted(branch.dependencies)),
+            branch.runInThread)
+    yield "))"
+
+
+# Execution
+##########################################
+
+def executeBranches(data, branches):
+    '''
+    Every branch is a tuple: (function, importedNames, dependencies, runInThread)
+    Branches that can not run in a thread are executed on the calling thread
+    in their original order while the other branches run on the thread pool.
+    On a worker thread of the pool all branches are executed on that thread.
+    '''
+    remainingDependencies = [len(branch[2]) for branch in branches]
+    dependentBranches = [[] for branch in branches]
+    for index, branch in enumerate(branches):
+        for dependency in branch[2]:
+            dependentBranches[dependency].append(index)
+
+    readyBranches = [index for index, amount in enumerate(remainingDependencies) if amount == 0]
+    runningBranches = {}
+    finishedAmount = 0
+
+    def finishBranch(index, exportedData):
+        data.update(exportedData)
+        for dependent in dependentBranches[index]:
+            remainingDependencies[dependent] -= 1
+            if remainingDependencies[dependent] == 0:
+                readyBranches.append(dependent)
+
+    def getArguments(branch):
+        return [data[name] for name in branch[1]]
+
+    executor = getExecutor()
+    useThreads = not isWorkerThread()
+    try:
+        while finishedAmount < len(branches):
+            for index in [index for index in readyBranches if useThreads and branches[index][3]]:
+                readyBranches.remove(index)
+                future = executor.submit(branches[index][0], *getArguments(branches[index]))
+                runningBranches[future] = index
+
+            if len(readyBranches) > 0:
+                index = min(readyBranches)
+                readyBranches.remove(index)
+                finishBranch(index, branches[index][0](*getArguments(branches[index])))
+                finishedAmount += 1
+                doneFutures = [future for future in runningBranches if future.done()]
+            else:
+                doneFutures, _ = wait(runningBranches, return_when = FIRST_COMPLETED)
+
+            for future in doneFutures:
+                finishBranch(runningBranches.pop(future), future.result())
+                finishedAmount += 1
+    except:
+        # don't let threads write into the data after the execution failed
+        wait(runningBranches)
+        raise
@@ -0,0 +1,140 @@
+import os
+import tempfile
+from unittest import TestCase, mock
+from . import frame_cache
+from . frame_cache import FrameCacheWriter, FrameCacheReader, getReader, closeReader
+from .. data_structures import (Mesh, Vector3DList, Vector2DList, ColorList, FloatList,
+                                EdgeIndicesList, LongList, PolygonIndicesList)
+
+def createMesh():
+    vertices = Vector3DList.fromValues([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0), (2, 0, 0)])
+    edges = EdgeIndicesList.fromValues([(0, 1), (1, 2), (2, 3), (3, 0), (1, 4), (4, 2)])
+    polygons = PolygonIndicesList.fromValues([(0, 1, 2, 3), (1, 4, 2)])
+    mesh = Mesh(vertices, edges, polygons, LongList.fromValues([3, 5]))
+    mesh.insertUVMap("UVMap", Vector2DList.fromValues([(i / 7, 1 - i / 7) for i in range(7)]))
+    mesh.insertVertexColorLayer("Col", ColorList.fromValues([(i / 7, 0, 1, 1) for i in range(7)]))
+    mesh.insertAttribute("POINT", "Weight", FloatList.fromValues(range(5)))
+    return mesh
+
+class TestFrameCache(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "cache.anfc")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def testChangesDoNotAffectLaterReads(self):
+        writer = FrameCacheWriter(self.path, "Vector List")
+        writer.writeFrame(1, Vector3DList.fromValues([(1, 2, 3), (4, 5, 6)]))
+        writer.close()
+
+        reader = FrameCacheReader(writer.versionPath)
+        vectors = reader.readFrame(1)
+        vectors.move((10, 0, 0))
+        self.assertEqual(tuple(vectors[0]), (11, 2, 3))
+        self.assertEqual(tuple(reader.readFrame(1)[0]), (1, 2, 3))
+        reader.close()
+
+    def testFramesAfterFirstPage(self):
+        writer = FrameCacheWriter(self.path, "Vector List")
+        for frame in range(3):
+            writer.writeFrame(frame, Vector3DList.fromValues([(frame, i, 0) for i in range(500)]))
+        writer.close()
+
+        reader = FrameCacheReader(writer.versionPath)
+        for frame in range(3):
+            vectors = reader.readFrame(frame)
+            self.assertEqual(len(vectors), 500)
+            self.assertEqual(tuple(vectors[499]), (frame, 499, 0))
+        self.assertIsNone(reader.readFrame(5))
+        reader.close()
+
+    def testMeshRoundTrip(self):
+        mesh = createMesh()
+        writer = FrameCacheWriter(self.path, "Mesh")
+        writer.writeFrame(1, mesh)
+        writer.writeFrame(2, Mesh())
+        writer.close()
+
+        reader = FrameCacheReader(writer.versionPath)
+        result = reader.readFrame(1)
+        self.assertEqual(list(result.vertices), list(mesh.vertices))
+        self.assertEqual(list(result.edges), list(mesh.edges))
+        self.assertEqual(list(result.polygons), list(mesh.polygons))
+        self.assertEqual(list(result.materialIndices), [3, 5])
+        self.assertEqual(result.getUVMapNames(), ["UVMap"])
+        self.assertEqual(list(result.getUVMapPositions("UVMap")), list(mesh.getUVMapPositions("UVMap")))
+        self.assertEqual(list(result.getVertexColors("Col")), list(mesh.getVertexColors("Col")))
+        self.assertEqual(list(result.getAttribute("POINT", FloatList, "Weight")), [0, 1, 2, 3, 4])
+        self.assertEqual(len(reader.readFrame(2).vertices), 0)
+        reader.close()
+
+    def testLongListsAreStoredAsInt64(self):
+        with mock.patch.object(frame_cache, "longIsInt64", False):
+            writer = FrameCacheWriter(self.path, "Mesh")
+            writer.writeFrame(0, createMesh())
+            writer.close()
+
+            reader = FrameCacheReader(writer.versionPath)
+            (arraysInfo, _), = reader.framesData.values()
+            self.assertEqual(arraysInfo[5][1], 16)
+            self.assertEqual(list(reader.readFrame(0).materialIndices), [3, 5])
+            reader.close()
+
+    def testUnsupportedListType(self):
+        mesh = createMesh()
+        mesh.insertAttribute("POINT", "Long", LongList.fromValues(range(5)))
+        mesh.attributes.insert("POINT", "Invalid", PolygonIndicesList())
+        writer = FrameCacheWriter(self.path, "Mesh")
+        with self.assertRaises(Exception):
+            writer.writeFrame(0, mesh)
+        writer.file.close()
+
+class TestFrameCacheVersions(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "cache.anfc")
+
+    def tearDown(self):
+        closeReader(self.path)
+        self.directory.cleanup()
+
+    def bake(self, value):
+        writer = FrameCacheWriter(self.path, "Vector List")
+        writer.writeFrame(1, Vector3DList.fromValues([value]))
+        writer.close()
+
+    def testMappedFileIsNeverReplaced(self):
+        originalReplace = os.replace
+        def replace(source, target):
+            # like on windows, where mapped files can not be replaced
+            self.assertFalse(os.path.exists(target))
+            originalReplace(source, target)
+
+        with mock.patch.object(frame_cache.os, "replace", replace):
+            self.bake((1, 2, 3))
+            oldVectors = getReader(self.path).readFrame(1)
+            self.bake((4, 5, 6))
+
+        self.assertEqual(tuple(oldVectors[0]), (1, 2, 3))
+        self.assertEqual(tuple(getReader(self.path).readFrame(1)[0]), (4, 5, 6))
+        self.assertEqual(sorted(os.listdir(self.directory.name)), ["cache.anfc.2"])
+
+    def testOldVersionsAreRemovedLater(self):
+        def remove(path):
+            raise PermissionError(path)
+
+        self.bake((1, 2, 3))
+        with mock.patch.object(frame_cache.os, "remove", remove):
+            self.bake((4, 5, 6))
+        self.assertEqual(sorted(os.listdir(self.directory.name)), ["cache.anfc.1", "cache.anfc.2"])
+        self.assertEqual(tuple(getReader(self.path).readFrame(1)[0]), (4, 5, 6))
+
+        self.bake((7, 8, 9))
+        self.assertEqual(sorted(os.listdir(self.directory.name)), ["cache.anfc.3"])
+        self.assertEqual(tuple(getReader(self.path).readFrame(1)[0]), (7, 8, 9))
+
+    def testMissingFile(self):
+        self.assertIsNone(getReader(self.path))
+        self.assertIsNone(getReader(os.path.join(self.directory.name, "missing", "cache.anfc")))
@@ -0,0 +1,56 @@
+from unittest import TestCase
+from time import perf_counter
+from . measurements import (NodeMeasurements, registerNodeExecution, registerTreeExecution,
+                            getChromeTrace, nodeEvents, frameEvents, measurementsByNodeIdentifier)
+from .. data_structures import FloatList, Vector3DList
+
+class TestNodeMeasurements(TestCase):
+    def testPercentiles(self):
+        measurements = NodeMeasurements()
+        for time in range(1, 101):
+            measurements.registerTime(time)
+        self.assertEqual(measurements.calls, 100)
+        self.assertEqual(measurements.minTime, 1)
+        self.assertEqual(measurements.maxTime, 100)
+        self.assertEqual(measurements.getPercentile(50), 51)
+        self.assertEqual(measurements.getPercentile(95), 95)
+
+    def testPercentileOfRecentTimes(self):
+        measurements = NodeMeasurements()
+        for _ in range(1000):
+            measurements.registerTime(10)
+        for _ in range(measurements.recentTimes.maxlen):
+            measurements.registerTime(1)
+        self.assertEqual(measurements.getPercentile(95), 1)
+        self.assertEqual(measurements.maxTime, 10)
+
+class TestExecutionEvents(TestCase):
+    def setUp(self):
+        nodeEvents.clear()
+        frameEvents.clear()
+        measurementsByNodeIdentifier.clear()
+
+    def testRegisterNodeExecution(self):
+        outputs = (FloatList(length = 10), Vector3DList(length = 10), "not a list")
+        registerNodeExecution("node", perf_counter(), outputs)
+        measurements = measurementsByNodeIdentifier["node"]
+        self.assertEqual(measurements.calls, 1)
+        self.assertEqual(measurements.outputMemory, 10 * 4 + 10 * 12)
+        self.assertEqual(nodeEvents[-1][0], "node")
+        self.assertEqual(nodeEvents[-1][3], 160)
+
+    def testRingBuffer(self):
+        for i in range(nodeEvents.maxlen + 10):
+            registerNodeExecution(str(i), perf_counter(), ())
+        self.assertEqual(len(nodeEvents), nodeEvents.maxlen)
+        self.assertEqual(nodeEvents[0][0], "10")
+
+    def testChromeTrace(self):
+        start = perf_counter()
+        registerNodeExecution("node", start, ())
+        registerTreeExecution("Tree", 5, start, 0.002)
+        events = getChromeTrace({"node" : "Tree - Node"})["traceEvents"]
+        self.assertEqual([event["name"] for event in events], ["Tree - Frame 5", "Tree - Node"])
+        self.assertEqual(events[0]["dur"], 2000)
+        self.assertEqual(events[0]["tid"], events[1]["tid"])
+        self.assertTrue(all(event["ph"] == "X" for event in events))
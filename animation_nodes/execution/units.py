@@ -3,6 +3,7 @@ from .. import problems
 from collections import defaultdict
 from . cache import clearExecutionCache
 from . measurements import resetMeasurements
+from . incremental import resetIncrementalStates
 from . main_execution_unit import MainExecutionUnit
 from . loop_execution_unit import LoopExecutionUnit
 from . group_execution_unit import GroupExecutionUnit
@@ -26,6 +27,7 @@ def createExecutionUnits(nodeByID):
 
 def reset():
     resetMeasurements()
+    resetIncrementalStates()
     _mainUnitsByNodeTree.clear()
     _subprogramUnitsByIdentifier.clear()
 
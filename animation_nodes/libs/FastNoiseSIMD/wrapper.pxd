@@ -25,7 +25,7 @@ cdef extern from "FastNoiseSIMD.h":
 
         void SetFractalType(FractalType fractalType)
 
-        void FillNoiseSet(float *noiseSet, FastNoiseVectorSet *vectorSet, float xOffset, float yOffset, float zOffset)
+        void FillNoiseSet(float *noiseSet, FastNoiseVectorSet *vectorSet, float xOffset, float yOffset, float zOffset) nogil
 
     cdef struct FastNoiseVectorSet:
         int size
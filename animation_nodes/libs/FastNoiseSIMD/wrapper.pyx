@@ -157,7 +157,9 @@ cdef void calcNoise(PyNoise noise, float *results, Vector3 *vectors, Py_ssize_t
         vectorSet.zSet[i] = vectors[i].z
 
     cdef Vector3 offset = noise.offset
-    noise.fn.FillNoiseSet(results, &vectorSet, offset.x, offset.y, offset.z)
+    cdef FastNoiseSIMD *fn = noise.fn
+    with nogil:
+        fn.FillNoiseSet(results, &vectorSet, offset.x, offset.y, offset.z)
 
     vectorSet.Free()
 
@@ -17,10 +17,10 @@ ctypedef fused Matrix3_or_Matrix4:
     Matrix4
 
 cdef void transformVec3AsPoint_InPlace(Vector3* vector, Matrix4* matrix)
-cdef void transformVec3AsPoint(Vector3* target, Vector3* vector, Matrix4* matrix)
+cdef void transformVec3AsPoint(Vector3* target, Vector3* vector, Matrix4* matrix) nogil
 
 cdef void transformVec3AsDirection_InPlace(Vector3* v, Matrix3_or_Matrix4* m)
-cdef void transformVec3AsDirection(Vector3* target, Vector3* v, Matrix3_or_Matrix4* m)
+cdef void transformVec3AsDirection(Vector3* target, Vector3* v, Matrix3_or_Matrix4* m) nogil
 
 cdef void multMatrix4AndVec4(Vector4* target, Matrix4* m, Vector4* v)
 
@@ -58,9 +58,9 @@ cdef void transposeMatrix_Inplace(Matrix3_or_Matrix4 *m)
 cdef void transposeMatrix(Matrix3_or_Matrix4* t, Matrix3_or_Matrix4 *m)
 
 cdef void invertOrthogonalTransformation(Matrix4* t, Matrix4* m)
-cdef void scaleMatrix3x3Part(Matrix3_or_Matrix4 *m, float s)
+cdef void scaleMatrix3x3Part(Matrix3_or_Matrix4 *m, float s) nogil
 
 cdef float getMatrix3x3PartDeterminant(Matrix3_or_Matrix4 *m)
 
 cdef void matrixFromNormalizedAxisData(Matrix4 *m, Vector3 *center, Vector3 *tangent,
-                                       Vector3 *bitangent, Vector3 *normal)
+                                       Vector3 *bitangent, Vector3 *normal) nogil
@@ -7,7 +7,7 @@ cdef void transformVec3AsPoint_InPlace(Vector3* v, Matrix4* m):
     newZ = v.x * m.a31 + v.y * m.a32 + v.z * m.a33 + m.a34
     v.x, v.y, v.z = newX, newY, newZ
 
-cdef void transformVec3AsPoint(Vector3* target, Vector3* v, Matrix4* m):
+cdef void transformVec3AsPoint(Vector3* target, Vector3* v, Matrix4* m) nogil:
     target.x = v.x * m.a11 + v.y * m.a12 + v.z * m.a13 + m.a14
     target.y = v.x * m.a21 + v.y * m.a22 + v.z * m.a23 + m.a24
     target.z = v.x * m.a31 + v.y * m.a32 + v.z * m.a33 + m.a34
@@ -19,7 +19,7 @@ cdef void transformVec3AsDirection_InPlace(Vector3* v, Matrix3_or_Matrix4* m):
     newZ = v.x * m.a31 + v.y * m.a32 + v.z * m.a33
     v.x, v.y, v.z = newX, newY, newZ
 
-cdef void transformVec3AsDirection(Vector3* target, Vector3* v, Matrix3_or_Matrix4* m):
+cdef void transformVec3AsDirection(Vector3* target, Vector3* v, Matrix3_or_Matrix4* m) nogil:
     target.x = v.x * m.a11 + v.y * m.a12 + v.z * m.a13
     target.y = v.x * m.a21 + v.y * m.a22 + v.z * m.a23
     target.z = v.x * m.a31 + v.y * m.a32 + v.z * m.a33
@@ -294,7 +294,7 @@ cdef inline void transpose3x3Part(Matrix3_or_Matrix4 *t, Matrix3_or_Matrix4 *m):
     t.a12, t.a22, t.a32 = m.a21, m.a22, m.a23
     t.a13, t.a23, t.a33 = m.a31, m.a32, m.a33
 
-cdef void scaleMatrix3x3Part(Matrix3_or_Matrix4 *m, float s):
+cdef void scaleMatrix3x3Part(Matrix3_or_Matrix4 *m, float s) nogil:
     m.a11 *= s
     m.a21 *= s
     m.a31 *= s
@@ -318,7 +318,7 @@ cdef float getMatrix3x3PartDeterminant(Matrix3_or_Matrix4 *m):
     )
 
 cdef void matrixFromNormalizedAxisData(Matrix4 *m, Vector3 *center, Vector3 *tangent,
-                                       Vector3 *bitangent, Vector3 *normal):
+                                       Vector3 *bitangent, Vector3 *normal) nogil:
     m.a11, m.a12, m.a13, m.a14 = tangent.x, bitangent.x, normal.x, center.x
     m.a21, m.a22, m.a23, m.a24 = tangent.y, bitangent.y, normal.y, center.y
     m.a31, m.a32, m.a33, m.a34 = tangent.z, bitangent.z, normal.z, center.z
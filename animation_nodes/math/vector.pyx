@@ -15,18 +15,18 @@ cdef void scaleVec3_Inplace(Vector3* v, float factor):
     v.y *= factor
     v.z *= factor
 
-cdef void scaleVec3(Vector3* target, Vector3* a, float factor):
+cdef void scaleVec3(Vector3* target, Vector3* a, float factor) nogil:
     target.x = a.x * factor
     target.y = a.y * factor
     target.z = a.z * factor
 
-cdef float lengthVec3(Vector3* v):
+cdef float lengthVec3(Vector3* v) nogil:
     return sqrt(v.x * v.x + v.y * v.y + v.z * v.z)
 
-cdef float lengthSquaredVec3(Vector3* v):
+cdef float lengthSquaredVec3(Vector3* v) nogil:
     return v.x * v.x + v.y * v.y + v.z * v.z
 
-cdef void addVec3(Vector3* target, Vector3* a, Vector3* b):
+cdef void addVec3(Vector3* target, Vector3* a, Vector3* b) nogil:
     target.x = a.x + b.x
     target.y = a.y + b.y
     target.z = a.z + b.z
@@ -36,7 +36,7 @@ cdef void addVec3_Inplace(Vector3* target, Vector3* other):
     target.y += other.y
     target.z += other.z
 
-cdef void subVec3(Vector3* target, Vector3* a, Vector3* b):
+cdef void subVec3(Vector3* target, Vector3* a, Vector3* b) nogil:
     target.x = a.x - b.x
     target.y = a.y - b.y
     target.z = a.z - b.z
@@ -52,7 +52,7 @@ cdef void divideVec3(Vector3* target, Vector3* a, Vector3* b):
     target.y = a.y / b.y if b.y != 0 else 0
     target.z = a.z / b.z if b.z != 0 else 0
 
-cdef void mixVec3(Vector3* target, Vector3* a, Vector3* b, float factor):
+cdef void mixVec3(Vector3* target, Vector3* a, Vector3* b, float factor) nogil:
     cdef float newX, newY, newZ
     newX = a.x * (1 - factor) + b.x * factor
     newY = a.y * (1 - factor) + b.y * factor
@@ -62,7 +62,7 @@ cdef void mixVec3(Vector3* target, Vector3* a, Vector3* b, float factor):
     target.z = newZ
 
 @cython.cdivision(True)
-cdef void normalizeVec3_InPlace(Vector3* v):
+cdef void normalizeVec3_InPlace(Vector3* v) nogil:
     cdef float length = sqrt(v.x * v.x + v.y * v.y + v.z * v.z)
     if length != 0:
         v.x /= length
@@ -72,7 +72,7 @@ cdef void normalizeVec3_InPlace(Vector3* v):
         v.x = v.y = v.z = 0
 
 @cython.cdivision(True)
-cdef void normalizeVec3(Vector3* target, Vector3* v):
+cdef void normalizeVec3(Vector3* target, Vector3* v) nogil:
     cdef float length = sqrt(v.x * v.x + v.y * v.y + v.z * v.z)
     if length != 0:
         target.x = v.x / length
@@ -105,17 +105,17 @@ cdef void normalizeLengthVec3_Inplace(Vector3* v, float length):
     else:
         v.x = v.y = v.z = 0
 
-cdef float distanceVec3(Vector3* a, Vector3* b):
+cdef float distanceVec3(Vector3* a, Vector3* b) nogil:
     return sqrt(distanceSquaredVec3(a, b))
 
-cdef float distanceSquaredVec3(Vector3* a, Vector3* b):
+cdef float distanceSquaredVec3(Vector3* a, Vector3* b) nogil:
     cdef:
         float diff1 = (a.x - b.x)
         float diff2 = (a.y - b.y)
         float diff3 = (a.z - b.z)
     return diff1 * diff1 + diff2 * diff2 + diff3 * diff3
 
-cdef float dotVec3(Vector3* a, Vector3* b):
+cdef float dotVec3(Vector3* a, Vector3* b) nogil:
     return a.x * b.x + a.y * b.y + a.z * b.z
 
 @cython.cdivision(True)
@@ -135,7 +135,7 @@ cdef float angleNormalizedVec3(Vector3 *a, Vector3 *b):
     elif dot < -1: dot = -1
     return acos(dot)
 
-cdef void crossVec3(Vector3* result, Vector3* a, Vector3* b):
+cdef void crossVec3(Vector3* result, Vector3* a, Vector3* b) nogil:
     result.x = a.y * b.z - a.z * b.y
     result.y = a.z * b.x - a.x * b.z
     result.z = a.x * b.y - a.y * b.x
@@ -155,7 +155,7 @@ cdef void projectVec3(Vector3* result, Vector3* a, Vector3* b):
         result.y = 0
         result.z = 0
 
-cdef void projectOnCenterPlaneVec3(Vector3 *result, Vector3 *v, Vector3 *planeNormal):
+cdef void projectOnCenterPlaneVec3(Vector3 *result, Vector3 *v, Vector3 *planeNormal) nogil:
     cdef Vector3 unitNormal, projVector
     normalizeVec3(&unitNormal, planeNormal)
     cdef float distance = dotVec3(v, &unitNormal)
@@ -181,7 +181,7 @@ cdef void snapVec3(Vector3* target, Vector3* v, Vector3* step):
     target.y = ceil(v.y / step.y - 0.5) * step.y if step.y != 0 else v.y
     target.z = ceil(v.z / step.z - 0.5) * step.z if step.z != 0 else v.z
 
-cdef void rotateAroundAxisVec3(Vector3 *target, Vector3 *v, Vector3 *axis, float angle):
+cdef void rotateAroundAxisVec3(Vector3 *target, Vector3 *v, Vector3 *axis, float angle) nogil:
     cdef Vector3 n
     normalizeVec3(&n, axis)
     cdef Vector3 d
@@ -0,0 +1,88 @@
+import os
+import bpy
+from bpy.props import *
+from ... base_types import AnimationNode
+from ... utils.path import toAbsolutePath
+from ... events import executionCodeChanged
+from ... utils.pretty_strings import formatBytes
+from ... execution.frame_cache import dataTypes, getReader, closeReader, isBaking, writeFrame
+
+dataTypeItems = [(dataType, dataType, "") for dataType in dataTypes]
+
+class FrameCacheNode(bpy.types.Node, AnimationNode):
+    bl_idname = "an_FrameCacheNode"
+    bl_label = "Frame Cache"
+    bl_width_default = 200
+    errorHandlingType = "EXCEPTION"
+    options = {"NO_INCREMENTAL_EXECUTION"}
+    searchTags = ["Bake", "Cache"]
+
+    def filePathChanged(self, context):
+        closeReader(self.absoluteFilePath)
+        executionCodeChanged()
+
+    dataType: EnumProperty(name = "Data Type", items = dataTypeItems,
+        update = AnimationNode.refresh)
+
+    filePath: StringProperty(name = "File Path", default = "//cache/frame_cache.anfc",
+        subtype = "FILE_PATH", update = filePathChanged)
+
+    useBakedData: BoolProperty(name = "Use Baked Data", default = False,
+        description = "Read the data from the file instead of evaluating the nodes before",
+        update = executionCodeChanged)
+
+    def create(self):
+        self.newInput(self.dataType, "Data", "data")
+        self.newOutput(self.dataType, "Data", "outData")
+
+    def draw(self, layout):
+        layout.prop(self, "dataType", text = "")
+        layout.prop(self, "filePath", text = "")
+        icon = "PLAY" if self.useBakedData else "REC"
+        layout.prop(self, "useBakedData", icon = icon)
+
+    def drawAdvanced(self, layout):
+        try: reader = getReader(self.absoluteFilePath)
+        except: reader = None
+
+        col = layout.column(align = True)
+        if reader is None:
+            col.label(text = "No valid baked data")
+        else:
+            frames = reader.frames
+            col.label(text = "Type: " + reader.dataType)
+            col.label(text = "Frames: {} - {}".format(min(frames, default = 0), max(frames, default = 0)))
+            col.label(text = "Size: " + formatBytes(os.path.getsize(reader.path)))
+
+    @property
+    def ignoresInputs(self):
+        return self.useBakedData and not isBaking()
+
+    def getExecutionCode(self, required):
+        if self.ignoresInputs:
+            yield "outData = self.readBakedData()"
+        else:
+            yield "self.writeBakedData(data)"
+            yield "outData = data"
+
+    def readBakedData(self):
+        try: reader = getReader(self.absoluteFilePath)
+        except Exception as e: self.raiseErrorMessage(str(e))
+
+        if reader is None:
+            self.raiseErrorMessage("File does not exist")
+        if reader.dataType != self.dataType:
+            self.raiseErrorMessage("File contains data of type '{}'".format(reader.dataType))
+
+        data = reader.readFrame(self.nodeTree.scene.frame_current)
+        if data is None:
+            self.raiseErrorMessage("Frame is not baked")
+        return data
+
+    def writeBakedData(self, data):
+        if isBaking():
+            writeFrame(self.absoluteFilePath, self.dataType, self.nodeTree.scene.frame_current, data)
+
+    @property
+    def absoluteFilePath(self):
+        return toAbsolutePath(self.filePath)
@@ -17,6 +17,7 @@ class SetKeyframesNode(bpy.types.Node, AnimationNode):
     bl_label = "Set Keyframes"
     bl_width_default = 200
     errorHandlingType = "MESSAGE"
+    options = {"NO_INCREMENTAL_EXECUTION"}
 
     paths: CollectionProperty(type = KeyframePath)
 
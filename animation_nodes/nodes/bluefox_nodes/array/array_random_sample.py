@@ -8,6 +8,7 @@ class ArrayRandomNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ArrayRandom"
     bl_label = "Random Sample"
     errorHandlingType = "EXCEPTION"
+    options = {"NO_INCREMENTAL_EXECUTION"}
 
     def create(self):
         self.newInput("Text", "Shape", "shape", value = "5,3")
@@ -63,31 +63,31 @@ class ConvertFromArrayNode(bpy.types.Node, AnimationNode):
                 if self.mode == "FLOATS":
                     if len(shape) != 1: 
                         self.raiseErrorMessage("Expected Array of Shape (n,)")  
-                    return DoubleList.fromNumpyArray(array.astype('double'))
+                    return DoubleList.fromBuffer(array.astype('double', order = 'C'))
                 elif self.mode == "VECTORS":
                     if len(shape) != 2 or shape[-1] != 3: 
                         self.raiseErrorMessage("Expected Array of Shape (n,3)")     
-                    return Vector3DList.fromNumpyArray(array.astype('f').ravel())
+                    return Vector3DList.fromBuffer(array.astype('f', order = 'C'))
                 elif self.mode == "COLORS":
                     if len(shape) != 2 or shape[-1] != 4: 
                         self.raiseErrorMessage("Expected Array of Shape (n,4)")   
-                    return ColorList.fromNumpyArray(array.astype('f').ravel())
+                    return ColorList.fromBuffer(array.astype('f', order = 'C'))
                 elif self.mode == "QUATERNIONS":
                     if len(shape) != 2 or shape[-1] != 4: 
                         self.raiseErrorMessage("Expected Array of Shape (n,4)")  
-                    return QuaternionList.fromNumpyArray(array.astype('f').ravel())
+                    return QuaternionList.fromBuffer(array.astype('f', order = 'C'))
                 elif self.mode == "MATRICES":
                     if len(shape) != 3 or shape[-1] != 4 or shape[-2] != 4: 
                         self.raiseErrorMessage("Expected Array of Shape (n,4,4)")  
-                    return Matrix4x4List.fromNumpyArray(array.astype('f').ravel())
+                    return Matrix4x4List.fromBuffer(array.astype('f', order = 'C'))
                 elif self.mode == "BOOLEANS":
                     if len(shape) != 1:
                         self.raiseErrorMessage("Expected Array of Shape (n,)")  
-                    return BooleanList.fromNumpyArray(array.astype('b'))
+                    return BooleanList.fromBuffer(array.astype('b', order = 'C'))
                 elif self.mode == "INTEGERS":
                     if len(shape) != 1: 
                         self.raiseErrorMessage("Expected Array of Shape (n,)")  
-                    return LongList.fromNumpyArray(array.astype('int'))        
+                    return LongList.fromBuffer(array.astype('l', order = 'C'))        
             except IndexError:
                 self.raiseErrorMessage("Index Out of Bound")
                 return
@@ -1,12 +1,11 @@
 import bpy
-import bmesh
 from bpy.props import *
 from ... utils.layout import writeText
+from ... utils.mesh_output import setMeshData
 from ... base_types import AnimationNode
-from .. mesh.c_utils import replicateMesh
 from ... events import propertyChanged, executionCodeChanged
 from .. mesh.generation.unity_triangle import mesh as unitytriangle
-from ... data_structures import (Mesh, Vector3DList, EdgeIndicesList, PolygonIndicesList)
+from ... data_structures import (Mesh, InstancedMesh, Vector3DList, EdgeIndicesList, PolygonIndicesList)
 
 dupliModeItems = [
     ("VERTS", "Vertices", "Instance on vertices", "", 0),
@@ -68,7 +67,7 @@ class DupliInstancerNode(bpy.types.Node, AnimationNode):
         if self.isValidObject(parent):
             mesh = parent.data
             replicatedMesh = self.getReplicatedMesh(matrices)    
-            self.setMesh(mesh, replicatedMesh)
+            setMeshData(mesh, replicatedMesh)
         parentOut = parent
 
         if parent == None or child == None or parent == child:
@@ -86,7 +85,7 @@ class DupliInstancerNode(bpy.types.Node, AnimationNode):
         if self.isValidObject(parent):
             mesh = parent.data
             replicatedMesh = self.getReplicatedMesh(matrices)     
-            self.setMesh(mesh, replicatedMesh)
+            setMeshData(mesh, replicatedMesh)
         parentOut = parent
 
         if parent == None or child == None or parent == child:
@@ -133,9 +132,9 @@ class DupliInstancerNode(bpy.types.Node, AnimationNode):
             edgeIndices = EdgeIndicesList.fromValues([])
             polygonIndices = PolygonIndicesList.fromValues([])
             pointMesh = Mesh(vertexLocations, edgeIndices, polygonIndices)
-            return replicateMesh(pointMesh, matrices)
+            return InstancedMesh(pointMesh, matrices)
         elif self.mode == "FACES":
-            return replicateMesh(unitytriangle, matrices)
+            return InstancedMesh(unitytriangle, matrices)
 
     def isValidObject(self, object):
         if object is None: return False
@@ -147,25 +146,3 @@ class DupliInstancerNode(bpy.types.Node, AnimationNode):
             return False
         return True        
 
-    def setMesh(self, outMesh, mesh):
-        # clear existing mesh
-        bmesh.new().to_mesh(outMesh)
-
-        # allocate memory
-        outMesh.vertices.add(len(mesh.vertices))
-        outMesh.edges.add(len(mesh.edges))
-        outMesh.loops.add(len(mesh.polygons.indices))
-        outMesh.polygons.add(len(mesh.polygons))
-
-        # Vertices
-        outMesh.vertices.foreach_set("co", mesh.vertices.asMemoryView())
-        outMesh.vertices.foreach_set("normal", mesh.getVertexNormals().asMemoryView())
-
-        # Edges
-        outMesh.edges.foreach_set("vertices", mesh.edges.asMemoryView())
-
-        # Polygons
-        outMesh.polygons.foreach_set("loop_total", mesh.polygons.polyLengths.asMemoryView())
-        outMesh.polygons.foreach_set("loop_start", mesh.polygons.polyStarts.asMemoryView())
-        outMesh.loops.foreach_set("vertex_index", mesh.polygons.indices.asMemoryView())
-        outMesh.loops.foreach_set("edge_index", mesh.getLoopEdges().asMemoryView())           
@@ -1,4 +1,5 @@
 import bpy
+from libc.string cimport memcpy
 from bpy.props import *
 from .... math cimport abs as absNumber
 from .... base_types import AnimationNode
@@ -116,6 +117,9 @@ cdef class MixTwoFalloffsBase(CompoundFalloff):
     cdef list getDependencies(self):
         return [self.a, self.b]
 
+    cdef bint isThreadSafe(self):
+        return True
+
 cdef class AddTwoFalloffs(MixTwoFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
         return dependencyResults[0] + dependencyResults[1]
@@ -124,8 +128,9 @@ cdef class AddTwoFalloffs(MixTwoFalloffsBase):
         cdef Py_ssize_t i
         cdef float *a = dependencyResults[0]
         cdef float *b = dependencyResults[1]
-        for i in range(amount):
-            target[i] = a[i] + b[i]
+        with nogil:
+            for i in range(amount):
+                target[i] = a[i] + b[i]
 
 cdef class SubtractTwoFalloffs(MixTwoFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
@@ -135,8 +140,9 @@ cdef class SubtractTwoFalloffs(MixTwoFalloffsBase):
         cdef Py_ssize_t i
         cdef float *a = dependencyResults[0]
         cdef float *b = dependencyResults[1]
-        for i in range(amount):
-            target[i] = a[i] - b[i]            
+        with nogil:
+            for i in range(amount):
+                target[i] = a[i] - b[i]            
 
 cdef class AverageTwoFalloffs(MixTwoFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
@@ -157,8 +163,9 @@ cdef class MultiplyTwoFalloffs(MixTwoFalloffsBase):
         cdef Py_ssize_t i
         cdef float *a = dependencyResults[0]
         cdef float *b = dependencyResults[1]
-        for i in range(amount):
-            target[i] = a[i] * b[i]
+        with nogil:
+            for i in range(amount):
+                target[i] = a[i] * b[i]
 
 cdef class DivideTwoFalloffs(MixTwoFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
@@ -185,8 +192,9 @@ cdef class MinTwoFalloffs(MixTwoFalloffsBase):
         cdef Py_ssize_t i
         cdef float *a = dependencyResults[0]
         cdef float *b = dependencyResults[1]
-        for i in range(amount):
-            target[i] = min(a[i], b[i])            
+        with nogil:
+            for i in range(amount):
+                target[i] = min(a[i], b[i])            
 
 cdef class MaxTwoFalloffs(MixTwoFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
@@ -196,8 +204,9 @@ cdef class MaxTwoFalloffs(MixTwoFalloffsBase):
         cdef Py_ssize_t i
         cdef float *a = dependencyResults[0]
         cdef float *b = dependencyResults[1]
-        for i in range(amount):
-            target[i] = max(a[i], b[i])
+        with nogil:
+            for i in range(amount):
+                target[i] = max(a[i], b[i])
 
 cdef class OverlayTwoFalloffs(MixTwoFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
@@ -210,11 +219,12 @@ cdef class OverlayTwoFalloffs(MixTwoFalloffsBase):
         cdef Py_ssize_t i
         cdef float *a = dependencyResults[0]
         cdef float *b = dependencyResults[1]
-        for i in range(amount):
-            if a[i] <= 0.5:
-                target[i] =  2 * a[i] * b[i]
-            else:
-                target[i] = (1 - (2 * (1 - a[i])) * (1 - b[i]))
+        with nogil:
+            for i in range(amount):
+                if a[i] <= 0.5:
+                    target[i] =  2 * a[i] * b[i]
+                else:
+                    target[i] = (1 - (2 * (1 - a[i])) * (1 - b[i]))
 
 cdef class DifferenceTwoFalloffs(MixTwoFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
@@ -240,6 +250,9 @@ cdef class MixFalloffsBase(CompoundFalloff):
     cdef list getDependencies(self):
         return self.falloffs
 
+    cdef bint isThreadSafe(self):
+        return True
+
 cdef class AddFalloffs(MixFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
         cdef int i
@@ -248,6 +261,18 @@ cdef class AddFalloffs(MixFalloffsBase):
             sum += dependencyResults[i]
         return sum
 
+    cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target):
+        cdef Py_ssize_t i
+        cdef int j
+        cdef float *values
+        with nogil:
+            for i in range(amount):
+                target[i] = 0
+            for j in range(self.amount):
+                values = dependencyResults[j]
+                for i in range(amount):
+                    target[i] += values[i]
+
 cdef class SubtractFalloffs(MixFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
         cdef int i
@@ -256,6 +281,18 @@ cdef class SubtractFalloffs(MixFalloffsBase):
             sub -= dependencyResults[i]
         return sub
 
+    cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target):
+        cdef Py_ssize_t i
+        cdef int j
+        cdef float *values
+        with nogil:
+            for i in range(amount):
+                target[i] = 0
+            for j in range(self.amount):
+                values = dependencyResults[j]
+                for i in range(amount):
+                    target[i] -= values[i]
+
 cdef class AverageFalloffs(MixFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
         cdef int i
@@ -264,6 +301,16 @@ cdef class AverageFalloffs(MixFalloffsBase):
             avg = (avg + dependencyResults[i]) / 2
         return avg
 
+    cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target):
+        cdef Py_ssize_t i
+        cdef int j
+        cdef float *values
+        memcpy(target, dependencyResults[0], sizeof(float) * amount)
+        for j in range(1, self.amount):
+            values = dependencyResults[j]
+            for i in range(amount):
+                target[i] = (target[i] + values[i]) / 2
+
 cdef class MultiplyFalloffs(MixFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
         cdef int i
@@ -272,6 +319,18 @@ cdef class MultiplyFalloffs(MixFalloffsBase):
             product *= dependencyResults[i]
         return product
 
+    cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target):
+        cdef Py_ssize_t i
+        cdef int j
+        cdef float *values
+        with nogil:
+            for i in range(amount):
+                target[i] = 1
+            for j in range(self.amount):
+                values = dependencyResults[j]
+                for i in range(amount):
+                    target[i] *= values[i]
+
 cdef class MinFalloffs(MixFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
         cdef int i
@@ -281,6 +340,18 @@ cdef class MinFalloffs(MixFalloffsBase):
                 minValue = dependencyResults[i]
         return minValue
 
+    cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target):
+        cdef Py_ssize_t i
+        cdef int j
+        cdef float *values
+        with nogil:
+            memcpy(target, dependencyResults[0], sizeof(float) * amount)
+            for j in range(1, self.amount):
+                values = dependencyResults[j]
+                for i in range(amount):
+                    if values[i] < target[i]:
+                        target[i] = values[i]
+
 cdef class MaxFalloffs(MixFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
         cdef int i
@@ -290,6 +361,18 @@ cdef class MaxFalloffs(MixFalloffsBase):
                 maxValue = dependencyResults[i]
         return maxValue
 
+    cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target):
+        cdef Py_ssize_t i
+        cdef int j
+        cdef float *values
+        with nogil:
+            memcpy(target, dependencyResults[0], sizeof(float) * amount)
+            for j in range(1, self.amount):
+                values = dependencyResults[j]
+                for i in range(amount):
+                    if values[i] > target[i]:
+                        target[i] = values[i]
+
 cdef class OverlayFalloffs(MixFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
         cdef int i
@@ -301,6 +384,20 @@ cdef class OverlayFalloffs(MixFalloffsBase):
                  value = 1 - (2 * (1 - dependencyResults[i])) * (1 - value)         
         return value
 
+    cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target):
+        cdef Py_ssize_t i
+        cdef int j
+        cdef float *values
+        with nogil:
+            memcpy(target, dependencyResults[0], sizeof(float) * amount)
+            for j in range(1, self.amount):
+                values = dependencyResults[j]
+                for i in range(amount):
+                    if values[i] <= 0.5:
+                        target[i] = 2 * values[i] * target[i]
+                    else:
+                        target[i] = 1 - (2 * (1 - values[i])) * (1 - target[i])
+
 cdef class DifferenceFalloffs(MixFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
         cdef int i
@@ -309,6 +406,19 @@ cdef class DifferenceFalloffs(MixFalloffsBase):
             sub -= dependencyResults[i]
         return absNumber(sub)
 
+    cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target):
+        cdef Py_ssize_t i
+        cdef int j
+        cdef float *values
+        for i in range(amount):
+            target[i] = 0
+        for j in range(self.amount):
+            values = dependencyResults[j]
+            for i in range(amount):
+                target[i] -= values[i]
+        for i in range(amount):
+            target[i] = absNumber(target[i])
+
 cdef class DivideFalloffs(MixFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
         cdef int i
@@ -319,4 +429,18 @@ cdef class DivideFalloffs(MixFalloffsBase):
             else:    
                 div /= dependencyResults[i]
         return div
+
+    cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target):
+        cdef Py_ssize_t i
+        cdef int j
+        cdef float *values
+        for i in range(amount):
+            target[i] = 0
+        for j in range(self.amount):
+            values = dependencyResults[j]
+            for i in range(amount):
+                if values[i] == 0:
+                    target[i] /= 0.00001
+                else:
+                    target[i] /= values[i]
       
\ No newline at end of file
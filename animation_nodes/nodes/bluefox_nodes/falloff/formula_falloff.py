@@ -2,7 +2,7 @@ import bpy
 import numpy as np
 from bpy.props import *
 from .... events import propertyChanged
-from .... utils.code import isCodeValid
+from .. formula_utils import evaluateFormula
 from .... base_types import AnimationNode
 from ... falloff . custom_falloff import CustomFalloff
 from .... data_structures import DoubleList, FloatList
@@ -14,6 +14,10 @@ class Formulafalloff(bpy.types.Node, AnimationNode):
     bl_width_default = 180
     errorHandlingType = "EXCEPTION"
 
+    useFloat32: BoolProperty(name = "Use Float32", default = False,
+        description = "Evaluate the formula with single precision, faster but less accurate",
+        update = propertyChanged)
+
     def create(self):
         self.newInput("Text", "formula", "formula", value = "sin(2*pi*id/count*f+t)*a", defaultDrawType = "PROPERTY_ONLY")
         self.newInput("Integer", "Count", "count", value = 1, minValue = 1)
@@ -25,6 +29,7 @@ class Formulafalloff(bpy.types.Node, AnimationNode):
         self.newOutput("Float List", "strengths", "strengths", hide = True)
 
     def drawAdvanced(self, layout):
+        layout.prop(self, "useFloat32")
         box = layout.box()
         col = box.column(align = True)
         col.label(text = "Variables", icon = "INFO")
@@ -42,61 +47,27 @@ class Formulafalloff(bpy.types.Node, AnimationNode):
         col.label(text = "copysign,dist,radians,degrees")
 
     def execute(self, formula, count, t, f, a):
-        falloff_out = ConstantFalloff(0)
-        strength_out = DoubleList(length = count)
-        strength_out.fill(0)
-        
         if formula == "":
-            pass
-        elif isCodeValid(formula): 
-            
-            try:
-                result = self.evaluateFormula(formula, count, t, f, a)
-                if type(result).__name__ != "ndarray" and not callable(result):
-                    result = np.repeat(result, count)
-                falloff_out = CustomFalloff(FloatList.fromNumpyArray(result.astype('f')), 0)
-                strength_out = DoubleList.fromNumpyArray(result.astype('double'))
-            except:
-                 self.raiseErrorMessage("Incorrect formula")           
-        else:
-           self.raiseErrorMessage("Incorrect formula")
-        
-        return falloff_out, strength_out
-    
-    def evaluateFormula(self, formula, count, t, f, a):
-        t *= self.nodeTree.scene.frame_current_final
-        id = np.linspace(1, count, num = count, dtype = "int")
+            strengths = DoubleList(length = count)
+            strengths.fill(0)
+            return ConstantFalloff(0), strengths
 
-        # constants
-        pi = np.pi
-        e = np.e
+        try:
+            result = self.evaluateFormula(formula, count, t, f, a)
+        except:
+            self.raiseErrorMessage("Incorrect formula")
 
-        # functions
-        def abs(x):return np.absolute(x)
-        def sqrt(x):return np.sqrt(x)
-        def cbrt(x):return np.cbrt(x)
-        def round(x):return np.around(x)
-        def floor(x):return np.floor(x)
-        def ceil(x):return np.ceil(x)
-        def trunc(x):return np.trunc(x)
-        def clamp(x):return np.clip(x,0,1)
-        def exp(x):return np.exp(x)
-        def log(x):return np.log(x)
-        def radians(x):return np.radians(x)
-        def degrees(x):return np.degrees(x)
-        def sin(x):return np.sin(x)
-        def cos(x):return np.cos(x)
-        def tan(x):return np.tan(x)
-        def asin(x):return np.arcsin(x)
-        def acos(x):return np.arccos(x)
-        def atan(x):return np.arctan(x)
-        def atan2(x,y):return np.arctan2(x,y)
-        def mod(x,y):return np.mod(x,y)
-        def pow(x,y):return np.power(x,y)
-        def rem(x,y):return np.remainder(x,y)
-        def max(x,y):return np.maximum(x,y)
-        def min(x,y):return np.minimum(x,y)
-        def copysign(x,y):return np.copysign(x,y)
-        def dist(x,y):return np.linalg.norm(x-y)
+        falloff = CustomFalloff(FloatList.fromNumpyArray(result.astype("float32")), 0)
+        return falloff, DoubleList.fromNumpyArray(result.astype("double"))
 
-        return eval(formula)
+    def evaluateFormula(self, formula, count, t, f, a):
+        t *= self.nodeTree.scene.frame_current_final
+        variables = {
+            "id" : lambda start, end: np.arange(start + 1, end + 1),
+            "count" : count,
+            "t" : t,
+            "f" : f,
+            "a" : a
+        }
+        dtype = "float32" if self.useFloat32 else "float64"
+        return evaluateFormula(formula, count, variables, dtype)
@@ -92,6 +92,9 @@ cdef class RadialFalloff(BaseFalloff):
         for i in range(amount):
             target[i] = radial(self, <Vector3*>values + i)
 
+    cdef bint isThreadSafe(self):
+        return True
+
 cdef inline float radial(RadialFalloff self, Vector3 *v):
     cdef Vector3 tmp
     cdef float newX, newY, newZ
@@ -0,0 +1,103 @@
+import ast
+import numpy as np
+from functools import lru_cache
+
+# Amount of elements that are evaluated at once.
+# Bounds the size of the temporary arrays numpy creates for every operation.
+chunkSize = 2 ** 16
+
+constants = {
+    "pi" : np.pi,
+    "e" : np.e
+}
+
+functions = {
+    "abs" : np.absolute,
+    "sqrt" : np.sqrt,
+    "cbrt" : np.cbrt,
+    "round" : np.around,
+    "floor" : np.floor,
+    "ceil" : np.ceil,
+    "trunc" : np.trunc,
+    "clamp" : lambda x: np.clip(x, 0, 1),
+    "exp" : np.exp,
+    "log" : np.log,
+    "radians" : np.radians,
+    "degrees" : np.degrees,
+    "sin" : np.sin,
+    "cos" : np.cos,
+    "tan" : np.tan,
+    "asin" : np.arcsin,
+    "acos" : np.arccos,
+    "atan" : np.arctan,
+    "atan2" : np.arctan2,
+    "mod" : np.mod,
+    "pow" : np.power,
+    "rem" : np.remainder,
+    "max" : np.maximum,
+    "min" : np.minimum,
+    "copysign" : np.copysign,
+    "dist" : lambda x, y: np.linalg.norm(x - y)
+}
+
+# These functions reduce the whole array,
+# so formulas that use them can not be evaluated in chunks.
+reducingFunctions = {"dist"}
+
+namespace = dict(constants, **functions)
+namespace["__builtins__"] = {}
+
+class CompiledFormula:
+    def __init__(self, code, usedNames, variableNames):
+        self.code = code
+        self.variableNames = variableNames
+        self.usedVariables = tuple(name for name in variableNames if name in usedNames)
+        self.isElementwise = reducingFunctions.isdisjoint(usedNames)
+
+    def evaluate(self, amount, variables, dtype = "float64"):
+        '''
+        Variables can be scalars, arrays with the given amount of elements
+        or functions that take a start and end index and return an array.
+        Float arrays are converted to the given dtype chunk by chunk,
+        integer arrays and scalars keep their type.
+        '''
+        result = np.empty(amount, dtype = dtype)
+        step = chunkSize if self.isElementwise else max(amount, 1)
+        for start in range(0, amount, step):
+            end = min(start + step, amount)
+            localVariables = {name : getChunk(variables[name], start, end, dtype)
+                              for name in self.usedVariables}
+            result[start:end] = eval(self.code, namespace, localVariables)
+        return result
+
+def getChunk(value, start, end, dtype):
+    if callable(value):
+        value = value(start, end)
+    elif not isinstance(value, np.ndarray):
+        return value
+    else:
+        value = value[start:end]
+    if value.dtype.kind != "f":
+        return value
+    return value.astype(dtype, copy = False)
+
+@lru_cache(maxsize = 64)
+def compileFormula(formula, variableNames):
+    '''
+    Parses the formula once and caches the code object.
+    Raises SyntaxError or NameError when the formula is invalid.
+    '''
+    tree = ast.parse(formula, mode = "eval")
+    usedNames = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            if node.id not in namespace and node.id not in variableNames:
+                raise NameError("unknown name in formula: " + node.id)
+            usedNames.add(node.id)
+        elif isinstance(node, ast.Attribute):
+            raise NameError("attribute access is not allowed in formulas")
+    return CompiledFormula(compile(tree, "<formula>", "eval"), usedNames, variableNames)
+
+def evaluateFormula(formula, amount, variables, dtype = "float64"):
+    compiled = compileFormula(formula, tuple(sorted(variables.keys())))
+    return compiled.evaluate(amount, variables, dtype)
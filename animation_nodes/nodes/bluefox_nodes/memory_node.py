@@ -13,6 +13,7 @@ class MemoryNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_MemoryNode"
     bl_label = "Memory Node"
     bl_width_default = 150
+    options = {"NO_INCREMENTAL_EXECUTION"}
 
     __annotations__ = {}
 
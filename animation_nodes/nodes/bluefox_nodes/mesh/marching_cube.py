@@ -3,9 +3,12 @@ import numpy as np
 from bpy.props import *
 from .... events import propertyChanged
 from .... base_types import AnimationNode, VectorizedSocket
+from .. formula_utils import evaluateFormula
 from . utils.marching_cubes import isoSurface
+from . utils.adaptive_sampling import (getCoarsePositions, getGridIndices, getActiveBlocks,
+                                       getBlockSamples, createBlockSurfaces, joinSurfaces)
 from .... data_structures.meshes.validate import createValidEdgesList
-from .... data_structures import LongList, Vector3DList, PolygonIndicesList, EdgeIndicesList, Mesh
+from .... data_structures import LongList, Vector3DList, Mesh
 
 fieldTypeItems = [
     ("FALLOFF", "Falloff", "Use falloff field", "", 0),
@@ -22,7 +25,19 @@ class MarchingCubes(bpy.types.Node, AnimationNode):
     useThresholdList: VectorizedSocket.newProperty()
 
     fieldType: EnumProperty(name = "Field Type", default = "FALLOFF",
-        items = fieldTypeItems, update = AnimationNode.refresh)  
+        items = fieldTypeItems, update = AnimationNode.refresh)
+
+    useFloat32: BoolProperty(name = "Use Float32", default = False,
+        description = "Evaluate the formula with single precision, faster but less accurate",
+        update = propertyChanged)
+
+    useAdaptiveSampling: BoolProperty(name = "Adaptive Sampling", default = False,
+        description = "Sample only the blocks of the grid that are close to the surface, small parts of the surface can be missed",
+        update = propertyChanged)
+
+    blockSize: IntProperty(name = "Block Size", default = 8, min = 2,
+        description = "Samples per side of the blocks that are checked for the surface",
+        update = propertyChanged)
 
     def create(self):
         if self.fieldType == "FALLOFF":
@@ -41,6 +56,13 @@ class MarchingCubes(bpy.types.Node, AnimationNode):
 
     def draw(self, layout):
         layout.prop(self, "fieldType", text = "")
+
+    def drawAdvanced(self, layout):
+        layout.prop(self, "useFloat32")
+        layout.prop(self, "useAdaptiveSampling")
+        row = layout.row()
+        row.active = self.useAdaptiveSampling
+        row.prop(self, "blockSize")
       
     def execute(self, field, transform, samples, threshold):
         if field is None:
@@ -55,10 +77,17 @@ class MarchingCubes(bpy.types.Node, AnimationNode):
                 boundingBox = Vector3DList.fromValues(unityCube)
                 boundingBox.transform(transform)
 
-                evaluatedField, b1n, b2n = self.evaluateField(boundingBox, samples, field)
-                vertices, faces = isoSurface(evaluatedField, threshold)
-                vertexLocations = Vector3DList.fromValues((vertices / samples) * (b2n - b1n) + b1n)
-                polygonIndices = PolygonIndicesList.fromValues(faces)
+                b1, b2 = self.getBounds(boundingBox)
+                ranges = [np.linspace(b1[axis], b2[axis], num=samples) for axis in range(3)]
+                origin = np.array(b1)
+                spacing = (np.array(b2) - origin) / samples
+
+                if self.useAdaptiveSampling:
+                    vertexLocations, polygonIndices = self.createAdaptiveSurface(
+                        field, ranges, threshold, origin, spacing)
+                else:
+                    evaluatedField = self.evaluateField(field, ranges)
+                    vertexLocations, polygonIndices = isoSurface(evaluatedField, threshold, origin, spacing)
                 edgeIndices = createValidEdgesList(polygons = polygonIndices)
                 materialIndices = LongList(length = len(polygonIndices))
                 materialIndices.fill(0)
@@ -68,17 +97,33 @@ class MarchingCubes(bpy.types.Node, AnimationNode):
                 self.raiseErrorMessage("Mesh generation failed")
                 return Mesh()
 
-    def evaluateField(self, boundingBox, samples, field):
-        b1, b2 = self.getBounds(boundingBox)
-        b1n, b2n = np.array(b1), np.array(b2)
-
-        xRange = np.linspace(b1[0], b2[0], num=samples)
-        yRange = np.linspace(b1[1], b2[1], num=samples)
-        zRange = np.linspace(b1[2], b2[2], num=samples)
-        grid = np.vstack([np.meshgrid(xRange, yRange, zRange, indexing='ij')]).reshape(3,-1).T
-
-        evaluatedField = self.getField(field, grid).reshape((samples, samples, samples))
-        return evaluatedField, b1n, b2n
+    def evaluateField(self, field, ranges):
+        samples = len(ranges[0])
+        if self.fieldType == "FORMULA":
+            getIndices = lambda start, end, axis: np.arange(start, end) // samples ** (2 - axis) % samples
+            evaluatedField = self.evaluateFormula(field, ranges, samples ** 3, getIndices)
+        else:
+            grid = np.vstack([np.meshgrid(*ranges, indexing='ij')]).reshape(3,-1).T
+            evaluatedField = self.getField(field, grid)
+        return evaluatedField.reshape((samples, samples, samples))
+
+    def createAdaptiveSurface(self, field, ranges, threshold, origin, spacing):
+        positions = getCoarsePositions(len(ranges[0]), self.blockSize)
+        coarseValues = self.evaluateFieldAtIndices(field, ranges, getGridIndices(positions, positions, positions))
+        blocks = getActiveBlocks(coarseValues.reshape((len(positions), ) * 3), threshold)
+
+        sampleIndices, blockInfos = getBlockSamples(blocks, positions)
+        values = self.evaluateFieldAtIndices(field, ranges, sampleIndices)
+        return joinSurfaces(createBlockSurfaces(values, blockInfos, threshold, origin, spacing))
+
+    def evaluateFieldAtIndices(self, field, ranges, indices):
+        if len(indices) == 0:
+            return np.zeros(0)
+        if self.fieldType == "FORMULA":
+            getIndices = lambda start, end, axis: indices[start:end, axis]
+            return self.evaluateFormula(field, ranges, len(indices), getIndices)
+        grid = np.column_stack([ranges[axis][indices[:, axis]] for axis in range(3)])
+        return self.getField(field, grid)
 
     def getBounds(self, vertices):
         vs = np.array(vertices)
@@ -95,49 +140,19 @@ class MarchingCubes(bpy.types.Node, AnimationNode):
             vectors = Vector3DList.fromNumpyArray(grid.astype('float32').ravel())
             falloff_strengths = falloffEvaluator.evaluateList(vectors)
             return falloff_strengths.asNumpyArray().astype('float32')
-        elif self.fieldType == "FORMULA":
-            return self.evaluateFormula(field,grid,x,y,z)  
         else:
             return field(x,y,z)
-                
+
     def getFalloffEvaluator(self, falloff):
         try: return falloff.getEvaluator("LOCATION")
         except: self.raiseErrorMessage("This falloff cannot be evaluated for vectors")
 
-    def evaluateFormula(self, formula, grid, x, y, z):
-        count = len(x)
-        default_result = np.zeros(count)
-
-        # constants
-        pi = np.pi
-        e = np.e
-
-        # functions
-        def abs(x):return np.absolute(x)
-        def sqrt(x):return np.sqrt(x)
-        def cbrt(x):return np.cbrt(x)
-        def round(x):return np.around(x)
-        def floor(x):return np.floor(x)
-        def ceil(x):return np.ceil(x)
-        def trunc(x):return np.trunc(x)
-        def clamp(x):return np.clip(x,0,1)
-        def exp(x):return np.exp(x)
-        def log(x):return np.log(x)
-        def radians(x):return np.radians(x)
-        def degrees(x):return np.degrees(x)
-        def sin(x):return np.sin(x)
-        def cos(x):return np.cos(x)
-        def tan(x):return np.tan(x)
-        def asin(x):return np.arcsin(x)
-        def acos(x):return np.arccos(x)
-        def atan(x):return np.arctan(x)
-        def atan2(x,y):return np.arctan2(x,y)
-        def mod(x,y):return np.mod(x,y)
-        def pow(x,y):return np.power(x,y)
-        def rem(x,y):return np.remainder(x,y)
-        def max(x,y):return np.maximum(x,y)
-        def min(x,y):return np.minimum(x,y)
-        def copysign(x,y):return np.copysign(x,y)
-        def dist(x,y):return np.linalg.norm(x-y)
-
-        return eval(formula)
+    def evaluateFormula(self, formula, ranges, amount, getIndices):
+        # the coordinates are created per chunk instead of for all samples at once
+        getCoordinates = lambda start, end, axis: ranges[axis][getIndices(start, end, axis)]
+        variables = {name : (lambda start, end, axis = axis: getCoordinates(start, end, axis))
+                     for axis, name in enumerate("xyz")}
+        variables["grid"] = lambda start, end: np.column_stack(
+            [getCoordinates(start, end, axis) for axis in range(3)])
+        dtype = "float32" if self.useFloat32 else "float64"
+        return evaluateFormula(formula, amount, variables, dtype)
@@ -0,0 +1,20 @@
+import numpy as np
+from unittest import TestCase
+from . marching_cube import MarchingCubes
+
+def evaluateFormulaField(formula):
+    node = MarchingCubes.__new__(MarchingCubes)
+    node.fieldType = "FORMULA"
+    node.useFloat32 = False
+    ranges = [np.linspace(0, 1, num = 4), np.linspace(2, 3, num = 4), np.linspace(4, 5, num = 4)]
+    return node.evaluateField(formula, ranges)
+
+class TestFormulaField(TestCase):
+    def testGridMatchesCoordinates(self):
+        for axis, name in enumerate("xyz"):
+            expected = evaluateFormulaField(name)
+            np.testing.assert_array_equal(evaluateFormulaField("grid[:, {}]".format(axis)), expected)
+
+    def testCoordinates(self):
+        field = evaluateFormulaField("x + y * 10 + z * 100")
+        self.assertAlmostEqual(field[1, 2, 3], 1 / 3 + (2 + 2 / 3) * 10 + 5 * 100)
@@ -0,0 +1,95 @@
+'''
+Adaptive sampling evaluates the field on a coarse grid of block corners first.
+Only the blocks whose corners are on both sides of the level, and their direct
+neighbours, are sampled with the full resolution and turned into a surface.
+Surfaces that are completely inside of a single block can be missed.
+'''
+
+import numpy as np
+from . marching_cubes import isoSurface
+from ..... data_structures import Vector3DList, UIntegerList, PolygonIndicesList
+
+def getCoarsePositions(samples, blockSize):
+    '''Grid indices of the block corners along one axis.'''
+    return np.append(np.arange(0, samples - 1, blockSize), samples - 1)
+
+def getGridIndices(xIndices, yIndices, zIndices):
+    grid = np.meshgrid(xIndices, yIndices, zIndices, indexing = "ij")
+    return np.stack(grid, axis = -1).reshape(-1, 3)
+
+def getActiveBlocks(coarseValues, level):
+    '''Returns the block coordinates of blocks that might contain the surface.'''
+    above = coarseValues > level
+    anyAbove = np.zeros(np.subtract(above.shape, 1), dtype = bool)
+    allAbove = np.ones_like(anyAbove)
+    for x in (0, 1):
+        for y in (0, 1):
+            for z in (0, 1):
+                corners = above[x:above.shape[0] - 1 + x,
+                                y:above.shape[1] - 1 + y,
+                                z:above.shape[2] - 1 + z]
+                anyAbove |= corners
+                allAbove &= corners
+    active = anyAbove & ~allAbove
+
+    # the surface can cross a block without changing the side of its corners
+    dilated = active.copy()
+    dilated[1:] |= active[:-1]
+    dilated[:-1] |= active[1:]
+    active = dilated.copy()
+    active[:, 1:] |= dilated[:, :-1]
+    active[:, :-1] |= dilated[:, 1:]
+    dilated = active.copy()
+    dilated[:, :, 1:] |= active[:, :, :-1]
+    dilated[:, :, :-1] |= active[:, :, 1:]
+    return np.argwhere(dilated)
+
+def getBlockSamples(blocks, positions):
+    '''
+    Returns the grid indices of the samples of all blocks and
+    for every block its shape and the index of its first sample.
+    '''
+    indexArrays = []
+    blockInfos = []
+    start = 0
+    for block in blocks:
+        ranges = [np.arange(positions[i], positions[i + 1] + 1) for i in block]
+        indices = getGridIndices(*ranges)
+        indexArrays.append(indices)
+        blockInfos.append((start, tuple(len(r) for r in ranges), indices[0]))
+        start += len(indices)
+
+    if len(indexArrays) == 0:
+        return np.zeros((0, 3), dtype = int), blockInfos
+    return np.concatenate(indexArrays), blockInfos
+
+def createBlockSurfaces(values, blockInfos, level, origin, spacing):
+    surfaces = []
+    for start, shape, indexOffset in blockInfos:
+        volume = values[start:start + np.prod(shape)].reshape(shape)
+        if volume.max() > level and volume.min() <= level:
+            surfaces.append(isoSurface(volume, level, origin, spacing, indexOffset))
+    return surfaces
+
+def joinSurfaces(surfaces):
+    '''
+    Neighbouring blocks create the same vertices on their shared faces,
+    these are merged so that the surface is connected again.
+    '''
+    vertexArrays = [vertices.asNumpyArray().reshape(-1, 3) for vertices, _ in surfaces]
+    vertexStarts = np.cumsum([0] + [len(vertices) for vertices, _ in surfaces])
+    indexArrays = [polygons.indices.asNumpyArray().astype(np.int64) + vertexStart
+                   for (_, polygons), vertexStart in zip(surfaces, vertexStarts)]
+
+    if len(indexArrays) == 0 or vertexStarts[-1] == 0:
+        return Vector3DList(), PolygonIndicesList()
+
+    vertices, newIndices = np.unique(np.concatenate(vertexArrays), axis = 0, return_inverse = True)
+    indices = newIndices.reshape(-1)[np.concatenate(indexArrays)]
+
+    triangleAmount = len(indices) // 3
+    polygons = PolygonIndicesList.fromLists(
+        UIntegerList.fromNumpyArray(indices.astype(np.uint32)),
+        UIntegerList.fromNumpyArray(np.arange(0, triangleAmount * 3, 3, dtype = np.uint32)),
+        UIntegerList.fromNumpyArray(np.full(triangleAmount, 3, dtype = np.uint32)))
+    return Vector3DList.fromNumpyArray(np.ascontiguousarray(vertices, dtype = np.float32).ravel()), polygons
@@ -84,962 +84,709 @@ skimage/_shared/version_requirements.py:is_installed:
     WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
-
 import numpy as np
+from cython cimport floating
+from libc.stdlib cimport malloc, free
+from libc.string cimport memmove
+from ..... utils.parallel import getThreadAmount, splitRange, runParts
+from ..... math cimport Vector3
 from ..... data_structures cimport (
+    LongList,
+    UIntegerList,
     Vector3DList,
     PolygonIndicesList,
 )
 
-cdef inline double _get_fraction(double from_value, double to_value,
-                                 double level):
-    if (to_value == from_value):
-        return 0
-    return ((level - from_value) / (to_value - from_value))
-
-
-def unpack_unique_verts(list trilist):
-    """
-    Convert a list of lists of tuples corresponding to triangle vertices
-    into a unique vertex list, and a list of triangle faces w/indices
-    corresponding to entries of the vertex list.
-
-    """
-    cdef Py_ssize_t idx = 0
-    cdef Py_ssize_t n_tris = len(trilist)
-    cdef Py_ssize_t i, j
-    cdef dict vert_index = {}
-    cdef list vert_list = []
-    cdef PolygonIndicesList faces = PolygonIndicesList()
-
-    cdef list templist
-
-    # Iterate over triangles
-    for i in range(n_tris):
-        templist = []
-
-        # Only parse vertices from non-degenerate triangles
-        if not ((trilist[i][0] == trilist[i][1]) or
-                (trilist[i][0] == trilist[i][2]) or
-                (trilist[i][1] == trilist[i][2])):
-
-            # Iterate over vertices within each triangle
-            for j in range(3):
-                vert = trilist[i][j]
-
-                # Check if a new unique vertex found
-                if vert not in vert_index:
-                    vert_index[vert] = idx
-                    templist.append(idx)
-                    vert_list.append(vert)
-                    idx += 1
-                else:
-                    templist.append(vert_index[vert])
-
-            faces.append(templist)
-
-    return vert_list, faces
-
-
-def iterate_and_store_3d(double[:, :, ::1] arr, double level):
-    """Iterate across the given array in a marching-cubes fashion,
-    looking for volumes with edges that cross 'level'. If such a volume is
-    found, appropriate triangulations are added to a growing list of
-    faces to be returned by this function.
-
-    """
-    if arr.shape[0] < 2 or arr.shape[1] < 2 or arr.shape[2] < 2:
-        raise ValueError("Input array must be at least 2x2x2.")
-
-    cdef list face_list = []
-    cdef list norm_list = []
-    cdef Py_ssize_t n
-    cdef bint plus_z
-    plus_z = False
-
-    # The plan is to iterate a 2x2x2 cube across the input array. This means
-    # the upper-left corner of the cube needs to iterate across a sub-array
-    # of size one-less-large in each direction (so we can get away with no
-    # bounds checking in Cython). The cube is represented by eight vertices:
-    # v1, v2, ..., v8, oriented thus (see Lorensen, Figure 4):
-    #
-    #           v8 ------ v7
-    #          / |       / |        y
-    #         /  |      /  |        ^  z
-    #       v4 ------ v3   |        | /
-    #        |  v5 ----|- v6        |/          (note: NOT right handed!)
-    #        |  /      |  /          ----> x
-    #        | /       | /
-    #       v1 ------ v2
-    #
-    # We also maintain the current 2D coordinates for v1, and ensure the array
-    # is of type 'double' and is C-contiguous (last index varies fastest).
-
-    # Coords start at (0, 0, 0).
-    cdef Py_ssize_t[3] coords
-    coords[0] = 0
-    coords[1] = 0
-    coords[2] = 0
-
-    # Calculate the number of iterations we'll need
-    cdef Py_ssize_t num_cube_steps = ((arr.shape[0] - 1) *
-                                      (arr.shape[1] - 1) *
-                                      (arr.shape[2] - 1))
-
-    cdef unsigned char cube_case = 0
-    cdef tuple e1, e2, e3, e4, e5, e6, e7, e8, e9, e10, e11, e12
-    cdef double v1, v2, v3, v4, v5, v6, v7, v8
-    cdef Py_ssize_t x0, y0, z0, x1, y1, z1
-    e5, e6, e7, e8 = (0, 0, 0), (0, 0, 0), (0, 0, 0), (0, 0, 0)
-
-    for n in range(num_cube_steps):
-        # There are 255 unique values for `cube_case`. This algorithm follows
-        # the Lorensen paper in vertex and edge labeling, however, it should
-        # be noted that Lorensen used a left-handed coordinate system while
-        # NumPy uses a proper right handed system. Transforming between these
-        # coordinate systems was handled in the definitions of the cube
-        # vertices v1, v2, ..., v8.
-        #
-        # Refer to the paper, figure 4, for cube edge designations e1, ... e12
-
-        # Standard Py_ssize_t coordinates for indexing
-        x0, y0, z0 = coords[0], coords[1], coords[2]
-        x1, y1, z1 = x0 + 1, y0 + 1, z0 + 1
-
-        # We use a right-handed coordinate system, UNlike the paper, but want
-        # to index in agreement - the coordinate adjustment takes place here.
-        v1 = arr[x0, y0, z0]
-        v2 = arr[x1, y0, z0]
-        v3 = arr[x1, y1, z0]
-        v4 = arr[x0, y1, z0]
-        v5 = arr[x0, y0, z1]
-        v6 = arr[x1, y0, z1]
-        v7 = arr[x1, y1, z1]
-        v8 = arr[x0, y1, z1]
-
-        # Unique triangulation cases
-        cube_case = 0
-        if (v1 > level): cube_case += 1
-        if (v2 > level): cube_case += 2
-        if (v3 > level): cube_case += 4
-        if (v4 > level): cube_case += 8
-        if (v5 > level): cube_case += 16
-        if (v6 > level): cube_case += 32
-        if (v7 > level): cube_case += 64
-        if (v8 > level): cube_case += 128
-
-        if (cube_case != 0 and cube_case != 255):
-            # Only do anything if there's a plane intersecting the cube.
-            # Cases 0 and 255 are entirely below/above the contour.
-
-            if cube_case > 127:
-                if ((cube_case != 150) and
-                     (cube_case != 170) and
-                     (cube_case != 195)):
-                    cube_case = 255 - cube_case
-
-            # Calculate cube edges, to become triangulation vertices.
-            # If we moved in a convenient direction, save 1/3 of the effort by
-            # re-assigning prior results.
-            if plus_z:
-                # Reassign prior calculated edges
-                e1 = e5
-                e2 = e6
-                e3 = e7
-                e4 = e8
-            else:
-                # Calculate these edges normally
-                e1 = x0 + _get_fraction(v1, v2, level), y0, z0
-                e2 = x1, y0 + _get_fraction(v2, v3, level), z0
-                e3 = x0 + _get_fraction(v4, v3, level), y1, z0
-                e4 = x0, y0 + _get_fraction(v1, v4, level), z0
-
-            # These must be calculated at each point unless we implemented a
-            # large, growing lookup table for all adjacent values; could save
-            # ~30% in terms of runtime at the expense of memory usage and
-            # much greater complexity.
-            e5 = x0 + _get_fraction(v5, v6, level), y0, z1
-            e6 = x1, y0 + _get_fraction(v6, v7, level), z1
-            e7 = x0 + _get_fraction(v8, v7, level), y1, z1
-            e8 = x0, y0 + _get_fraction(v5, v8, level), z1
-            e9 = x0, y0, z0 + _get_fraction(v1, v5, level)
-            e10 = x1, y0, z0 + _get_fraction(v2, v6, level)
-            e11 = x0, y1, z0 + _get_fraction(v4, v8, level)
-            e12 = x1, y1, z0 + _get_fraction(v3, v7, level)
-
-
-            # Append appropriate triangles to the growing output `face_list`
-            _append_tris(face_list, cube_case, e1, e2, e3, e4, e5,
-                           e6, e7, e8, e9, e10, e11, e12)
-
-        # Advance the coords indices
-        if coords[2] < arr.shape[2] - 2:
-            coords[2] += 1
-            plus_z = True
-        elif coords[1] < arr.shape[1] - 2:
-            coords[1] += 1
-            coords[2] = 0
-            plus_z = False
-        else:
-            coords[0] += 1
-            coords[1] = 0
-            coords[2] = 0
-            plus_z = False
-
-    return face_list
-
-
-def _append_tris(list face_list, unsigned char case, tuple e1, tuple e2,
-                 tuple e3, tuple e4, tuple e5, tuple e6, tuple e7, tuple e8,
-                 tuple e9, tuple e10, tuple e11, tuple e12):
-    # Permits recursive use for duplicated planes to conserve code - it's
-    # quite long enough as-is.
-
-    if (case == 1):
-        # front lower left corner
-        face_list.append([e1, e4, e9])
-    elif (case == 2):
-        # front lower right corner
-        face_list.append([e10, e2, e1])
-    elif (case == 3):
-        # front lower plane
-        face_list.append([e2, e4, e9])
-        face_list.append([e2, e9, e10])
-    elif (case == 4):
-        # front upper right corner
-        face_list.append([e12, e3, e2])
-    elif (case == 5):
-        # lower left, upper right corners
-        _append_tris(face_list, 1, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 4, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 6):
-        # front right plane
-        face_list.append([e12, e3, e1])
-        face_list.append([e12, e1, e10])
-    elif (case == 7):
-        # Shelf including v1, v2, v3
-        face_list.append([e3, e4, e12])
-        face_list.append([e4, e9, e12])
-        face_list.append([e12, e9, e10])
-    elif (case == 8):
-        # front upper left corner
-        face_list.append([e3, e11, e4])
-    elif (case == 9):
-        # front left plane
-        face_list.append([e3, e11, e9])
-        face_list.append([e3, e9, e1])
-    elif (case == 10):
-        # upper left, lower right corners
-        _append_tris(face_list, 2, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 8, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 11):
-        # Shelf including v4, v1, v2
-        face_list.append([e3, e11, e2])
-        face_list.append([e11, e10, e2])
-        face_list.append([e11, e9, e10])
-    elif (case == 12):
-        # front upper plane
-        face_list.append([e11, e4, e12])
-        face_list.append([e2, e4, e12])
-    elif (case == 13):
-        # Shelf including v1, v4, v3
-        face_list.append([e11, e9, e12])
-        face_list.append([e12, e9, e1])
-        face_list.append([e12, e1, e2])
-    elif (case == 14):
-        # Shelf including v2, v3, v4
-        face_list.append([e11, e10, e12])
-        face_list.append([e11, e4, e10])
-        face_list.append([e4, e1, e10])
-    elif (case == 15):
-        # Plane parallel to x-axis through middle
-        face_list.append([e11, e9, e12])
-        face_list.append([e12, e9, e10])
-    elif (case == 16):
-        # back lower left corner
-        face_list.append([e8, e9, e5])
-    elif (case == 17):
-        # lower left plane
-        face_list.append([e4, e1, e8])
-        face_list.append([e8, e1, e5])
-    elif (case == 18):
-        # lower left back, lower right front corners
-        _append_tris(face_list, 16, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 2, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 19):
-        # Shelf including v1, v2, v5
-        face_list.append([e8, e4, e2])
-        face_list.append([e8, e2, e10])
-        face_list.append([e8, e10, e5])
-    elif (case == 20):
-        # lower left back, upper right front corners
-        _append_tris(face_list, 16, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 4, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 21):
-        # lower left plane + upper right front corner, v1, v3, v5
-        _append_tris(face_list, 17, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 4, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 22):
-        # front right plane + lower left back corner, v2, v3, v5
-        _append_tris(face_list, 16, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 6, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 23):
-        # Rotated case 14 in the paper
-        face_list.append([e3, e10, e8])
-        face_list.append([e3, e10, e12])
-        face_list.append([e8, e10, e5])
-        face_list.append([e3, e4, e8])
-    elif (case == 24):
-        # upper front left, lower back left corners
-        _append_tris(face_list, 16, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 8, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 25):
-        # Shelf including v1, v4, v5
-        face_list.append([e1, e5, e3])
-        face_list.append([e3, e8, e11])
-        face_list.append([e3, e5, e8])
-    elif (case == 26):
-        # Three isolated corners
-        _append_tris(face_list, 2, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 8, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 16, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 27):
-        # Full corner v1, case 9 in paper: (v1, v2, v4, v5)
-        face_list.append([e11, e3, e2])
-        face_list.append([e11, e2, e10])
-        face_list.append([e10, e11, e8])
-        face_list.append([e8, e5, e10])
-    elif (case == 28):
-        # upper front plane + corner v5
-        _append_tris(face_list, 16, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 12, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 29):
-        # special case of 11 in the paper: (v1, v3, v4, v5)
-        face_list.append([e11, e5, e2])
-        face_list.append([e11, e12, e2])
-        face_list.append([e11, e5, e8])
-        face_list.append([e2, e1, e5])
-    elif (case == 30):
-        # Shelf (v2, v3, v4) and lower left back corner
-        _append_tris(face_list, 14, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 16, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 31):
-        # Shelf: (v6, v7, v8) by inversion
-        face_list.append([e11, e12, e10])
-        face_list.append([e11, e8, e10])
-        face_list.append([e8, e10, e5])
-    elif (case == 32):
-        # lower right back corner
-        face_list.append([e6, e5, e10])
-    elif (case == 33):
-        # lower right back, lower left front corners
-        _append_tris(face_list, 1, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 32, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 34):
-        # lower right plane
-        face_list.append([e1, e2, e5])
-        face_list.append([e2, e6, e5])
-    elif (case == 35):
-        # Shelf: v1, v2, v6
-        face_list.append([e4, e2, e6])
-        face_list.append([e4, e9, e6])
-        face_list.append([e6, e9, e5])
-    elif (case == 36):
-        # upper right front, lower right back corners
-        _append_tris(face_list, 32, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 4, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 37):
-        # lower left front, upper right front, lower right back corners
-        _append_tris(face_list, 32, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 4, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 1, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 38):
-        # Shelf: v2, v3, v6
-        face_list.append([e3, e1, e5])
-        face_list.append([e3, e5, e12])
-        face_list.append([e12, e5, e6])
-    elif (case == 39):
-        # Full corner v2: (v1, v2, v3, v6)
-        face_list.append([e3, e4, e5])
-        face_list.append([e4, e9, e5])
-        face_list.append([e3, e5, e6])
-        face_list.append([e3, e12, e6])
-    elif (case == 40):
-        # upper left front, lower right back corners
-        _append_tris(face_list, 32, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 8, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 41):
-        # front left plane, lower right back corner
-        _append_tris(face_list, 32, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 9, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 42):
-        # lower right plane, upper front left corner
-        _append_tris(face_list, 8, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 34, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 43):
-        # Rotated case 11 in paper
-        face_list.append([e11, e3, e9])
-        face_list.append([e3, e9, e6])
-        face_list.append([e3, e2, e6])
-        face_list.append([e9, e5, e6])
-    elif (case == 44):
-        # upper front plane, lower right back corner
-        _append_tris(face_list, 12, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 32, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 45):
-        # Shelf: (v1, v3, v4) + lower right back corner
-        _append_tris(face_list, 13, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 32, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 46):
-        # Rotated case 14 in paper
-        face_list.append([e4, e11, e12])
-        face_list.append([e4, e12, e5])
-        face_list.append([e12, e5, e6])
-        face_list.append([e4, e5, e1])
-    elif (case == 47):
-        # Shelf: (v5, v8, v7) by inversion
-        face_list.append([e11, e9, e12])
-        face_list.append([e12, e9, e5])
-        face_list.append([e12, e5, e6])
-    elif (case == 48):
-        # Back lower plane
-        face_list.append([e9, e10, e6])
-        face_list.append([e9, e6, e8])
-    elif (case == 49):
-        # Shelf: (v1, v5, v6)
-        face_list.append([e4, e8, e6])
-        face_list.append([e4, e6, e1])
-        face_list.append([e6, e1, e10])
-    elif (case == 50):
-        # Shelf: (v2, v5, v6)
-        face_list.append([e8, e6, e2])
-        face_list.append([e8, e2, e1])
-        face_list.append([e8, e9, e1])
-    elif (case == 51):
-        # Plane through middle of cube, parallel to x-z axis
-        face_list.append([e4, e8, e2])
-        face_list.append([e8, e2, e6])
-    elif (case == 52):
-        # Back lower plane, and front upper right corner
-        _append_tris(face_list, 48, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 4, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 53):
-        # Shelf (v1, v5, v6) and front upper right corner
-        _append_tris(face_list, 49, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 4, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 54):
-        # Rotated case 11 from paper (v2, v3, v5, v6)
-        face_list.append([e1, e9, e3])
-        face_list.append([e9, e3, e6])
-        face_list.append([e9, e8, e6])
-        face_list.append([e12, e3, e6])
-    elif (case == 55):
-        # Shelf: (v4, v8, v7) by inversion
-        face_list.append([e4, e8, e6])
-        face_list.append([e4, e6, e3])
-        face_list.append([e6, e3, e12])
-    elif (case == 56):
-        # Back lower plane + upper left front corner
-        _append_tris(face_list, 48, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 8, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 57):
-        # Rotated case 14 from paper (v4, v1, v5, v6)
-        face_list.append([e3, e11, e8])
-        face_list.append([e3, e8, e10])
-        face_list.append([e10, e6, e8])
-        face_list.append([e3, e1, e10])
-    elif (case == 58):
-        # Shelf: (v2, v6, v5) + upper left front corner
-        _append_tris(face_list, 50, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 8, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 59):
-        # Shelf: (v3, v7, v8) by inversion
-        face_list.append([e2, e6, e8])
-        face_list.append([e8, e2, e3])
-        face_list.append([e8, e3, e11])
-    elif (case == 60):
-        # AMBIGUOUS CASE: parallel planes (front upper, back lower)
-        _append_tris(face_list, 48, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 12, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 61):
-        # Upper back plane + lower right front corner by inversion
-        _append_tris(face_list, 63, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 2, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 62):
-        # Upper back plane + lower left front corner by inversion
-        _append_tris(face_list, 63, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 1, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 63):
-        # Upper back plane
-        face_list.append([e11, e12, e6])
-        face_list.append([e11, e8, e6])
-    elif (case == 64):
-        # Upper right back corner
-        face_list.append([e12, e7, e6])
-    elif (case == 65):
-        # upper right back, lower left front corners
-        _append_tris(face_list, 64, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 1, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 66):
-        # upper right back, lower right front corners
-        _append_tris(face_list, 64, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 2, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 67):
-        # lower front plane + upper right back corner
-        _append_tris(face_list, 64, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 3, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 68):
-        # upper right plane
-        face_list.append([e3, e2, e6])
-        face_list.append([e3, e7, e6])
-    elif (case == 69):
-        # Upper right plane, lower left front corner
-        _append_tris(face_list, 68, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 1, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 70):
-        # Shelf: (v2, v3, v7)
-        face_list.append([e1, e3, e7])
-        face_list.append([e1, e10, e7])
-        face_list.append([e7, e10, e6])
-    elif (case == 71):
-        # Rotated version of case 11 in paper (v1, v2, v3, v7)
-        face_list.append([e10, e7, e4])
-        face_list.append([e4, e3, e7])
-        face_list.append([e10, e4, e9])
-        face_list.append([e7, e10, e6])
-    elif (case == 72):
-        # upper left front, upper right back corners
-        _append_tris(face_list, 64, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 8, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 73):
-        # front left plane, upper right back corner
-        _append_tris(face_list, 64, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 9, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 74):
-        # Three isolated corners, exactly case 7 in paper
-        _append_tris(face_list, 64, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 8, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 2, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 75):
-        # Shelf: (v1, v2, v4) + upper right back corner
-        _append_tris(face_list, 64, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 11, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 76):
-        # Shelf: (v4, v3, v7)
-        face_list.append([e4, e2, e6])
-        face_list.append([e4, e11, e7])
-        face_list.append([e4, e7, e6])
-    elif (case == 77):
-        # Rotated case 14 in paper (v1, v4, v3, v7)
-        face_list.append([e11, e9, e1])
-        face_list.append([e11, e1, e6])
-        face_list.append([e1, e6, e2])
-        face_list.append([e11, e6, e7])
-    elif (case == 78):
-        # Full corner v3: (v2, v3, v4, v7)
-        face_list.append([e1, e4, e7])
-        face_list.append([e1, e7, e6])
-        face_list.append([e4, e11, e7])
-        face_list.append([e1, e10, e6])
-    elif (case == 79):
-        # Shelf: (v6, v5, v8) by inversion
-        face_list.append([e9, e11, e10])
-        face_list.append([e11, e7, e10])
-        face_list.append([e7, e10, e6])
-    elif (case == 80):
-        # lower left back, upper right back corners (v5, v7)
-        _append_tris(face_list, 64, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 16, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 81):
-        # lower left plane, upper right back corner
-        _append_tris(face_list, 64, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 17, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 82):
-        # isolated corners (v2, v5, v7)
-        _append_tris(face_list, 64, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 16, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 2, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 83):
-        # Shelf: (v1, v2, v5) + upper right back corner
-        _append_tris(face_list, 64, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 19, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 84):
-        # upper right plane, lower left back corner
-        _append_tris(face_list, 16, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 68, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 85):
-        # AMBIGUOUS CASE: upper right and lower left parallel planes
-        _append_tris(face_list, 17, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 68, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 86):
-        # Shelf: (v2, v3, v7) + lower left back corner
-        _append_tris(face_list, 70, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 16, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 87):
-        # Upper left plane + lower right back corner, by inversion
-        _append_tris(face_list, 119, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 32, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 88):
-        # Isolated corners v4, v5, v7
-        _append_tris(face_list, 64, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 16, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 8, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 89):
-        # Shelf: (v1, v4, v5) + isolated corner v7
-        _append_tris(face_list, 25, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 64, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 90):
-        # Four isolated corners v2, v4, v5, v7
-        _append_tris(face_list, 2, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 8, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 16, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 64, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 91):
-        # Three isolated corners, v3, v6, v8 by inversion
-        _append_tris(face_list, 4, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 32, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 127, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 92):
-        # Shelf (v4, v3, v7) + isolated corner v5
-        _append_tris(face_list, 76, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 16, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 93):
-        # Lower right plane + isolated corner v8 by inversion
-        _append_tris(face_list, 127, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 34, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 94):
-        # Isolated corners v1, v6, v8 by inversion
-        _append_tris(face_list, 1, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 32, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 127, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 95):
-        # Isolated corners v6, v8 by inversion
-        _append_tris(face_list, 32, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 127, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 96):
-        # back right plane
-        face_list.append([e7, e12, e5])
-        face_list.append([e5, e10, e12])
-    elif (case == 97):
-        # back right plane + isolated corner v1
-        _append_tris(face_list, 96, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 1, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 98):
-        # Shelf: (v2, v6, v7)
-        face_list.append([e1, e7, e5])
-        face_list.append([e7, e1, e12])
-        face_list.append([e1, e12, e2])
-    elif (case == 99):
-        # Rotated case 14 in paper: (v1, v2, v6, v7)
-        face_list.append([e9, e2, e7])
-        face_list.append([e9, e2, e4])
-        face_list.append([e2, e7, e12])
-        face_list.append([e7, e9, e5])
-    elif (case == 100):
-        # Shelf: (v3, v6, v7)
-        face_list.append([e3, e7, e5])
-        face_list.append([e3, e5, e2])
-        face_list.append([e2, e5, e10])
-    elif (case == 101):
-        # Shelf: (v3, v6, v7) + isolated corner v1
-        _append_tris(face_list, 100, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 1, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 102):
-        # Plane bisecting left-right halves of cube
-        face_list.append([e1, e3, e7])
-        face_list.append([e1, e7, e5])
-    elif (case == 103):
-        # Shelf: (v4, v5, v8) by inversion
-        face_list.append([e3, e7, e5])
-        face_list.append([e3, e5, e4])
-        face_list.append([e4, e5, e9])
-    elif (case == 104):
-        # Back right plane + isolated corner v4
-        _append_tris(face_list, 8, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 96, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 105):
-        # AMBIGUOUS CASE: back right and front left planes
-        _append_tris(face_list, 96, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 9, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 106):
-        # Shelf: (v2, v6, v7) + isolated corner v4
-        _append_tris(face_list, 98, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 8, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 107):
-        # Back left plane + isolated corner v3 by inversion
-        _append_tris(face_list, 4, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 111, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 108):
-        # Rotated case 11 from paper: (v4, v3, v7, v6)
-        face_list.append([e4, e10, e7])
-        face_list.append([e4, e10, e2])
-        face_list.append([e4, e11, e7])
-        face_list.append([e7, e10, e5])
-    elif (case == 109):
-        # Back left plane + isolated corner v2 by inversion
-        _append_tris(face_list, 111, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 2, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 110):
-        # Shelf: (v1, v5, v8) by inversion
-        face_list.append([e1, e5, e7])
-        face_list.append([e1, e7, e11])
-        face_list.append([e1, e11, e4])
-    elif (case == 111):
-        # Back left plane
-        face_list.append([e11, e9, e7])
-        face_list.append([e9, e7, e5])
-    elif (case == 112):
-        # Shelf: (v5, v6, v7)
-        face_list.append([e9, e10, e12])
-        face_list.append([e9, e12, e7])
-        face_list.append([e9, e7, e8])
-    elif (case == 113):
-        # Exactly case 11 from paper: (v1, v5, v6, v7)
-        face_list.append([e1, e8, e12])
-        face_list.append([e1, e8, e4])
-        face_list.append([e8, e7, e12])
-        face_list.append([e12, e1, e10])
-    elif (case == 114):
-        # Full corner v6: (v2, v6, v7, v5)
-        face_list.append([e1, e9, e7])
-        face_list.append([e1, e7, e12])
-        face_list.append([e1, e12, e2])
-        face_list.append([e9, e8, e7])
-    elif (case == 115):
-        # Shelf: (v3, v4, v8)
-        face_list.append([e2, e4, e8])
-        face_list.append([e2, e12, e7])
-        face_list.append([e2, e8, e7])
-    elif (case == 116):
-        # Rotated case 14 in paper: (v5, v6, v7, v3)
-        face_list.append([e9, e2, e7])
-        face_list.append([e9, e2, e10])
-        face_list.append([e9, e8, e7])
-        face_list.append([e2, e3, e7])
-    elif (case == 117):
-        # upper left plane + isolated corner v2 by inversion
-        _append_tris(face_list, 2, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 119, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 118):
-        # Shelf: (v1, v4, v8)
-        face_list.append([e1, e3, e7])
-        face_list.append([e7, e1, e8])
-        face_list.append([e1, e8, e9])
-    elif (case == 119):
-        # Upper left plane
-        face_list.append([e4, e3, e7])
-        face_list.append([e4, e8, e7])
-    elif (case == 120):
-        # Shelf: (v5, v6, v7) + isolated corner v4
-        _append_tris(face_list, 112, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 8, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 121):
-        # Front right plane + isolated corner v8
-        _append_tris(face_list, 6, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 127, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 122):
-        # Isolated corners v1, v3, v8
-        _append_tris(face_list, 1, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 4, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 127, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 123):
-        # Isolated corners v3, v8
-        _append_tris(face_list, 4, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 127, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 124):
-        # Front lower plane + isolated corner v8
-        _append_tris(face_list, 3, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 127, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 125):
-        # Isolated corners v2, v8
-        _append_tris(face_list, 2, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 127, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 126):
-        # Isolated corners v1, v8
-        _append_tris(face_list, 1, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 127, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 127):
-        # Isolated corner v8
-        face_list.append([e11, e7, e8])
-    elif (case == 150):
-        # AMBIGUOUS CASE: back right and front left planes
-        # In these cube_case > 127 cases, the vertices are identical BUT
-        # they are connected in the opposite fashion.
-        _append_tris(face_list, 6, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 111, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 170):
-        # AMBIGUOUS CASE: upper left and lower right planes
-        # In these cube_case > 127 cases, the vertices are identical BUT
-        # they are connected in the opposite fashion.
-        _append_tris(face_list, 119, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 34, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-    elif (case == 195):
-        # AMBIGUOUS CASE: back upper and front lower planes
-        # In these cube_case > 127 cases, the vertices are identical BUT
-        # they are connected in the opposite fashion.
-        _append_tris(face_list, 63, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-        _append_tris(face_list, 3, e1, e2, e3, e4, e5, e6, e7, e8, e9, e10,
-                     e11, e12)
-
-    return
-
-def isoSurface(volume, float level, spacing=(1,1,1)):
+# Triangles of every cube case as cube edge indices, three per triangle.
+# The cases are the ones of the scikit-image implementation which follows
+# the Lorensen paper. Cases above 127 use the triangles of their complement,
+# except for the ambiguous cases 150, 170 and 195.
+cdef signed char[3072] triangleTable = [
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    0, 3, 8, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    9, 1, 0, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    1, 3, 8, 1, 8, 9, -1, -1, -1, -1, -1, -1,
+    11, 2, 1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    0, 3, 8, 11, 2, 1, -1, -1, -1, -1, -1, -1,
+    11, 2, 0, 11, 0, 9, -1, -1, -1, -1, -1, -1,
+    2, 3, 11, 3, 8, 11, 11, 8, 9, -1, -1, -1,
+    2, 10, 3, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    2, 10, 8, 2, 8, 0, -1, -1, -1, -1, -1, -1,
+    9, 1, 0, 2, 10, 3, -1, -1, -1, -1, -1, -1,
+    2, 10, 1, 10, 9, 1, 10, 8, 9, -1, -1, -1,
+    10, 3, 11, 1, 3, 11, -1, -1, -1, -1, -1, -1,
+    10, 8, 11, 11, 8, 0, 11, 0, 1, -1, -1, -1,
+    10, 9, 11, 10, 3, 9, 3, 0, 9, -1, -1, -1,
+    10, 8, 11, 11, 8, 9, -1, -1, -1, -1, -1, -1,
+    7, 8, 4, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    3, 0, 7, 7, 0, 4, -1, -1, -1, -1, -1, -1,
+    7, 8, 4, 9, 1, 0, -1, -1, -1, -1, -1, -1,
+    7, 3, 1, 7, 1, 9, 7, 9, 4, -1, -1, -1,
+    7, 8, 4, 11, 2, 1, -1, -1, -1, -1, -1, -1,
+    3, 0, 7, 7, 0, 4, 11, 2, 1, -1, -1, -1,
+    7, 8, 4, 11, 2, 0, 11, 0, 9, -1, -1, -1,
+    2, 9, 7, 2, 9, 11, 7, 9, 4, 2, 3, 7,
+    7, 8, 4, 2, 10, 3, -1, -1, -1, -1, -1, -1,
+    0, 4, 2, 2, 7, 10, 2, 4, 7, -1, -1, -1,
+    9, 1, 0, 2, 10, 3, 7, 8, 4, -1, -1, -1,
+    10, 2, 1, 10, 1, 9, 9, 10, 7, 7, 4, 9,
+    7, 8, 4, 10, 3, 11, 1, 3, 11, -1, -1, -1,
+    10, 4, 1, 10, 11, 1, 10, 4, 7, 1, 0, 4,
+    10, 9, 11, 10, 3, 9, 3, 0, 9, 7, 8, 4,
+    10, 11, 9, 10, 7, 9, 7, 9, 4, -1, -1, -1,
+    5, 4, 9, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    0, 3, 8, 5, 4, 9, -1, -1, -1, -1, -1, -1,
+    0, 1, 4, 1, 5, 4, -1, -1, -1, -1, -1, -1,
+    3, 1, 5, 3, 8, 5, 5, 8, 4, -1, -1, -1,
+    5, 4, 9, 11, 2, 1, -1, -1, -1, -1, -1, -1,
+    5, 4, 9, 11, 2, 1, 0, 3, 8, -1, -1, -1,
+    2, 0, 4, 2, 4, 11, 11, 4, 5, -1, -1, -1,
+    2, 3, 4, 3, 8, 4, 2, 4, 5, 2, 11, 5,
+    5, 4, 9, 2, 10, 3, -1, -1, -1, -1, -1, -1,
+    5, 4, 9, 2, 10, 8, 2, 8, 0, -1, -1, -1,
+    2, 10, 3, 0, 1, 4, 1, 5, 4, -1, -1, -1,
+    10, 2, 8, 2, 8, 5, 2, 1, 5, 8, 4, 5,
+    10, 3, 11, 1, 3, 11, 5, 4, 9, -1, -1, -1,
+    10, 8, 11, 11, 8, 0, 11, 0, 1, 5, 4, 9,
+    3, 10, 11, 3, 11, 4, 11, 4, 5, 3, 4, 0,
+    10, 8, 11, 11, 8, 4, 11, 4, 5, -1, -1, -1,
+    8, 9, 5, 8, 5, 7, -1, -1, -1, -1, -1, -1,
+    3, 7, 5, 3, 5, 0, 5, 0, 9, -1, -1, -1,
+    7, 5, 1, 7, 1, 0, 7, 8, 0, -1, -1, -1,
+    3, 7, 1, 7, 1, 5, -1, -1, -1, -1, -1, -1,
+    8, 9, 5, 8, 5, 7, 11, 2, 1, -1, -1, -1,
+    3, 7, 5, 3, 5, 0, 5, 0, 9, 11, 2, 1,
+    0, 8, 2, 8, 2, 5, 8, 7, 5, 11, 2, 5,
+    3, 7, 5, 3, 5, 2, 5, 2, 11, -1, -1, -1,
+    8, 9, 5, 8, 5, 7, 2, 10, 3, -1, -1, -1,
+    2, 10, 7, 2, 7, 9, 9, 5, 7, 2, 0, 9,
+    7, 5, 1, 7, 1, 0, 7, 8, 0, 2, 10, 3,
+    1, 5, 7, 7, 1, 2, 7, 2, 10, -1, -1, -1,
+    8, 9, 5, 8, 5, 7, 10, 3, 11, 1, 3, 11,
+    10, 11, 5, 10, 7, 5, 9, 1, 0, -1, -1, -1,
+    10, 11, 5, 10, 7, 5, 0, 3, 8, -1, -1, -1,
+    10, 11, 5, 10, 7, 5, -1, -1, -1, -1, -1, -1,
+    11, 6, 5, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    11, 6, 5, 0, 3, 8, -1, -1, -1, -1, -1, -1,
+    11, 6, 5, 9, 1, 0, -1, -1, -1, -1, -1, -1,
+    11, 6, 5, 1, 3, 8, 1, 8, 9, -1, -1, -1,
+    2, 1, 5, 2, 6, 5, -1, -1, -1, -1, -1, -1,
+    2, 1, 5, 2, 6, 5, 0, 3, 8, -1, -1, -1,
+    0, 2, 6, 0, 9, 6, 6, 9, 5, -1, -1, -1,
+    9, 6, 3, 3, 2, 6, 9, 3, 8, 6, 9, 5,
+    11, 6, 5, 2, 10, 3, -1, -1, -1, -1, -1, -1,
+    11, 6, 5, 2, 10, 8, 2, 8, 0, -1, -1, -1,
+    11, 6, 5, 2, 10, 3, 9, 1, 0, -1, -1, -1,
+    11, 6, 5, 2, 10, 1, 10, 9, 1, 10, 8, 9,
+    3, 1, 5, 3, 10, 6, 3, 6, 5, -1, -1, -1,
+    10, 8, 0, 10, 0, 5, 0, 5, 1, 10, 5, 6,
+    0, 3, 6, 0, 6, 5, 3, 10, 6, 0, 9, 5,
+    8, 10, 9, 10, 6, 9, 6, 9, 5, -1, -1, -1,
+    11, 6, 5, 7, 8, 4, -1, -1, -1, -1, -1, -1,
+    11, 6, 5, 3, 0, 7, 7, 0, 4, -1, -1, -1,
+    11, 6, 5, 7, 8, 4, 9, 1, 0, -1, -1, -1,
+    11, 6, 5, 7, 3, 1, 7, 1, 9, 7, 9, 4,
+    7, 8, 4, 2, 1, 5, 2, 6, 5, -1, -1, -1,
+    3, 0, 7, 7, 0, 4, 2, 1, 5, 2, 6, 5,
+    0, 2, 6, 0, 9, 6, 6, 9, 5, 7, 8, 4,
+    3, 2, 6, 3, 7, 6, 5, 4, 9, -1, -1, -1,
+    11, 6, 5, 7, 8, 4, 2, 10, 3, -1, -1, -1,
+    0, 4, 2, 2, 7, 10, 2, 4, 7, 11, 6, 5,
+    9, 1, 0, 2, 10, 3, 7, 8, 4, 11, 6, 5,
+    11, 2, 1, 5, 4, 9, 10, 6, 7, -1, -1, -1,
+    3, 1, 5, 3, 10, 6, 3, 6, 5, 7, 8, 4,
+    10, 6, 7, 0, 1, 4, 1, 5, 4, -1, -1, -1,
+    0, 3, 8, 5, 4, 9, 10, 6, 7, -1, -1, -1,
+    5, 4, 9, 10, 6, 7, -1, -1, -1, -1, -1, -1,
+    6, 11, 4, 4, 9, 11, -1, -1, -1, -1, -1, -1,
+    6, 11, 4, 4, 9, 11, 0, 3, 8, -1, -1, -1,
+    0, 6, 4, 6, 0, 11, 0, 11, 1, -1, -1, -1,
+    8, 1, 6, 8, 1, 3, 1, 6, 11, 6, 8, 4,
+    2, 6, 4, 2, 4, 1, 1, 4, 9, -1, -1, -1,
+    2, 6, 4, 2, 4, 1, 1, 4, 9, 0, 3, 8,
+    0, 2, 6, 0, 6, 4, -1, -1, -1, -1, -1, -1,
+    2, 6, 4, 2, 4, 3, 3, 4, 8, -1, -1, -1,
+    2, 10, 3, 6, 11, 4, 4, 9, 11, -1, -1, -1,
+    6, 11, 4, 4, 9, 11, 2, 10, 8, 2, 8, 0,
+    0, 6, 4, 6, 0, 11, 0, 11, 1, 2, 10, 3,
+    11, 2, 1, 10, 8, 6, 8, 6, 4, -1, -1, -1,
+    3, 9, 6, 3, 9, 1, 3, 10, 6, 6, 9, 4,
+    10, 8, 6, 8, 6, 4, 9, 1, 0, -1, -1, -1,
+    0, 4, 6, 0, 6, 10, 0, 10, 3, -1, -1, -1,
+    10, 8, 6, 8, 6, 4, -1, -1, -1, -1, -1, -1,
+    8, 9, 11, 8, 11, 6, 8, 6, 7, -1, -1, -1,
+    0, 7, 11, 0, 7, 3, 7, 6, 11, 11, 0, 9,
+    0, 8, 6, 0, 6, 11, 0, 11, 1, 8, 7, 6,
+    1, 3, 7, 1, 11, 6, 1, 7, 6, -1, -1, -1,
+    8, 1, 6, 8, 1, 9, 8, 7, 6, 1, 2, 6,
+    9, 1, 0, 3, 2, 6, 3, 7, 6, -1, -1, -1,
+    0, 2, 6, 6, 0, 7, 0, 7, 8, -1, -1, -1,
+    3, 2, 6, 3, 7, 6, -1, -1, -1, -1, -1, -1,
+    8, 9, 11, 8, 11, 6, 8, 6, 7, 2, 10, 3,
+    11, 2, 0, 11, 0, 9, 10, 6, 7, -1, -1, -1,
+    0, 3, 8, 11, 2, 1, 10, 6, 7, -1, -1, -1,
+    11, 2, 1, 10, 6, 7, -1, -1, -1, -1, -1, -1,
+    1, 3, 8, 1, 8, 9, 10, 6, 7, -1, -1, -1,
+    9, 1, 0, 10, 6, 7, -1, -1, -1, -1, -1, -1,
+    0, 3, 8, 10, 6, 7, -1, -1, -1, -1, -1, -1,
+    10, 6, 7, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    10, 6, 7, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    0, 3, 8, 10, 6, 7, -1, -1, -1, -1, -1, -1,
+    9, 1, 0, 10, 6, 7, -1, -1, -1, -1, -1, -1,
+    1, 3, 8, 1, 8, 9, 10, 6, 7, -1, -1, -1,
+    11, 2, 1, 10, 6, 7, -1, -1, -1, -1, -1, -1,
+    0, 3, 8, 11, 2, 1, 10, 6, 7, -1, -1, -1,
+    11, 2, 0, 11, 0, 9, 10, 6, 7, -1, -1, -1,
+    8, 9, 11, 8, 11, 6, 8, 6, 7, 2, 10, 3,
+    3, 2, 6, 3, 7, 6, -1, -1, -1, -1, -1, -1,
+    0, 2, 6, 6, 0, 7, 0, 7, 8, -1, -1, -1,
+    9, 1, 0, 3, 2, 6, 3, 7, 6, -1, -1, -1,
+    8, 1, 6, 8, 1, 9, 8, 7, 6, 1, 2, 6,
+    1, 3, 7, 1, 11, 6, 1, 7, 6, -1, -1, -1,
+    0, 8, 6, 0, 6, 11, 0, 11, 1, 8, 7, 6,
+    0, 7, 11, 0, 7, 3, 7, 6, 11, 11, 0, 9,
+    8, 9, 11, 8, 11, 6, 8, 6, 7, -1, -1, -1,
+    10, 8, 6, 8, 6, 4, -1, -1, -1, -1, -1, -1,
+    0, 4, 6, 0, 6, 10, 0, 10, 3, -1, -1, -1,
+    10, 8, 6, 8, 6, 4, 9, 1, 0, -1, -1, -1,
+    3, 9, 6, 3, 9, 1, 3, 10, 6, 6, 9, 4,
+    11, 2, 1, 10, 8, 6, 8, 6, 4, -1, -1, -1,
+    0, 6, 4, 6, 0, 11, 0, 11, 1, 2, 10, 3,
+    11, 2, 0, 11, 0, 9, 10, 8, 6, 8, 6, 4,
+    2, 10, 3, 6, 11, 4, 4, 9, 11, -1, -1, -1,
+    2, 6, 4, 2, 4, 3, 3, 4, 8, -1, -1, -1,
+    0, 2, 6, 0, 6, 4, -1, -1, -1, -1, -1, -1,
+    2, 6, 4, 2, 4, 1, 1, 4, 9, 0, 3, 8,
+    2, 6, 4, 2, 4, 1, 1, 4, 9, -1, -1, -1,
+    8, 1, 6, 8, 1, 3, 1, 6, 11, 6, 8, 4,
+    0, 6, 4, 6, 0, 11, 0, 11, 1, -1, -1, -1,
+    6, 11, 4, 4, 9, 11, 0, 3, 8, -1, -1, -1,
+    6, 11, 4, 4, 9, 11, -1, -1, -1, -1, -1, -1,
+    5, 4, 9, 10, 6, 7, -1, -1, -1, -1, -1, -1,
+    0, 3, 8, 5, 4, 9, 10, 6, 7, -1, -1, -1,
+    10, 6, 7, 0, 1, 4, 1, 5, 4, -1, -1, -1,
+    3, 1, 5, 3, 10, 6, 3, 6, 5, 7, 8, 4,
+    11, 2, 1, 5, 4, 9, 10, 6, 7, -1, -1, -1,
+    9, 1, 0, 2, 10, 3, 7, 8, 4, 11, 6, 5,
+    0, 4, 2, 2, 7, 10, 2, 4, 7, 11, 6, 5,
+    11, 6, 5, 7, 8, 4, 2, 10, 3, -1, -1, -1,
+    3, 2, 6, 3, 7, 6, 5, 4, 9, -1, -1, -1,
+    0, 2, 6, 0, 9, 6, 6, 9, 5, 7, 8, 4,
+    3, 2, 6, 3, 7, 6, 0, 1, 4, 1, 5, 4,
+    7, 8, 4, 2, 1, 5, 2, 6, 5, -1, -1, -1,
+    11, 6, 5, 7, 3, 1, 7, 1, 9, 7, 9, 4,
+    11, 6, 5, 7, 8, 4, 9, 1, 0, -1, -1, -1,
+    11, 6, 5, 3, 0, 7, 7, 0, 4, -1, -1, -1,
+    11, 6, 5, 7, 8, 4, -1, -1, -1, -1, -1, -1,
+    8, 10, 9, 10, 6, 9, 6, 9, 5, -1, -1, -1,
+    0, 3, 6, 0, 6, 5, 3, 10, 6, 0, 9, 5,
+    10, 8, 0, 10, 0, 5, 0, 5, 1, 10, 5, 6,
+    3, 1, 5, 3, 10, 6, 3, 6, 5, -1, -1, -1,
+    11, 6, 5, 2, 10, 1, 10, 9, 1, 10, 8, 9,
+    11, 6, 5, 2, 10, 3, 9, 1, 0, -1, -1, -1,
+    11, 6, 5, 2, 10, 8, 2, 8, 0, -1, -1, -1,
+    11, 6, 5, 2, 10, 3, -1, -1, -1, -1, -1, -1,
+    9, 6, 3, 3, 2, 6, 9, 3, 8, 6, 9, 5,
+    0, 2, 6, 0, 9, 6, 6, 9, 5, -1, -1, -1,
+    2, 1, 5, 2, 6, 5, 0, 3, 8, -1, -1, -1,
+    2, 1, 5, 2, 6, 5, -1, -1, -1, -1, -1, -1,
+    11, 6, 5, 1, 3, 8, 1, 8, 9, -1, -1, -1,
+    11, 6, 5, 9, 1, 0, -1, -1, -1, -1, -1, -1,
+    11, 6, 5, 0, 3, 8, -1, -1, -1, -1, -1, -1,
+    11, 6, 5, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    10, 11, 5, 10, 7, 5, -1, -1, -1, -1, -1, -1,
+    10, 11, 5, 10, 7, 5, 0, 3, 8, -1, -1, -1,
+    10, 11, 5, 10, 7, 5, 9, 1, 0, -1, -1, -1,
+    10, 11, 5, 10, 7, 5, 1, 3, 8, 1, 8, 9,
+    1, 5, 7, 7, 1, 2, 7, 2, 10, -1, -1, -1,
+    7, 5, 1, 7, 1, 0, 7, 8, 0, 2, 10, 3,
+    2, 10, 7, 2, 7, 9, 9, 5, 7, 2, 0, 9,
+    8, 9, 5, 8, 5, 7, 2, 10, 3, -1, -1, -1,
+    3, 7, 5, 3, 5, 2, 5, 2, 11, -1, -1, -1,
+    0, 8, 2, 8, 2, 5, 8, 7, 5, 11, 2, 5,
+    3, 7, 5, 3, 5, 0, 5, 0, 9, 11, 2, 1,
+    8, 9, 5, 8, 5, 7, 11, 2, 1, -1, -1, -1,
+    3, 7, 1, 7, 1, 5, -1, -1, -1, -1, -1, -1,
+    7, 5, 1, 7, 1, 0, 7, 8, 0, -1, -1, -1,
+    3, 7, 5, 3, 5, 0, 5, 0, 9, -1, -1, -1,
+    8, 9, 5, 8, 5, 7, -1, -1, -1, -1, -1, -1,
+    10, 8, 11, 11, 8, 4, 11, 4, 5, -1, -1, -1,
+    3, 10, 11, 3, 11, 4, 11, 4, 5, 3, 4, 0,
+    10, 8, 11, 11, 8, 0, 11, 0, 1, 5, 4, 9,
+    10, 3, 11, 1, 3, 11, 5, 4, 9, -1, -1, -1,
+    10, 2, 8, 2, 8, 5, 2, 1, 5, 8, 4, 5,
+    2, 10, 3, 0, 1, 4, 1, 5, 4, -1, -1, -1,
+    5, 4, 9, 2, 10, 8, 2, 8, 0, -1, -1, -1,
+    5, 4, 9, 2, 10, 3, -1, -1, -1, -1, -1, -1,
+    2, 3, 4, 3, 8, 4, 2, 4, 5, 2, 11, 5,
+    2, 0, 4, 2, 4, 11, 11, 4, 5, -1, -1, -1,
+    5, 4, 9, 11, 2, 1, 0, 3, 8, -1, -1, -1,
+    5, 4, 9, 11, 2, 1, -1, -1, -1, -1, -1, -1,
+    3, 1, 5, 3, 8, 5, 5, 8, 4, -1, -1, -1,
+    0, 1, 4, 1, 5, 4, -1, -1, -1, -1, -1, -1,
+    0, 3, 8, 5, 4, 9, -1, -1, -1, -1, -1, -1,
+    5, 4, 9, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    10, 11, 9, 10, 7, 9, 7, 9, 4, -1, -1, -1,
+    10, 9, 11, 10, 3, 9, 3, 0, 9, 7, 8, 4,
+    10, 4, 1, 10, 11, 1, 10, 4, 7, 1, 0, 4,
+    7, 8, 4, 10, 3, 11, 1, 3, 11, -1, -1, -1,
+    10, 2, 1, 10, 1, 9, 9, 10, 7, 7, 4, 9,
+    9, 1, 0, 2, 10, 3, 7, 8, 4, -1, -1, -1,
+    0, 4, 2, 2, 7, 10, 2, 4, 7, -1, -1, -1,
+    7, 8, 4, 2, 10, 3, -1, -1, -1, -1, -1, -1,
+    2, 9, 7, 2, 9, 11, 7, 9, 4, 2, 3, 7,
+    7, 8, 4, 11, 2, 0, 11, 0, 9, -1, -1, -1,
+    3, 0, 7, 7, 0, 4, 11, 2, 1, -1, -1, -1,
+    7, 8, 4, 11, 2, 1, -1, -1, -1, -1, -1, -1,
+    7, 3, 1, 7, 1, 9, 7, 9, 4, -1, -1, -1,
+    7, 8, 4, 9, 1, 0, -1, -1, -1, -1, -1, -1,
+    3, 0, 7, 7, 0, 4, -1, -1, -1, -1, -1, -1,
+    7, 8, 4, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    10, 8, 11, 11, 8, 9, -1, -1, -1, -1, -1, -1,
+    10, 9, 11, 10, 3, 9, 3, 0, 9, -1, -1, -1,
+    10, 8, 11, 11, 8, 0, 11, 0, 1, -1, -1, -1,
+    10, 3, 11, 1, 3, 11, -1, -1, -1, -1, -1, -1,
+    2, 10, 1, 10, 9, 1, 10, 8, 9, -1, -1, -1,
+    9, 1, 0, 2, 10, 3, -1, -1, -1, -1, -1, -1,
+    2, 10, 8, 2, 8, 0, -1, -1, -1, -1, -1, -1,
+    2, 10, 3, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    2, 3, 11, 3, 8, 11, 11, 8, 9, -1, -1, -1,
+    11, 2, 0, 11, 0, 9, -1, -1, -1, -1, -1, -1,
+    0, 3, 8, 11, 2, 1, -1, -1, -1, -1, -1, -1,
+    11, 2, 1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    1, 3, 8, 1, 8, 9, -1, -1, -1, -1, -1, -1,
+    9, 1, 0, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    0, 3, 8, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1
+]
+
+cdef unsigned char[256] triangleAmounts = [
+    0, 1, 1, 2, 1, 2, 2, 3, 1, 2, 2, 3, 2, 3, 3, 2,
+    1, 2, 2, 3, 2, 3, 3, 4, 2, 3, 3, 4, 3, 4, 4, 3,
+    1, 2, 2, 3, 2, 3, 3, 4, 2, 3, 3, 4, 3, 4, 4, 3,
+    2, 3, 3, 2, 3, 4, 4, 3, 3, 4, 4, 3, 4, 3, 3, 2,
+    1, 2, 2, 3, 2, 3, 3, 4, 2, 3, 3, 4, 3, 4, 4, 3,
+    2, 3, 3, 4, 3, 4, 4, 3, 3, 4, 4, 3, 4, 3, 3, 2,
+    2, 3, 3, 4, 3, 4, 2, 3, 3, 4, 4, 3, 4, 3, 3, 2,
+    3, 4, 4, 3, 4, 3, 3, 2, 4, 3, 3, 2, 3, 2, 2, 1,
+    1, 2, 2, 3, 2, 3, 3, 4, 2, 3, 3, 4, 3, 4, 4, 3,
+    2, 3, 3, 4, 3, 4, 4, 3, 3, 2, 4, 3, 4, 3, 3, 2,
+    2, 3, 3, 4, 3, 4, 4, 3, 3, 4, 4, 3, 4, 3, 3, 2,
+    3, 4, 4, 3, 4, 3, 3, 2, 4, 3, 3, 2, 3, 2, 2, 1,
+    2, 3, 3, 4, 3, 4, 4, 3, 3, 4, 4, 3, 2, 3, 3, 2,
+    3, 4, 4, 3, 4, 3, 3, 2, 4, 3, 3, 2, 3, 2, 2, 1,
+    3, 4, 4, 3, 4, 3, 3, 2, 4, 3, 3, 2, 3, 2, 2, 1,
+    2, 3, 3, 2, 3, 2, 2, 1, 3, 2, 2, 1, 2, 1, 1, 0
+]
+
+# Cube corners in the order of the case bits.
+#
+#           v8 ------ v7
+#          / |       / |        y
+#         /  |      /  |        ^  z
+#       v4 ------ v3   |        | /
+#        |  v5 ----|- v6        |/
+#        |  /      |  /          ----> x
+#        | /       | /
+#       v1 ------ v2
+cdef int[8] cornerOffsetX = [0, 1, 1, 0, 0, 1, 1, 0]
+cdef int[8] cornerOffsetY = [0, 0, 1, 1, 0, 0, 1, 1]
+cdef int[8] cornerOffsetZ = [0, 0, 0, 0, 1, 1, 1, 1]
+
+# Start corner and axis of the cube edges e1 to e12.
+cdef int[12] edgeOffsetX = [0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 1]
+cdef int[12] edgeOffsetY = [0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 1]
+cdef int[12] edgeOffsetZ = [0, 0, 0, 0, 1, 1, 1, 1, 0, 0, 0, 0]
+cdef int[12] edgeAxis = [0, 1, 0, 1, 0, 1, 0, 1, 2, 2, 2, 2]
+
+# Every grid point owns up to four vertices: one on the point itself, used when
+# the value is exactly the level, and one on each edge going in positive x, y
+# and z direction. Neighbouring cubes share vertices by looking up these slots.
+DEF SLOT_AMOUNT = 4
+DEF CORNER_SLOT = 0
+
+# Volumes with less cubes are not split into slabs.
+DEF MIN_PARALLEL_CUBES = 32768
+
+cdef struct VolumeInfo:
+    Py_ssize_t sizeX, sizeY, sizeZ
+    double level
+    double origin[3]
+    double spacing[3]
+    double indexOffset[3]
+
+def isoSurface(volume, double level, origin = (0, 0, 0), spacing = (1, 1, 1), indexOffset = (0, 0, 0)):
+    '''
+    Returns a Vector3DList and a PolygonIndicesList with the triangles
+    of the surface where the values of the volume cross the level.
+    The vertex locations are origin + (indexOffset + grid index) * spacing.
+    Volumes that are blocks of a larger grid produce the exact same
+    locations on their shared faces when the index offset is used.
+    '''
+    volume = np.ascontiguousarray(volume)
+    if volume.dtype != np.float32 and volume.dtype != np.float64:
+        volume = volume.astype(np.float64)
     if volume.ndim != 3:
         raise ValueError("Input volume must have 3 dimensions.")
-    if level is None:
-        level = 0.5 * (volume.min() + volume.max())
-    else:
-        level = float(level)
-        if level < volume.min() or level > volume.max():
-            raise ValueError("Surface level must be within volume data range.")
-    if len(spacing) != 3:
-        raise ValueError("`spacing` must consist of three floats.")
-
-    volume = np.array(volume, dtype=np.float64, order="C")
-    cdef list raw_faces = iterate_and_store_3d(volume, level)
-    verts, faces = unpack_unique_verts(raw_faces)
-    vertices = np.asarray(verts) * np.r_[spacing]
-    return vertices, faces
+    if min(volume.shape) < 2:
+        raise ValueError("Input volume must be at least 2x2x2.")
+    if level < volume.min() or level > volume.max():
+        raise ValueError("Surface level must be within volume data range.")
+    if len(origin) != 3 or len(spacing) != 3 or len(indexOffset) != 3:
+        raise ValueError("`origin`, `spacing` and `indexOffset` must consist of three numbers.")
+
+    cdef MarchingCubes marchingCubes = MarchingCubes(volume, level, origin, spacing, indexOffset)
+    return marchingCubes.execute()
+
+
+cdef class MarchingCubes:
+    '''
+    The surface is created in two passes over slabs of cube layers along
+    the first axis. The first pass counts the vertices of every grid plane
+    and the triangles of every cube layer, so that the second pass can
+    write them directly into the preallocated lists.
+    Both passes release the GIL and the slabs are processed in parallel.
+    '''
+    cdef:
+        VolumeInfo info
+        object volume
+        const void *values
+        bint isFloat
+
+        LongList vertexAmounts
+        LongList vertexStarts
+        LongList layerTriangleAmounts
+        LongList layerTriangleStarts
+
+        Vector3DList vertices
+        UIntegerList indices
+
+    def __cinit__(self, volume, double level, origin, spacing, indexOffset):
+        cdef const float[:, :, ::1] floatValues
+        cdef const double[:, :, ::1] doubleValues
+        if volume.dtype == np.float32:
+            floatValues = volume
+            self.values = &floatValues[0, 0, 0]
+            self.isFloat = True
+        else:
+            doubleValues = volume
+            self.values = &doubleValues[0, 0, 0]
+            self.isFloat = False
+        self.volume = volume
+
+        self.info.sizeX, self.info.sizeY, self.info.sizeZ = volume.shape
+        self.info.level = level
+        for i in range(3):
+            self.info.origin[i] = origin[i]
+            self.info.spacing[i] = spacing[i]
+            self.info.indexOffset[i] = indexOffset[i]
+
+    def execute(self):
+        cdef Py_ssize_t layerAmount = self.info.sizeX - 1
+        slabs = getSlabs(layerAmount, (self.info.sizeY - 1) * (self.info.sizeZ - 1))
+
+        self.vertexAmounts = LongList(length = self.info.sizeX)
+        self.layerTriangleAmounts = LongList(length = layerAmount)
+        runParts(self.countSlab, slabs)
+
+        self.vertexStarts = getStarts(self.vertexAmounts)
+        self.layerTriangleStarts = getStarts(self.layerTriangleAmounts)
+        self.vertices = Vector3DList(length = self.vertexAmounts.getSumOfElements())
+        self.indices = UIntegerList(length = self.layerTriangleAmounts.getSumOfElements() * 3)
+        runParts(self.triangulateSlab, slabs)
+
+        return self.vertices, self.getPolygons()
+
+    def countSlab(self, Py_ssize_t start, Py_ssize_t end):
+        cdef VolumeInfo *info = &self.info
+        cdef const void *values = self.values
+        cdef long *vertexAmounts = self.vertexAmounts.data
+        cdef long *triangleAmounts = self.layerTriangleAmounts.data
+
+        with nogil:
+            if self.isFloat:
+                countSlab_LowLevel(<float*>values, info, start, end, vertexAmounts, triangleAmounts)
+            else:
+                countSlab_LowLevel(<double*>values, info, start, end, vertexAmounts, triangleAmounts)
+
+    def triangulateSlab(self, Py_ssize_t start, Py_ssize_t end):
+        cdef VolumeInfo *info = &self.info
+        cdef const void *values = self.values
+        cdef Py_ssize_t planeSize = self.info.sizeY * self.info.sizeZ * SLOT_AMOUNT
+        cdef unsigned int *slotIndicesA = <unsigned int*>malloc(planeSize * sizeof(unsigned int))
+        cdef unsigned int *slotIndicesB = <unsigned int*>malloc(planeSize * sizeof(unsigned int))
+        cdef SlabOutput output
+        output.vertexStarts = self.vertexStarts.data
+        output.triangleStarts = self.layerTriangleStarts.data
+        output.triangleAmounts = self.layerTriangleAmounts.data
+        output.vertices = self.vertices.data
+        output.indices = self.indices.data
+
+        try:
+            if slotIndicesA == NULL or slotIndicesB == NULL:
+                raise MemoryError()
+            with nogil:
+                if self.isFloat:
+                    triangulateSlab_LowLevel(<float*>values, info, start, end,
+                                             &output, slotIndicesA, slotIndicesB)
+                else:
+                    triangulateSlab_LowLevel(<double*>values, info, start, end,
+                                             &output, slotIndicesA, slotIndicesB)
+        finally:
+            free(slotIndicesA)
+            free(slotIndicesB)
+
+    cdef getPolygons(self):
+        cdef Py_ssize_t triangleAmount = self.removeDegeneratedTriangleGaps()
+        if triangleAmount * 3 < self.indices.length:
+            self.indices.length = triangleAmount * 3
+            self.indices.shrinkToLength()
+            self.removeUnusedVertices()
+
+        cdef UIntegerList polyStarts = UIntegerList(length = triangleAmount)
+        cdef UIntegerList polyLengths = UIntegerList(length = triangleAmount)
+        cdef Py_ssize_t i
+        for i in range(triangleAmount):
+            polyStarts.data[i] = i * 3
+            polyLengths.data[i] = 3
+        return PolygonIndicesList.fromLists(self.indices, polyStarts, polyLengths)
+
+    cdef Py_ssize_t removeDegeneratedTriangleGaps(self):
+        cdef Py_ssize_t x, triangleAmount = 0
+        for x in range(self.info.sizeX - 1):
+            memmove(self.indices.data + triangleAmount * 3,
+                    self.indices.data + self.layerTriangleStarts.data[x] * 3,
+                    self.layerTriangleAmounts.data[x] * 3 * sizeof(unsigned int))
+            triangleAmount += self.layerTriangleAmounts.data[x]
+        return triangleAmount
+
+    cdef removeUnusedVertices(self):
+        # vertices on grid points can be used by degenerated triangles only
+        cdef Py_ssize_t i, vertexAmount = 0
+        cdef LongList newIndices = LongList(length = self.vertices.length)
+        newIndices.fill(-1)
+
+        for i in range(self.indices.length):
+            newIndices.data[self.indices.data[i]] = 0
+        for i in range(self.vertices.length):
+            if newIndices.data[i] == 0:
+                newIndices.data[i] = vertexAmount
+                self.vertices.data[vertexAmount] = self.vertices.data[i]
+                vertexAmount += 1
+        for i in range(self.indices.length):
+            self.indices.data[i] = newIndices.data[self.indices.data[i]]
+
+        self.vertices.length = vertexAmount
+        self.vertices.shrinkToLength()
+
+cdef LongList getStarts(LongList amounts):
+    cdef LongList starts = LongList(length = amounts.length)
+    cdef long i, start = 0
+    for i in range(amounts.length):
+        starts.data[i] = start
+        start += amounts.data[i]
+    return starts
+
+
+# Slabs
+##########################################
+
+def getSlabs(Py_ssize_t layerAmount, Py_ssize_t layerSize):
+    cdef Py_ssize_t threadAmount = getThreadAmount()
+    if threadAmount == 1 or layerAmount * layerSize < MIN_PARALLEL_CUBES:
+        return [(0, layerAmount)]
+    # more slabs than threads, because the surface is not distributed evenly
+    return splitRange(layerAmount, threadAmount * 4)
+
+cdef struct SlabOutput:
+    long *vertexStarts
+    long *triangleStarts
+    long *triangleAmounts
+    Vector3 *vertices
+    unsigned int *indices
+
+cdef void countSlab_LowLevel(floating *values, VolumeInfo *info,
+                             Py_ssize_t start, Py_ssize_t end,
+                             long *vertexAmounts, long *triangleAmounts) nogil:
+    cdef Py_ssize_t x
+    for x in range(start, end):
+        vertexAmounts[x] = processPlane(values, info, x, 0, NULL, NULL)
+        triangleAmounts[x] = countLayerTriangles(values, info, x)
+    if end == info.sizeX - 1:
+        vertexAmounts[end] = processPlane(values, info, end, 0, NULL, NULL)
+
+cdef void triangulateSlab_LowLevel(floating *values, VolumeInfo *info,
+                                   Py_ssize_t start, Py_ssize_t end, SlabOutput *output,
+                                   unsigned int *slotIndicesA, unsigned int *slotIndicesB) nogil:
+    '''
+    Every slab writes the vertices of its first plane and the planes in between.
+    The vertices of the last plane are written by the next slab.
+    '''
+    cdef Py_ssize_t x
+    cdef bint ownsNextPlane
+    cdef unsigned int *temporary
+
+    processPlane(values, info, start, output.vertexStarts[start], slotIndicesA, output.vertices)
+    for x in range(start, end):
+        ownsNextPlane = x + 1 < end or x + 1 == info.sizeX - 1
+        processPlane(values, info, x + 1, output.vertexStarts[x + 1], slotIndicesB,
+                     output.vertices if ownsNextPlane else NULL)
+        output.triangleAmounts[x] = triangulateLayer(values, info, x, slotIndicesA, slotIndicesB,
+                                                     output.indices + output.triangleStarts[x] * 3)
+        temporary = slotIndicesA
+        slotIndicesA = slotIndicesB
+        slotIndicesB = temporary
+
+
+# Vertices
+##########################################
+
+cdef Py_ssize_t processPlane(floating *values, VolumeInfo *info, Py_ssize_t x,
+                             Py_ssize_t startIndex, unsigned int *slotIndices,
+                             Vector3 *vertices) nogil:
+    '''
+    Returns the amount of vertices owned by the grid points of the plane.
+    Their indices are written into the slots and their locations into
+    the vertices, unless these pointers are NULL.
+    '''
+    cdef Py_ssize_t y, z, slot
+    cdef Py_ssize_t index = startIndex
+    cdef double level = info.level
+    cdef double value, nextValue
+
+    for y in range(info.sizeY):
+        for z in range(info.sizeZ):
+            slot = (y * info.sizeZ + z) * SLOT_AMOUNT
+            value = getValue(values, info, x, y, z)
+
+            if cornerHasVertex(values, info, x, y, z):
+                setVertex(info, slotIndices, slot + CORNER_SLOT, vertices, index, x, y, z)
+                index += 1
+
+            if x < info.sizeX - 1:
+                nextValue = getValue(values, info, x + 1, y, z)
+                if edgeHasVertex(value, nextValue, level):
+                    setVertex(info, slotIndices, slot + 1, vertices, index,
+                              x + getFraction(value, nextValue, level), y, z)
+                    index += 1
+
+            if y < info.sizeY - 1:
+                nextValue = getValue(values, info, x, y + 1, z)
+                if edgeHasVertex(value, nextValue, level):
+                    setVertex(info, slotIndices, slot + 2, vertices, index,
+                              x, y + getFraction(value, nextValue, level), z)
+                    index += 1
+
+            if z < info.sizeZ - 1:
+                nextValue = getValue(values, info, x, y, z + 1)
+                if edgeHasVertex(value, nextValue, level):
+                    setVertex(info, slotIndices, slot + 3, vertices, index,
+                              x, y, z + getFraction(value, nextValue, level))
+                    index += 1
+
+    return index - startIndex
+
+cdef inline void setVertex(VolumeInfo *info, unsigned int *slotIndices, Py_ssize_t slot,
+                           Vector3 *vertices, Py_ssize_t index,
+                           double x, double y, double z) nogil:
+    if slotIndices != NULL:
+        slotIndices[slot] = <unsigned int>index
+    if vertices != NULL:
+        vertices[index].x = <float>(info.origin[0] + (info.indexOffset[0] + x) * info.spacing[0])
+        vertices[index].y = <float>(info.origin[1] + (info.indexOffset[1] + y) * info.spacing[1])
+        vertices[index].z = <float>(info.origin[2] + (info.indexOffset[2] + z) * info.spacing[2])
+
+cdef inline bint edgeHasVertex(double a, double b, double level) nogil:
+    # edges that end exactly on the level use the vertex of that grid point
+    return (a > level) != (b > level) and a != level and b != level
+
+cdef bint cornerHasVertex(floating *values, VolumeInfo *info,
+                          Py_ssize_t x, Py_ssize_t y, Py_ssize_t z) nogil:
+    cdef double level = info.level
+    if getValue(values, info, x, y, z) != level:
+        return False
+    if x > 0 and getValue(values, info, x - 1, y, z) > level: return True
+    if y > 0 and getValue(values, info, x, y - 1, z) > level: return True
+    if z > 0 and getValue(values, info, x, y, z - 1) > level: return True
+    if x < info.sizeX - 1 and getValue(values, info, x + 1, y, z) > level: return True
+    if y < info.sizeY - 1 and getValue(values, info, x, y + 1, z) > level: return True
+    if z < info.sizeZ - 1 and getValue(values, info, x, y, z + 1) > level: return True
+    return False
+
+cdef inline double getFraction(double fromValue, double toValue, double level) nogil:
+    if toValue == fromValue:
+        return 0
+    return (level - fromValue) / (toValue - fromValue)
+
+cdef inline double getValue(floating *values, VolumeInfo *info,
+                            Py_ssize_t x, Py_ssize_t y, Py_ssize_t z) nogil:
+    return values[(x * info.sizeY + y) * info.sizeZ + z]
+
+
+# Triangles
+##########################################
+
+cdef Py_ssize_t countLayerTriangles(floating *values, VolumeInfo *info, Py_ssize_t x) nogil:
+    cdef Py_ssize_t y, z, amount = 0
+    for y in range(info.sizeY - 1):
+        for z in range(info.sizeZ - 1):
+            amount += triangleAmounts[getCubeCase(values, info, x, y, z)]
+    return amount
+
+cdef Py_ssize_t triangulateLayer(floating *values, VolumeInfo *info, Py_ssize_t x,
+                                 unsigned int *slotIndicesA, unsigned int *slotIndicesB,
+                                 unsigned int *indices) nogil:
+    '''
+    Writes the triangles of the cubes between the planes x and x + 1.
+    Returns the amount of triangles, degenerated triangles are skipped.
+    '''
+    cdef Py_ssize_t y, z, i, amount = 0
+    cdef int cubeCase
+    cdef signed char *edges
+    cdef unsigned int a, b, c
+
+    for y in range(info.sizeY - 1):
+        for z in range(info.sizeZ - 1):
+            cubeCase = getCubeCase(values, info, x, y, z)
+            edges = triangleTable + cubeCase * 12
+            for i in range(triangleAmounts[cubeCase]):
+                a = getEdgeVertex(values, info, x, y, z, edges[i * 3 + 0], slotIndicesA, slotIndicesB)
+                b = getEdgeVertex(values, info, x, y, z, edges[i * 3 + 1], slotIndicesA, slotIndicesB)
+                c = getEdgeVertex(values, info, x, y, z, edges[i * 3 + 2], slotIndicesA, slotIndicesB)
+                if a == b or b == c or a == c:
+                    continue
+                indices[amount * 3 + 0] = a
+                indices[amount * 3 + 1] = b
+                indices[amount * 3 + 2] = c
+                amount += 1
+    return amount
+
+cdef inline int getCubeCase(floating *values, VolumeInfo *info,
+                            Py_ssize_t x, Py_ssize_t y, Py_ssize_t z) nogil:
+    cdef int i, cubeCase = 0
+    for i in range(8):
+        if getValue(values, info, x + cornerOffsetX[i], y + cornerOffsetY[i], z + cornerOffsetZ[i]) > info.level:
+            cubeCase |= 1 << i
+    return cubeCase
+
+cdef inline unsigned int getEdgeVertex(floating *values, VolumeInfo *info,
+                                       Py_ssize_t x, Py_ssize_t y, Py_ssize_t z, int edge,
+                                       unsigned int *slotIndicesA, unsigned int *slotIndicesB) nogil:
+    cdef int axis = edgeAxis[edge]
+    cdef Py_ssize_t startX = x + edgeOffsetX[edge]
+    cdef Py_ssize_t startY = y + edgeOffsetY[edge]
+    cdef Py_ssize_t startZ = z + edgeOffsetZ[edge]
+    cdef Py_ssize_t endX = startX + (axis == 0)
+    cdef Py_ssize_t endY = startY + (axis == 1)
+    cdef Py_ssize_t endZ = startZ + (axis == 2)
+
+    if getValue(values, info, startX, startY, startZ) == info.level:
+        return getSlot(info, slotIndicesA, slotIndicesB, startX - x, startY, startZ, CORNER_SLOT)
+    if getValue(values, info, endX, endY, endZ) == info.level:
+        return getSlot(info, slotIndicesA, slotIndicesB, endX - x, endY, endZ, CORNER_SLOT)
+    return getSlot(info, slotIndicesA, slotIndicesB, startX - x, startY, startZ, axis + 1)
+
+cdef inline unsigned int getSlot(VolumeInfo *info, unsigned int *slotIndicesA, unsigned int *slotIndicesB,
+                                 Py_ssize_t plane, Py_ssize_t y, Py_ssize_t z, int slot) nogil:
+    cdef unsigned int *slotIndices = slotIndicesA if plane == 0 else slotIndicesB
+    return slotIndices[(y * info.sizeZ + z) * SLOT_AMOUNT + slot]
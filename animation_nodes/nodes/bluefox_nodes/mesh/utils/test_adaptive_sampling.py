@@ -0,0 +1,73 @@
+import numpy as np
+from collections import Counter
+from unittest import TestCase
+from . marching_cubes import isoSurface
+from . adaptive_sampling import (getCoarsePositions, getGridIndices, getActiveBlocks,
+                                 getBlockSamples, createBlockSurfaces, joinSurfaces)
+
+def sphereField(indices, center):
+    return np.linalg.norm(indices - center, axis = -1)
+
+def createAdaptiveSurface(field, samples, blockSize, level, origin, spacing):
+    positions = getCoarsePositions(samples, blockSize)
+    coarseValues = field(getGridIndices(positions, positions, positions))
+    blocks = getActiveBlocks(coarseValues.reshape((len(positions), ) * 3), level)
+    sampleIndices, blockInfos = getBlockSamples(blocks, positions)
+    return joinSurfaces(createBlockSurfaces(field(sampleIndices), blockInfos, level, origin, spacing))
+
+def createFullSurface(field, samples, level, origin, spacing):
+    indices = getGridIndices(*(np.arange(samples), ) * 3)
+    return isoSurface(field(indices).reshape((samples, ) * 3), level, origin, spacing)
+
+def getTriangles(polygons):
+    return polygons.indices.asNumpyArray().astype(np.int64).reshape(-1, 3)
+
+def getTriangleSet(vertices, polygons):
+    locations = [tuple(v) for v in np.round(vertices.asNumpyArray().reshape(-1, 3), 4)]
+    return {frozenset(locations[i] for i in triangle) for triangle in getTriangles(polygons)}
+
+def getCollapsedMask(triangles):
+    a, b, c = triangles.T
+    return (a == b) | (b == c) | (c == a)
+
+def getEdgeCounts(triangles):
+    edges = np.concatenate([triangles[:, [0, 1]], triangles[:, [1, 2]], triangles[:, [2, 0]]])
+    return Counter(map(tuple, np.sort(edges, axis = 1)))
+
+class TestAdaptiveSampling(TestCase):
+    def check(self, samples, blockSize, center, level, origin = (0, 0, 0), spacing = (1, 1, 1)):
+        field = lambda indices: sphereField(indices, center)
+        adaptive = createAdaptiveSurface(field, samples, blockSize, level, origin, spacing)
+        full = createFullSurface(field, samples, level, origin, spacing)
+
+        # the full grid can create separate vertices at the same location
+        # when values are very close to the level, the blocks are welded
+        fullVertices = full[0].asNumpyArray().reshape(-1, 3)
+        self.assertTrue(len(fullVertices) > 0)
+        self.assertEqual(len(adaptive[0]), len(np.unique(fullVertices, axis = 0)))
+        self.assertEqual(len(adaptive[1]), len(full[1]))
+        self.assertEqual(getTriangleSet(*adaptive), getTriangleSet(*full))
+
+        vertices = adaptive[0].asNumpyArray().reshape(-1, 3)
+        self.assertEqual(len(np.unique(vertices, axis = 0)), len(vertices))
+        # welding collapses the slivers between vertices at the same location
+        triangles = getTriangles(adaptive[1])
+        edgeCounts = getEdgeCounts(triangles[~getCollapsedMask(triangles)])
+        self.assertTrue(all(count == 2 for count in edgeCounts.values()))
+
+    def testSphereCrossingBlockFaces(self):
+        # the sphere crosses the faces at 8, 16 and 24 in all directions
+        self.check(33, 8, (16.2, 15.7, 16.4), 11.3)
+
+    def testLevelOnBlockFaces(self):
+        # vertices lie exactly on the shared faces and corners of the blocks
+        self.check(33, 8, (16, 16, 16), 8)
+
+    def testUnevenLastBlock(self):
+        self.check(30, 7, (13.6, 14.2, 15.1), 9.7, (-2, 1, 0.5), (0.25, 0.5, 0.25))
+
+    def testNoActiveBlocks(self):
+        field = lambda indices: sphereField(indices, (8, 8, 8))
+        vertices, polygons = createAdaptiveSurface(field, 17, 4, 100, (0, 0, 0), (1, 1, 1))
+        self.assertEqual(len(vertices), 0)
+        self.assertEqual(len(polygons), 0)
@@ -0,0 +1,62 @@
+import os
+import numpy as np
+from collections import Counter
+from unittest import TestCase, mock
+from . marching_cubes import isoSurface, getSlabs
+
+def sphereField(samples, center, radius = 0):
+    grid = np.indices((samples, samples, samples)).transpose(1, 2, 3, 0)
+    return np.linalg.norm(grid - center, axis = -1) - radius
+
+def getTriangles(polygons):
+    indices = polygons.indices.asNumpyArray().astype(np.int64)
+    return indices.reshape(-1, 3)
+
+def getEdgeCounts(triangles):
+    edges = np.concatenate([triangles[:, [0, 1]], triangles[:, [1, 2]], triangles[:, [2, 0]]])
+    return Counter(map(tuple, np.sort(edges, axis = 1)))
+
+def getEulerCharacteristic(vertices, polygons):
+    triangles = getTriangles(polygons)
+    return len(vertices) - len(getEdgeCounts(triangles)) + len(triangles)
+
+class TestIsoSurface(TestCase):
+    def testSphereIsWatertight(self):
+        vertices, polygons = isoSurface(sphereField(24, (11.3, 12.1, 11.7)), 8.2)
+        triangles = getTriangles(polygons)
+        self.assertTrue(len(triangles) > 0)
+        self.assertTrue(all(count == 2 for count in getEdgeCounts(triangles).values()))
+        self.assertEqual(getEulerCharacteristic(vertices, polygons), 2)
+
+    def testNoDuplicateVertices(self):
+        # the level is exactly reached on grid points
+        vertices, _ = isoSurface(sphereField(16, (7, 7, 7)), 5)
+        array = vertices.asNumpyArray().reshape(-1, 3)
+        self.assertEqual(len(np.unique(array, axis = 0)), len(array))
+
+    def testVerticesAreOnLevel(self):
+        center = np.array((10.4, 9.8, 10.1))
+        origin, spacing = (1, -2, 0.5), (0.5, 0.5, 0.5)
+        vertices, _ = isoSurface(sphereField(22, center), 6.3, origin, spacing)
+        locations = vertices.asNumpyArray().reshape(-1, 3)
+        distances = np.linalg.norm((locations - origin) / spacing - center, axis = 1)
+        # linear interpolation places the vertices slightly inside of the sphere
+        self.assertTrue(np.all(np.abs(distances - 6.3) < 0.1))
+
+    def testSlabsGiveSameResult(self):
+        volume = sphereField(48, (20.5, 24.2, 23.9), 15) * np.cos(np.indices((48, 48, 48))[0] * 0.3)
+        with mock.patch.object(os, "cpu_count", lambda: 4):
+            self.assertTrue(len(getSlabs(47, 47 * 47)) > 1)
+            multiVertices, multiPolygons = isoSurface(volume, 0.5)
+        with mock.patch.object(os, "cpu_count", lambda: 1):
+            self.assertEqual(len(getSlabs(47, 47 * 47)), 1)
+            singleVertices, singlePolygons = isoSurface(volume, 0.5)
+        self.assertTrue(len(singleVertices) > 0)
+        self.assertTrue(np.array_equal(multiVertices.asNumpyArray(), singleVertices.asNumpyArray()))
+        self.assertEqual(list(multiPolygons.indices), list(singlePolygons.indices))
+
+    def testInvalidInput(self):
+        with self.assertRaises(ValueError):
+            isoSurface(np.zeros((4, 4)), 0)
+        with self.assertRaises(ValueError):
+            isoSurface(sphereField(4, (1, 1, 1)), 100)
@@ -20,6 +20,7 @@ class SplineTracerNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_splinetracer"
     bl_label = "Spline Tracer"
     bl_width_default = 150
+    options = {"NO_INCREMENTAL_EXECUTION"}
     
     def checkedPropertiesChanged(self, context):
         self.updateSocketVisibility()
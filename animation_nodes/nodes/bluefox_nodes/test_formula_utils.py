@@ -0,0 +1,15 @@
+import numpy as np
+from unittest import TestCase
+from . formula_utils import evaluateFormula
+
+class TestEvaluateFormula(TestCase):
+    def testIntegerArraysStayIntegers(self):
+        variables = {"id" : lambda start, end: np.arange(start + 1, end + 1)}
+        self.assertEqual(list(evaluateFormula("id & 1", 5, variables, "float32")), [1, 0, 1, 0, 1])
+        result = evaluateFormula("id % 2", 3, {"id" : np.array([2 ** 24 + 1, 3, 4])}, "float32")
+        self.assertEqual(list(result), [1, 1, 0])
+
+    def testFloatArraysUseDtype(self):
+        result = evaluateFormula("x * 2", 3, {"x" : np.array([1.5, 2.5, 3.5])}, "float32")
+        self.assertEqual(result.dtype, np.float32)
+        self.assertEqual(list(result), [3, 5, 7])
@@ -28,5 +28,12 @@ cdef class ConstantFalloff(BaseFalloff):
     cdef void evaluateList(self, void *values, Py_ssize_t startIndex,
                            Py_ssize_t amount, float *target):
         cdef Py_ssize_t i
-        for i in range(amount):
-            target[i] = self.value
+        with nogil:
+            for i in range(amount):
+                target[i] = self.value
+
+    cdef bint isConstant(self):
+        return True
+
+    cdef bint isThreadSafe(self):
+        return True
@@ -14,6 +14,7 @@ class EvaluateFalloffNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_EvaluateFalloffNode"
     bl_label = "Evaluate Falloff"
     errorHandlingType = "EXCEPTION"
+    options = {"THREAD_SAFE"}
 
     __annotations__ = {}
 
@@ -48,25 +49,37 @@ class EvaluateFalloffNode(bpy.types.Node, AnimationNode):
         row.prop(self, "useList", text = "", icon = "LINENUMBERS_ON")
 
     def getExecutionFunctionName(self):
+        # the execution functions must not read node properties,
+        # because the node can be executed on a worker thread
         if self.useList:
             if self.falloffType == "NONE":
                 return "execute_List_None"
-            elif self.falloffType in ("LOCATION", "TRANSFORMATION_MATRIX"):
-                return "execute_List_CList"
+            elif self.falloffType == "LOCATION":
+                return "execute_List_Location"
+            elif self.falloffType == "TRANSFORMATION_MATRIX":
+                return "execute_List_Matrix"
         else:
             if self.falloffType == "NONE":
                 return "execute_Single_None"
-            elif self.falloffType in ("LOCATION", "TRANSFORMATION_MATRIX"):
-                return "execute_Single_Object"
+            elif self.falloffType == "LOCATION":
+                return "execute_Single_Location"
+            elif self.falloffType == "TRANSFORMATION_MATRIX":
+                return "execute_Single_Matrix"
 
     def execute_Single_None(self, Falloff falloff, index):
         cdef Py_ssize_t _index = clampLong(index)
         cdef FalloffEvaluator evaluator = self.getFalloffEvaluator(falloff, "NONE")
         return evaluator.evaluate(NULL, _index)
 
-    def execute_Single_Object(self, Falloff falloff, object, index):
+    def execute_Single_Location(self, Falloff falloff, location, index):
+        return self.evaluateSingle(falloff, "LOCATION", location, index)
+
+    def execute_Single_Matrix(self, Falloff falloff, matrix, index):
+        return self.evaluateSingle(falloff, "TRANSFORMATION_MATRIX", matrix, index)
+
+    def evaluateSingle(self, Falloff falloff, type, object, index):
         cdef Py_ssize_t _index = clampLong(index)
-        cdef FalloffEvaluator evaluator = self.getFalloffEvaluator(falloff, self.falloffType)
+        cdef FalloffEvaluator evaluator = self.getFalloffEvaluator(falloff, type)
         return evaluator(object, _index)
 
     def execute_List_None(self, falloff, amount):
@@ -80,18 +93,15 @@ class EvaluateFalloffNode(bpy.types.Node, AnimationNode):
             strengths.data[i] = _falloff.evaluate(NULL, i)
         return strengths
 
-    def execute_List_CList(self, falloff, myList):
-        cdef FalloffEvaluator _falloff = self.getFalloffEvaluator(falloff, self.falloffType)
-        return self.evaluate_CList(_falloff, myList)
+    def execute_List_Location(self, falloff, locations):
+        return self.evaluateList(self.getFalloffEvaluator(falloff, "LOCATION"), locations)
 
-    def evaluate_CList(self, FalloffEvaluator _falloff, CList myList):
-        cdef Py_ssize_t i
-        cdef char *data = <char*>myList.getPointer()
-        cdef int elementSize = myList.getElementSize()
-        cdef DoubleList strengths = DoubleList(length = myList.getLength())
-        for i in range(myList.getLength()):
-            strengths.data[i] = _falloff.evaluate(data + i * elementSize, i)
-        return strengths
+    def execute_List_Matrix(self, falloff, matrices):
+        return self.evaluateList(self.getFalloffEvaluator(falloff, "TRANSFORMATION_MATRIX"), matrices)
+
+    def evaluateList(self, FalloffEvaluator _falloff, CList myList):
+        # releases the GIL for thread safe falloffs
+        return DoubleList.fromValues(_falloff.evaluateList(myList))
 
     def getFalloffEvaluator(self, falloff, type):
         try: return falloff.getEvaluator(type)
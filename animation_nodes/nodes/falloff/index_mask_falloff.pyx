@@ -64,6 +64,9 @@ cdef class MaskEveryNthFalloff(BaseFalloff):
             return self.valueA
         return self.valueB
 
+    cdef bint isThreadSafe(self):
+        return True
+
 cdef class MaskRandomFalloff(BaseFalloff):
     cdef Py_ssize_t seed
     cdef float probability
@@ -81,3 +84,6 @@ cdef class MaskRandomFalloff(BaseFalloff):
         if randomDouble_Positive(index + self.seed) < self.probability:
             return self.valueA
         return self.valueB
+
+    cdef bint isThreadSafe(self):
+        return True
@@ -85,3 +85,10 @@ cdef class Falloff_InterpolateDoubleListFalloff(CompoundFalloff):
     cdef float evaluate(self, float *dependencyResults):
         cdef float x = dependencyResults[0] * (self.myList.length - 1)
         return evaluatePosition(x, self.myList, self.interpolation)
+
+    cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target):
+        cdef float *data = dependencyResults[0]
+        cdef float scale = self.myList.length - 1
+        cdef Py_ssize_t i
+        for i in range(amount):
+            target[i] = evaluatePosition(data[i] * scale, self.myList, self.interpolation)
@@ -1,4 +1,5 @@
 import bpy
+from libc.string cimport memcpy
 from bpy.props import *
 from ... base_types import AnimationNode
 from . constant_falloff import ConstantFalloff
@@ -90,6 +91,9 @@ cdef class MixTwoFalloffsBase(CompoundFalloff):
     cdef list getDependencies(self):
         return [self.a, self.b]
 
+    cdef bint isThreadSafe(self):
+        return True
+
 cdef class AddTwoFalloffs(MixTwoFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
         return dependencyResults[0] + dependencyResults[1]
@@ -98,8 +102,9 @@ cdef class AddTwoFalloffs(MixTwoFalloffsBase):
         cdef Py_ssize_t i
         cdef float *a = dependencyResults[0]
         cdef float *b = dependencyResults[1]
-        for i in range(amount):
-            target[i] = a[i] + b[i]
+        with nogil:
+            for i in range(amount):
+                target[i] = a[i] + b[i]
 
 cdef class MultiplyTwoFalloffs(MixTwoFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
@@ -109,8 +114,9 @@ cdef class MultiplyTwoFalloffs(MixTwoFalloffsBase):
         cdef Py_ssize_t i
         cdef float *a = dependencyResults[0]
         cdef float *b = dependencyResults[1]
-        for i in range(amount):
-            target[i] = a[i] * b[i]
+        with nogil:
+            for i in range(amount):
+                target[i] = a[i] * b[i]
 
 cdef class MinTwoFalloffs(MixTwoFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
@@ -120,8 +126,9 @@ cdef class MinTwoFalloffs(MixTwoFalloffsBase):
         cdef Py_ssize_t i
         cdef float *a = dependencyResults[0]
         cdef float *b = dependencyResults[1]
-        for i in range(amount):
-            target[i] = min(a[i], b[i])
+        with nogil:
+            for i in range(amount):
+                target[i] = min(a[i], b[i])
 
 cdef class MaxTwoFalloffs(MixTwoFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
@@ -131,8 +138,9 @@ cdef class MaxTwoFalloffs(MixTwoFalloffsBase):
         cdef Py_ssize_t i
         cdef float *a = dependencyResults[0]
         cdef float *b = dependencyResults[1]
-        for i in range(amount):
-            target[i] = max(a[i], b[i])
+        with nogil:
+            for i in range(amount):
+                target[i] = max(a[i], b[i])
 
 cdef class SubtractTwoFalloffs(MixTwoFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
@@ -142,8 +150,9 @@ cdef class SubtractTwoFalloffs(MixTwoFalloffsBase):
         cdef Py_ssize_t i
         cdef float *a = dependencyResults[0]
         cdef float *b = dependencyResults[1]
-        for i in range(amount):
-            target[i] = a[i] - b[i]
+        with nogil:
+            for i in range(amount):
+                target[i] = a[i] - b[i]
 
 # Overlay is defined as follows:
 # - First the A falloff is clamped.
@@ -172,11 +181,12 @@ cdef class OverlayTwoFalloffs(MixTwoFalloffsBase):
         cdef Py_ssize_t i
         cdef float *a = dependencyResults[0]
         cdef float *b = dependencyResults[1]
-        for i in range(amount):
-            if a[i] < 0.5:
-                target[i] = a[i] * (1 + b[i])
-            else:
-                target[i] = a[i] + b[i] * (1 - a[i])
+        with nogil:
+            for i in range(amount):
+                if a[i] < 0.5:
+                    target[i] = a[i] * (1 + b[i])
+                else:
+                    target[i] = a[i] + b[i] * (1 - a[i])
 
 
 cdef class MixFalloffsBase(CompoundFalloff):
@@ -192,6 +202,9 @@ cdef class MixFalloffsBase(CompoundFalloff):
     cdef list getDependencies(self):
         return self.falloffs
 
+    cdef bint isThreadSafe(self):
+        return True
+
 cdef class AddFalloffs(MixFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
         cdef int i
@@ -200,6 +213,18 @@ cdef class AddFalloffs(MixFalloffsBase):
             sum += dependencyResults[i]
         return sum
 
+    cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target):
+        cdef Py_ssize_t i
+        cdef int j
+        cdef float *values
+        with nogil:
+            for i in range(amount):
+                target[i] = 0
+            for j in range(self.amount):
+                values = dependencyResults[j]
+                for i in range(amount):
+                    target[i] += values[i]
+
 cdef class MultiplyFalloffs(MixFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
         cdef int i
@@ -208,6 +233,18 @@ cdef class MultiplyFalloffs(MixFalloffsBase):
             product *= dependencyResults[i]
         return product
 
+    cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target):
+        cdef Py_ssize_t i
+        cdef int j
+        cdef float *values
+        with nogil:
+            for i in range(amount):
+                target[i] = 1
+            for j in range(self.amount):
+                values = dependencyResults[j]
+                for i in range(amount):
+                    target[i] *= values[i]
+
 cdef class MinFalloffs(MixFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
         cdef int i
@@ -217,6 +254,18 @@ cdef class MinFalloffs(MixFalloffsBase):
                 minValue = dependencyResults[i]
         return minValue
 
+    cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target):
+        cdef Py_ssize_t i
+        cdef int j
+        cdef float *values
+        with nogil:
+            memcpy(target, dependencyResults[0], sizeof(float) * amount)
+            for j in range(1, self.amount):
+                values = dependencyResults[j]
+                for i in range(amount):
+                    if values[i] < target[i]:
+                        target[i] = values[i]
+
 cdef class MaxFalloffs(MixFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
         cdef int i
@@ -225,3 +274,15 @@ cdef class MaxFalloffs(MixFalloffsBase):
             if dependencyResults[i] > maxValue:
                 maxValue = dependencyResults[i]
         return maxValue
+
+    cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target):
+        cdef Py_ssize_t i
+        cdef int j
+        cdef float *values
+        with nogil:
+            memcpy(target, dependencyResults[0], sizeof(float) * amount)
+            for j in range(1, self.amount):
+                values = dependencyResults[j]
+                for i in range(amount):
+                    if values[i] > target[i]:
+                        target[i] = values[i]
@@ -44,11 +44,15 @@ cdef class PointDistanceFalloff(BaseFalloff):
     cdef void evaluateList(self, void *values, Py_ssize_t startIndex,
                            Py_ssize_t amount, float *target):
         cdef Py_ssize_t i
-        for i in range(amount):
-            target[i] = calcDistance(self, <Vector3*>values + i)
+        with nogil:
+            for i in range(amount):
+                target[i] = calcDistance(self, <Vector3*>values + i)
 
+    cdef bint isThreadSafe(self):
+        return True
 
-cdef inline float calcDistance(PointDistanceFalloff self, Vector3 *v):
+
+cdef inline float calcDistance(PointDistanceFalloff self, Vector3 *v) nogil:
     cdef float distance = distanceVec3(&self.origin, v)
     if distance <= self.minDistance: return 1
     if distance <= self.maxDistance: return 1 - (distance - self.minDistance) * self.factor
@@ -80,6 +80,9 @@ cdef class RadialFalloff(BaseFalloff):
                 subVec3(&position, <Vector3 *>values + i, &self.origin)
                 target[i] = self.getRadialValue3D(&position)
 
+    cdef bint isThreadSafe(self):
+        return True
+
     @cython.cdivision(True)
     cdef float getRadialValue2D(self, float x, float y):
         cdef double angle = atan2(y, x)
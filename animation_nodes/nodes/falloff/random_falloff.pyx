@@ -31,3 +31,6 @@ cdef class RandomFalloff(BaseFalloff):
 
     cdef float evaluate(self, void *object, Py_ssize_t index):
         return randomDouble_Range((self.seed + index) % 0x7fffffff, self.minValue, self.maxValue)
+
+    cdef bint isThreadSafe(self):
+        return True
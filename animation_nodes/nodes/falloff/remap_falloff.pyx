@@ -49,6 +49,24 @@ cdef class RemapFalloff(CompoundFalloff):
     cdef float evaluate(self, float *dependencyResults):
         return self.outMin + ((dependencyResults[0] - self.inMin) / self.inLength) * self.outLength
 
+    cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target):
+        cdef float *data = dependencyResults[0]
+        cdef float factor, offset
+        cdef Py_ssize_t i
+        self.getAffineMapping(&factor, &offset)
+        with nogil:
+            for i in range(amount):
+                target[i] = data[i] * factor + offset
+
+    @cython.cdivision(True)
+    cdef bint getAffineMapping(self, float *factor, float *offset):
+        factor[0] = self.outLength / self.inLength
+        offset[0] = self.outMin - self.inMin * factor[0]
+        return True
+
+    cdef bint isThreadSafe(self):
+        return True
+
 cdef class RemapInterpolatedFalloff(CompoundFalloff):
     cdef:
         Falloff falloff
@@ -73,3 +91,11 @@ cdef class RemapInterpolatedFalloff(CompoundFalloff):
     cdef float evaluate(self, float *dependencyResults):
         cdef float value = self.interpolation.evaluate((dependencyResults[0] - self.inMin) / self.inLength)
         return self.outMin + value * self.outLength
+
+    @cython.cdivision(True)
+    cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target):
+        cdef float *data = dependencyResults[0]
+        cdef Py_ssize_t i
+        for i in range(amount):
+            target[i] = self.outMin + self.outLength * self.interpolation.evaluate(
+                (data[i] - self.inMin) / self.inLength)
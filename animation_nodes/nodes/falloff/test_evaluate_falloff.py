@@ -0,0 +1,20 @@
+from unittest import TestCase
+from . evaluate_falloff import EvaluateFalloffNode
+from . test_list_evaluation import createFalloffStack, randomVectors
+
+class ThreadedEvaluateFalloffNode(EvaluateFalloffNode):
+    # node properties must not be read on worker threads
+    def __getattribute__(self, name):
+        if name in ("falloffType", "useList"):
+            raise AssertionError("property read during execution: " + name)
+        return super().__getattribute__(name)
+
+class TestEvaluateFalloffNode(TestCase):
+    def testListMatchesSingleEvaluation(self):
+        node = ThreadedEvaluateFalloffNode.__new__(ThreadedEvaluateFalloffNode)
+        falloff = createFalloffStack()
+        vectors = randomVectors(1000, 0)
+        strengths = node.execute_List_Location(falloff, vectors)
+        self.assertEqual(len(strengths), len(vectors))
+        for i in range(0, len(vectors), 37):
+            self.assertAlmostEqual(strengths[i], node.execute_Single_Location(falloff, tuple(vectors[i]), i), places = 5)
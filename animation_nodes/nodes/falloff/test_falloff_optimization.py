@@ -0,0 +1,70 @@
+from unittest import TestCase
+from . constant_falloff import ConstantFalloff
+from . random_falloff import RandomFalloff
+from . invert_falloff import InvertFalloff
+from . remap_falloff import RemapFalloff
+from . mix_falloffs import MixFalloffs
+from . interpolate_list_falloff import Falloff_InterpolateDoubleListFalloff
+from ... algorithms.interpolations import Linear
+from ... data_structures.lists.base_lists import Vector3DList, FloatList
+from ... data_structures.falloffs.evaluation import optimizeFalloff
+
+def evaluateBoth(falloff, amount = 5000, clamped = False):
+    vectors = Vector3DList(length = amount)
+    vectors.fill(0)
+    evaluator = falloff.getEvaluator("LOCATION", clamped)
+    single = [evaluator((0, 0, 0), i) for i in range(0, amount, 71)]
+    return list(evaluator.evaluateList(vectors))[::71], single
+
+class TestOptimizeFalloff(TestCase):
+    def assertValuesEqual(self, falloff, expected, clamped = False):
+        listResult, singleResult = evaluateBoth(falloff, clamped = clamped)
+        for a, b, c in zip(listResult, singleResult, expected):
+            self.assertAlmostEqual(a, c, places = 5)
+            self.assertAlmostEqual(b, c, places = 5)
+
+    def testBaseFalloffIsUnchanged(self):
+        falloff = RandomFalloff(1, 0, 1)
+        self.assertIs(optimizeFalloff(falloff), falloff)
+
+    def testFoldConstants(self):
+        falloff = MixFalloffs([ConstantFalloff(0.25), ConstantFalloff(0.5), ConstantFalloff(2)], "ADD")
+        falloff = RemapFalloff(falloff, 0, 2, 0, 1)
+        optimized = optimizeFalloff(falloff)
+        self.assertEqual(type(optimized).__name__, "FoldedConstantFalloff")
+        self.assertValuesEqual(falloff, [1.375] * 100)
+
+    def testFoldClampedConstant(self):
+        falloff = Falloff_InterpolateDoubleListFalloff(ConstantFalloff(3),
+            FloatList.fromValues([0, 2, 4]), Linear())
+        self.assertEqual(type(optimizeFalloff(falloff)).__name__, "FoldedConstantFalloff")
+        self.assertValuesEqual(falloff, [4] * 100)
+
+    def testCollapseRemapChain(self):
+        random = RandomFalloff(2, 0, 1)
+        falloff = RemapFalloff(InvertFalloff(RemapFalloff(random, 0, 1, 2, 4)), 0, 1, 0, 10)
+        optimized = optimizeFalloff(falloff)
+        self.assertEqual(type(optimized).__name__, "AffineFalloff")
+        expected = [(1 - (2 + 2 * v)) * 10 for v in evaluateBoth(random)[1]]
+        self.assertValuesEqual(falloff, expected)
+
+    def testCollapseClampedChain(self):
+        random = RandomFalloff(3, 0, 1)
+        remapped = RemapFalloff(random, 0, 1, -1, 2)
+        falloff = Falloff_InterpolateDoubleListFalloff(RemapFalloff(remapped, 0, 1, 0, 1),
+            FloatList.fromValues([0, 1]), Linear())
+        expected = [min(max(v * 3 - 1, 0), 1) for v in evaluateBoth(random)[1]]
+        self.assertValuesEqual(falloff, expected)
+
+    def testClampedEvaluator(self):
+        random = RandomFalloff(4, 0, 1)
+        falloff = InvertFalloff(RemapFalloff(random, 0, 1, -1, 1))
+        expected = [min(max(1 - (v * 2 - 1), 0), 1) for v in evaluateBoth(random)[1]]
+        self.assertValuesEqual(falloff, expected, clamped = True)
+
+    def testSharedDependency(self):
+        random = RandomFalloff(5, 0, 1)
+        inverted = InvertFalloff(random)
+        falloff = MixFalloffs([inverted, random, inverted, ConstantFalloff(0.5)], "ADD")
+        expected = [2 - v + 0.5 for v in evaluateBoth(random)[1]]
+        self.assertValuesEqual(falloff, expected)
@@ -0,0 +1,89 @@
+import os
+import numpy as np
+from unittest import TestCase, mock
+from . random_falloff import RandomFalloff
+from . remap_falloff import RemapFalloff
+from . index_mask_falloff import MaskEveryNthFalloff
+from . directional_falloff import UniDirectionalFalloff, BiDirectionalFalloff
+from . mix_falloffs import MixFalloffs
+from . custom_falloff import CustomFalloff
+from .. bluefox_nodes.falloff.composite_falloffs import MixFalloffs as CompositeFalloffs
+from ... data_structures.lists.base_lists import Vector3DList, Matrix4x4List, FloatList
+from ... data_structures.falloffs.evaluation import getParallelParts
+
+def randomVectors(amount, seed):
+    random = np.random.RandomState(seed)
+    return Vector3DList.fromNumpyArray(random.uniform(-5, 5, amount * 3).astype(np.float32))
+
+def createFalloffStack():
+    falloffs = [RandomFalloff(1, 0, 1),
+                UniDirectionalFalloff((0, 0, 0), (1, 0, 0), 4),
+                BiDirectionalFalloff((1, 0, 0), (0, 1, 1), 3),
+                MaskEveryNthFalloff(3, 1, 0.2, 0.7)]
+    falloff = MixFalloffs(falloffs, "MAX")
+    falloff = RemapFalloff(falloff, 0, 1, 1, 0)
+    falloff = CompositeFalloffs([falloff, RandomFalloff(2, 0, 1), falloffs[1]], "AVG")
+    return CompositeFalloffs([falloff, RandomFalloff(3, 0, 2), falloffs[2]], "ADD")
+
+class TestListEvaluation(TestCase):
+    def assertListMatchesSingleEvaluation(self, evaluator, vectors, startIndex = 0):
+        result = evaluator.evaluateList(vectors, startIndex)
+        self.assertEqual(len(result), len(vectors))
+        for i in range(0, len(vectors), 97):
+            self.assertAlmostEqual(result[i], evaluator(tuple(vectors[i]), i + startIndex), places = 5)
+
+    def testMultipleChunks(self):
+        evaluator = createFalloffStack().getEvaluator("LOCATION")
+        self.assertListMatchesSingleEvaluation(evaluator, randomVectors(10000, 0))
+
+    def testStartIndex(self):
+        evaluator = createFalloffStack().getEvaluator("LOCATION")
+        self.assertListMatchesSingleEvaluation(evaluator, randomVectors(5000, 1), startIndex = 123)
+
+    def testClamped(self):
+        evaluator = createFalloffStack().getEvaluator("LOCATION", clamped = True)
+        result = evaluator.evaluateList(randomVectors(5000, 2)).asNumpyArray()
+        self.assertTrue(result.min() >= 0 and result.max() <= 1)
+        self.assertListMatchesSingleEvaluation(evaluator, randomVectors(5000, 2))
+
+    def testConvertedSource(self):
+        vectors = randomVectors(6000, 3)
+        matrices = np.tile(np.eye(4, dtype = np.float32), (len(vectors), 1, 1))
+        matrices[:, :3, 3] = vectors.asNumpyArray().reshape(-1, 3)
+        falloff = createFalloffStack()
+        result = falloff.getEvaluator("TRANSFORMATION_MATRIX").evaluateList(
+            Matrix4x4List.fromNumpyArray(matrices.ravel()))
+        expected = falloff.getEvaluator("LOCATION").evaluateList(vectors)
+        self.assertEqual(list(result), list(expected))
+
+    def testEmptyList(self):
+        evaluator = createFalloffStack().getEvaluator("LOCATION")
+        self.assertEqual(len(evaluator.evaluateList(Vector3DList())), 0)
+
+class TestParallelListEvaluation(TestCase):
+    def evaluateWithThreads(self, falloff, vectors, threadAmount, startIndex = 0):
+        with mock.patch.object(os, "cpu_count", lambda: threadAmount):
+            return falloff.getEvaluator("LOCATION").evaluateList(vectors, startIndex)
+
+    def testParallelParts(self):
+        with mock.patch.object(os, "cpu_count", lambda: 4):
+            parts = getParallelParts(100000)
+            self.assertEqual(parts[0][0], 0)
+            self.assertEqual(parts[-1][1], 100000)
+            self.assertEqual(len(parts), 4)
+            self.assertEqual(getParallelParts(1000), [(0, 1000)])
+
+    def testSameResultAsSerial(self):
+        falloff = createFalloffStack()
+        vectors = randomVectors(100000, 4)
+        serial = self.evaluateWithThreads(falloff, vectors, 1, 17)
+        parallel = self.evaluateWithThreads(falloff, vectors, 4, 17)
+        self.assertEqual(list(serial), list(parallel))
+
+    def testNotThreadSafeFalloff(self):
+        strengths = FloatList.fromNumpyArray(np.linspace(0, 1, 100000).astype(np.float32))
+        falloff = MixFalloffs([CustomFalloff(strengths, 0), RandomFalloff(1, 0, 1)], "ADD")
+        vectors = randomVectors(100000, 5)
+        result = self.evaluateWithThreads(falloff, vectors, 4)
+        expected = self.evaluateWithThreads(falloff, vectors, 1)
+        self.assertEqual(list(result), list(expected))
@@ -10,6 +10,7 @@ frameTypeItems = [
 class EvaluateFCurveNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_EvaluateFCurveNode"
     bl_label = "Evaluate FCurve"
+    options = {"NO_INCREMENTAL_EXECUTION"}
 
     frameType: EnumProperty(
         name = "Frame Type", default = "OFFSET",
@@ -16,6 +16,7 @@ class ExpressionNode(bpy.types.Node, AnimationNode):
     bl_label = "Expression"
     bl_width_default = 200
     dynamicLabelType = "HIDDEN_ONLY"
+    options = {"NO_INCREMENTAL_EXECUTION"}
 
     def settingChanged(self, context = None):
         self.errorMessage = ""
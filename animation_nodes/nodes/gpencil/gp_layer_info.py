@@ -15,6 +15,7 @@ class GPLayerInfoNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_GPLayerInfoNode"
     bl_label = "GP Layer Info"
     errorHandlingType = "EXCEPTION"
+    options = {"NO_INCREMENTAL_EXECUTION"}
 
     frameType: EnumProperty(name = "Frame Type", default = "ACTIVE",
         items = frameTypeItems, update = AnimationNode.refresh)
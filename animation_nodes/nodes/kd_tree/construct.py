@@ -10,9 +10,4 @@ class ConstructKDTreeNode(bpy.types.Node, AnimationNode):
         self.newOutput("KDTree", "KDTree", "kdTree")
 
     def getExecutionCode(self, required):
-        yield "kdTree = mathutils.kdtree.KDTree(len(vectorList))"
-        yield "for i, vector in enumerate(vectorList): kdTree.insert(vector, i)"
-        yield "kdTree.balance()"
-
-    def getUsedModules(self):
-        return ["mathutils"]
+        return "kdTree = KDTree(vectorList)"
@@ -4,7 +4,6 @@ from ... base_types import AnimationNode, VectorizedSocket
 class FindNearestPointInKDTreeNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_FindNearestPointInKDTreeNode"
     bl_label = "Find Nearest Point"
-    codeEffects = [VectorizedSocket.CodeEffect]
 
     useVectorList: VectorizedSocket.newProperty()
 
@@ -22,6 +21,11 @@ class FindNearestPointInKDTreeNode(bpy.types.Node, AnimationNode):
             ("Index", "index"), ("Indices", "indices")))
 
     def getExecutionCode(self, required):
-        yield "nearestVector, index, distance = kdTree.find(searchVector)"
-        yield "if nearestVector is None:"
-        yield "    nearestVector, index, distance = Vector((0, 0, 0)), 0.0, -1"
+        if self.useVectorList:
+            yield "indices, distances = kdTree.findNearest(searchVectors)"
+            if "nearestVectors" in required:
+                yield "nearestVectors = kdTree.getPoints(indices)"
+        else:
+            yield "nearestVector, index, distance = kdTree.find(searchVector)"
+            yield "if nearestVector is None:"
+            yield "    nearestVector, index, distance = Vector((0, 0, 0)), -1, -1.0"
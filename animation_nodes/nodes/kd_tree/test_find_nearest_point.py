@@ -0,0 +1,28 @@
+from unittest import TestCase
+from mathutils import Vector
+from . find_nearest_point import FindNearestPointInKDTreeNode
+from ... data_structures import KDTree, Vector3DList
+
+def execute(useVectorList, kdTree, searchVector):
+    node = FindNearestPointInKDTreeNode.__new__(FindNearestPointInKDTreeNode)
+    node.useVectorList = useVectorList
+    variables = {"Vector" : Vector, "kdTree" : kdTree,
+                 "searchVector" : searchVector, "searchVectors" : Vector3DList.fromValues([searchVector])}
+    code = "\n".join(node.getExecutionCode({"nearestVector", "nearestVectors"}))
+    exec(code, variables)
+    if useVectorList:
+        return tuple(variables["nearestVectors"][0]), variables["indices"][0], variables["distances"][0]
+    return tuple(variables["nearestVector"]), variables["index"], variables["distance"]
+
+class TestFindNearestPointNode(TestCase):
+    def testEmptyTreeResultsMatch(self):
+        kdTree = KDTree(Vector3DList())
+        single = execute(False, kdTree, (1, 2, 3))
+        vectorized = execute(True, kdTree, (1, 2, 3))
+        self.assertEqual(single, ((0, 0, 0), -1, -1))
+        self.assertEqual(single, vectorized)
+        self.assertIsInstance(single[1], int)
+
+    def testResultsMatch(self):
+        kdTree = KDTree(Vector3DList.fromValues([(0, 0, 0), (1, 2, 2), (5, 5, 5)]))
+        self.assertEqual(execute(False, kdTree, (1, 2, 3)), execute(True, kdTree, (1, 2, 3)))
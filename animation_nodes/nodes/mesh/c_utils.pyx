@@ -2,6 +2,7 @@
 cimport cython
 from libc.string cimport memcpy
 
+from ... algorithms.mesh.replicate_mesh import replicateMesh
 from ... algorithms.mesh_generation.cylinder import getCylinderMesh
 
 from ... data_structures cimport (
@@ -24,7 +25,7 @@ from ... math cimport (
     Vector3, Matrix4, toVector3, distanceSquaredVec3,
     scaleVec3, subVec3, crossVec3, distanceVec3, lengthVec3, dotVec3,
     transformVec3AsPoint_InPlace, normalizeVec3_InPlace, scaleVec3_Inplace,
-    normalizeLengthVec3_Inplace, transformVec3AsPoint, transformVec3AsDirection,
+    normalizeLengthVec3_Inplace,
     matrixFromNormalizedAxisData,
 )
 
@@ -543,171 +544,3 @@ def getEdgeMatrices(Vector3DList vertices, EdgeIndicesList edges, VirtualDoubleL
         m.a41, m.a42, m.a43, m.a44 = 0, 0, 0, 1
 
     return matrices
-
-
-# Replicate Mesh
-###################################
-
-def replicateMesh(Mesh source, transformations):
-    cdef Py_ssize_t vertexAmount = source.vertices.length
-    cdef Py_ssize_t edgeAmount = source.edges.length
-
-    newVertices = getReplicatedVertices(source.vertices, transformations)
-    newEdges = getReplicatedEdges(source.edges, len(transformations), vertexAmount)
-    newPolygons = getReplicatedPolygons(source.polygons, len(transformations), vertexAmount)
-
-    newVertexNormals = getReplicatedNormals(source.getVertexNormals(), transformations)
-    newPolygonNormals = getReplicatedNormals(source.getPolygonNormals(), transformations)
-    newLoopEdges = getReplicatedLoopEdges(source.getLoopEdges(), len(transformations), edgeAmount)
-
-    materialIndices = source.materialIndices.repeated(amount = len(transformations))
-
-    mesh = Mesh(newVertices, newEdges, newPolygons, materialIndices, skipValidation = True)
-    mesh.setVertexNormals(newVertexNormals)
-    mesh.setPolygonNormals(newPolygonNormals)
-    mesh.setLoopEdges(newLoopEdges)
-
-    mesh.replicateMeshProperties(source, len(transformations))
-
-    return mesh
-
-def getReplicatedVertices(Vector3DList oldVertices, transformations):
-    if isinstance(transformations, Vector3DList):
-        return getReplicatedVertices_VectorList(oldVertices, transformations)
-    elif isinstance(transformations, Matrix4x4List):
-        return getReplicatedVertices_MatrixList(oldVertices, transformations)
-
-def getReplicatedVertices_VectorList(Vector3DList oldVertices, Vector3DList transformations):
-    cdef Vector3DList newVertices = Vector3DList(oldVertices.length * transformations.length)
-    cdef Vector3* _oldVertices = oldVertices.data
-    cdef Vector3* _newVertices = newVertices.data
-    cdef Vector3* _transformations = transformations.data
-
-    cdef Py_ssize_t i, j
-    cdef Py_ssize_t index = 0
-    for i in range(transformations.length):
-        for j in range(oldVertices.length):
-            _newVertices[index].x = _oldVertices[j].x + _transformations[i].x
-            _newVertices[index].y = _oldVertices[j].y + _transformations[i].y
-            _newVertices[index].z = _oldVertices[j].z + _transformations[i].z
-            index += 1
-
-    return newVertices
-
-def getReplicatedVertices_MatrixList(Vector3DList oldVertices, Matrix4x4List matrices):
-    cdef Vector3DList newVertices = Vector3DList(oldVertices.length * matrices.length)
-    cdef Vector3 *_newVertices = newVertices.data
-    cdef Vector3 *_oldVertices = oldVertices.data
-    cdef Matrix4 *_matrices = matrices.data
-
-    cdef Py_ssize_t i, j
-    cdef Py_ssize_t index = 0
-    for i in range(matrices.length):
-        for j in range(oldVertices.length):
-            transformVec3AsPoint(_newVertices + index,
-                                 _oldVertices + j,
-                                 _matrices + i)
-            index += 1
-    return newVertices
-
-def getReplicatedEdges(EdgeIndicesList edges, Py_ssize_t amount, Py_ssize_t vertexAmount):
-    cdef Py_ssize_t edgeAmount = edges.length
-    cdef EdgeIndicesList newEdges = EdgeIndicesList(length = edges.length * amount)
-
-    cdef EdgeIndices *_oldEdges = edges.data
-    cdef EdgeIndices *_newEdges = newEdges.data
-
-    cdef Py_ssize_t i, j, offset
-    cdef Py_ssize_t index = 0
-    for i in range(amount):
-        offset = vertexAmount * i
-        for j in range(edgeAmount):
-            _newEdges[index].v1 = _oldEdges[j].v1 + offset
-            _newEdges[index].v2 = _oldEdges[j].v2 + offset
-            index += 1
-    return newEdges
-
-def getReplicatedPolygons(PolygonIndicesList polygons, Py_ssize_t amount, Py_ssize_t vertexAmount):
-    cdef Py_ssize_t indicesAmount = polygons.indices.length
-    cdef Py_ssize_t polygonAmount = polygons.getLength()
-    cdef PolygonIndicesList newPolygons = PolygonIndicesList(
-        indicesAmount = amount * indicesAmount,
-        polygonAmount = amount * polygonAmount)
-
-    cdef unsigned int *_oldIndices = polygons.indices.data
-    cdef unsigned int *_oldPolyStarts = polygons.polyStarts.data
-    cdef unsigned int *_oldPolyLengths = polygons.polyLengths.data
-
-    cdef unsigned int *_newIndices = newPolygons.indices.data
-    cdef unsigned int *_newPolyStarts = newPolygons.polyStarts.data
-    cdef unsigned int *_newPolyLengths = newPolygons.polyLengths.data
-
-    cdef Py_ssize_t i, j, offset, index
-
-    # Polygon Indices
-    index = 0
-    for i in range(amount):
-        offset = vertexAmount * i
-        for j in range(indicesAmount):
-            _newIndices[index] = _oldIndices[j] + offset
-            index += 1
-
-    # Polygon Starts
-    index = 0
-    for i in range(amount):
-        offset = indicesAmount * i
-        for j in range(polygonAmount):
-            _newPolyStarts[index] = _oldPolyStarts[j] + offset
-            index += 1
-
-    # Polygon Lengths
-    for i in range(amount):
-        memcpy(_newPolyLengths + i * polygonAmount,
-               _oldPolyLengths,
-               sizeof(unsigned int) * polygonAmount)
-
-    return newPolygons
-
-def getReplicatedNormals(Vector3DList normals, transformations):
-    if isinstance(transformations, Vector3DList):
-        return getReplicatedNormals_Vector3DList(normals, transformations)
-    elif isinstance(transformations, Matrix4x4List):
-        return getReplicatedNormals_Matrix4x4List(normals, transformations)
-
-def getReplicatedNormals_Vector3DList(Vector3DList normals, Vector3DList transformations):
-    return normals.repeated(amount = len(transformations))
-
-def getReplicatedNormals_Matrix4x4List(Vector3DList normals, Matrix4x4List matrices):
-    cdef Py_ssize_t normalsAmount = normals.length
-    cdef Vector3DList newNormals = Vector3DList(length = normalsAmount * matrices.length)
-
-    cdef Vector3 *_normals = normals.data
-    cdef Vector3 *_newNormals = newNormals.data
-    cdef Matrix4 *_matrices = matrices.data
-
-    cdef Py_ssize_t i, j
-    cdef Py_ssize_t index = 0
-    for i in range(matrices.length):
-        for j in range(normalsAmount):
-            transformVec3AsDirection(
-                _newNormals + index,
-                _normals + j,
-                _matrices + i)
-            index += 1
-    return newNormals
-
-def getReplicatedLoopEdges(UIntegerList loopEdges, Py_ssize_t amount, Py_ssize_t edgeAmount):
-    cdef Py_ssize_t loopEdgesAmount = loopEdges.length
-    cdef UIntegerList newLoopEdges = UIntegerList(length = amount * loopEdgesAmount)
-
-    cdef unsigned int *_loopEdges = loopEdges.data
-    cdef unsigned int *_newLoopEdges = newLoopEdges.data
-
-    cdef Py_ssize_t i, j, offset
-    cdef Py_ssize_t index = 0
-    for i in range(amount):
-        offset = edgeAmount * i
-        for j in range(loopEdgesAmount):
-            _newLoopEdges[index] = _loopEdges[j] + offset
-            index += 1
-    return newLoopEdges
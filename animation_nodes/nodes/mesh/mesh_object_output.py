@@ -1,16 +1,16 @@
 import bpy
-import bmesh
 from bpy.props import *
 from ... utils.layout import writeText
 from ... base_types import AnimationNode
 from ... utils.animation import isAnimated
-from ... data_structures import UShortList
+from ... utils.mesh_output import setMeshData, forgetTopology
 from ... events import propertyChanged, executionCodeChanged
 
 meshDataTypeItems = [
     ("MESH_DATA", "Mesh", "Mesh object that contains only vertex locations, edge indices and polygon indices", "", 0),
     ("BMESH", "BMesh", "BMesh object", "", 1),
-    ("VERTICES", "Vertices", "A list of vertex locations; The length of this list has to be equal to the amount of vertices the mesh already has", "", 2) ]
+    ("VERTICES", "Vertices", "A list of vertex locations; The length of this list has to be equal to the amount of vertices the mesh already has", "", 2),
+    ("INSTANCED_MESH", "Instanced Mesh", "Mesh that is only replicated when its topology changed", "", 3) ]
 
 class MeshObjectOutputNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_MeshObjectOutputNode"
@@ -47,6 +47,8 @@ class MeshObjectOutputNode(bpy.types.Node, AnimationNode):
             self.newInput("BMesh", "BMesh", "bm")
         elif self.meshDataType == "VERTICES":
             self.newInput("Vector List", "Vertices", "vertices")
+        elif self.meshDataType == "INSTANCED_MESH":
+            self.newInput("Instanced Mesh", "Instanced Mesh", "instancedMesh")
 
         for socket in self.inputs[1:]:
             socket.useIsUsedProperty = True
@@ -63,6 +65,7 @@ class MeshObjectOutputNode(bpy.types.Node, AnimationNode):
         if self.meshDataType == "MESH_DATA": return self.inputs["Mesh"]
         if self.meshDataType == "BMESH": return self.inputs["BMesh"]
         if self.meshDataType == "VERTICES": return self.inputs["Vertices"]
+        if self.meshDataType == "INSTANCED_MESH": return self.inputs["Instanced Mesh"]
 
     def drawAdvanced(self, layout):
         layout.prop(self, "ensureAnimationData")
@@ -87,6 +90,8 @@ class MeshObjectOutputNode(bpy.types.Node, AnimationNode):
             if s["BMesh"].isUsed:        yield "    self.setBMesh(mesh, bm)"
         elif self.meshDataType == "VERTICES":
             if s["Vertices"].isUsed:     yield "    self.setVertices(mesh, vertices)"
+        elif self.meshDataType == "INSTANCED_MESH":
+            if s["Instanced Mesh"].isUsed: yield "    self.setMesh(mesh, instancedMesh)"
 
         yield "    if self.ensureAnimationData:"
         yield "        self.ensureThatMeshHasAnimationData(mesh)"
@@ -102,50 +107,11 @@ class MeshObjectOutputNode(bpy.types.Node, AnimationNode):
         return True
 
     def setMesh(self, outMesh, mesh):
-        # clear existing mesh
-        bmesh.new().to_mesh(outMesh)
-
-        # allocate memory
-        outMesh.vertices.add(len(mesh.vertices))
-        outMesh.edges.add(len(mesh.edges))
-        outMesh.loops.add(len(mesh.polygons.indices))
-        outMesh.polygons.add(len(mesh.polygons))
-
-        # Vertices
-        outMesh.vertices.foreach_set("co", mesh.vertices.asMemoryView())
-        outMesh.vertices.foreach_set("normal", mesh.getVertexNormals().asMemoryView())
-
-        # Edges
-        outMesh.edges.foreach_set("vertices", mesh.edges.asMemoryView())
-
-        # Polygons
-        outMesh.polygons.foreach_set("loop_total", mesh.polygons.polyLengths.asMemoryView())
-        outMesh.polygons.foreach_set("loop_start", mesh.polygons.polyStarts.asMemoryView())
-        outMesh.loops.foreach_set("vertex_index", mesh.polygons.indices.asMemoryView())
-        outMesh.loops.foreach_set("edge_index", mesh.getLoopEdges().asMemoryView())
-
-        # Material Indices
-        materialIndices = UShortList.fromValues(mesh.materialIndices)
-        outMesh.polygons.foreach_set("material_index", materialIndices.asMemoryView())
-
-        # UV Maps
-        for name, data in mesh.getUVMaps():
-            outMesh.uv_layers.new(name = name)
-            outMesh.uv_layers[name].data.foreach_set("uv", data.asMemoryView())
-
-        # Vertex Color Layers
-        for name, data in mesh.getVertexColorLayers():
-            outMesh.vertex_colors.new(name = name)
-            outMesh.vertex_colors[name].data.foreach_set("color", data.asMemoryView())
-
-        if self.validateMesh:
-            outMesh.validate(verbose = self.validateMeshVerbose)
-
-        if self.calculateLooseEdges:
-            outMesh.update(calc_edges_loose = True)
+        setMeshData(outMesh, mesh, self.validateMesh, self.validateMeshVerbose, self.calculateLooseEdges)
 
     def setBMesh(self, mesh, bm):
         bm.to_mesh(mesh)
+        forgetTopology(mesh)
 
     def setVertices(self, mesh, vertices):
         if len(mesh.vertices) != len(vertices):
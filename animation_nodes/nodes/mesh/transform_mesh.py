@@ -1,8 +1,8 @@
 import bpy
 from bpy.props import *
 from mathutils import Matrix
-from . c_utils import replicateMesh
-from ... data_structures import VirtualPyList, Mesh
+from ... algorithms.mesh.replicate_mesh import replicateMesh
+from ... data_structures import VirtualPyList, Mesh, InstancedMesh
 from ... base_types import AnimationNode, VectorizedSocket
 
 transformationTypeItems = [
@@ -13,6 +13,7 @@ transformationTypeItems = [
 class TransformMeshNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_TransformMeshNode"
     bl_label = "Transform Mesh"
+    options = {"THREAD_SAFE"}
 
     transformationType: EnumProperty(name = "Transformation Type", default = "MATRIX",
         items = transformationTypeItems, update = AnimationNode.refresh)
@@ -20,6 +21,11 @@ class TransformMeshNode(bpy.types.Node, AnimationNode):
     joinMeshes: BoolProperty(name = "Join Meshes", default = True,
         update = AnimationNode.refresh)
 
+    deferReplication: BoolProperty(name = "Defer Replication", default = False,
+        description = ("Output an instanced mesh that is only replicated when it is needed, "
+                       "output nodes can update it without replicating edges and polygons"),
+        update = AnimationNode.refresh)
+
     useMeshList: VectorizedSocket.newProperty()
     useTransformationList: VectorizedSocket.newProperty()
 
@@ -37,6 +43,8 @@ class TransformMeshNode(bpy.types.Node, AnimationNode):
 
         if self.hasListInput and not self.joinMeshes:
             self.newOutput("Mesh List", "Meshes", "outMeshes")
+        elif self.outputsInstancedMesh:
+            self.newOutput("Instanced Mesh", "Mesh", "outMesh")
         else:
             self.newOutput("Mesh", "Mesh", "outMesh")
 
@@ -44,17 +52,23 @@ class TransformMeshNode(bpy.types.Node, AnimationNode):
         layout.prop(self, "transformationType", text = "")
         if self.hasListInput:
             layout.prop(self, "joinMeshes")
+        if self.canDeferReplication:
+            layout.prop(self, "deferReplication")
 
     def getExecutionFunctionName(self):
+        # the execution functions must not read node properties,
+        # because the node can be executed on a worker thread
         if self.transformationType == "MATRIX":
             if self.useMeshList:
                 if self.useTransformationList:
-                    return "execute_MultipleMeshes_MultipleMatrices"
+                    return self.withJoinSuffix("execute_MultipleMeshes_MultipleMatrices")
                 else:
-                    return "execute_MultipleMeshes_SingleMatrix"
+                    return self.withJoinSuffix("execute_MultipleMeshes_SingleMatrix")
             else:
                 if self.useTransformationList:
-                    if self.joinMeshes:
+                    if self.outputsInstancedMesh:
+                        return "execute_SingleMesh_MultipleMatrices_Instanced"
+                    elif self.joinMeshes:
                         return "execute_SingleMesh_MultipleMatrices_Joined"
                     else:
                         return "execute_SingleMesh_MultipleMatrices_Separated"
@@ -63,9 +77,9 @@ class TransformMeshNode(bpy.types.Node, AnimationNode):
         else:
             if self.useMeshList:
                 if self.useTransformationList:
-                    return "execute_MultipleMeshes_MultipleVectors"
+                    return self.withJoinSuffix("execute_MultipleMeshes_MultipleVectors")
                 else:
-                    return "execute_MultipleMeshes_SingleVector"
+                    return self.withJoinSuffix("execute_MultipleMeshes_SingleVector")
             else:
                 if self.useTransformationList:
                     if self.joinMeshes:
@@ -75,6 +89,9 @@ class TransformMeshNode(bpy.types.Node, AnimationNode):
                 else:
                     return "execute_Single_Vector"
 
+    def withJoinSuffix(self, functionName):
+        return functionName + ("_Joined" if self.joinMeshes else "")
+
     def execute_Single_Vector(self, mesh, vector):
         mesh.move(vector)
         return mesh
@@ -89,6 +106,10 @@ class TransformMeshNode(bpy.types.Node, AnimationNode):
     def execute_SingleMesh_MultipleMatrices_Joined(self, mesh, matrices):
         return replicateMesh(mesh, matrices)
 
+    def execute_SingleMesh_MultipleMatrices_Instanced(self, mesh, matrices):
+        # transforming the instanced mesh changes its matrices in place
+        return InstancedMesh(mesh, matrices.copy())
+
     def execute_SingleMesh_MultipleVectors_Separated(self, mesh, vectors):
         outMeshes = []
         for vector in vectors:
@@ -108,12 +129,12 @@ class TransformMeshNode(bpy.types.Node, AnimationNode):
     def execute_MultipleMeshes_SingleVector(self, meshes, vector):
         for mesh in meshes:
             mesh.move(vector)
-        return self.joinWhenNecessary(meshes)
+        return meshes
 
     def execute_MultipleMeshes_SingleMatrix(self, meshes, matrix):
         for mesh in meshes:
             mesh.transform(matrix)
-        return self.joinWhenNecessary(meshes)
+        return meshes
 
     def execute_MultipleMeshes_MultipleVectors(self, meshes, vectors):
         _meshes = VirtualPyList.create(meshes, Mesh())
@@ -126,7 +147,7 @@ class TransformMeshNode(bpy.types.Node, AnimationNode):
             m.move(_vectors[i])
             outMeshes.append(m)
 
-        return self.joinWhenNecessary(outMeshes)
+        return outMeshes
 
     def execute_MultipleMeshes_MultipleMatrices(self, meshes, matrices):
         _meshes = VirtualPyList.create(meshes, Mesh())
@@ -139,18 +160,33 @@ class TransformMeshNode(bpy.types.Node, AnimationNode):
             m.transform(_matrices[i])
             outMeshes.append(m)
 
-        return self.joinWhenNecessary(outMeshes)
+        return outMeshes
 
-    def joinWhenNecessary(self, meshes):
-        if self.joinMeshes:
-            return Mesh.join(*meshes)
-        else:
-            return meshes
+    def execute_MultipleMeshes_SingleVector_Joined(self, meshes, vector):
+        return Mesh.join(*self.execute_MultipleMeshes_SingleVector(meshes, vector))
+
+    def execute_MultipleMeshes_SingleMatrix_Joined(self, meshes, matrix):
+        return Mesh.join(*self.execute_MultipleMeshes_SingleMatrix(meshes, matrix))
+
+    def execute_MultipleMeshes_MultipleVectors_Joined(self, meshes, vectors):
+        return Mesh.join(*self.execute_MultipleMeshes_MultipleVectors(meshes, vectors))
+
+    def execute_MultipleMeshes_MultipleMatrices_Joined(self, meshes, matrices):
+        return Mesh.join(*self.execute_MultipleMeshes_MultipleMatrices(meshes, matrices))
 
     @property
     def hasListInput(self):
         return self.useMeshList or self.useTransformationList
 
+    @property
+    def canDeferReplication(self):
+        return (self.transformationType == "MATRIX" and self.joinMeshes and
+                self.useTransformationList and not self.useMeshList)
+
+    @property
+    def outputsInstancedMesh(self):
+        return self.canDeferReplication and self.deferReplication
+
     @property
     def inputMeshesAreModified(self):
         return (not self.hasListInput or
@@ -1,9 +1,11 @@
 import bpy
 from bpy.props import *
-from ... math cimport toPyMatrix4
+from libc.string cimport memcmp
 from ... sockets.info import isList
-from ... events import executionCodeChanged
+from ... utils.handlers import eventHandler
+from ... math cimport Matrix4, toPyMatrix4
 from ... data_structures cimport Matrix4x4List
+from ... events import propertyChanged, executionCodeChanged
 from ... base_types import AnimationNode, VectorizedSocket
 
 outputItems = [	("BASIS", "Basis", "", "NONE", 0),
@@ -11,6 +13,18 @@ outputItems = [	("BASIS", "Basis", "", "NONE", 0),
                 ("PARENT_INVERSE", "Parent Inverse", "", "NONE", 2),
                 ("WORLD", "World", "", "NONE", 3) ]
 
+attributeByOutputType = {
+    "BASIS" : "matrix_basis",
+    "LOCAL" : "matrix_local",
+    "PARENT_INVERSE" : "matrix_parent_inverse",
+    "WORLD" : "matrix_world"
+}
+
+# node identifier -> (attribute, objects, matrices) of the last execution
+lastOutputByIdentifier = {}
+
+# node identifier -> (updated objects, total objects) of the last execution
+updatedAmountByIdentifier = {}
 
 class ObjectMatrixOutputNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ObjectMatrixOutputNode"
@@ -21,6 +35,11 @@ class ObjectMatrixOutputNode(bpy.types.Node, AnimationNode):
     __annotations__["outputType"] = EnumProperty(name = "Type", default = "WORLD",
         items = outputItems, update = executionCodeChanged)
 
+    __annotations__["skipUnchanged"] = BoolProperty(name = "Skip Unchanged", default = False,
+        description = ("Only write matrices that changed since the last execution. "
+                       "Changes done outside of this node are not detected"),
+        update = propertyChanged)
+
     __annotations__["useObjectList"] = VectorizedSocket.newProperty()
     __annotations__["useMatrixList"] = VectorizedSocket.newProperty()
 
@@ -40,6 +59,11 @@ class ObjectMatrixOutputNode(bpy.types.Node, AnimationNode):
         if self.outputType != "WORLD":
             layout.label(text = "This mode might not work as expected", icon = "INFO")
 
+        layout.prop(self, "skipUnchanged")
+        if self.identifier in updatedAmountByIdentifier:
+            layout.label(text = "Updated Objects: {} / {}".format(
+                *updatedAmountByIdentifier[self.identifier]))
+
     def getExecutionFunctionName(self):
         if isList(self.inputs[1].dataType):
             return "execute_List"
@@ -61,28 +85,33 @@ class ObjectMatrixOutputNode(bpy.types.Node, AnimationNode):
     def execute_List(self, list objects, Matrix4x4List matrices):
         cdef:
             Py_ssize_t i
-            str attribute = self.outputType
+            Py_ssize_t updatedAmount = 0
             Py_ssize_t amount = min(len(objects), len(matrices))
-        if attribute == "WORLD":
-            for i in range(amount):
-                obj = objects[i]
-                if obj is not None:
-                    obj.matrix_world = toPyMatrix4(matrices.data + i)
-        elif attribute == "LOCAL":
-            for i in range(amount):
-                obj = objects[i]
-                if obj is not None:
-                    obj.matrix_local = toPyMatrix4(matrices.data + i)
-        elif attribute == "PARENT_INVERSE":
-            for i in range(amount):
-                obj = objects[i]
-                if obj is not None:
-                    obj.matrix_parent_inverse = toPyMatrix4(matrices.data + i)
-        elif attribute == "BASIS":
-            for i in range(amount):
-                obj = objects[i]
-                if obj is not None:
-                    obj.matrix_basis = toPyMatrix4(matrices.data + i)
+            str attribute = attributeByOutputType[self.outputType]
+            list lastObjects = []
+            Matrix4x4List lastMatrices = Matrix4x4List()
+
+        if self.skipUnchanged:
+            lastOutput = lastOutputByIdentifier.get(self.identifier)
+            if lastOutput is not None and lastOutput[0] == attribute:
+                lastObjects = lastOutput[1]
+                lastMatrices = lastOutput[2]
+        else:
+            lastOutputByIdentifier.pop(self.identifier, None)
+
+        for i in range(amount):
+            obj = objects[i]
+            if obj is None:
+                continue
+            if i < len(lastObjects) and lastObjects[i] == obj:
+                if memcmp(matrices.data + i, lastMatrices.data + i, sizeof(Matrix4)) == 0:
+                    continue
+            setattr(obj, attribute, toPyMatrix4(matrices.data + i))
+            updatedAmount += 1
+
+        if self.skipUnchanged:
+            lastOutputByIdentifier[self.identifier] = (attribute, objects[:amount], matrices[:amount])
+        updatedAmountByIdentifier[self.identifier] = (updatedAmount, amount)
         return objects
 
     def getBakeCode(self):
@@ -94,3 +123,8 @@ class ObjectMatrixOutputNode(bpy.types.Node, AnimationNode):
         yield "    object.keyframe_insert('location')"
         yield "    object.keyframe_insert('rotation_euler')"
         yield "    object.keyframe_insert('scale')"
+
+@eventHandler("FILE_LOAD_POST")
+def clearLastOutputs():
+    lastOutputByIdentifier.clear()
+    updatedAmountByIdentifier.clear()
@@ -10,6 +10,7 @@ from ... utils.nodes import newNodeAtCursor, invokeTranslation
 class SimulationInputNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_SimulationInputNode"
     bl_label = "Simulation Input"
+    options = {"NO_INCREMENTAL_EXECUTION"}
 
     simulationBlockID = 0
     simulationBlocks = {}
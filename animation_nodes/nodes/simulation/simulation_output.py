@@ -7,6 +7,7 @@ class SimulationOutputNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_SimulationOutputNode"
     bl_label = "Simulation Output"
     onlySearchTags = True
+    options = {"NO_INCREMENTAL_EXECUTION"}
 
     simulationInputIdentifier: StringProperty(update = propertyChanged)
 
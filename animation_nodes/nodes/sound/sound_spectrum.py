@@ -3,6 +3,7 @@ import numpy
 from math import expm1
 from bpy.props import *
 from ... utils.scene import getFPS
+from ... utils.path import toAbsolutePath
 from ... base_types import AnimationNode
 from ... data_structures import DoubleList
 
@@ -38,6 +39,9 @@ class SoundSpectrumNode(bpy.types.Node, AnimationNode):
     minDuration: FloatProperty(name = "Minimum Duration", default = 0, min = 0,
         description = ("The minimum duration of the sound used to compute the spectrum."
         " High value corresponds to higher spectral resolution but introduce overlapping spectrum"))
+    cacheDirectory: StringProperty(name = "Cache Directory", default = "", subtype = "DIR_PATH",
+        description = ("Directory to store the computed spectra in, so that they are reused"
+        " when the file is opened again. Spectra are only kept in memory if empty"))
 
     samplingMethod: EnumProperty(name = "Sampling Method", default = "EXP",
         items = samplingMethodItems, update = AnimationNode.refresh)
@@ -75,6 +79,7 @@ class SoundSpectrumNode(bpy.types.Node, AnimationNode):
         layout.prop(self, "smoothingSamples")
         layout.prop(self, "kaiserBeta")
         layout.prop(self, "minDuration")
+        layout.prop(self, "cacheDirectory")
 
     def getExecutionFunctionName(self):
         if self.samplingMethod == "EXP": return "executeExponential"
@@ -88,9 +93,7 @@ class SoundSpectrumNode(bpy.types.Node, AnimationNode):
         if not isValidRange(low, high): self.raiseErrorMessage("Invalid interval!")
         if count < 1: self.raiseErrorMessage("Invalid count!")
 
-        spectrum = sound.computeTimeSmoothedSpectrum(frame / getFPS(scene),
-            frame / getFPS(scene) + max(1 / getFPS(scene), self.minDuration),
-            attack, release, self.smoothingSamples, self.kaiserBeta)
+        spectrum = self.computeSpectrum(sound, frame, attack, release, scene)
         maxFrequency = len(spectrum) - 1
 
         scale = expm1(exponentialRate) / (high - low)
@@ -108,9 +111,7 @@ class SoundSpectrumNode(bpy.types.Node, AnimationNode):
         if len(sound.soundSequences) == 0: self.raiseErrorMessage("Empty sound!")
         if not isValidRange(low, high): self.raiseErrorMessage("Invalid interval!")
 
-        spectrum = sound.computeTimeSmoothedSpectrum(frame / getFPS(scene),
-            frame / getFPS(scene) + max(1 / getFPS(scene), self.minDuration),
-            attack, release, self.smoothingSamples, self.kaiserBeta)
+        spectrum = self.computeSpectrum(sound, frame, attack, release, scene)
         maxFrequency = len(spectrum) - 1
 
         reductionFunction = reductionFunctions[self.reductionFunction]
@@ -120,9 +121,7 @@ class SoundSpectrumNode(bpy.types.Node, AnimationNode):
         if len(sound.soundSequences) == 0: self.raiseErrorMessage("Empty sound!")
         if not isValidCustomList(pins): self.raiseErrorMessage("Invalid pins list!")
 
-        spectrum = sound.computeTimeSmoothedSpectrum(frame / getFPS(scene),
-            frame / getFPS(scene) + max(1 / getFPS(scene), self.minDuration),
-            attack, release, self.smoothingSamples, self.kaiserBeta)
+        spectrum = self.computeSpectrum(sound, frame, attack, release, scene)
         maxFrequency = len(spectrum) - 1
 
         bins = DoubleList(len(pins) - 1)
@@ -135,11 +134,15 @@ class SoundSpectrumNode(bpy.types.Node, AnimationNode):
     def executeFull(self, sound, frame, attack, release, amplitude, scene):
         if len(sound.soundSequences) == 0: self.raiseErrorMessage("Empty sound!")
 
-        spectrum = sound.computeTimeSmoothedSpectrum(frame / getFPS(scene),
-            frame / getFPS(scene) + max(1 / getFPS(scene), self.minDuration),
-            attack, release, self.smoothingSamples, self.kaiserBeta)
+        spectrum = self.computeSpectrum(sound, frame, attack, release, scene)
         return DoubleList.fromNumpyArray(spectrum * amplitude)
 
+    def computeSpectrum(self, sound, frame, attack, release, scene):
+        fps = getFPS(scene)
+        cacheDirectory = toAbsolutePath(self.cacheDirectory) if self.cacheDirectory else None
+        return sound.computeTimeSmoothedSpectrum(frame / fps, frame / fps + max(1 / fps, self.minDuration),
+            attack, release, self.smoothingSamples, self.kaiserBeta, cacheDirectory)
+
 def isValidRange(low, high):
     if low >= high: return False
     if low < 0 or low > 1: return False
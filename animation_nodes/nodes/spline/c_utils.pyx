@@ -4,10 +4,10 @@ from libc.math cimport M_PI as PI
 from ... data_structures.meshes.mesh_data import calculateCrossProducts
 from .. mesh.c_utils import matricesFromNormalizedAxisData
 from ... data_structures cimport (
-    Vector3DList, EdgeIndicesList, FloatList,
+    Vector3DList, EdgeIndicesList, FloatList, DoubleList,
     Spline, Matrix4x4List, VirtualFloatList
 )
-from ... math cimport scaleMatrix3x3Part, Vector3, subVec3, angleVec3
+from ... math cimport scaleMatrix3x3Part, Vector3, subVec3, angleVec3, distanceVec3
 
 def getMatricesAlongSpline(Spline spline, Py_ssize_t amount, distribution):
     assert spline.isEvaluable()
@@ -28,6 +28,23 @@ def getMatricesAlongSpline(Spline spline, Py_ssize_t amount, distribution):
 
     return matrices
 
+def projectPointsOnSpline(Spline spline, Vector3DList locations, bint extended):
+    cdef FloatList parameters
+    cdef Vector3DList positions, tangents
+    if extended:
+        parameters = None
+        positions, tangents = spline.projectPointsExtended(locations)
+    else:
+        parameters = spline.projectPoints(locations)
+        positions = spline.samplePoints(parameters, False)
+        tangents = spline.sampleTangents(parameters, False)
+
+    cdef DoubleList distances = DoubleList(length = locations.length)
+    cdef Py_ssize_t i
+    for i in range(locations.length):
+        distances.data[i] = distanceVec3(positions.data + i, locations.data + i)
+    return positions, tangents, distances, parameters
+
 def tiltSplinePoints(Spline spline, VirtualFloatList tilts, bint accumulate):
     cdef FloatList splineTilts = spline.tilts
     cdef Py_ssize_t i
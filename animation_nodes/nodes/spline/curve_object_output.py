@@ -9,6 +9,10 @@ class CurveObjectOutputNode(bpy.types.Node, AnimationNode):
     bl_width_default = 180
     errorHandlingType = "MESSAGE"
 
+    usePackedSplines: BoolProperty(name = "Packed Splines", default = False,
+        description = "Use splines that are stored in shared lists, e.g. from the Splines from Edges node",
+        update = AnimationNode.refresh)
+
     useSplineList: VectorizedSocket.newProperty()
 
     def create(self):
@@ -16,9 +20,12 @@ class CurveObjectOutputNode(bpy.types.Node, AnimationNode):
         socket.defaultDrawType = "PROPERTY_ONLY"
         socket.objectCreationType = "CURVE"
 
-        self.newInput(VectorizedSocket("Spline", "useSplineList",
-            ("Spline", "spline", dict(defaultDrawType = "TEXT_ONLY")),
-            ("Splines", "splines", dict(defaultDrawType = "TEXT_ONLY"))))
+        if self.usePackedSplines:
+            self.newInput("Packed Splines", "Splines", "splines", defaultDrawType = "TEXT_ONLY")
+        else:
+            self.newInput(VectorizedSocket("Spline", "useSplineList",
+                ("Spline", "spline", dict(defaultDrawType = "TEXT_ONLY")),
+                ("Splines", "splines", dict(defaultDrawType = "TEXT_ONLY"))))
 
         self.newInput("Float", "Bevel Depth", "bevelDepth", minValue = 0)
         self.newInput("Integer", "Bevel Resolution", "bevelResolution")
@@ -41,12 +48,15 @@ class CurveObjectOutputNode(bpy.types.Node, AnimationNode):
         for socket in self.inputs[4:]:
             socket.hide = True
 
+    def drawAdvanced(self, layout):
+        layout.prop(self, "usePackedSplines")
+
     def getExecutionCode(self, required):
         yield "if getattr(object, 'type', '') == 'CURVE':"
         yield "    curve = object.data"
 
         s = self.inputs
-        if self.useSplineList:
+        if self.usePackedSplines or self.useSplineList:
             if s["Splines"].isUsed:         yield "    self.setSplines(object, splines)"
         else:
             if s["Spline"].isUsed:          yield "    self.setSplines(object, [spline])"
@@ -3,7 +3,7 @@ from bpy.props import *
 from ... base_types import AnimationNode
 from . c_utils import getMatricesAlongSpline
 from ... data_structures import Mesh, LongList
-from .. mesh.c_utils import getReplicatedVertices
+from ... algorithms.mesh.replicate_mesh import getReplicatedVertices
 from . spline_evaluation_base import SplineEvaluationBase
 from ... algorithms.mesh_generation.circle import getPointsOnCircle
 from ... algorithms.mesh_generation.grid import quadEdges, quadPolygons
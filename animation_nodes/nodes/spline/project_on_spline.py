@@ -1,6 +1,6 @@
 import bpy
 from bpy.props import *
-from ... base_types import AnimationNode
+from ... base_types import AnimationNode, VectorizedSocket
 
 class ProjectOnSplineNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ProjectOnSplineNode"
@@ -11,20 +11,33 @@ class ProjectOnSplineNode(bpy.types.Node, AnimationNode):
         description = "Project point on extended spline. If this is turned on the parameter is not computable",
         update = AnimationNode.refresh)
 
+    useLocationList: VectorizedSocket.newProperty()
+
     def create(self):
         self.newInput("Spline", "Spline", "spline", defaultDrawType = "PROPERTY_ONLY")
-        self.newInput("Vector", "Location", "location")
+        self.newInput(VectorizedSocket("Vector", "useLocationList",
+            ("Location", "location"), ("Locations", "locations")))
 
-        self.newOutput("Vector", "Position", "position")
-        self.newOutput("Vector", "Tangent", "tangent")
-        self.newOutput("Float", "Distance", "distance")
+        self.newOutput(VectorizedSocket("Vector", "useLocationList",
+            ("Position", "position"), ("Positions", "positions")))
+        self.newOutput(VectorizedSocket("Vector", "useLocationList",
+            ("Tangent", "tangent"), ("Tangents", "tangents")))
+        self.newOutput(VectorizedSocket("Float", "useLocationList",
+            ("Distance", "distance"), ("Distances", "distances")))
         if not self.extended:
-            self.newOutput("Float", "Parameter", "parameter")
+            self.newOutput(VectorizedSocket("Float", "useLocationList",
+                ("Parameter", "parameter"), ("Parameters", "parameters")))
 
     def draw(self, layout):
         layout.prop(self, "extended", text = "Extended")
 
     def getExecutionCode(self, required):
+        if self.useLocationList:
+            yield from self.getExecutionCode_List()
+        else:
+            yield from self.getExecutionCode_Single()
+
+    def getExecutionCode_Single(self):
         yield "if spline.isEvaluable():"
         if self.extended:
             yield "    position, tangent = spline.projectExtended(location)"
@@ -38,3 +51,14 @@ class ProjectOnSplineNode(bpy.types.Node, AnimationNode):
         yield "    tangent = Vector((0, 0, 0))"
         yield "    parameter = 0.0"
         yield "    distance = 0.0"
+
+    def getExecutionCode_List(self):
+        yield "if spline.isEvaluable():"
+        yield "    positions, tangents, distances, _parameters = AN.nodes.spline.c_utils.projectPointsOnSpline(spline, locations, self.extended)"
+        if not self.extended:
+            yield "    parameters = DoubleList.fromValues(_parameters)"
+        yield "else:"
+        yield "    positions = Vector3DList.fromValue((0, 0, 0), length = len(locations))"
+        yield "    tangents = Vector3DList.fromValue((0, 0, 0), length = len(locations))"
+        yield "    distances = DoubleList.fromValue(0, length = len(locations))"
+        yield "    parameters = DoubleList.fromValue(0, length = len(locations))"
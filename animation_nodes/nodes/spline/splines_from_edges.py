@@ -1,9 +1,9 @@
 import bpy
 from bpy.props import *
 from ... events import propertyChanged
-from ... data_structures import VirtualDoubleList
+from ... data_structures import VirtualDoubleList, SplineList
 from ... base_types import AnimationNode, VectorizedSocket
-from . splines_from_edges_utils import splinesFromBranches, splinesFromEdges
+from . splines_from_edges_utils import splinesFromBranches, splinesFromEdges, packedSplinesFromEdges
 
 algorithmTypeItems = [
     ("EDGE", "Spline Per Edge", "", "NONE", 0),
@@ -28,6 +28,11 @@ class SplinesFromEdgesNode(bpy.types.Node, AnimationNode):
         description = "Only important if there is a list of radii",
         update = propertyChanged, items = radiusTypeItems)
 
+    packSplines: BoolProperty(name = "Pack Splines", default = False,
+        description = ("Output all splines in shared lists, this is much faster "
+                       "for many splines that are only passed to the Curve Object Output"),
+        update = AnimationNode.refresh)
+
     useRadiusList: VectorizedSocket.newProperty()
 
     def create(self):
@@ -39,20 +44,30 @@ class SplinesFromEdgesNode(bpy.types.Node, AnimationNode):
             ("Radii", "radii"),
             codeProperties = dict(default = 0.1)))
 
-        self.newOutput("Spline List", "Splines", "splines")
+        if self.packSplines:
+            self.newOutput("Packed Splines", "Splines", "splines")
+        else:
+            self.newOutput("Spline List", "Splines", "splines")
 
     def draw(self, layout):
         layout.prop(self, "algorithmType", text = "")
         if self.algorithmType == "EDGE":
             layout.prop(self, "radiusType", text = "")
 
+    def drawAdvanced(self, layout):
+        layout.prop(self, "packSplines")
+
     def execute(self, vertices, edgeIndices, radii):
-        if len(edgeIndices) == 0: return []
+        if len(edgeIndices) == 0:
+            return SplineList() if self.packSplines else []
         if edgeIndices.getMaxIndex() >= len(vertices):
             self.raiseErrorMessage("Invalid Edge Indices.")
 
         radii = VirtualDoubleList.create(radii, 0.1)
         if self.algorithmType == "EDGE":
+            if self.packSplines:
+                return packedSplinesFromEdges(vertices, edgeIndices, radii, self.radiusType)
             return splinesFromEdges(vertices, edgeIndices, radii, self.radiusType)
         else:
-            return splinesFromBranches(vertices, edgeIndices, radii)
+            splines = splinesFromBranches(vertices, edgeIndices, radii)
+            return SplineList.fromSplines(splines) if self.packSplines else splines
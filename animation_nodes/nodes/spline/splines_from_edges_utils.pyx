@@ -1,6 +1,6 @@
 from ... data_structures cimport (
-    Vector3DList, EdgeIndicesList, PolySpline,
-    VirtualDoubleList, FloatList, IntegerList
+    Vector3DList, EdgeIndicesList, PolySpline, SplineList,
+    VirtualDoubleList, FloatList, IntegerList, LongList
 )
 
 def splinesFromBranches(Vector3DList vertices, EdgeIndicesList edges, VirtualDoubleList radii):
@@ -151,3 +151,24 @@ def splinesFromEdges(Vector3DList vertices, EdgeIndicesList edges, VirtualDouble
 
         splines.append(PolySpline.__new__(PolySpline, edgeVertices, edgeRadii))
     return splines
+
+def packedSplinesFromEdges(Vector3DList vertices, EdgeIndicesList edges, VirtualDoubleList radii,
+                           str radiusType):
+    cdef:
+        long i
+        Vector3DList points = Vector3DList(length = edges.length * 2)
+        FloatList pointRadii = FloatList(length = edges.length * 2)
+        bint radiusPerVertex = radiusType == "VERTEX"
+
+    for i in range(edges.length):
+        points.data[i * 2 + 0] = vertices.data[edges.data[i].v1]
+        points.data[i * 2 + 1] = vertices.data[edges.data[i].v2]
+        if radiusPerVertex:
+            pointRadii.data[i * 2 + 0] = radii.get(edges.data[i].v1)
+            pointRadii.data[i * 2 + 1] = radii.get(edges.data[i].v2)
+        else:
+            pointRadii.data[i * 2 + 0] = radii.get(i)
+            pointRadii.data[i * 2 + 1] = radii.get(i)
+
+    return SplineList.fromPolySplinePoints(points, pointRadii,
+        LongList.fromValue(2, length = edges.length))
@@ -0,0 +1,16 @@
+from unittest import TestCase
+from . splines_from_edges_utils import splinesFromEdges, packedSplinesFromEdges
+from ... data_structures import Vector3DList, EdgeIndicesList, DoubleList, VirtualDoubleList
+
+class TestPackedSplinesFromEdges(TestCase):
+    def testSameAsSplines(self):
+        vertices = Vector3DList.fromValues([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 2)])
+        edges = EdgeIndicesList.fromValues([(0, 1), (1, 2), (3, 0)])
+        radii = VirtualDoubleList.create(DoubleList.fromValues([0.1, 0.2, 0.3, 0.4]), 0)
+        for radiusType in ("EDGE", "VERTEX"):
+            splines = splinesFromEdges(vertices, edges, radii, radiusType)
+            packed = packedSplinesFromEdges(vertices, edges, radii, radiusType)
+            self.assertEqual(len(packed), len(splines))
+            for spline, result in zip(splines, packed):
+                self.assertEqual([tuple(v) for v in spline.points], [tuple(v) for v in result.points])
+                self.assertEqual(list(spline.radii), list(result.radii))
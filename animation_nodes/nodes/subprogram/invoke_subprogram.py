@@ -5,6 +5,8 @@ from ... base_types import AnimationNode
 from ... events import executionCodeChanged
 from ... utils.blender_ui import getDpiFactor
 from ... utils.enum_items import cacheEnumItems
+from ... utils.pretty_strings import formatBytes
+from ... utils.lru_cache import getLimitedCache, getSharedLimitedCache, getDataSize
 from ... tree_info import (getSubprogramNetworks,
                            getNodeByIdentifier,
                            getNetworkByIdentifier)
@@ -15,7 +17,13 @@ cacheTypeItems = [
     ("FRAME_BASED", "Once per Frame", ""),
     ("INPUT_BASED", "Once per Input", "")]
 
+evictionTypeItems = [
+    ("LRU", "Least Recently Used", "Remove the results that were not used for the longest time"),
+    ("FRAME_WINDOW", "Frame Window", "Only keep the results of frames close to the current frame")]
+
 oneTimeCache = {}
+# the LRU caches are stored by node identifier and by subprogram identifier,
+# the strictest limits of all nodes that invoke a subprogram are used for its input cache
 frameBasedCache = {}
 inputBasedCache = {}
 
@@ -24,6 +32,7 @@ class InvokeSubprogramNode(bpy.types.Node, AnimationNode):
     bl_label = "Invoke Subprogram"
     bl_width_default = 160
     dynamicLabelType = "HIDDEN_ONLY"
+    options = {"NO_INCREMENTAL_EXECUTION"}
 
     subprogramIdentifier: StringProperty(name = "Subprogram Identifier", default = "",
         update = AnimationNode.refresh)
@@ -37,6 +46,14 @@ class InvokeSubprogramNode(bpy.types.Node, AnimationNode):
     isOutputStorable: BoolProperty(default = False)
     isInputComparable: BoolProperty(default = False)
 
+    cacheMaxEntries: IntProperty(name = "Max Entries", default = 0, min = 0,
+        description = "Maximum amount of cached results (0 = unlimited)")
+    cacheMaxMemory: FloatProperty(name = "Max Memory (MB)", default = 1024, min = 0,
+        description = "Maximum estimated memory used by the cached results (0 = unlimited)")
+    cacheEvictionType: EnumProperty(name = "Eviction", items = evictionTypeItems, default = "LRU")
+    cacheFrameWindow: IntProperty(name = "Frame Window", default = 50, min = 0,
+        description = "Results of frames that are further away from the current frame are removed")
+
     showCacheOptions: BoolProperty(name = "Show Cache Options", default = False,
         description = "Draw cache options in the node for easier access")
 
@@ -84,22 +101,46 @@ class InvokeSubprogramNode(bpy.types.Node, AnimationNode):
             try: return True, oneTimeCache[self.identifier]
             except: pass
         if self.cacheType == "FRAME_BASED":
-            try: return True, frameBasedCache[self.identifier][str(self.nodeTree.scene.frame_current)]
-            except: pass
+            return self.getFrameBasedCache().lookup(self.nodeTree.scene.frame_current)
         if self.cacheType == "INPUT_BASED":
-            try: return True, inputBasedCache[self.subprogramIdentifier][self.getArgsHash(args)]
-            except: pass
+            return self.getInputBasedCache().lookup(self.getArgsHash(args))
 
         return False, None
 
     def setCacheData(self, data, *args):
         if self.cacheType == "ONE_TIME": oneTimeCache[self.identifier] = data
         elif self.cacheType == "FRAME_BASED":
-            if self.identifier not in frameBasedCache: frameBasedCache[self.identifier] = {}
-            frameBasedCache[self.identifier][str(self.nodeTree.scene.frame_current)] = data
+            frame = self.nodeTree.scene.frame_current
+            cache = self.getFrameBasedCache()
+            if self.cacheEvictionType == "FRAME_WINDOW":
+                window = self.cacheFrameWindow
+                cache.removeWhere(lambda key: abs(key - frame) > window)
+            cache.set(frame, data)
         elif self.cacheType == "INPUT_BASED":
-            if self.subprogramIdentifier not in inputBasedCache: inputBasedCache[self.subprogramIdentifier] = {}
-            inputBasedCache[self.subprogramIdentifier][self.getArgsHash(args)] = data
+            self.getInputBasedCache().set(self.getArgsHash(args), data)
+
+    def getFrameBasedCache(self):
+        return getLimitedCache(frameBasedCache, self.identifier,
+                               self.cacheMaxEntries, self.cacheMaxBytes)
+
+    def getInputBasedCache(self):
+        return getSharedLimitedCache(inputBasedCache, self.subprogramIdentifier, self.identifier,
+                                     self.cacheMaxEntries, self.cacheMaxBytes)
+
+    @property
+    def cacheMaxBytes(self):
+        return int(self.cacheMaxMemory * 1024 ** 2)
+
+    def getCacheMemoryInfo(self):
+        '''Returns the amount of entries and the estimated bytes.'''
+        if self.cacheType == "ONE_TIME" and self.identifier in oneTimeCache:
+            return 1, getDataSize(oneTimeCache[self.identifier])
+        if self.cacheType == "FRAME_BASED": cache = frameBasedCache.get(self.identifier)
+        elif self.cacheType == "INPUT_BASED": cache = inputBasedCache.get(self.subprogramIdentifier)
+        else: cache = None
+
+        if cache is None: return 0, 0
+        return len(cache), cache.usedBytes
 
     def getArgsHash(self, args):
         return tuple(hash(arg.freeze() if hasattr(arg, "freeze") else arg) for arg in args)
@@ -130,6 +171,8 @@ class InvokeSubprogramNode(bpy.types.Node, AnimationNode):
 
     def drawAdvanced(self, layout):
         self.drawCacheOptions(layout)
+        if self.canCache and self.cacheType in ("FRAME_BASED", "INPUT_BASED"):
+            self.drawCacheLimits(layout)
         col = layout.column()
         col.active = self.cacheType == "DISABLED"
         col.prop(self, "showCacheOptions")
@@ -143,8 +186,20 @@ class InvokeSubprogramNode(bpy.types.Node, AnimationNode):
             col.label(text = "This caching method is not available:")
             if not self.isOutputStorable: col.label(text = "  - The output is not storable")
             if not self.isInputComparable: col.label(text = "  - The input is not comparable")
+        elif self.cacheType != "DISABLED":
+            amount, size = self.getCacheMemoryInfo()
+            layout.label(text = "Cached: {} ({} entries)".format(formatBytes(size), amount))
         self.invokeFunction(layout, "clearCache", text = "Clear Cache")
 
+    def drawCacheLimits(self, layout):
+        col = layout.column(align = True)
+        col.prop(self, "cacheMaxEntries")
+        col.prop(self, "cacheMaxMemory")
+        if self.cacheType == "FRAME_BASED":
+            col.prop(self, "cacheEvictionType", text = "")
+            if self.cacheEvictionType == "FRAME_WINDOW":
+                col.prop(self, "cacheFrameWindow")
+
     def checkCachingPossibilities(self):
         self.isInputComparable = all(socket.comparable for socket in self.inputs)
         self.isOutputStorable = all(socket.storable for socket in self.outputs)
@@ -154,6 +209,14 @@ class InvokeSubprogramNode(bpy.types.Node, AnimationNode):
         frameBasedCache.pop(self.identifier, None)
         inputBasedCache.pop(self.subprogramIdentifier, None)
 
+    def delete(self):
+        oneTimeCache.pop(self.identifier, None)
+        frameBasedCache.pop(self.identifier, None)
+        # other nodes can still use the input cache of the subprogram
+        cache = inputBasedCache.get(self.subprogramIdentifier)
+        if cache is not None:
+            cache.removeOwner(self.identifier)
+
 
     @property
     def subprogramNode(self):
@@ -1,8 +1,8 @@
 import bpy
 from bpy.props import *
-from mathutils.kdtree import KDTree
+import numpy as np
 from ... base_types import AnimationNode
-from ... data_structures import EdgeIndicesList
+from ... data_structures import KDTree, EdgeIndicesList
 from .. mesh.c_utils import calculateEdgeLengths
 
 modeItems = [
@@ -41,49 +41,24 @@ class FindClosePointsNode(bpy.types.Node, AnimationNode):
             yield "distances = self.calculateEdgeLengths(points, edges)"
 
     def execute_Amount(self, points, amount):
-        kdTree = self.buildKDTree(points)
-        amount = max(0, amount)
-
-        edges = EdgeIndicesList()
-        edgeSet = set()
-
-        for index, point in enumerate(points):
-            for foundPoint, foundIndex, distance in kdTree.find_n(point, amount + 1):
-                if foundIndex == index:
-                    continue
-
-                edge = (foundIndex, index) if foundIndex < index else (index, foundIndex)
-                if edge not in edgeSet:
-                    edgeSet.add(edge)
-                    edges.append(edge)
-
-        return edges
+        kdTree = KDTree(points)
+        foundIndices, _, _, lengths = kdTree.findNNearest(points, max(0, amount) + 1)
+        return self.createEdges(foundIndices, lengths)
 
     def execute_Distance(self, points, maxDistance):
-        kdTree = self.buildKDTree(points)
-        maxDistance = max(0, maxDistance)
-
-        edges = EdgeIndicesList()
-        edgeSet = set()
-
-        for index, point in enumerate(points):
-            for foundPoint, foundIndex, distance in kdTree.find_range(point, maxDistance):
-                if foundIndex == index:
-                    continue
-
-                edge = (foundIndex, index) if foundIndex < index else (index, foundIndex)
-                if edge not in edgeSet:
-                    edgeSet.add(edge)
-                    edges.append(edge)
-
-        return edges
-
-    def buildKDTree(self, points):
-        kdTree = KDTree(len(points))
-        for i, vector in enumerate(points):
-            kdTree.insert(vector, i)
-        kdTree.balance()
-        return kdTree
+        kdTree = KDTree(points)
+        foundIndices, _, _, lengths = kdTree.findInRadius(points, max(0, maxDistance))
+        return self.createEdges(foundIndices, lengths)
+
+    def createEdges(self, foundIndices, lengths):
+        '''Every edge is created once, in the order in which it is found first.'''
+        found = foundIndices.asNumpyArray()
+        queries = np.repeat(np.arange(len(lengths)), lengths.asNumpyArray())
+        isOtherPoint = found != queries
+        edges = np.sort(np.stack((queries[isOtherPoint], found[isOtherPoint]), axis = -1), axis = 1)
+        _, firstIndices = np.unique(edges, axis = 0, return_index = True)
+        edges = edges[np.sort(firstIndices)]
+        return EdgeIndicesList.fromBuffer(edges.astype(np.uint32).ravel())
 
     def calculateEdgeLengths(self, points, edges):
         return calculateEdgeLengths(points, edges)
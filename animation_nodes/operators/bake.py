@@ -1,6 +1,8 @@
 import bpy
 from bpy.props import *
 from .. preferences import getPreferences
+from .. events import executionCodeChanged
+from .. execution.frame_cache import startBakeSession, finishBakeSession
 
 class BakeAnimation(bpy.types.Operator):
     bl_idname = "an.bake_to_keyframes"
@@ -39,3 +41,44 @@ class BakeAnimation(bpy.types.Operator):
         getPreferences().executionCode.type = "DEFAULT"
         bpy.context.window_manager.event_timer_remove(self.timer)
         return {"FINISHED"}
+
+class BakeFrameCaches(bpy.types.Operator):
+    bl_idname = "an.bake_frame_caches"
+    bl_label = "Bake Frame Caches"
+    bl_description = "Playback animation and write the data of all Frame Cache nodes into their files"
+
+    startFrame: IntProperty(default = 1)
+    endFrame: IntProperty(default = 250)
+
+    def invoke(self, context, event):
+        context.window_manager.modal_handler_add(self)
+        self.timer = context.window_manager.event_timer_add(0.001, window = context.window)
+
+        # nodes that use baked data have to be executed again
+        startBakeSession()
+        executionCodeChanged()
+
+        self.scene = context.scene
+        self.scene.frame_set(self.startFrame)
+        return {"RUNNING_MODAL"}
+
+    def modal(self, context, event):
+        if event.type in ("RIGHTMOUSE", "ESC"):
+            return self.finish()
+
+        currentFrame = self.scene.frame_current
+
+        if event.type == "TIMER":
+            self.scene.frame_set(currentFrame + 1)
+            context.view_layer.update()
+
+        if self.scene.frame_current >= self.endFrame:
+            return self.finish()
+
+        return {"RUNNING_MODAL"}
+
+    def finish(self):
+        finishBakeSession()
+        executionCodeChanged()
+        bpy.context.window_manager.event_timer_remove(self.timer)
+        return {"FINISHED"}
@@ -93,7 +93,9 @@ class ExecutionCodeProperties(bpy.types.PropertyGroup):
         ("DEFAULT", "Default", "", "NONE", 0),
         ("MONITOR", "Monitor Execution", "", "NONE", 1),
         ("MEASURE", "Measure Execution Times", "", "NONE", 2),
-        ("BAKE", "Bake", "", "NONE", 3)]
+        ("BAKE", "Bake", "", "NONE", 3),
+        ("INCREMENTAL", "Incremental Execution", "Only execute nodes whose inputs changed since the last execution", "NONE", 4),
+        ("PARALLEL", "Parallel Execution", "Execute independent branches of thread safe nodes on multiple threads", "NONE", 5)]
 
     type: EnumProperty(name = "Execution Code Type", default = "DEFAULT",
         description = "Different execution codes can be useful in different contexts",
@@ -0,0 +1,29 @@
+import bpy
+from .. data_structures import InstancedMesh
+from .. base_types import AnimationNodeSocket
+from . implicit_conversion import registerImplicitConversion
+
+class InstancedMeshSocket(bpy.types.NodeSocket, AnimationNodeSocket):
+    bl_idname = "an_InstancedMeshSocket"
+    bl_label = "Instanced Mesh Socket"
+    dataType = "Instanced Mesh"
+    drawColor = (0.2, 0.7, 1, 0.6)
+    storable = True
+    comparable = False
+
+    @classmethod
+    def getDefaultValue(cls):
+        return InstancedMesh()
+
+    @classmethod
+    def getCopyExpression(cls):
+        return "value.copy()"
+
+    @classmethod
+    def correctValue(cls, value):
+        if isinstance(value, InstancedMesh):
+            return value, 0
+        return cls.getDefaultValue(), 2
+
+registerImplicitConversion("Instanced Mesh", "Mesh", "value.toMesh()")
+registerImplicitConversion("Mesh", "Instanced Mesh", "InstancedMesh.fromMesh(value)")
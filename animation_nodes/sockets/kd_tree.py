@@ -1,6 +1,6 @@
 import bpy
-from mathutils.kdtree import KDTree
 from .. base_types import AnimationNodeSocket
+from .. data_structures import KDTree
 
 class KDTreeSocket(bpy.types.NodeSocket, AnimationNodeSocket):
     bl_idname = "an_KDTreeSocket"
@@ -12,9 +12,7 @@ class KDTreeSocket(bpy.types.NodeSocket, AnimationNodeSocket):
 
     @classmethod
     def getDefaultValue(cls):
-        kdTree = KDTree(0)
-        kdTree.balance()
-        return kdTree
+        return KDTree()
 
     @classmethod
     def correctValue(cls, value):
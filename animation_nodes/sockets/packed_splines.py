@@ -0,0 +1,29 @@
+import bpy
+from .. data_structures import SplineList
+from .. base_types import AnimationNodeSocket
+from . implicit_conversion import registerImplicitConversion
+
+class PackedSplinesSocket(bpy.types.NodeSocket, AnimationNodeSocket):
+    bl_idname = "an_PackedSplinesSocket"
+    bl_label = "Packed Splines Socket"
+    dataType = "Packed Splines"
+    drawColor = (0.8, 0.4, 1.0, 0.5)
+    storable = True
+    comparable = False
+
+    @classmethod
+    def getDefaultValue(cls):
+        return SplineList()
+
+    @classmethod
+    def getCopyExpression(cls):
+        return "value.copy()"
+
+    @classmethod
+    def correctValue(cls, value):
+        if isinstance(value, SplineList):
+            return value, 0
+        return cls.getDefaultValue(), 2
+
+registerImplicitConversion("Packed Splines", "Spline List", "value.toSplines()")
+registerImplicitConversion("Spline List", "Packed Splines", "SplineList.fromSplines(value)")
@@ -172,6 +172,23 @@ class NodeNetwork:
         return nodeByID[nodeID]
 
 
+    def getAnimationNodeDependencies(self):
+        '''
+        Maps the id of every animation node in this network
+        to the set of node ids its inputs are linked to.
+        '''
+        socketsByNode = self.forestData.socketsByNode
+        linkedSockets = self.forestData.linkedSockets
+        animationNodes = self.forestData.animationNodes
+
+        dependencies = {}
+        for nodeID in self.nodeIDs:
+            if nodeID in animationNodes:
+                dependencies[nodeID] = {otherSocketID[0]
+                    for socketID in socketsByNode[nodeID][0]
+                    for otherSocketID in linkedSockets[socketID]}
+        return dependencies
+
     def getSortedAnimationNodes(self, nodeByID = None):
         '''
         Used Algorithm:
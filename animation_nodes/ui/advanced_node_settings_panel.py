@@ -16,3 +16,4 @@ class NodeSettingsPanel(bpy.types.Panel):
     def draw(self, context):
         node = bpy.context.active_node
         node.drawAdvanced(self.layout)
+        node.drawOutputCacheSettings(self.layout)
@@ -45,6 +45,8 @@ class DeveloperPanel(bpy.types.Panel):
         row.prop(executionCode, "type", text = "")
         if executionCode.type == "MEASURE":
             row.operator("an.reset_measurements", text = "", icon = "RECOVER_LAST")
+        elif executionCode.type == "INCREMENTAL":
+            row.operator("an.reset_incremental_execution", text = "", icon = "RECOVER_LAST")
 
         row = col.row(align = True)
         row.operator("an.print_current_execution_code", text = "Print", icon = "CONSOLE")
@@ -65,3 +67,7 @@ class DeveloperPanel(bpy.types.Panel):
         props.function = profiling.function
         props.sort = profiling.sort
         props.output = profiling.output
+
+        row = col.row(align = True)
+        row.operator("an.export_chrome_trace", text = "Export Chrome Trace", icon = "EXPORT")
+        row.operator("an.reset_execution_events", text = "", icon = "RECOVER_LAST")
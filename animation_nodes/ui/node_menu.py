@@ -592,6 +592,7 @@ class AnimationMenu(bpy.types.Menu):
         insertNode(layout, "an_TimeInfoNode", "Time Info")
         insertNode(layout, "an_DelayTimeNode", "Delay")
         insertNode(layout, "an_RepeatTimeNode", "Repeat")
+        insertNode(layout, "an_FrameCacheNode", "Frame Cache")
         layout.separator()
         for dataType in numericalDataTypes:
             insertNode(layout, "an_AnimateDataNode", "Animate " + dataType, {"dataType" : repr(dataType)})
@@ -42,6 +42,7 @@ class FloatingNodeSettingsPanel(bpy.types.Operator):
 
         if self.mode == "ADVANCED_SETTINGS":
             node.drawAdvanced(layout)
+            node.drawOutputCacheSettings(layout)
         elif self.mode == "SOCKET_SETTINGS":
             drawSocketLists(layout, node)
 
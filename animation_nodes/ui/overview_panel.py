@@ -36,3 +36,7 @@ class OverviewPanel(bpy.types.Panel):
         props = layout.operator("an.bake_to_keyframes", text = "Bake to Keyframes", icon = "DECORATE_KEYFRAME")
         props.startFrame = context.scene.frame_start
         props.endFrame = context.scene.frame_end
+
+        props = layout.operator("an.bake_frame_caches", text = "Bake Frame Caches", icon = "FILE_CACHE")
+        props.startFrame = context.scene.frame_start
+        props.endFrame = context.scene.frame_end
@@ -6,7 +6,7 @@ cpdef findListSegment(long amount, bint cyclic, float parameter):
     findListSegment_LowLevel(amount, cyclic, parameter, indices, &factor)
     return [indices[0], indices[1]], factor
 
-cdef void findListSegment_LowLevel(long amount, bint cyclic, float parameter, long* index, float* factor):
+cdef void findListSegment_LowLevel(long amount, bint cyclic, float parameter, long* index, float* factor) nogil:
     if not cyclic:
         if parameter < 1:
             index[0] = <long>floor(parameter * (amount - 1))
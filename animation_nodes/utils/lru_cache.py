@@ -0,0 +1,181 @@
+import sys
+import struct
+import hashlib
+from collections import OrderedDict
+
+class LRUCache:
+    '''
+    Stores values until the amount of entries or the estimated memory
+    usage exceeds the limits. Then the least recently used entries are
+    removed first. A limit of zero means that there is no limit.
+    '''
+    def __init__(self, maxEntries = 0, maxBytes = 0):
+        self.entries = OrderedDict()
+        self.maxEntries = maxEntries
+        self.maxBytes = maxBytes
+        self.usedBytes = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def lookup(self, key):
+        '''Returns a (found, value) tuple and marks the entry as recently used.'''
+        entry = self.entries.get(key)
+        if entry is None:
+            return False, None
+        self.entries.move_to_end(key)
+        return True, entry[0]
+
+    def get(self, key, default = None):
+        found, value = self.lookup(key)
+        return value if found else default
+
+    def set(self, key, value, size = None):
+        if size is None:
+            size = getDataSize(value)
+        self.remove(key)
+        if self.maxBytes > 0 and size > self.maxBytes:
+            return
+        self.entries[key] = (value, size)
+        self.usedBytes += size
+        self.removeExceedingEntries()
+
+    def remove(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.usedBytes -= entry[1]
+
+    def removeWhere(self, condition):
+        for key in [key for key in self.entries if condition(key)]:
+            self.remove(key)
+
+    def removeOldest(self):
+        _, (_, size) = self.entries.popitem(last = False)
+        self.usedBytes -= size
+
+    def setLimits(self, maxEntries, maxBytes):
+        self.maxEntries = maxEntries
+        self.maxBytes = maxBytes
+        self.removeExceedingEntries()
+
+    def removeExceedingEntries(self):
+        while len(self.entries) > 0 and self.exceedsLimits():
+            self.removeOldest()
+
+    def exceedsLimits(self):
+        return ((self.maxEntries > 0 and len(self.entries) > self.maxEntries) or
+                (self.maxBytes > 0 and self.usedBytes > self.maxBytes))
+
+    def clear(self):
+        self.entries.clear()
+        self.usedBytes = 0
+
+class SharedLRUCache(LRUCache):
+    '''
+    Cache that is used by multiple owners with their own limits.
+    The strictest limits of all owners are applied.
+    '''
+    def __init__(self):
+        super().__init__()
+        self.limitsByOwner = {}
+
+    def setOwnerLimits(self, owner, maxEntries, maxBytes):
+        if self.limitsByOwner.get(owner) != (maxEntries, maxBytes):
+            self.limitsByOwner[owner] = (maxEntries, maxBytes)
+            self.updateLimits()
+
+    def removeOwner(self, owner):
+        if self.limitsByOwner.pop(owner, None) is not None:
+            self.updateLimits()
+
+    def updateLimits(self):
+        limits = self.limitsByOwner.values()
+        self.setLimits(getStrictestLimit(maxEntries for maxEntries, _ in limits),
+                       getStrictestLimit(maxBytes for _, maxBytes in limits))
+
+def getStrictestLimit(limits):
+    return min((limit for limit in limits if limit > 0), default = 0)
+
+
+def getLimitedCache(caches, key, maxEntries, maxBytes):
+    '''Get the cache from the dict and update its limits, or create a new one.'''
+    cache = caches.get(key)
+    if cache is None:
+        cache = LRUCache(maxEntries, maxBytes)
+        caches[key] = cache
+    elif cache.maxEntries != maxEntries or cache.maxBytes != maxBytes:
+        cache.setLimits(maxEntries, maxBytes)
+    return cache
+
+def getSharedLimitedCache(caches, key, owner, maxEntries, maxBytes):
+    '''Get the shared cache from the dict and update the limits of the owner, or create a new one.'''
+    cache = caches.get(key)
+    if cache is None:
+        cache = SharedLRUCache()
+        caches[key] = cache
+    cache.setOwnerLimits(owner, maxEntries, maxBytes)
+    return cache
+
+def getDataSize(value):
+    '''Estimation of the amount of bytes used by the value.'''
+    if hasattr(value, "getMemoryUsage"):
+        return value.getMemoryUsage()
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(getDataSize(element) for element in value)
+    return sys.getsizeof(value)
+
+immutableTypes = (bool, int, float, str, bytes, type(None))
+
+def toHashableKey(value):
+    '''
+    Returns a hashable object that is equal for equal values.
+    Raises a TypeError when the value can not be represented by a key,
+    so that mutable objects are never compared by their identity.
+    '''
+    if isinstance(value, immutableTypes):
+        return value
+    if isinstance(value, (tuple, list)):
+        return tuple(toHashableKey(element) for element in value)
+    if isinstance(value, getDigestTypes()):
+        # a hit returns the cached outputs without comparing the inputs,
+        # so the key has to be collision resistant
+        return (type(value), getContentDigest(value))
+    if hasattr(value, "freeze") and hasattr(value, "copy"):
+        return value.copy().freeze()
+    raise TypeError("cannot create key for type '{}'".format(type(value).__name__))
+
+def getDigestTypes():
+    # imported here to avoid a circular import
+    from .. data_structures import CList, PolygonIndicesList, Mesh
+    return (CList, PolygonIndicesList, Mesh)
+
+def getContentDigest(value):
+    digest = hashlib.blake2b(digest_size = 32)
+    updateContentDigest(digest, value)
+    return digest.digest()
+
+def updateContentDigest(digest, value):
+    from .. data_structures import CList, PolygonIndicesList, Mesh
+    if isinstance(value, CList):
+        # the size separates the buffers of consecutive lists
+        buffer = value.asMemoryView()
+        digest.update(struct.pack("<Q", buffer.nbytes))
+        digest.update(buffer)
+    elif isinstance(value, PolygonIndicesList):
+        # the poly starts are implied by the lengths
+        updateContentDigest(digest, value.indices)
+        updateContentDigest(digest, value.polyLengths)
+    elif isinstance(value, Mesh):
+        for data in (value.vertices, value.edges, value.polygons, value.materialIndices):
+            updateContentDigest(digest, data)
+        for domain, name, data in value.attributes.iterAttributes():
+            for text in (domain, name, type(data).__name__):
+                encoded = text.encode()
+                digest.update(struct.pack("<Q", len(encoded)))
+                digest.update(encoded)
+            updateContentDigest(digest, data)
+    else:
+        raise TypeError("cannot create digest for type '{}'".format(type(value).__name__))
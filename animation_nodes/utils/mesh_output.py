@@ -0,0 +1,100 @@
+'''
+Output nodes remember the topology they wrote into a Blender mesh.
+When the next mesh has the same topology, only the vertex data has to be
+updated instead of rebuilding the whole Blender mesh.
+'''
+
+import bmesh
+from . handlers import eventHandler
+from .. data_structures import UShortList, InstancedMesh
+
+topologyKeyByMeshPointer = {}
+
+def getTopologyKey(outMesh, mesh):
+    # the sizes of the Blender mesh detect changes done outside of Animation Nodes
+    return (mesh.getTopologyHash(), mesh.getDomainLength("POINT"),
+            tuple(mesh.getUVMapNames()), tuple(mesh.getVertexColorLayerNames()),
+            len(outMesh.vertices), len(outMesh.edges), len(outMesh.loops), len(outMesh.polygons),
+            tuple(outMesh.uv_layers.keys()), tuple(outMesh.vertex_colors.keys()))
+
+def hasSameTopology(outMesh, mesh):
+    key = topologyKeyByMeshPointer.get(outMesh.as_pointer())
+    return key is not None and key == getTopologyKey(outMesh, mesh)
+
+def rememberTopology(outMesh, mesh):
+    topologyKeyByMeshPointer[outMesh.as_pointer()] = getTopologyKey(outMesh, mesh)
+
+def forgetTopology(outMesh):
+    topologyKeyByMeshPointer.pop(outMesh.as_pointer(), None)
+
+def setMeshData(outMesh, mesh, validate = False, validateVerbose = False, calculateLooseEdges = False):
+    if hasSameTopology(outMesh, mesh):
+        updateVertexData(outMesh, mesh)
+    else:
+        # the key of an instanced mesh is not the key of its replicated mesh,
+        # so the key is taken from the mesh that is passed in
+        rebuildMesh(outMesh, mesh.toMesh() if isinstance(mesh, InstancedMesh) else mesh)
+        rememberTopology(outMesh, mesh)
+
+    # both paths have to create the same Blender mesh for the same input
+    if validate:
+        outMesh.validate(verbose = validateVerbose)
+
+    if calculateLooseEdges:
+        outMesh.update(calc_edges_loose = True)
+
+def rebuildMesh(outMesh, mesh):
+    # clear existing mesh
+    bmesh.new().to_mesh(outMesh)
+
+    # allocate memory
+    outMesh.vertices.add(len(mesh.vertices))
+    outMesh.edges.add(len(mesh.edges))
+    outMesh.loops.add(len(mesh.polygons.indices))
+    outMesh.polygons.add(len(mesh.polygons))
+
+    # Vertices
+    outMesh.vertices.foreach_set("co", mesh.vertices.asMemoryView())
+    outMesh.vertices.foreach_set("normal", mesh.getVertexNormals().asMemoryView())
+
+    # Edges
+    outMesh.edges.foreach_set("vertices", mesh.edges.asMemoryView())
+
+    # Polygons
+    outMesh.polygons.foreach_set("loop_total", mesh.polygons.polyLengths.asMemoryView())
+    outMesh.polygons.foreach_set("loop_start", mesh.polygons.polyStarts.asMemoryView())
+    outMesh.loops.foreach_set("vertex_index", mesh.polygons.indices.asMemoryView())
+    outMesh.loops.foreach_set("edge_index", mesh.getLoopEdges().asMemoryView())
+
+    # Material Indices
+    materialIndices = UShortList.fromValues(mesh.materialIndices)
+    outMesh.polygons.foreach_set("material_index", materialIndices.asMemoryView())
+
+    # UV Maps
+    for name, data in mesh.getUVMaps():
+        outMesh.uv_layers.new(name = name)
+        outMesh.uv_layers[name].data.foreach_set("uv", data.asMemoryView())
+
+    # Vertex Color Layers
+    for name, data in mesh.getVertexColorLayers():
+        outMesh.vertex_colors.new(name = name)
+        outMesh.vertex_colors[name].data.foreach_set("color", data.asMemoryView())
+
+def updateVertexData(outMesh, mesh):
+    outMesh.vertices.foreach_set("co", mesh.vertices.asMemoryView())
+    outMesh.vertices.foreach_set("normal", mesh.getVertexNormals().asMemoryView())
+
+    for name, data in mesh.getUVMaps():
+        if name in outMesh.uv_layers:
+            outMesh.uv_layers[name].data.foreach_set("uv", data.asMemoryView())
+
+    for name, data in mesh.getVertexColorLayers():
+        if name in outMesh.vertex_colors:
+            outMesh.vertex_colors[name].data.foreach_set("color", data.asMemoryView())
+
+    # foreach_set does not tag the mesh for an update of the viewport
+    outMesh.update_tag()
+
+@eventHandler("FILE_LOAD_POST")
+def clearTopologyKeys():
+    topologyKeyByMeshPointer.clear()
@@ -0,0 +1,46 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+_executor = None
+_threadState = threading.local()
+
+def getThreadAmount():
+    return os.cpu_count() or 1
+
+def getExecutor():
+    '''
+    All parallel work of Animation Nodes shares this thread pool,
+    so that the amount of worker threads never exceeds the cpu count.
+    '''
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers = getThreadAmount(),
+                                       thread_name_prefix = "AN Worker",
+                                       initializer = _markWorkerThread)
+    return _executor
+
+def _markWorkerThread():
+    _threadState.isWorker = True
+
+def isWorkerThread():
+    return getattr(_threadState, "isWorker", False)
+
+def splitRange(amount, partAmount):
+    partAmount = max(1, min(amount, partAmount))
+    return [(amount * i // partAmount, amount * (i + 1) // partAmount)
+            for i in range(partAmount)]
+
+def runParts(function, parts):
+    '''
+    Calls function(start, end) for every part. On a worker thread the parts
+    are executed one after the other, because waiting for other tasks of
+    the same pool from inside the pool can deadlock.
+    '''
+    if len(parts) == 1 or isWorkerThread():
+        for start, end in parts:
+            function(start, end)
+    else:
+        starts, ends = zip(*parts)
+        for _ in getExecutor().map(function, starts, ends):
+            pass
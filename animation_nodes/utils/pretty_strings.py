@@ -9,3 +9,9 @@ def formatQuaternion(quaternion):
 
 def formatFloat(number):
     return "{:>8.3f}".format(number)
+
+def formatBytes(amount):
+    for unit in ("B", "KB", "MB"):
+        if amount < 1024: return "{:.1f} {}".format(amount, unit)
+        amount /= 1024
+    return "{:.2f} GB".format(amount)
@@ -0,0 +1,55 @@
+from unittest import TestCase
+from . lru_cache import getSharedLimitedCache, toHashableKey
+from .. data_structures.meshes.test_mesh_data import createQuad
+from .. data_structures import FloatList, DoubleList, PolygonIndicesList
+
+class TestSharedLimitedCache(TestCase):
+    def testStrictestLimitsAreUsed(self):
+        caches = {}
+        cache = getSharedLimitedCache(caches, "subprogram", "node A", 10, 0)
+        for i in range(10):
+            cache.set(i, i, size = 100)
+        self.assertIs(getSharedLimitedCache(caches, "subprogram", "node B", 0, 500), cache)
+        self.assertEqual(len(cache), 5)
+
+        # the order in which the owners use the cache does not matter
+        getSharedLimitedCache(caches, "subprogram", "node A", 10, 0)
+        self.assertEqual((cache.maxEntries, cache.maxBytes), (10, 500))
+        getSharedLimitedCache(caches, "subprogram", "node B", 3, 0)
+        self.assertEqual((cache.maxEntries, cache.maxBytes), (3, 0))
+        self.assertEqual(len(cache), 3)
+
+    def testRemoveOwner(self):
+        cache = getSharedLimitedCache({}, "subprogram", "node A", 2, 0)
+        cache.setOwnerLimits("node B", 5, 0)
+        cache.removeOwner("node A")
+        self.assertEqual(cache.maxEntries, 5)
+        cache.removeOwner("node B")
+        self.assertEqual(cache.maxEntries, 0)
+
+class TestHashableKey(TestCase):
+    def testEqualContent(self):
+        self.assertEqual(toHashableKey([FloatList.fromValues([1, 2]), 3]),
+                         toHashableKey([FloatList.fromValues([1, 2]), 3]))
+
+    def testDifferentContent(self):
+        self.assertNotEqual(toHashableKey(FloatList.fromValues([1, 2])),
+                            toHashableKey(FloatList.fromValues([1, 3])))
+        self.assertNotEqual(toHashableKey(FloatList.fromValues([1, 2])),
+                            toHashableKey(DoubleList.fromValues([1, 2])))
+
+    def testSameIndicesInDifferentPolygons(self):
+        polygons1 = PolygonIndicesList.fromValues([(0, 1, 2, 3), (0, 1, 2)])
+        polygons2 = PolygonIndicesList.fromValues([(0, 1, 2), (3, 0, 1, 2)])
+        self.assertNotEqual(toHashableKey(polygons1), toHashableKey(polygons2))
+
+    def testMeshAttributes(self):
+        mesh1, mesh2 = createQuad(), createQuad()
+        mesh1.insertAttribute("POINT", "A", FloatList.fromValues([0, 0, 0, 0]))
+        mesh2.insertAttribute("POINT", "B", FloatList.fromValues([0, 0, 0, 0]))
+        self.assertNotEqual(toHashableKey(mesh1), toHashableKey(mesh2))
+        self.assertEqual(toHashableKey(mesh1), toHashableKey(mesh1.copy()))
+
+    def testUnsupportedType(self):
+        with self.assertRaises(TypeError):
+            toHashableKey(object())
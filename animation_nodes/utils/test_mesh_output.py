@@ -0,0 +1,102 @@
+import numpy
+from unittest import TestCase, mock
+from . import mesh_output
+from . mesh_output import setMeshData, clearTopologyKeys
+from .. data_structures.meshes.test_instanced_mesh import createTranslations
+from .. data_structures import (Mesh, InstancedMesh, Vector3DList, EdgeIndicesList,
+                                PolygonIndicesList, LongList)
+
+class FakeCollection:
+    def __init__(self):
+        self.amount = 0
+        self.data = {}
+
+    def __len__(self):
+        return self.amount
+
+    def add(self, amount):
+        self.amount += amount
+
+    def foreach_set(self, name, buffer):
+        self.data[name] = numpy.array(buffer).ravel()
+
+class FakeLayer:
+    def __init__(self):
+        self.data = FakeCollection()
+
+class FakeLayers(dict):
+    def new(self, name):
+        self[name] = FakeLayer()
+
+class FakeBlenderMesh:
+    def __init__(self):
+        self.calls = []
+        self.clear()
+
+    def clear(self):
+        self.vertices = FakeCollection()
+        self.edges = FakeCollection()
+        self.loops = FakeCollection()
+        self.polygons = FakeCollection()
+        self.uv_layers = FakeLayers()
+        self.vertex_colors = FakeLayers()
+
+    def as_pointer(self):
+        return id(self)
+
+    def validate(self, verbose = False):
+        self.calls.append("validate")
+
+    def update(self, calc_edges_loose = False):
+        self.calls.append("update loose edges" if calc_edges_loose else "update")
+
+    def update_tag(self):
+        self.calls.append("update tag")
+
+def createMesh(offset = 0):
+    vertices = Vector3DList.fromValues([(0, 0, offset), (1, 0, 0), (1, 1, 0), (0, 1, 0)])
+    edges = EdgeIndicesList.fromValues([(0, 1), (1, 2), (2, 3), (3, 0)])
+    polygons = PolygonIndicesList.fromValues([(0, 1, 2, 3)])
+    return Mesh(vertices, edges, polygons, LongList.fromValues([0]))
+
+class TestSetMeshData(TestCase):
+    def setUp(self):
+        clearTopologyKeys()
+        patcher = mock.patch.object(mesh_output, "bmesh")
+        self.bmesh = patcher.start()
+        self.bmesh.new.return_value.to_mesh.side_effect = lambda outMesh: outMesh.clear()
+        self.addCleanup(patcher.stop)
+
+    def testFastPathWritesNormals(self):
+        outMesh = FakeBlenderMesh()
+        setMeshData(outMesh, createMesh())
+        mesh = createMesh(offset = 1)
+        setMeshData(outMesh, mesh)
+        self.assertEqual(self.bmesh.new.call_count, 1)
+        self.assertTrue(numpy.allclose(outMesh.vertices.data["co"], numpy.array(mesh.vertices).ravel()))
+        self.assertTrue(numpy.allclose(outMesh.vertices.data["normal"],
+                                       numpy.array(mesh.getVertexNormals()).ravel()))
+
+    def testSameResultOnBothPaths(self):
+        fastMesh = FakeBlenderMesh()
+        setMeshData(fastMesh, createMesh(), True, False, True)
+        setMeshData(fastMesh, createMesh(offset = 1), True, False, True)
+
+        rebuiltMesh = FakeBlenderMesh()
+        setMeshData(rebuiltMesh, createMesh(offset = 1), True, False, True)
+
+        self.assertEqual(self.bmesh.new.call_count, 2)
+        self.assertEqual(fastMesh.calls.count("validate"), 2)
+        self.assertEqual(fastMesh.calls.count("update loose edges"), 2)
+        for name in ("co", "normal"):
+            self.assertTrue(numpy.allclose(fastMesh.vertices.data[name], rebuiltMesh.vertices.data[name]))
+
+    def testInstancedMeshUsesFastPath(self):
+        outMesh = FakeBlenderMesh()
+        setMeshData(outMesh, InstancedMesh(createMesh(), createTranslations(3)))
+        instancedMesh = InstancedMesh(createMesh(offset = 1), createTranslations(3))
+        setMeshData(outMesh, instancedMesh)
+        self.assertEqual(self.bmesh.new.call_count, 1)
+        self.assertIn("update tag", outMesh.calls)
+        self.assertTrue(numpy.allclose(outMesh.vertices.data["co"],
+                                       numpy.array(instancedMesh.toMesh().vertices).ravel()))
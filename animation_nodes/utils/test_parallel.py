@@ -0,0 +1,35 @@
+import threading
+from unittest import TestCase
+from . parallel import splitRange, runParts, getExecutor, isWorkerThread
+
+class TestSplitRange(TestCase):
+    def testPartsCoverRange(self):
+        parts = splitRange(10, 3)
+        self.assertEqual(parts, [(0, 3), (3, 6), (6, 10)])
+
+    def testNotMorePartsThanElements(self):
+        self.assertEqual(splitRange(2, 8), [(0, 1), (1, 2)])
+        self.assertEqual(splitRange(5, 0), [(0, 5)])
+
+class TestRunParts(TestCase):
+    def testAllPartsAreExecuted(self):
+        results = [None] * 8
+        def function(start, end):
+            for i in range(start, end):
+                results[i] = i * 2
+        runParts(function, splitRange(8, 4))
+        self.assertEqual(results, [i * 2 for i in range(8)])
+
+    def testNestedCallsRunOnWorkerThread(self):
+        def outer():
+            threads = set()
+            def inner(start, end):
+                threads.add(threading.get_ident())
+            runParts(inner, splitRange(100, 10))
+            return isWorkerThread(), threads == {threading.get_ident()}
+
+        # would deadlock if the inner parts waited for the same pool
+        futures = [getExecutor().submit(outer) for _ in range(getExecutor()._max_workers + 1)]
+        for future in futures:
+            self.assertEqual(future.result(timeout = 10), (True, True))
+        self.assertFalse(isWorkerThread())
@@ -0,0 +1,50 @@
+import numpy as np
+from framework import benchmark
+from animation_nodes.data_structures import Vector3DList
+from animation_nodes.nodes.falloff.random_falloff import RandomFalloff
+from animation_nodes.nodes.falloff.remap_falloff import RemapFalloff
+from animation_nodes.nodes.falloff.mix_falloffs import MixFalloffs
+from animation_nodes.nodes.falloff.index_mask_falloff import MaskEveryNthFalloff
+from animation_nodes.nodes.falloff.point_distance_falloff import PointDistanceFalloff
+from animation_nodes.nodes.falloff.directional_falloff import UniDirectionalFalloff, BiDirectionalFalloff
+
+amount = 1000000
+
+def randomVectors(amount, seed = 0):
+    random = np.random.RandomState(seed)
+    return Vector3DList.fromNumpyArray(random.uniform(-5, 5, amount * 3).astype(np.float32))
+
+def createFalloffStack():
+    falloffs = [RandomFalloff(1, 0, 1),
+                UniDirectionalFalloff((0, 0, 0), (1, 0, 0), 4),
+                BiDirectionalFalloff((1, 0, 0), (0, 1, 1), 3),
+                MaskEveryNthFalloff(3, 1, 0.2, 0.7)]
+    falloff = MixFalloffs(falloffs, "MAX")
+    return RemapFalloff(falloff, 0, 1, 1, 0)
+
+def evaluateListBenchmark(falloff):
+    vectors = randomVectors(amount)
+    evaluator = falloff.getEvaluator("LOCATION")
+    return lambda: evaluator.evaluateList(vectors)
+
+@benchmark("falloffs.evaluateList.pointDistance")
+def setupPointDistance():
+    return evaluateListBenchmark(PointDistanceFalloff((0, 0, 0), 1, 4))
+
+@benchmark("falloffs.evaluateList.stack")
+def setupStack():
+    return evaluateListBenchmark(createFalloffStack())
+
+@benchmark("falloffs.evaluateSingle.stack")
+def setupSingle():
+    evaluator = createFalloffStack().getEvaluator("LOCATION")
+    vectors = [tuple(v) for v in randomVectors(10000)]
+    def evaluate():
+        for i, vector in enumerate(vectors):
+            evaluator(vector, i)
+    return evaluate
+
+@benchmark("falloffs.getEvaluator.stack")
+def setupGetEvaluator():
+    falloff = createFalloffStack()
+    return lambda: falloff.getEvaluator("LOCATION")
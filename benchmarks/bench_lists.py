@@ -0,0 +1,54 @@
+import numpy as np
+from mathutils import Matrix
+from framework import benchmark
+from animation_nodes.data_structures import (
+    FloatList, DoubleList, LongList, Vector3DList, Matrix4x4List
+)
+
+amount = 1000000
+
+def randomFloats(amount, seed = 0):
+    return np.random.RandomState(seed).uniform(-10, 10, amount).astype(np.float32)
+
+@benchmark("lists.FloatList.fromNumpyArray")
+def setupFloatListFromNumpy():
+    array = randomFloats(amount)
+    return lambda: FloatList.fromNumpyArray(array)
+
+@benchmark("lists.FloatList.fromValues")
+def setupFloatListFromValues():
+    values = randomFloats(amount // 10).tolist()
+    return lambda: FloatList.fromValues(values)
+
+@benchmark("lists.FloatList.add")
+def setupFloatListAdd():
+    a = FloatList.fromNumpyArray(randomFloats(amount, 0))
+    b = FloatList.fromNumpyArray(randomFloats(amount, 1))
+    return lambda: a + b
+
+@benchmark("lists.DoubleList.getSumOfElements")
+def setupDoubleListSum():
+    values = DoubleList.fromNumpyArray(randomFloats(amount).astype(np.float64))
+    return values.getSumOfElements
+
+@benchmark("lists.LongList.getItemsByIndices")
+def setupLongListIndexing():
+    values = LongList.fromNumpyArray(np.arange(amount, dtype = "int64"))
+    indices = LongList.fromNumpyArray(np.random.RandomState(0).randint(0, amount, amount).astype("int64"))
+    return lambda: values[indices]
+
+@benchmark("lists.Vector3DList.copy")
+def setupVectorListCopy():
+    vectors = Vector3DList.fromNumpyArray(randomFloats(amount * 3))
+    return vectors.copy
+
+@benchmark("lists.Vector3DList.transform")
+def setupVectorListTransform():
+    vectors = Vector3DList.fromNumpyArray(randomFloats(amount * 3))
+    matrix = Matrix(((0, -1, 0, 1), (1, 0, 0, 2), (0, 0, 2, 3), (0, 0, 0, 1)))
+    return lambda: vectors.transform(matrix)
+
+@benchmark("lists.Matrix4x4List.transpose")
+def setupMatrixListTranspose():
+    matrices = Matrix4x4List.fromNumpyArray(randomFloats(amount // 10 * 16))
+    return matrices.transpose
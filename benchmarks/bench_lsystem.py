@@ -0,0 +1,21 @@
+from framework import benchmark
+from animation_nodes.algorithms.lsystem import calculateLSystem
+
+defaults = {
+    "Step Size" : 1,
+    "Angle" : 25,
+    "Random Angle" : 0,
+    "Scale Step Size" : 0.9,
+    "Gravity" : 0,
+    "Scale Width" : 0.9
+}
+
+@benchmark("lsystem.hilbert")
+def setupHilbert():
+    rules = ["A = -BF+AFA+FB-", "B = +AF-BFB-FA+"]
+    return lambda: calculateLSystem("A", rules, 9, 0, defaults)
+
+@benchmark("lsystem.branches3D")
+def setupBranches():
+    rules = ["A = \"! [&FFFA] //// [&FFFA] //// [&FFFA]"]
+    return lambda: calculateLSystem("A", rules, 10, 0, defaults)
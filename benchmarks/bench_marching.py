@@ -0,0 +1,19 @@
+import numpy as np
+from framework import benchmark
+from animation_nodes.data_structures import DoubleList, VirtualDoubleList
+from animation_nodes.nodes.falloff.point_distance_falloff import PointDistanceFalloff
+from animation_nodes.algorithms.mesh_generation.marching_squares import marchingSquaresOnGrid
+from animation_nodes.nodes.bluefox_nodes.mesh.utils.marching_cubes import isoSurface
+
+@benchmark("marching.squaresOnGrid")
+def setupMarchingSquares():
+    evaluator = PointDistanceFalloff((0, 0, 0), 2, 3).getEvaluator("LOCATION")
+    thresholds = VirtualDoubleList.create(DoubleList.fromValues([0.25, 0.5, 0.75]), 0)
+    return lambda: marchingSquaresOnGrid(500, 500, 10, 10, evaluator, 3, thresholds, (0, 0, 0), "SIZE")
+
+@benchmark("marching.cubes.isoSurface")
+def setupMarchingCubes():
+    samples = np.linspace(-1, 1, 128)
+    x, y, z = np.meshgrid(samples, samples, samples, indexing = "ij")
+    volume = np.sin(x * 6) + np.cos(y * 5) + np.sin(z * 4)
+    return lambda: isoSurface(volume, 0.3, (-1, -1, -1), (2 / 127,) * 3)
@@ -0,0 +1,62 @@
+from mathutils import Matrix
+from framework import benchmark
+from animation_nodes.data_structures import Matrix4x4List
+from animation_nodes.algorithms.mesh.replicate_mesh import replicateMesh
+from animation_nodes.algorithms.mesh_generation.grid import getGridMesh_Size
+
+def createGridMesh(divisions):
+    return getGridMesh_Size(10, 10, divisions, divisions)
+
+def createTransformations(amount):
+    return Matrix4x4List.fromValues([Matrix.Translation((i, 0, 0)) for i in range(amount)])
+
+def derivedDataBenchmark(name, divisions = 500):
+    # changing the vertices invalidates the cached derived data
+    mesh = createGridMesh(divisions)
+    getData = getattr(mesh, name)
+    def calculate():
+        mesh.verticesTransformed()
+        getData()
+    return calculate
+
+@benchmark("meshes.getVertexNormals")
+def setupVertexNormals():
+    return derivedDataBenchmark("getVertexNormals")
+
+@benchmark("meshes.getPolygonNormals")
+def setupPolygonNormals():
+    return derivedDataBenchmark("getPolygonNormals")
+
+@benchmark("meshes.getPolygonCenters")
+def setupPolygonCenters():
+    return derivedDataBenchmark("getPolygonCenters")
+
+@benchmark("meshes.getLinkedVertices")
+def setupLinkedVertices():
+    mesh = createGridMesh(500)
+    def calculate():
+        mesh.topologyChanged()
+        mesh.getLinkedVertices()
+    return calculate
+
+@benchmark("meshes.triangulateMesh")
+def setupTriangulateMesh():
+    mesh = createGridMesh(500)
+    return lambda: mesh.copy().triangulateMesh()
+
+@benchmark("meshes.replicateMesh.manySmall")
+def setupReplicateManySmall():
+    mesh = createGridMesh(4)
+    transformations = createTransformations(100000)
+    return lambda: replicateMesh(mesh, transformations)
+
+@benchmark("meshes.replicateMesh.fewLarge")
+def setupReplicateFewLarge():
+    mesh = createGridMesh(300)
+    transformations = createTransformations(20)
+    return lambda: replicateMesh(mesh, transformations)
+
+@benchmark("meshes.join")
+def setupJoin():
+    meshes = [createGridMesh(20) for _ in range(2000)]
+    return lambda: meshes[0].join(*meshes)
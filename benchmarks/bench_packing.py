@@ -0,0 +1,11 @@
+import numpy as np
+from framework import benchmark
+from animation_nodes.data_structures import Vector3DList, FloatList
+from animation_nodes.algorithms.mesh_generation.close_packing import dynamicRadiusSpherePacking
+
+@benchmark("packing.dynamicRadiusSpherePacking")
+def setupDynamicRadius():
+    random = np.random.RandomState(0)
+    points = Vector3DList.fromNumpyArray(random.uniform(-10, 10, 20000 * 3).astype(np.float32))
+    influences = FloatList.fromNumpyArray(random.uniform(0, 1, 20000).astype(np.float32))
+    return lambda: dynamicRadiusSpherePacking(points, 0.01, 0.5, 0.01, influences, True)
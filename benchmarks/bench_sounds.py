@@ -0,0 +1,28 @@
+import numpy as np
+from framework import benchmark
+from animation_nodes.data_structures.sounds.sound import Sound
+from animation_nodes.data_structures.sounds.sound_data import SoundData
+from animation_nodes.data_structures.sounds.sound_sequence import SoundSequence, sampleRate
+from animation_nodes.data_structures.sounds.spectrum_cache import clearSpectrumCache
+
+def createSoundSequences(seconds):
+    random = np.random.RandomState(0)
+    data = SoundData(random.uniform(-1, 1, sampleRate * seconds).astype(np.float32), sampleRate)
+    return [SoundSequence(data, 0, 0, seconds, 1, 25)]
+
+def playbackBenchmark(clearCache):
+    sequences = createSoundSequences(10)
+    def playback():
+        if clearCache: clearSpectrumCache()
+        # the node gets a new sound object on every frame
+        for frame in range(100, 150):
+            Sound(sequences).computeTimeSmoothedSpectrum(frame / 25, (frame + 1) / 25, 0.005, 0.6, 10, 6)
+    return playback
+
+@benchmark("sounds.timeSmoothedSpectrum.playback")
+def setupSpectrumPlayback():
+    return playbackBenchmark(clearCache = True)
+
+@benchmark("sounds.timeSmoothedSpectrum.cached")
+def setupSpectrumCached():
+    return playbackBenchmark(clearCache = False)
@@ -0,0 +1,214 @@
+import numpy as np
+from framework import benchmark
+from animation_nodes.data_structures import (
+    Vector3DList, FloatList, BezierSpline, PolySpline
+)
+
+def randomArray(amount, seed = 0, scale = 5):
+    random = np.random.RandomState(seed)
+    return random.uniform(-scale, scale, amount * 3).astype(np.float32)
+
+def randomVectors(amount, seed = 0):
+    return Vector3DList.fromNumpyArray(randomArray(amount, seed))
+
+def createBezierSpline(pointAmount = 1000):
+    points = randomArray(pointAmount, 0)
+    return BezierSpline(Vector3DList.fromNumpyArray(points),
+                        Vector3DList.fromNumpyArray(points + randomArray(pointAmount, 1, 1)),
+                        Vector3DList.fromNumpyArray(points + randomArray(pointAmount, 2, 1)))
+
+def createPolySpline(pointAmount = 1000):
+    return PolySpline(randomVectors(pointAmount))
+
+@benchmark("splines.bezier.getDistributedPoints.resolution")
+def setupBezierResolution():
+    spline = createBezierSpline()
+    return lambda: spline.getDistributedPoints(100000)
+
+@benchmark("splines.bezier.getDistributedPoints.uniform")
+def setupBezierUniform():
+    spline = createBezierSpline()
+    spline.ensureUniformConverter(20)
+    return lambda: spline.getDistributedPoints(100000, distributionType = "UNIFORM")
+
+@benchmark("splines.bezier.ensureUniformConverter")
+def setupBezierUniformConverter():
+    spline = createBezierSpline()
+    def calculate():
+        newSpline = BezierSpline(spline.points, spline.leftHandles, spline.rightHandles)
+        newSpline.ensureUniformConverter(20)
+    return calculate
+
+@benchmark("splines.bezier.ensureUniformConverter.unchanged")
+def setupBezierUniformConverterUnchanged():
+    spline = createBezierSpline()
+    def calculate():
+        spline.markChanged()
+        spline.ensureUniformConverter(20)
+    return calculate
+
+@benchmark("splines.bezier.ensureUniformConverter.oneChangedPoint")
+def setupBezierUniformConverterChangedPoint():
+    spline = createBezierSpline()
+    spline.ensureUniformConverter(20)
+    points = [(0, 0, 0), (1, 1, 1)]
+    def calculate():
+        points.reverse()
+        spline.points[500] = points[0]
+        spline.markChanged()
+        spline.ensureUniformConverter(20)
+    return calculate
+
+@benchmark("splines.bezier.getPartialLength.uniform")
+def setupBezierPartialLength():
+    spline = createBezierSpline()
+    spline.ensureUniformConverter(20)
+    def calculate():
+        start = spline.toUniformParameter(0.25)
+        end = spline.toUniformParameter(0.75)
+        spline.getPartialLength(start, end, 20000)
+    return calculate
+
+@benchmark("splines.bezier.samplePoints")
+def setupBezierSamplePoints():
+    spline = createBezierSpline()
+    parameters = FloatList.fromNumpyArray(np.random.RandomState(0).uniform(0, 1, 100000).astype(np.float32))
+    return lambda: spline.samplePoints(parameters)
+
+@benchmark("splines.bezier.getLength")
+def setupBezierLength():
+    spline = createBezierSpline()
+    return lambda: spline.getLength(100000)
+
+@benchmark("splines.bezier.project")
+def setupBezierProject():
+    spline = createBezierSpline(20)
+    points = [tuple(v) for v in randomVectors(100, 3)]
+    def project():
+        for point in points:
+            spline.project(point)
+    return project
+
+def createHelixSpline(pointAmount = 1000):
+    angles = np.linspace(0, 40 * np.pi, pointAmount)
+    points = np.stack([np.cos(angles) * 5, np.sin(angles) * 5, angles / 4], axis = 1).astype(np.float32)
+    spline = BezierSpline(Vector3DList.fromNumpyArray(points.ravel()))
+    spline.smoothAllHandles()
+    return spline
+
+@benchmark("splines.bezier.projectPoints.random")
+def setupBezierProjectPointsRandom():
+    spline = createBezierSpline()
+    points = randomVectors(10000, 3)
+    return lambda: spline.projectPoints(points)
+
+@benchmark("splines.bezier.projectPoints.helix")
+def setupBezierProjectPointsHelix():
+    spline = createHelixSpline()
+    points = Vector3DList.fromNumpyArray(randomArray(10000, 3) + np.tile([0, 0, 15], 10000).astype(np.float32))
+    return lambda: spline.projectPoints(points)
+
+@benchmark("splines.poly.getDistributedPoints.uniform")
+def setupPolyUniform():
+    spline = createPolySpline()
+    spline.ensureUniformConverter(0)
+    return lambda: spline.getDistributedPoints(100000, distributionType = "UNIFORM")
+
+def createShortSplines(amount = 20000):
+    splines = []
+    for i in range(amount):
+        if i % 2 == 0:
+            splines.append(createBezierSpline(4))
+        else:
+            splines.append(createPolySpline(4))
+    return splines
+
+@benchmark("splines.list.fromSplines")
+def setupSplineListFromSplines():
+    from animation_nodes.data_structures import SplineList
+    splines = createShortSplines()
+    return lambda: SplineList.fromSplines(splines)
+
+@benchmark("splines.list.getDistributedPoints.loop")
+def setupSplineLoopDistributedPoints():
+    splines = createShortSplines()
+    def calculate():
+        for spline in splines:
+            spline.getDistributedPoints(10)
+    return calculate
+
+@benchmark("splines.list.getDistributedPoints.packed")
+def setupSplineListDistributedPoints():
+    from animation_nodes.data_structures import SplineList
+    splineList = SplineList.fromSplines(createShortSplines())
+    return lambda: splineList.getDistributedPoints(10)
+
+class FakeCurvePoints:
+    def add(self, amount): pass
+    def foreach_set(self, name, data): pass
+
+class FakeCurveSpline:
+    def __init__(self):
+        self.points = FakeCurvePoints()
+        self.bezier_points = FakeCurvePoints()
+
+class FakeCurveSplines:
+    def new(self, type): return FakeCurveSpline()
+    def clear(self): pass
+    def foreach_set(self, name, data): pass
+
+class FakeCurveObject:
+    type = "CURVE"
+    def __init__(self):
+        self.data = type("FakeCurve", (), {"splines" : FakeCurveSplines()})()
+
+@benchmark("splines.toBlender.list")
+def setupSplinesToBlender():
+    from animation_nodes.data_structures.splines.to_blender import setSplinesOnBlenderObject
+    splines = createShortSplines()
+    object = FakeCurveObject()
+    return lambda: setSplinesOnBlenderObject(object, splines)
+
+@benchmark("splines.toBlender.splineList")
+def setupSplineListToBlender():
+    from animation_nodes.data_structures import SplineList
+    from animation_nodes.data_structures.splines.to_blender import setSplinesOnBlenderObject
+    splineList = SplineList.fromSplines(createShortSplines())
+    object = FakeCurveObject()
+    return lambda: setSplinesOnBlenderObject(object, splineList)
+
+def createSampledSplines(amount = 2000):
+    splines = createShortSplines(amount)
+    for spline in splines:
+        spline.ensureNormals()
+    return splines
+
+@benchmark("splines.sampleMatrices.loop")
+def setupSplineLoopSampleMatrices():
+    splines = createSampledSplines()
+    parameters = FloatList.fromNumpyArray(np.linspace(0, 1, 100).astype(np.float32))
+    def calculate():
+        for spline in splines:
+            spline.sampleMatrices(parameters)
+    return calculate
+
+@benchmark("splines.sampleMatrices.batched")
+def setupSplineBatchedSampleMatrices():
+    from animation_nodes.data_structures.splines.sampling import sampleSplines
+    splines = createSampledSplines()
+    parameters = FloatList.fromNumpyArray(np.linspace(0, 1, 100).astype(np.float32))
+    return lambda: sampleSplines(splines, parameters, points = False, matrices = True)
+
+@benchmark("splines.loft.linear")
+def setupLinearLoft():
+    from animation_nodes.algorithms.mesh_generation.loft import LinearLoft
+    loft = LinearLoft()
+    loft.splines = [createBezierSpline(20) for _ in range(500)]
+    loft.splineSamples = 200
+    loft.subdivisions = 0
+    loft.start, loft.end = 0, 1
+    loft.cyclic = False
+    loft.distributionType = "RESOLUTION"
+    loft.uniformResolution = 20
+    loft.validate()
+    return loft.calcVertices
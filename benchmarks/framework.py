@@ -0,0 +1,59 @@
+'''
+A small timing framework in the style of asv.
+
+Benchmarks are setup functions decorated with @benchmark. They prepare
+the input data and return the function that is timed. This way the
+setup is never part of the measured time.
+'''
+
+import time
+import statistics
+
+registeredBenchmarks = []
+
+def benchmark(name):
+    def decorator(setup):
+        registeredBenchmarks.append(Benchmark(name, setup))
+        return setup
+    return decorator
+
+class Benchmark:
+    def __init__(self, name, setup):
+        self.name = name
+        self.setup = setup
+
+    def run(self, repeat = 5, minTime = 0.2):
+        function = self.setup()
+        number = findLoopAmount(function, minTime)
+        times = [timeLoops(function, number) / number for _ in range(repeat)]
+        return BenchmarkResult(self.name, min(times), statistics.median(times), number)
+
+class BenchmarkResult:
+    def __init__(self, name, best, median, number):
+        self.name = name
+        self.best = best
+        self.median = median
+        self.number = number
+
+    def toDict(self):
+        return {"best" : self.best, "median" : self.median, "number" : self.number}
+
+def findLoopAmount(function, minTime):
+    # same approach as timeit.Timer.autorange
+    number = 1
+    while True:
+        if timeLoops(function, number) >= minTime:
+            return number
+        number *= 10
+
+def timeLoops(function, number):
+    start = time.perf_counter()
+    for _ in range(number):
+        function()
+    return time.perf_counter() - start
+
+def formatTime(seconds):
+    for unit, factor in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= factor:
+            return "{:.3f} {}".format(seconds / factor, unit)
+    return "{:.3f} ns".format(seconds / 1e-9)
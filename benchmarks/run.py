@@ -0,0 +1,67 @@
+'''
+Runs the benchmarks outside of Blender. The addon has to be compiled first.
+
+    python benchmarks/run.py
+    python benchmarks/run.py -k falloff --save before.json
+    python benchmarks/run.py --compare before.json
+'''
+
+import os
+import sys
+import json
+import argparse
+import importlib
+
+benchmarksDirectory = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, benchmarksDirectory)
+
+from stand_ins import installStandIns
+from framework import registeredBenchmarks, formatTime
+
+def main():
+    args = parseArguments()
+    installStandIns()
+    importBenchmarkModules()
+
+    previousResults = loadResults(args.compare) if args.compare else {}
+    results = {}
+
+    for benchmark in registeredBenchmarks:
+        if not all(keyword in benchmark.name for keyword in args.keywords):
+            continue
+        result = benchmark.run(repeat = args.repeat, minTime = args.min_time)
+        results[result.name] = result.toDict()
+        printResult(result, previousResults.get(result.name))
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent = 2, sort_keys = True)
+
+def parseArguments():
+    parser = argparse.ArgumentParser(description = "Run the Animation Nodes benchmarks.")
+    parser.add_argument("-k", dest = "keywords", action = "append", default = [],
+        help = "only run benchmarks whose name contains this text")
+    parser.add_argument("--repeat", type = int, default = 5)
+    parser.add_argument("--min-time", type = float, default = 0.2,
+        help = "minimum duration of a single repetition in seconds")
+    parser.add_argument("--save", help = "write the results to this json file")
+    parser.add_argument("--compare", help = "compare with the results in this json file")
+    return parser.parse_args()
+
+def importBenchmarkModules():
+    for fileName in sorted(os.listdir(benchmarksDirectory)):
+        if fileName.startswith("bench_") and fileName.endswith(".py"):
+            importlib.import_module(fileName[:-3])
+
+def loadResults(path):
+    with open(path) as f:
+        return json.load(f)
+
+def printResult(result, previous):
+    line = "{:<50} {:>12} {:>12}".format(result.name, formatTime(result.best), formatTime(result.median))
+    if previous is not None:
+        line += "   {:.2f}x".format(result.best / previous["best"])
+    print(line, flush = True)
+
+if __name__ == "__main__":
+    main()
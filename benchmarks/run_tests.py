@@ -0,0 +1,39 @@
+'''
+Runs the unit tests outside of Blender with the stand-ins of the benchmarks.
+The addon has to be compiled first. Tests that depend on the behavior of
+Blender can only be run inside of Blender with animation_nodes.tests.
+
+    python benchmarks/run_tests.py
+    python benchmarks/run_tests.py -k kd_tree
+'''
+
+import os
+import sys
+import argparse
+import unittest
+
+benchmarksDirectory = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, benchmarksDirectory)
+
+from stand_ins import installStandIns, repositoryDirectory, addonDirectory
+
+def main():
+    args = parseArguments()
+    installStandIns()
+
+    testLoader = unittest.TestLoader()
+    if args.keywords:
+        testLoader.testNamePatterns = ["*{}*".format(keyword) for keyword in args.keywords]
+    allTests = testLoader.discover(addonDirectory, pattern = "test*", top_level_dir = repositoryDirectory)
+    result = unittest.TextTestRunner(verbosity = args.verbosity).run(allTests)
+    sys.exit(0 if result.wasSuccessful() else 1)
+
+def parseArguments():
+    parser = argparse.ArgumentParser(description = "Run the Animation Nodes tests outside of Blender.")
+    parser.add_argument("-k", dest = "keywords", action = "append", default = [],
+        help = "only run tests whose name contains this text")
+    parser.add_argument("-v", dest = "verbosity", action = "store_const", const = 2, default = 1)
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    main()
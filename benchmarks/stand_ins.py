@@ -0,0 +1,225 @@
+'''
+Minimal stand-ins for the modules that only exist inside of Blender.
+
+They only have to be good enough to import the compiled modules and the
+node modules that define the benchmarked classes. Nothing that depends on
+the behavior of Blender should be benchmarked with them. Code that does math
+with mathutils objects runs with the much slower pure Python classes below,
+so its timings are only comparable with other runs of these benchmarks.
+'''
+
+import os
+import sys
+import ast
+import types
+import importlib
+import importlib.abc
+import importlib.machinery
+
+repositoryDirectory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+addonDirectory = os.path.join(repositoryDirectory, "animation_nodes")
+
+blenderModuleNames = {"bpy", "bpy_extras", "bmesh", "bgl", "blf", "gpu", "gpu_extras", "aud", "idprop"}
+
+propertyNames = ["BoolProperty", "IntProperty", "FloatProperty", "StringProperty",
+                 "EnumProperty", "PointerProperty", "CollectionProperty",
+                 "BoolVectorProperty", "IntVectorProperty", "FloatVectorProperty"]
+
+def installStandIns():
+    if "bpy" in sys.modules:
+        return
+    installMathutils()
+    sys.meta_path.insert(0, BlenderModuleFinder())
+    installAddonPackage()
+
+class StandIn:
+    '''Accepts every attribute access and call.'''
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return StandIn(self._name + "." + name)
+
+    def __call__(self, *args, **kwargs):
+        # used as decorator
+        if len(args) == 1 and callable(args[0]) and len(kwargs) == 0:
+            return args[0]
+        return StandIn(self._name + "()")
+
+    def __iter__(self):
+        return iter(())
+
+    def __getitem__(self, key):
+        return StandIn(self._name + "[]")
+
+    def __repr__(self):
+        return "<StandIn {}>".format(self._name)
+
+class BlenderModuleFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    '''Creates a stand-in for every module that is part of Blender.'''
+    def find_spec(self, name, path, target = None):
+        if name.split(".")[0] in blenderModuleNames or name.startswith("mathutils."):
+            return importlib.machinery.ModuleSpec(name, self, is_package = True)
+        return None
+
+    def create_module(self, spec):
+        return None
+
+    def exec_module(self, module):
+        module.__path__ = []
+        if module.__name__ == "bpy.types":
+            # classes in bpy.types are used as base classes
+            classes = {}
+            def getClass(name):
+                if name.startswith("__"):
+                    raise AttributeError(name)
+                if name not in classes:
+                    classes[name] = type(name, (), {"bl_rna" : StandIn(name + ".bl_rna")})
+                return classes[name]
+            module.__getattr__ = getClass
+            return
+
+        def getStandIn(name, moduleName = module.__name__):
+            if name.startswith("__"):
+                raise AttributeError(name)
+            return StandIn(moduleName + "." + name)
+        module.__getattr__ = getStandIn
+
+        if module.__name__ == "bpy.props":
+            for propertyName in propertyNames:
+                setattr(module, propertyName, StandIn("bpy.props." + propertyName))
+            module.__all__ = propertyNames
+        elif module.__name__ == "bpy":
+            module.types = importlib.import_module("bpy.types")
+            module.props = importlib.import_module("bpy.props")
+
+def installAddonPackage():
+    '''
+    The __init__ of the addon registers it in Blender, so only
+    an empty package with the same path and bl_info is created.
+    '''
+    package = types.ModuleType("animation_nodes")
+    package.__path__ = [addonDirectory]
+    package.bl_info = readBlInfo(os.path.join(addonDirectory, "__init__.py"))
+    sys.modules["animation_nodes"] = package
+    if repositoryDirectory not in sys.path:
+        sys.path.insert(0, repositoryDirectory)
+
+def readBlInfo(path):
+    with open(path) as f:
+        tree = ast.parse(f.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and getattr(node.targets[0], "id", None) == "bl_info":
+            return ast.literal_eval(node.value)
+    return {}
+
+
+# mathutils
+##################################
+
+class Vector(list):
+    names = "xyzw"
+
+    def __init__(self, values = (0, 0, 0)):
+        super().__init__(float(value) for value in values)
+
+    def __getattr__(self, name):
+        if name in self.names and self.names.index(name) < len(self):
+            return self[self.names.index(name)]
+        raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        if name in self.names:
+            self[self.names.index(name)] = float(value)
+        else:
+            super().__setattr__(name, value)
+
+    def __add__(self, other):
+        return type(self)(a + b for a, b in zip(self, other))
+
+    def __sub__(self, other):
+        return type(self)(a - b for a, b in zip(self, other))
+
+    def __mul__(self, factor):
+        return type(self)(a * factor for a in self)
+
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return type(self)(-a for a in self)
+
+    @property
+    def length(self):
+        return self.length_squared ** 0.5
+
+    @property
+    def length_squared(self):
+        return sum(a * a for a in self)
+
+    def normalized(self):
+        length = self.length
+        return type(self)(a / length for a in self) if length > 0 else self.copy()
+
+    def dot(self, other):
+        return sum(a * b for a, b in zip(self, other))
+
+    def cross(self, other):
+        return type(self)((self[1] * other[2] - self[2] * other[1],
+                           self[2] * other[0] - self[0] * other[2],
+                           self[0] * other[1] - self[1] * other[0]))
+
+    def copy(self):
+        return type(self)(self)
+
+    def to_tuple(self):
+        return tuple(self)
+
+class Euler(Vector):
+    def __init__(self, values = (0, 0, 0), order = "XYZ"):
+        super().__init__(values)
+        self.order = order
+
+class Quaternion(Vector):
+    names = "wxyz"
+
+    def __init__(self, values = (1, 0, 0, 0)):
+        super().__init__(values)
+
+class Color(Vector):
+    names = "rgb"
+
+class Matrix(list):
+    def __init__(self, rows = ((1, 0, 0, 0), (0, 1, 0, 0), (0, 0, 1, 0), (0, 0, 0, 1))):
+        super().__init__(Vector(row) for row in rows)
+
+    @classmethod
+    def Identity(cls, size):
+        return cls([[float(i == j) for j in range(size)] for i in range(size)])
+
+    @classmethod
+    def Translation(cls, vector):
+        matrix = cls.Identity(4)
+        for i in range(3):
+            matrix[i][3] = vector[i]
+        return matrix
+
+    @property
+    def row(self):
+        return self
+
+    @property
+    def col(self):
+        return [Vector(column) for column in zip(*self)]
+
+    def copy(self):
+        return Matrix(self)
+
+def installMathutils():
+    module = types.ModuleType("mathutils")
+    module.__path__ = []
+    for cls in (Vector, Euler, Quaternion, Color, Matrix):
+        setattr(module, cls.__name__, cls)
+    module.__getattr__ = lambda attribute: StandIn("mathutils." + attribute)
+    sys.modules["mathutils"] = module